@@ -3,6 +3,9 @@ ASGI configuration for backend application.
 It exposes the ASGI callable as a module-level variable named ``application``.
 For more data on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
+
+HTTP is served by Django; WebSocket connections to /ws/<kind>/<id> are
+served by core.realtime.websocket.
 """
 
 import os
@@ -10,5 +13,16 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# Read by the DATABASES setting
+os.environ.setdefault('ASGI_SERVER', 'True')
+
+django_application = get_asgi_application()
+
+# Imported once Django is set up, as it uses the models and settings
+from core.realtime.websocket import websocket_application  # noqa: E402
+
 
-application = get_asgi_application()
\ No newline at end of file
+async def application(scope, receive, send):
+    if scope['type'] == 'websocket':
+        return await websocket_application(scope, receive, send)
+    return await django_application(scope, receive, send)
@@ -11,8 +11,9 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
 import os
+from decimal import Decimal
 from pathlib import Path
-from decouple import config
+from decouple import config, Csv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -49,6 +50,8 @@ INSTALLED_APPS = [
     'access_control',
     'teams',
     'user_preferences',
+    'assets',
+    'budgets',
 ]
 
 MIDDLEWARE = [
@@ -63,6 +66,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'access_control.middleware.authorization.AuthorizationMiddleware',
     'user_preferences.middleware.user_locale.UserLocaleMiddleware',
+    'core.middleware.read_your_writes.ReadYourWritesMiddleware',
     'django.middleware.locale.LocaleMiddleware'
 ]
 
@@ -85,22 +89,71 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'backend.wsgi.application'
+ASGI_APPLICATION = 'backend.asgi.application'
 
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# Connections are kept open for DB_CONN_MAX_AGE seconds (0 closes them after
+# every request) and checked before reuse when DB_CONN_HEALTH_CHECKS is on.
+# DB_POOL uses core.db.backends.postgresql_pool instead: a per-process pool
+# shared by all threads, to which connections are returned after each request.
+# Under ASGI (set by backend.asgi) each request runs its sync code in its own
+# thread, so connections are never kept open there; use DB_POOL instead.
+# Set DB_PGBOUNCER_MODE=transaction when DB_HOST points at a pgbouncer in
+# transaction pooling mode; the database time zone should then be UTC, as
+# session settings do not survive across transactions.
+DB_POOL = config('DB_POOL', default=False, cast=bool)
+ASGI_SERVER = config('ASGI_SERVER', default=False, cast=bool)
+DB_PGBOUNCER_MODE = config('DB_PGBOUNCER_MODE', default='')
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'core.db.backends.postgresql_pool' if DB_POOL else 'django.db.backends.postgresql',
         'NAME': config('POSTGRES_DB', default='apollone_db'),
         'USER': config('POSTGRES_USER', default='postgres'),
         'PASSWORD': config('POSTGRES_PASSWORD', default='cocofly4321'),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('POSTGRES_PORT', default='5432'),
+        'CONN_MAX_AGE': 0 if DB_POOL or ASGI_SERVER else config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
+        # Server-side cursors need the same server connection for the whole query
+        'DISABLE_SERVER_SIDE_CURSORS': DB_PGBOUNCER_MODE == 'transaction',
+        'OPTIONS': {
+            'connect_timeout': config('DB_CONNECT_TIMEOUT', default=10, cast=int),
+        },
+        'POOL': {
+            'MAX_SIZE': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            'TIMEOUT': config('DB_POOL_TIMEOUT', default=30.0, cast=float),
+            'MAX_IDLE': config('DB_POOL_MAX_IDLE', default=600.0, cast=float),
+            'MAX_LIFETIME': config('DB_POOL_MAX_LIFETIME', default=3600.0, cast=float),
+            'CHECK_AFTER': config('DB_POOL_CHECK_AFTER', default=30.0, cast=float),
+        },
     }
 }
 
+# Read replicas: comma separated hosts of streaming replicas of the default
+# database. Views opt in with core.db.routers.use_read_replica; a replica
+# lagging more than DB_REPLICA_MAX_LAG seconds is skipped, and users read
+# from the primary for DB_REPLICA_STICKY_SECONDS after their own writes.
+DB_REPLICA_HOSTS = config('DB_REPLICA_HOSTS', default='', cast=Csv())
+DB_READ_REPLICAS = []
+for index, host in enumerate(DB_REPLICA_HOSTS, start=1):
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': config('DB_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DB_READ_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['core.db.routers.ReplicaRouter']
+DB_REPLICA_MAX_LAG = config('DB_REPLICA_MAX_LAG', default=5.0, cast=float)
+DB_REPLICA_LAG_CHECK_INTERVAL = config('DB_REPLICA_LAG_CHECK_INTERVAL', default=5.0, cast=float)
+DB_REPLICA_STICKY_SECONDS = config('DB_REPLICA_STICKY_SECONDS', default=15, cast=int)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -153,6 +206,56 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Realtime updates over WebSockets (/ws/<kind>/<id>, see core.realtime)
+# 'postgres' brokers events through LISTEN/NOTIFY so events written by any
+# process reach every ASGI process; 'memory' keeps them in-process, which
+# only works with a single ASGI process that does all the writing. LISTEN
+# needs a session connection: set REALTIME_LISTEN_DB_HOST to the database
+# server when DB_HOST is a pgbouncer in transaction mode.
+REALTIME_CHANNEL_LAYER = config('REALTIME_CHANNEL_LAYER', default='postgres')
+REALTIME_LISTEN_DB_HOST = config('REALTIME_LISTEN_DB_HOST', default='')
+REALTIME_MAX_QUEUE = config('REALTIME_MAX_QUEUE', default=100, cast=int)
+# Open subscriptions get a heartbeat and are re-authorized at this interval
+REALTIME_HEARTBEAT_SECONDS = config('REALTIME_HEARTBEAT_SECONDS', default=30, cast=int)
+
+# Asset uploads
+# Versions are uploaded in chunks of at most ASSET_UPLOAD_MAX_CHUNK_SIZE bytes
+# (keep nginx client_max_body_size for the upload location in line), and
+# unfinished uploads idle for ASSET_UPLOAD_EXPIRY_HOURS are discarded
+ASSET_UPLOAD_MAX_SIZE = config('ASSET_UPLOAD_MAX_SIZE', default=5 * 1024 ** 3, cast=int)
+ASSET_UPLOAD_MAX_CHUNK_SIZE = config('ASSET_UPLOAD_MAX_CHUNK_SIZE', default=64 * 1024 ** 2, cast=int)
+ASSET_UPLOAD_EXPIRY_HOURS = config('ASSET_UPLOAD_EXPIRY_HOURS', default=24, cast=int)
+
+# Asset downloads are authorized by Django and sent by nginx from the internal
+# location ASSET_DOWNLOAD_ACCEL_PREFIX (an alias of MEDIA_ROOT); disable when
+# running without nginx so Django streams the files itself
+ASSET_DOWNLOAD_ACCEL_REDIRECT = config('ASSET_DOWNLOAD_ACCEL_REDIRECT', default=True, cast=bool)
+ASSET_DOWNLOAD_ACCEL_PREFIX = config('ASSET_DOWNLOAD_ACCEL_PREFIX', default='/protected-media/')
+
+# Budget approval policy (standardPolicy in budget_approval.yaml). A request
+# goes through stage 1, then through each next stage while its amount is
+# above the threshold of the stage before. Stage approvers are the
+# BUDGET:APPROVE PermissionApprovers holding a valid role named 'role';
+# 'team' stages only route to members of the request's team.
+BUDGET_APPROVAL_STAGES = [
+    {
+        'stage': 1,
+        'role': config('BUDGET_STAGE1_ROLE', default='team_leader'),
+        'threshold': config('BUDGET_STAGE1_THRESHOLD', default='10000', cast=Decimal),
+        'team': True,
+    },
+    {
+        'stage': 2,
+        'role': config('BUDGET_STAGE2_ROLE', default='org_admin'),
+        'threshold': config('BUDGET_STAGE2_THRESHOLD', default='20000', cast=Decimal),
+        'team': False,
+    },
+]
+
+# Stages undecided for BUDGET_APPROVAL_SLA_HOURS are escalated to the next
+# role level by the escalate_budget_requests worker
+BUDGET_APPROVAL_SLA_HOURS = config('BUDGET_APPROVAL_SLA_HOURS', default=48, cast=int)
+
 # Static files configuration for production
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
@@ -171,6 +274,17 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
+# JSON backend for the REST API: 'orjson' (core.renderers / core.parsers)
+# or 'json' for the stock DRF JSONRenderer / JSONParser
+API_JSON_BACKEND = config('API_JSON_BACKEND', default='orjson')
+
+if API_JSON_BACKEND == 'orjson':
+    API_JSON_RENDERER = 'core.renderers.ORJSONRenderer'
+    API_JSON_PARSER = 'core.parsers.ORJSONParser'
+else:
+    API_JSON_RENDERER = 'rest_framework.renderers.JSONRenderer'
+    API_JSON_PARSER = 'rest_framework.parsers.JSONParser'
+
 # Django REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -189,15 +303,59 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        API_JSON_RENDERER,
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        API_JSON_PARSER,
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
     ],
 }
 
+# Campaign budget alerts
+# Utilization percentages that trigger a budget_alert notification when crossed
+BUDGET_ALERT_THRESHOLDS = config('BUDGET_ALERT_THRESHOLDS', default='80,100', cast=Csv(int))
+
+# Cache
+# Use a shared backend (e.g. django.core.cache.backends.redis.RedisCache) when
+# running several workers, so cache invalidation is seen by all of them;
+# docker-compose points it at the redis service
+CACHE_BACKEND = config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': config('CACHE_LOCATION', default='apolloone'),
+    }
+}
+
+# Longest time in seconds the in-memory approver index is trusted before it is
+# reloaded. Approver changes reach other processes right away only through a
+# shared cache backend; with LocMemCache they are seen after at most this long
+APPROVER_INDEX_TIMEOUT = config('APPROVER_INDEX_TIMEOUT', default=60, cast=int)
+
+# Longest time in seconds a user's compiled permissions are cached; entries
+# also expire at the next validity window boundary of the user's roles
+PERMISSION_CACHE_TIMEOUT = config('PERMISSION_CACHE_TIMEOUT', default=300, cast=int)
+
+# Seconds a cached campaign API response is kept (0 disables the response cache).
+# Cached responses are invalidated through data versions kept in the cache, so
+# writes from other processes (workers, run_campaign_lifecycle) are only seen
+# with a shared backend; the response cache is off with LocMemCache
+CAMPAIGN_RESPONSE_CACHE_TIMEOUT = config('CAMPAIGN_RESPONSE_CACHE_TIMEOUT', default=300, cast=int)
+if CACHE_BACKEND == 'django.core.cache.backends.locmem.LocMemCache':
+    CAMPAIGN_RESPONSE_CACHE_TIMEOUT = 0
+
+# Serialize campaign list pages from values() rows instead of model instances
+CAMPAIGN_FAST_LIST_SERIALIZER = config('CAMPAIGN_FAST_LIST_SERIALIZER', default=True, cast=bool)
+
+# Cache-Control max-age (seconds) for the OpenAPI spec; clients revalidate with its ETag
+OPENAPI_SPEC_MAX_AGE = config('OPENAPI_SPEC_MAX_AGE', default=86400, cast=int)
+
+# Slack webhooks: POST messages to the configured webhook instead of only
+# writing mock logs, and the request timeout in seconds
+SLACK_WEBHOOK_DELIVERY = config('SLACK_WEBHOOK_DELIVERY', default=False, cast=bool)
+SLACK_WEBHOOK_TIMEOUT = config('SLACK_WEBHOOK_TIMEOUT', default=5.0, cast=float)
+
 from datetime import timedelta
 
 SIMPLE_JWT = {
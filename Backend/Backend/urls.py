@@ -19,6 +19,7 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.http import HttpResponse
+from core import views as core_views
 from user_preferences import views as user_pref_views
 
 
@@ -29,13 +30,17 @@ def health_check(request):
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('campaigns.urls')),
+    path('api/', include('assets.urls')),
+    path('api/', include('budgets.urls')),
     path('api/test/', include('test_app.urls')),
     path('health/', health_check, name='health_check'),
+    path('health/db/', core_views.database_metrics, name='database_metrics'),
     path('api/access_control/', include('access_control.urls')),
     path('api/teams/', include('teams.urls')),
     path('auth/', include('authentication.urls')),
     path('users/', include('user_preferences.urls')),
     path('notifications/mock-task-alert/', user_pref_views.mock_task_alert, name='mock-task-alert'),
+    path('notifications/async/mock-task-alert/', user_pref_views.amock_task_alert, name='mock-task-alert-async'),
 
 ]
 
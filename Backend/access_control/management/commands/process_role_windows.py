@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from access_control.services.role_windows import RoleWindowScheduler
+
+
+class Command(BaseCommand):
+    """
+    Report user roles whose validity window opened or closed
+
+    Run once per tick from cron, or with --interval as a long-running
+    worker loop:
+
+        python manage.py process_role_windows
+        python manage.py process_role_windows --interval 60
+    """
+
+    help = 'Emit activation and expiry events for user roles whose valid_from or valid_to has passed'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=RoleWindowScheduler.DEFAULT_BATCH_SIZE,
+            help='Number of roles reported per transaction'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Keep running and repeat every N seconds (0 runs a single tick)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many boundaries are due'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be a positive integer')
+
+        scheduler = RoleWindowScheduler(batch_size=options['batch_size'])
+
+        while True:
+            if options['dry_run']:
+                results = scheduler.count_due()
+                label = 'Due'
+            else:
+                results = scheduler.run()
+                label = 'Reported'
+
+            summary = ', '.join(f'{count} {event}' for event, count in results.items())
+            self.stdout.write(self.style.SUCCESS(f'{label}: {summary}'))
+
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
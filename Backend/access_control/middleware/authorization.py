@@ -1,9 +1,5 @@
 from django.http import JsonResponse
-from django.utils import timezone
-from django.db.models import Q
-from datetime import timedelta
-from core.models import Permission
-from access_control.models import RolePermission, UserRole
+from access_control.services.permissions import PermissionCache
 from typing import Optional, Callable, Any
 from functools import wraps
 from teams.models import Team, TeamMember
@@ -22,6 +18,10 @@ class AuthorizationMiddleware:
         'PATCH': 'APPROVE',
         'DELETE': 'DELETE',
     }
+    # Views that authorize requests themselves, e.g. read-only POSTs
+    EXEMPT_PATHS = {
+        '/api/access_control/permissions/check/',
+    }
 
     def __init__(self, get_response=None):
         self.get_response = get_response
@@ -36,6 +36,9 @@ class AuthorizationMiddleware:
         if not user or not user.is_authenticated:
             return None
 
+        if request.path in self.EXEMPT_PATHS:
+            return None
+
         # Parse the module from the path, e.g. /api/assets/... → ASSET
         parts = request.path.strip('/').split('/')
         if len(parts) < 2 or parts[0] != 'api':
@@ -54,19 +57,8 @@ class AuthorizationMiddleware:
             return None
         
         
-        # Only consider roles that are currently valid
-        now = timezone.now()
-        role_ids = UserRole.objects.filter(
-            user=request.user,
-            valid_from__lte=now
-        ).filter(Q(valid_to__gte=now) | Q(valid_to__isnull=True)).values_list('role_id', flat=True)
-
-        # Check if any of the user's roles grants the required permission
-        has = RolePermission.objects.filter(
-            role_id__in=role_ids,
-            permission__module=module_key,
-            permission__action=action_key
-        ).exists()
+        # Compiled from the roles that are currently valid
+        has = PermissionCache().has_permission(request.user.id, module_key, action_key)
 
         if has:
             return None  # Allow request to proceed
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.23 on 2026-10-19 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('access_control', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userrole',
+            name='activated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='userrole',
+            name='expired_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        # Window boundaries already passed are not reported again
+        migrations.RunSQL(
+            """
+            UPDATE access_control_userrole
+            SET activated_at = CASE WHEN valid_from <= now() THEN valid_from END,
+                expired_at = CASE WHEN valid_to <= now() THEN valid_to END
+            """,
+            migrations.RunSQL.noop
+        ),
+        migrations.AddIndex(
+            model_name='userrole',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['user', 'valid_to', 'valid_from'], include=('role',), name='user_roles_active'),
+        ),
+        migrations.AddIndex(
+            model_name='userrole',
+            index=models.Index(condition=models.Q(('activated_at__isnull', True)), fields=['valid_from'], name='user_roles_activation_due'),
+        ),
+        migrations.AddIndex(
+            model_name='userrole',
+            index=models.Index(condition=models.Q(('expired_at__isnull', True), ('valid_to__isnull', False)), fields=['valid_to'], name='user_roles_expiry_due'),
+        ),
+    ]
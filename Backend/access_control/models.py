@@ -36,9 +36,38 @@ class UserRole(TimeStampedModel):
     )
     valid_from = models.DateTimeField(default=timezone.now)
     valid_to = models.DateTimeField(null=True, blank=True)
+    # Set by the process_role_windows job when it reports the window boundary
+    activated_at = models.DateTimeField(null=True, blank=True)
+    expired_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         unique_together = ("user", "role", "team")
+        indexes = [
+            # Roles of a user that may be active, with their window
+            models.Index(
+                fields=["user", "valid_to", "valid_from"],
+                include=["role"],
+                name="user_roles_active",
+                condition=models.Q(is_deleted=False)
+            ),
+            # Window boundaries not reported yet
+            models.Index(
+                fields=["valid_from"],
+                name="user_roles_activation_due",
+                condition=models.Q(activated_at__isnull=True)
+            ),
+            models.Index(
+                fields=["valid_to"],
+                name="user_roles_expiry_due",
+                condition=models.Q(expired_at__isnull=True, valid_to__isnull=False)
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # A role granted already valid has no activation left to report
+        if self._state.adding and self.activated_at is None and self.valid_from <= timezone.now():
+            self.activated_at = self.valid_from
+        super().save(*args, **kwargs)
 
 class PermissionApprover(models.Model):
     permission = models.ForeignKey(Permission, on_delete=models.CASCADE)
@@ -0,0 +1,122 @@
+import threading
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from ..models import PermissionApprover
+
+User = get_user_model()
+
+# Data version of the approver sets, shared by every process through a shared
+# cache; it expires after APPROVER_INDEX_TIMEOUT, so processes that cannot see
+# each other's bumps (e.g. with LocMemCache) reload at least that often
+APPROVERS_VERSION_KEY = 'access_control:approvers-version'
+
+# Process-local approver index: its data version and "MODULE:ACTION" -> user IDs
+_index = {'version': None, 'approvers': {}}
+_index_lock = threading.Lock()
+
+
+class ApproverError(Exception):
+    """An approver set that cannot be saved"""
+
+
+def _bump_version():
+    cache.set(APPROVERS_VERSION_KEY, uuid.uuid4().hex, timeout=settings.APPROVER_INDEX_TIMEOUT)
+
+
+def invalidate_approver_index():
+    """
+    Make every process reload its approver index
+
+    The version is bumped right away, so the current transaction sees its
+    own changes, and again once it commits, so processes that reloaded in
+    between do not keep the uncommitted state.
+    """
+    _bump_version()
+    transaction.on_commit(_bump_version)
+
+
+class ApproverService:
+    """
+    Approvers configured for permissions
+
+    Reads of a permission's approvers are one join of users on
+    PermissionApprover. Saving an approver set diffs it against the stored
+    one and applies the difference with one DELETE and one bulk INSERT.
+    Approval routing asks for the approvers of a module and action many
+    times per request, so those lookups are served from an in-memory index
+    of every permission's approvers. The index is loaded with one query and
+    reloaded when the data version in the cache changes, which every
+    approver change does, or expires. Changes made by another process are
+    only seen through the version with a shared cache backend; otherwise
+    the index may be up to APPROVER_INDEX_TIMEOUT seconds stale.
+    """
+
+    def get_approvers(self, permission_id):
+        """Users approving a permission, as id/username/email dicts"""
+        return list(
+            User.objects.filter(permissionapprover__permission_id=permission_id)
+            .order_by('id')
+            .values('id', 'username', 'email')
+        )
+
+    def set_approvers(self, permission, user_ids):
+        """
+        Replace the approvers of a permission
+
+        Returns (added, removed) user ID counts. Raises ApproverError if a
+        user does not exist or is not active.
+        """
+        user_ids = set(user_ids)
+        active_ids = set(User.objects.filter(id__in=user_ids, is_active=True).values_list('id', flat=True))
+        if active_ids != user_ids:
+            unknown = ', '.join(str(user_id) for user_id in sorted(user_ids - active_ids))
+            raise ApproverError(f'Unknown or inactive users: {unknown}')
+
+        with transaction.atomic():
+            current_ids = set(
+                PermissionApprover.objects.filter(permission=permission).values_list('user_id', flat=True)
+            )
+            removed = current_ids - user_ids
+            added = user_ids - current_ids
+            if removed:
+                PermissionApprover.objects.filter(permission=permission, user_id__in=removed).delete()
+            PermissionApprover.objects.bulk_create(
+                [PermissionApprover(permission=permission, user_id=user_id) for user_id in sorted(added)],
+                ignore_conflicts=True
+            )
+            # bulk_create does not send post_save
+            if added:
+                invalidate_approver_index()
+        return len(added), len(removed)
+
+    def get_approver_ids(self, module, action):
+        """IDs of the users approving module:action, from the in-memory index"""
+        return self.get_index().get(f'{module}:{action}', frozenset())
+
+    def get_index(self):
+        """The current approver index, reloaded if its data version changed"""
+        version = cache.get(APPROVERS_VERSION_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not cache.add(APPROVERS_VERSION_KEY, version, timeout=settings.APPROVER_INDEX_TIMEOUT):
+                version = cache.get(APPROVERS_VERSION_KEY)
+
+        with _index_lock:
+            if _index['version'] == version:
+                return _index['approvers']
+
+        approvers = {}
+        for module, action, user_id in PermissionApprover.objects.values_list(
+            'permission__module', 'permission__action', 'user_id'
+        ):
+            approvers.setdefault(f'{module}:{action}', set()).add(user_id)
+        approvers = {key: frozenset(user_ids) for key, user_ids in approvers.items()}
+        with _index_lock:
+            _index['version'] = version
+            _index['approvers'] = approvers
+        return approvers
@@ -0,0 +1,131 @@
+import math
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from ..models import UserRole
+
+# Data version of every compiled permission set, bumped when roles change
+PERMISSIONS_VERSION_KEY = 'access_control:permissions-version'
+USER_PERMISSIONS_KEY = 'access_control:permissions:{}:{}'
+
+
+def _new_version():
+    """Return a fresh data version token"""
+    return uuid.uuid4().hex
+
+
+def _drop(user_ids):
+    if user_ids is None:
+        cache.set(PERMISSIONS_VERSION_KEY, _new_version(), timeout=None)
+    else:
+        version = PermissionCache().get_version()
+        cache.delete_many([USER_PERMISSIONS_KEY.format(version, user_id) for user_id in user_ids])
+
+
+def invalidate_permissions(user_ids=None):
+    """
+    Drop the compiled permissions of users, or of every user by default
+
+    They are dropped once the current transaction commits (right away
+    outside one), so nothing is dropped for changes that are rolled back.
+    """
+    user_ids = None if user_ids is None else list(user_ids)
+    transaction.on_commit(lambda: _drop(user_ids))
+
+
+class PermissionCache:
+    """
+    Compiled "MODULE:ACTION" permission sets of users
+
+    A user's set is compiled with one query through the user_roles_active
+    index, from the roles whose validity window contains the current time
+    (inactive users have none), and cached until the next window boundary of
+    the user's roles or PERMISSION_CACHE_TIMEOUT, whichever comes first.
+    Checking a permission is then a cache lookup instead of a time-range
+    scan of the user's roles on every request.
+
+    Role and permission changes, and the role_activated and role_expired
+    events of the process_role_windows job, drop the affected sets when
+    their transaction commits. Other processes only see those drops with a
+    shared cache backend. With the default per-process LocMemCache they do
+    not, and a set is only guaranteed to be current once its window
+    boundary or PERMISSION_CACHE_TIMEOUT has passed.
+    """
+
+    def get_version(self):
+        """Get the current data version of the compiled permissions"""
+        return cache.get_or_set(PERMISSIONS_VERSION_KEY, _new_version, timeout=None)
+
+    def has_permission(self, user_id, module, action):
+        """Whether a currently valid role of the user grants module:action"""
+        return f'{module}:{action}' in self.get_permissions(user_id)
+
+    def get_permissions(self, user_id):
+        """The user's permissions as a frozenset of "MODULE:ACTION" strings"""
+        return self.get_many([user_id])[user_id]
+
+    def get_many(self, user_ids):
+        """Permissions of several users, compiling the missing ones with one query"""
+        version = self.get_version()
+        keys = {user_id: USER_PERMISSIONS_KEY.format(version, user_id) for user_id in set(user_ids)}
+        cached = cache.get_many(keys.values())
+        permissions = {user_id: cached[key] for user_id, key in keys.items() if key in cached}
+
+        missing = [user_id for user_id in keys if user_id not in permissions]
+        if missing:
+            now = timezone.now()
+            entries = []
+            for user_id, (user_permissions, expires_at) in self.compile(missing, now).items():
+                timeout = settings.PERMISSION_CACHE_TIMEOUT
+                if expires_at is not None:
+                    timeout = max(1, min(timeout, math.ceil((expires_at - now).total_seconds())))
+                entries.append((keys[user_id], user_permissions, timeout))
+                permissions[user_id] = user_permissions
+            # Sets compiled in a transaction may include its uncommitted
+            # changes, so they are only cached once it commits
+            transaction.on_commit(lambda: self._store(entries))
+        return permissions
+
+    def _store(self, entries):
+        for key, user_permissions, timeout in entries:
+            cache.set(key, user_permissions, timeout)
+
+    def compile(self, user_ids, now):
+        """
+        Compile the permissions of users at now
+
+        Returns a dict mapping each user ID to (permissions, the next window
+        boundary of the user's roles or None).
+        """
+        compiled = {user_id: (set(), None) for user_id in user_ids}
+        rows = UserRole.objects.filter(
+            user_id__in=user_ids,
+            is_deleted=False,
+            user__is_active=True
+        ).filter(Q(valid_to__gte=now) | Q(valid_to__isnull=True)).values_list(
+            'user_id',
+            'valid_from',
+            'valid_to',
+            'role__role_permissions__permission__module',
+            'role__role_permissions__permission__action',
+            'role__role_permissions__is_deleted',
+            'role__role_permissions__permission__is_deleted'
+        )
+        for user_id, valid_from, valid_to, module, action, role_permission_deleted, permission_deleted in rows:
+            user_permissions, expires_at = compiled[user_id]
+            # Future roles start, current ones end at their boundary
+            boundary = valid_from if valid_from > now else valid_to
+            if boundary is not None and (expires_at is None or boundary < expires_at):
+                expires_at = boundary
+            if valid_from <= now and module and not role_permission_deleted and not permission_deleted:
+                user_permissions.add(f'{module}:{action}')
+            compiled[user_id] = (user_permissions, expires_at)
+        return {
+            user_id: (frozenset(user_permissions), expires_at)
+            for user_id, (user_permissions, expires_at) in compiled.items()
+        }
@@ -0,0 +1,101 @@
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from user_preferences.services.notification_queue import NotificationQueue
+from ..models import UserRole
+from ..signals import role_activated, role_expired
+
+ACTIVATED = 'activated'
+EXPIRED = 'expired'
+
+
+class RoleWindowScheduler:
+    """
+    Scheduled reporting of role validity window boundaries
+
+    Finds the user roles whose valid_from or valid_to has passed since the
+    last run with range scans on the user_roles_activation_due and
+    user_roles_expiry_due partial indexes, which only hold boundaries not
+    reported yet. For each batch it stamps activated_at or expired_at with
+    one UPDATE, sends the role_activated or role_expired signal (which
+    invalidates the users' compiled permissions) and queues a
+    role_activated or role_expired notification to each user. Rows are
+    claimed with SELECT ... FOR UPDATE SKIP LOCKED, so several workers can
+    run at the same time without reporting a boundary twice.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, queue=None):
+        self.batch_size = batch_size
+        self.queue = queue or NotificationQueue()
+
+    def get_boundaries(self, now):
+        """
+        Return the scheduled boundaries as
+        (event, due filter, index ordering field, stamped field, signal)
+        """
+        return [
+            (EXPIRED, Q(expired_at__isnull=True, valid_to__lt=now), 'valid_to', 'expired_at', role_expired),
+            (ACTIVATED, Q(activated_at__isnull=True, valid_from__lte=now), 'valid_from', 'activated_at', role_activated),
+        ]
+
+    def count_due(self, now=None):
+        """Count boundaries due to be reported without changing anything"""
+        now = now or timezone.now()
+        return {
+            event: UserRole.objects.filter(due).count()
+            for event, due, _, _, _ in self.get_boundaries(now)
+        }
+
+    def run(self, now=None):
+        """
+        Report every due boundary
+
+        Returns a dict mapping the event to the number of roles reported.
+        """
+        now = now or timezone.now()
+        return {
+            event: self._report(event, due, order_field, stamp_field, signal, now)
+            for event, due, order_field, stamp_field, signal in self.get_boundaries(now)
+        }
+
+    def _report(self, event, due, order_field, stamp_field, signal, now):
+        """Report all due boundaries of one kind in batches and return the count"""
+        total = 0
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    UserRole.objects.filter(due)
+                    .order_by(order_field)
+                    .select_for_update(skip_locked=True, of=('self',))
+                    .values_list('id', 'user_id', 'role__name', 'is_deleted')[:self.batch_size]
+                )
+                if not batch:
+                    break
+
+                # update() bypasses auto_now, so stamp updated_at explicitly
+                UserRole.objects.filter(id__in=[row[0] for row in batch]).update(
+                    **{stamp_field: now}, updated_at=now
+                )
+                signal.send(
+                    sender=UserRole,
+                    user_role_ids=[row[0] for row in batch],
+                    user_ids={row[1] for row in batch}
+                )
+
+                messages_by_user = {}
+                for _, user_id, role_name, is_deleted in batch:
+                    if not is_deleted:
+                        messages_by_user.setdefault(user_id, []).append(
+                            f"Your role {role_name} is now active" if event == ACTIVATED
+                            else f"Your role {role_name} has expired"
+                        )
+                if messages_by_user:
+                    self.queue.enqueue(f'role_{event}', messages_by_user)
+
+            total += len(batch)
+            if len(batch) < self.batch_size:
+                break
+        return total
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from core.models import Permission
+from .models import PermissionApprover, RolePermission, UserRole
+from .services.approvers import invalidate_approver_index
+from .services.permissions import invalidate_permissions
+
+# Sent by the process_role_windows job with user_role_ids and user_ids
+role_activated = Signal()
+role_expired = Signal()
+
+
+@receiver(post_save, sender=PermissionApprover)
+@receiver(post_delete, sender=PermissionApprover)
+def invalidate_approvers(sender, instance, **kwargs):
+    """Reload the approver index after an approver change"""
+    invalidate_approver_index()
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def invalidate_user_permissions(sender, instance, **kwargs):
+    """Drop the compiled permissions of a user whose role changed"""
+    invalidate_permissions([instance.user_id])
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_deactivated_user_permissions(sender, instance, **kwargs):
+    """Drop the compiled permissions of a user who may have been (de)activated"""
+    invalidate_permissions([instance.pk])
+
+
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+@receiver(post_save, sender=RolePermission)
+@receiver(post_delete, sender=RolePermission)
+def invalidate_all_permissions(sender, instance, **kwargs):
+    """Drop every compiled permission set after a role or permission change"""
+    invalidate_permissions()
+
+
+@receiver(role_activated)
+@receiver(role_expired)
+def invalidate_window_permissions(sender, user_ids, **kwargs):
+    """Drop the compiled permissions of users whose role window opened or closed"""
+    invalidate_permissions(user_ids)
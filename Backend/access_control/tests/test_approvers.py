@@ -0,0 +1,99 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from access_control.models import PermissionApprover
+from access_control.services.approvers import APPROVERS_VERSION_KEY, ApproverError, ApproverService
+from core.models import Permission
+
+User = get_user_model()
+
+
+class ApproverServiceTest(TestCase):
+    """
+    Test cases for permission approvers and their in-memory index
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        self.client = APIClient()
+        self.permission = Permission.objects.create(module='BUDGET', action='APPROVE')
+        self.users = [
+            User.objects.create_user(username=f'user{i}', email=f'user{i}@example.com', password='pw')
+            for i in range(4)
+        ]
+        self.service = ApproverService()
+        self.url = reverse('approver-detail', args=[self.permission.id])
+
+    def test_set_approvers_applies_the_difference(self):
+        """Test saving an approver set deletes and inserts only what changed"""
+        first, second, third, _ = (user.id for user in self.users)
+        self.assertEqual(self.service.set_approvers(self.permission, [first, second]), (2, 0))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.service.set_approvers(self.permission, [second, third]), (1, 1))
+
+        writes = [q['sql'] for q in queries if q['sql'].startswith(('INSERT', 'DELETE'))]
+        self.assertEqual(len(writes), 2)
+        self.assertEqual(
+            set(PermissionApprover.objects.values_list('user_id', flat=True)), {second, third}
+        )
+
+    def test_set_approvers_rejects_unknown_users(self):
+        """Test unknown and inactive users cannot be approvers"""
+        User.objects.filter(pk=self.users[0].pk).update(is_active=False)
+
+        for user_ids in ([self.users[0].id], [999999]):
+            with self.assertRaises(ApproverError):
+                self.service.set_approvers(self.permission, user_ids)
+        response = self.client.post(self.url, {'user_ids': [999999]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(PermissionApprover.objects.exists())
+
+    def test_approver_detail(self):
+        """Test approvers are replaced and read back with one query"""
+        response = self.client.post(self.url, {'user_ids': [self.users[1].id, self.users[2].id]}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual([user['username'] for user in response.data], ['user1', 'user2'])
+        self.assertEqual(self.client.get(reverse('approver-detail', args=[999999])).status_code, 404)
+
+    def test_approver_index(self):
+        """Test the index is served from memory and reloaded after changes"""
+        PermissionApprover.objects.create(permission=self.permission, user=self.users[0])
+        self.assertEqual(self.service.get_approver_ids('BUDGET', 'APPROVE'), {self.users[0].id})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.service.get_approver_ids('BUDGET', 'APPROVE'), {self.users[0].id})
+            self.assertEqual(self.service.get_approver_ids('ASSET', 'APPROVE'), set())
+
+        self.service.set_approvers(self.permission, [self.users[3].id])
+        self.assertEqual(self.service.get_approver_ids('BUDGET', 'APPROVE'), {self.users[3].id})
+        PermissionApprover.objects.filter(user=self.users[3]).delete()
+        self.assertEqual(self.service.get_approver_ids('BUDGET', 'APPROVE'), set())
+
+    def test_approver_index_expires(self):
+        """Test changes made without invalidation are picked up once the version expires"""
+        self.assertEqual(self.service.get_approver_ids('BUDGET', 'APPROVE'), set())
+        # As another process would with a per-process cache
+        PermissionApprover.objects.bulk_create([PermissionApprover(permission=self.permission, user=self.users[0])])
+        self.assertEqual(self.service.get_approver_ids('BUDGET', 'APPROVE'), set())
+
+        cache.delete(APPROVERS_VERSION_KEY)
+        self.assertEqual(self.service.get_approver_ids('BUDGET', 'APPROVE'), {self.users[0].id})
+
+    def test_approver_list(self):
+        """Test the approver candidates are paginated and searchable"""
+        response = self.client.get(reverse('approver-list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 4)
+
+        response = self.client.get(reverse('approver-list'), {'search': 'USER2@'})
+        self.assertEqual([user['id'] for user in response.data['results']], [self.users[2].id])
@@ -0,0 +1,111 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from access_control.models import RolePermission, UserRole
+from core.models import Organization, Permission, Role
+
+User = get_user_model()
+
+
+class PermissionCheckTest(TestCase):
+    """
+    Test cases for the batched permission check endpoint
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        self.client = APIClient()
+        # Not reversed: the middleware tests leave their own URLconf set
+        self.url = '/api/access_control/permissions/check/'
+        organization = Organization.objects.create(name='Agency')
+        editor = Role.objects.create(organization=organization, name='editor', level=3)
+        approver = Role.objects.create(organization=organization, name='approver', level=2)
+        auditor = Role.objects.create(organization=organization, name='auditor', level=1)
+        for role, module, action in [
+            (editor, 'CAMPAIGN', 'EDIT'),
+            (approver, 'CAMPAIGN', 'APPROVE'),
+            (approver, 'BUDGET', 'APPROVE'),
+            (auditor, 'ACCESS_CONTROL', 'VIEW'),
+        ]:
+            permission, _ = Permission.objects.get_or_create(module=module, action=action)
+            RolePermission.objects.create(role=role, permission=permission)
+
+        self.editor = User.objects.create_user(username='editor', email='editor@example.com', password='pw')
+        self.approver = User.objects.create_user(username='approver', email='approver@example.com', password='pw')
+        UserRole.objects.create(user=self.editor, role=editor)
+        UserRole.objects.create(user=self.approver, role=approver)
+        self.auditor = User.objects.create_user(username='auditor', email='auditor@example.com', password='pw')
+        UserRole.objects.create(user=self.auditor, role=auditor)
+        self.client.force_authenticate(user=self.auditor)
+
+    def test_batch_check(self):
+        """Test every check gets its own answer, compiled after the caller's set, then from the cache"""
+        checks = [
+            {'user_id': self.editor.id, 'module': 'CAMPAIGN', 'action': 'EDIT'},
+            {'user_id': self.editor.id, 'module': 'campaign', 'action': 'approve'},
+            {'userId': self.approver.id, 'module': 'BUDGET', 'action': 'APPROVE'},
+            {'user_id': 999999, 'module': 'BUDGET', 'action': 'APPROVE'},
+        ]
+        cache.clear()
+
+        with self.assertNumQueries(2), self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, {'checks': checks}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result['allowed'] for result in response.data['results']], [True, False, True, False])
+        self.assertEqual(response.data['results'][1]['action'], 'APPROVE')
+
+        with self.assertNumQueries(0):
+            response = self.client.post(self.url, {'checks': checks}, format='json')
+        self.assertEqual([result['allowed'] for result in response.data['results']], [True, False, True, False])
+
+    def test_single_check(self):
+        """Test a single check answers allowed, and inactive users are denied"""
+        payload = {'user_id': self.approver.id, 'module': 'CAMPAIGN', 'action': 'APPROVE'}
+        self.assertEqual(self.client.post(self.url, payload, format='json').data, {'allowed': True})
+
+        self.approver.is_active = False
+        self.approver.save()
+        self.assertEqual(self.client.post(self.url, payload, format='json').data, {'allowed': False})
+
+    def test_invalid_checks(self):
+        """Test malformed and oversized batches are refused"""
+        for payload in [
+            {'user_id': self.editor.id, 'module': 'CAMPAIGN'},
+            {'checks': []},
+            {'checks': ['CAMPAIGN:EDIT']},
+            {'checks': [{'user_id': 'editor', 'module': 'CAMPAIGN', 'action': 'EDIT'}]},
+            {'checks': [{'user_id': self.editor.id, 'module': 'CAMPAIGN', 'action': 'EDIT'}] * 501},
+        ]:
+            self.assertEqual(self.client.post(self.url, payload, format='json').status_code, 400, payload)
+
+    def test_requires_authentication(self):
+        """Test anonymous callers cannot check permissions"""
+        self.client.force_authenticate(user=None)
+        payload = {'user_id': self.editor.id, 'module': 'CAMPAIGN', 'action': 'EDIT'}
+
+        self.assertEqual(self.client.post(self.url, payload, format='json').status_code, 401)
+
+    def test_other_users_need_permission(self):
+        """Test users without ACCESS_CONTROL:VIEW can only check themselves"""
+        self.client.force_authenticate(user=self.editor)
+        own = {'user_id': self.editor.id, 'module': 'CAMPAIGN', 'action': 'EDIT'}
+        other = {'user_id': self.approver.id, 'module': 'BUDGET', 'action': 'APPROVE'}
+
+        self.assertEqual(self.client.post(self.url, {'checks': [own]}, format='json').data['results'][0]['allowed'], True)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.post(self.url, other, format='json').status_code, 403)
+        self.assertEqual(self.client.post(self.url, {'checks': [own, other]}, format='json').status_code, 403)
+
+    def test_session_users_check_their_own_permissions(self):
+        """Test the middleware does not require ACCESS_CONTROL:EDIT for this read-only POST"""
+        client = APIClient()
+        client.force_login(self.editor)
+        own = {'user_id': self.editor.id, 'module': 'CAMPAIGN', 'action': 'EDIT'}
+
+        response = client.post(self.url, own, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'allowed': True})
@@ -0,0 +1,143 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from access_control.models import RolePermission, UserRole
+from access_control.services.permissions import PermissionCache
+from access_control.services.role_windows import RoleWindowScheduler
+from access_control.signals import role_activated, role_expired
+from core.models import Organization, Permission, Role
+from user_preferences.models import PendingNotification
+from user_preferences.services.permission_service import PermissionService
+
+User = get_user_model()
+
+
+class RoleWindowTest(TestCase):
+    """
+    Test cases for compiled permissions and role validity window events
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        organization = Organization.objects.create(name='Agency')
+        self.editor = Role.objects.create(organization=organization, name='editor', level=3)
+        self.approver = Role.objects.create(organization=organization, name='approver', level=2)
+        RolePermission.objects.create(
+            role=self.editor, permission=Permission.objects.create(module='CAMPAIGN', action='EDIT')
+        )
+        RolePermission.objects.create(
+            role=self.approver, permission=Permission.objects.create(module='CAMPAIGN', action='APPROVE')
+        )
+        self.user = User.objects.create_user(username='alice', email='alice@example.com', password='pw')
+        self.permissions = PermissionCache()
+        self.now = timezone.now()
+
+    def test_compiled_permissions_follow_windows(self):
+        """Test only roles whose window contains now grant permissions, cached until the next boundary"""
+        UserRole.objects.create(
+            user=self.user, role=self.editor,
+            valid_from=self.now - timedelta(days=1), valid_to=self.now + timedelta(hours=1)
+        )
+        UserRole.objects.create(user=self.user, role=self.approver, valid_from=self.now + timedelta(minutes=5))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.permissions.get_permissions(self.user.id), {'CAMPAIGN:EDIT'})
+        with self.assertNumQueries(0):
+            self.assertTrue(self.permissions.has_permission(self.user.id, 'CAMPAIGN', 'EDIT'))
+            self.assertFalse(self.permissions.has_permission(self.user.id, 'CAMPAIGN', 'APPROVE'))
+
+        permissions, expires_at = self.permissions.compile([self.user.id], self.now)[self.user.id]
+        self.assertEqual(expires_at, self.now + timedelta(minutes=5))
+        permissions, expires_at = self.permissions.compile([self.user.id], self.now + timedelta(minutes=10))[self.user.id]
+        self.assertEqual(permissions, {'CAMPAIGN:EDIT', 'CAMPAIGN:APPROVE'})
+        self.assertEqual(expires_at, self.now + timedelta(hours=1))
+
+    def test_orm_permissions_ignore_expired_and_future_roles(self):
+        """Test the permission service fallback only reports currently valid roles"""
+        UserRole.objects.create(
+            user=self.user, role=self.editor,
+            valid_from=self.now - timedelta(days=2), valid_to=self.now - timedelta(days=1)
+        )
+        UserRole.objects.create(user=self.user, role=self.approver, valid_from=self.now + timedelta(days=1))
+        self.assertEqual(PermissionService._get_permissions_via_orm(self.user.id), [])
+
+        UserRole.objects.filter(role=self.approver).update(valid_from=self.now - timedelta(days=1))
+        cache.clear()
+        self.assertEqual(PermissionService._get_permissions_via_orm(self.user.id), ['CAMPAIGN:APPROVE'])
+
+    def test_role_changes_invalidate_permissions(self):
+        """Test granting roles and permissions is seen right away"""
+        self.assertFalse(self.permissions.has_permission(self.user.id, 'CAMPAIGN', 'EDIT'))
+        UserRole.objects.create(user=self.user, role=self.editor)
+        self.assertTrue(self.permissions.has_permission(self.user.id, 'CAMPAIGN', 'EDIT'))
+
+        RolePermission.objects.filter(role=self.editor).delete()
+        self.assertFalse(self.permissions.has_permission(self.user.id, 'CAMPAIGN', 'EDIT'))
+
+    def test_rolled_back_changes_are_not_cached(self):
+        """Test a set compiled inside a rolled back transaction is not kept"""
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                UserRole.objects.create(user=self.user, role=self.editor)
+                self.assertTrue(self.permissions.has_permission(self.user.id, 'CAMPAIGN', 'EDIT'))
+                raise RuntimeError('rollback')
+
+        self.assertFalse(self.permissions.has_permission(self.user.id, 'CAMPAIGN', 'EDIT'))
+
+    def test_window_events(self):
+        """Test the scheduler reports each opened and closed window once"""
+        user_role = UserRole.objects.create(
+            user=self.user, role=self.approver,
+            valid_from=self.now + timedelta(minutes=5), valid_to=self.now + timedelta(hours=1)
+        )
+        granted = UserRole.objects.create(user=self.user, role=self.editor)
+        self.assertIsNotNone(granted.activated_at)
+
+        events = []
+
+        def record(sender, signal, user_role_ids, user_ids, **kwargs):
+            events.append((signal, user_role_ids, user_ids))
+
+        role_activated.connect(record)
+        role_expired.connect(record)
+        self.addCleanup(role_activated.disconnect, record)
+        self.addCleanup(role_expired.disconnect, record)
+        scheduler = RoleWindowScheduler()
+
+        self.assertEqual(scheduler.run(self.now), {'expired': 0, 'activated': 0})
+        self.assertFalse(self.permissions.has_permission(self.user.id, 'CAMPAIGN', 'APPROVE'))
+
+        later = self.now + timedelta(minutes=10)
+        self.assertEqual(scheduler.count_due(later), {'expired': 0, 'activated': 1})
+        self.assertEqual(scheduler.run(later), {'expired': 0, 'activated': 1})
+        self.assertEqual(events, [(role_activated, [user_role.id], {self.user.id})])
+        user_role.refresh_from_db()
+        self.assertEqual(user_role.activated_at, later)
+        self.assertTrue(PendingNotification.objects.filter(user=self.user, trigger_type='role_activated').exists())
+
+        self.assertEqual(scheduler.run(self.now + timedelta(hours=2)), {'expired': 1, 'activated': 0})
+        self.assertEqual(events[-1], (role_expired, [user_role.id], {self.user.id}))
+        self.assertEqual(scheduler.run(self.now + timedelta(hours=3)), {'expired': 0, 'activated': 0})
+
+    def test_command(self):
+        """Test the command reports due boundaries and processes them"""
+        UserRole.objects.create(
+            user=self.user, role=self.editor,
+            valid_from=self.now - timedelta(days=2), valid_to=self.now - timedelta(days=1),
+            activated_at=self.now - timedelta(days=2)
+        )
+
+        out = StringIO()
+        call_command('process_role_windows', '--dry-run', stdout=out)
+        self.assertIn('Due: 1 expired, 0 activated', out.getvalue())
+        call_command('process_role_windows', stdout=out)
+        self.assertIn('Reported: 1 expired, 0 activated', out.getvalue())
+        self.assertTrue(UserRole.objects.filter(expired_at__isnull=False).exists())
@@ -9,12 +9,21 @@ import json
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import IsAuthenticated
+
+from core.db.routers import use_read_replica
 
 from .models import Organization, Role, Permission, UserRole, RolePermission, PermissionApprover
+from .services.approvers import ApproverError, ApproverService
+from .services.permissions import PermissionCache
 
 User = get_user_model()
 
+# Largest number of checks check_permission answers in one request
+MAX_PERMISSION_CHECKS = 500
+
 
 # original asset view
 class AssetListView(View):
@@ -30,6 +39,7 @@ class CampaignEditView(View):
 # simplified organization view
 
 @api_view(['GET'])
+@use_read_replica
 def organizations_list(request):
     """fetch organization list"""
     orgs = Organization.objects.filter(is_deleted=False)
@@ -38,6 +48,7 @@ def organizations_list(request):
 
 
 @api_view(['GET'])
+@use_read_replica
 def teams_list(request):
     """fetch team list - using teams compeleted by Dev W """
     from teams.models import Team as TeamsModel  # import teams
@@ -66,6 +77,7 @@ def teams_list(request):
 
 
 @api_view(['GET'])
+@use_read_replica
 def roles_list(request):
     """fetch role lists"""
     roles = Role.objects.filter(is_deleted=False).order_by('level')
@@ -83,6 +95,7 @@ def roles_list(request):
 
 
 @api_view(['GET'])
+@use_read_replica
 def permissions_list(request):
     """fetch permission list"""
     permissions = Permission.objects.filter(is_deleted=False)
@@ -107,6 +120,7 @@ def permissions_list(request):
 
 
 @api_view(['GET'])
+@use_read_replica
 def role_permissions_list(request):
     """Fetch rolepermission"""
     role_id = request.query_params.get('role_id')
@@ -272,6 +286,7 @@ def copy_role_permissions(request, to_role_id):
 
 
 @api_view(['GET'])
+@use_read_replica
 def user_permissions(request, user_id):
     """Fetch user permissions"""
     try:
@@ -310,58 +325,94 @@ def user_permissions(request, user_id):
     return Response(data)
 
 
-@api_view(['POST']) 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
 def check_permission(request):
-    """Check users' permissions"""
-    user_id = request.data.get('user_id') or request.data.get('userId')
-    module = request.data.get('module')
-    action = request.data.get('action')
-    
-    if not all([user_id, module, action]):
-        return Response({'error': 'Missing required fields'}, status=400)
-    
-    try:
-        user = User.objects.get(id=user_id, is_active=True)
-    except User.DoesNotExist:
-        return Response({'allowed': False, 'reason': 'User not found'})
-    
-    # updated later
-    return Response({'allowed': True})
+    """
+    Check users' permissions
+
+    Takes a single user_id/module/action, or a "checks" list of them, and
+    answers each from the compiled permission sets of the users, compiling
+    the missing ones with one query. Checking other users than oneself
+    needs the ACCESS_CONTROL:VIEW permission.
+    """
+    single = 'checks' not in request.data
+    checks = [request.data] if single else request.data['checks']
+    if not isinstance(checks, list) or not checks:
+        return Response({'error': 'checks must be a non-empty list'}, status=400)
+    if len(checks) > MAX_PERMISSION_CHECKS:
+        return Response({'error': f'At most {MAX_PERMISSION_CHECKS} checks can be made at once'}, status=400)
+
+    parsed = []
+    for check in checks:
+        if not isinstance(check, dict):
+            return Response({'error': 'Each check must be an object'}, status=400)
+        user_id = check.get('user_id') or check.get('userId')
+        module = check.get('module')
+        action = check.get('action')
+        if not all([user_id, module, action]):
+            return Response({'error': 'Missing required fields'}, status=400)
+        try:
+            user_id = int(user_id)
+        except (TypeError, ValueError):
+            return Response({'error': 'user_id must be a user ID'}, status=400)
+        parsed.append((user_id, str(module).upper(), str(action).upper()))
+
+    user_ids = {user_id for user_id, _, _ in parsed}
+    permission_cache = PermissionCache()
+    # Other users' sets are only compiled once the caller may see them
+    if (user_ids != {request.user.id} and not request.user.is_superuser
+            and not permission_cache.has_permission(request.user.id, 'ACCESS_CONTROL', 'VIEW')):
+        return Response({'error': 'You can only check your own permissions'}, status=403)
+    permissions = permission_cache.get_many(user_ids)
+    results = [
+        {'user_id': user_id, 'module': module, 'action': action,
+         'allowed': f'{module}:{action}' in permissions[user_id]}
+        for user_id, module, action in parsed
+    ]
+    if single:
+        return Response({'allowed': results[0]['allowed']})
+    return Response({'results': results})
 
 
 @api_view(['GET'])
+@use_read_replica
 def approver_list(request):
-    """fetch all users that can be configured as approvers"""
-    try:
-        users = User.objects.all().values('id', 'username', 'email')
-        return Response(list(users))
-    except Exception as e:
-        print(f"[approver_list] Exception: {e}")
-        import traceback; traceback.print_exc()
-        return Response({'error': str(e)}, status=500)
+    """
+    fetch the users that can be configured as approvers
+
+    Paginated; ?search= matches usernames and emails.
+    """
+    users = User.objects.filter(is_active=True).order_by('id').values('id', 'username', 'email')
+    search = request.query_params.get('search')
+    if search:
+        users = users.filter(Q(username__icontains=search) | Q(email__icontains=search))
+    paginator = PageNumberPagination()
+    page = paginator.paginate_queryset(users, request)
+    return paginator.get_paginated_response(page)
+
 
 @api_view(['GET', 'POST'])
+@use_read_replica
 def approver_detail(request, permission_id):
-    print("==== approver_detail called ====")
+    """fetch or replace the approvers of a permission"""
+    service = ApproverService()
+    if request.method == 'GET':
+        approvers = service.get_approvers(permission_id)
+        # Only an empty result can come from an unknown permission
+        if not approvers:
+            get_object_or_404(Permission, id=permission_id)
+        return Response(approvers)
+
+    permission = get_object_or_404(Permission, id=permission_id)
+    user_ids = request.data.get('user_ids', [])
+    if not isinstance(user_ids, list) or not all(isinstance(user_id, int) for user_id in user_ids):
+        return Response({'error': 'user_ids must be a list of user IDs'}, status=400)
     try:
-        permission = get_object_or_404(Permission, id=permission_id)
-        if request.method == 'GET':
-            approvers = PermissionApprover.objects.filter(permission=permission)
-            user_ids = approvers.values_list('user_id', flat=True)
-            users = User.objects.filter(id__in=user_ids).values('id', 'username', 'email')
-            return Response(list(users))
-        elif request.method == 'POST':
-            user_ids = request.data.get('user_ids', [])
-            # delete all existing approvers under this permission
-            PermissionApprover.objects.filter(permission=permission).exclude(user_id__in=user_ids).delete()
-            # add new approvers
-            for user_id in user_ids:
-                PermissionApprover.objects.get_or_create(permission=permission, user_id=user_id)
-            return Response({'status': 'success'})
-    except Exception as e:
-        print(f"[approver_detail] Exception: {e}")
-        import traceback; traceback.print_exc()
-        return Response({'error': str(e)}, status=500)
+        added, removed = service.set_approvers(permission, user_ids)
+    except ApproverError as e:
+        return Response({'error': str(e)}, status=400)
+    return Response({'status': 'success', 'added': added, 'removed': removed})
 
 @api_view(['DELETE'])
 def approver_remove(request, permission_id, user_id):
@@ -0,0 +1,88 @@
+from django.contrib import admin
+from .models import Asset, AssetHistory, AssetUpload, AssetVersion
+
+
+class AssetVersionInline(admin.TabularInline):
+    """Inline display of asset versions"""
+    model = AssetVersion
+    extra = 0
+    can_delete = False
+    fields = ['version_number', 'original_filename', 'size', 'checksum', 'scan_status', 'uploaded_by', 'created_at']
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Asset)
+class AssetAdmin(admin.ModelAdmin):
+    """
+    Admin interface for Asset model
+    """
+
+    list_display = ['id', 'task_id', 'owner', 'team', 'status', 'is_deleted', 'created_at']
+    list_filter = ['status', 'is_deleted', 'created_at']
+    search_fields = ['owner__username', 'owner__email', 'team__name']
+    list_select_related = ['owner', 'team']
+    readonly_fields = ['created_at', 'updated_at']
+    inlines = [AssetVersionInline]
+
+
+@admin.register(AssetVersion)
+class AssetVersionAdmin(admin.ModelAdmin):
+    """
+    Admin interface for AssetVersion model
+
+    Read-only: versions are created by completed uploads
+    """
+
+    list_display = ['asset', 'version_number', 'original_filename', 'size', 'scan_status', 'created_at']
+    list_filter = ['scan_status', 'created_at']
+    search_fields = ['original_filename', 'checksum']
+    list_select_related = ['asset']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(AssetUpload)
+class AssetUploadAdmin(admin.ModelAdmin):
+    """
+    Admin interface for AssetUpload model
+    """
+
+    list_display = ['id', 'asset', 'uploaded_by', 'filename', 'offset', 'size', 'status', 'updated_at']
+    list_filter = ['status', 'updated_at']
+    search_fields = ['filename', 'uploaded_by__username']
+    list_select_related = ['asset', 'uploaded_by']
+    readonly_fields = ['offset', 'block_hashes', 'version', 'created_at', 'updated_at']
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(AssetHistory)
+class AssetHistoryAdmin(admin.ModelAdmin):
+    """
+    Admin interface for AssetHistory model
+
+    Read-only: the history is append-only
+    """
+
+    list_display = ['asset', 'event_type', 'from_status', 'to_status', 'user', 'created_at']
+    list_filter = ['event_type', 'to_status', 'created_at']
+    search_fields = ['comment', 'user__username']
+    list_select_related = ['asset', 'user']
+    date_hierarchy = 'created_at'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
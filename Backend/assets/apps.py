@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class AssetsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'assets'
+
+    def ready(self):
+        # Make /ws/assets/<id> subscribable
+        from .realtime import register
+        register()
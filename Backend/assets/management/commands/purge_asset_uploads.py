@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from assets.services.uploads import AssetUploadService
+
+
+class Command(BaseCommand):
+    """
+    Abort unfinished asset uploads idle longer than ASSET_UPLOAD_EXPIRY_HOURS and delete their part files
+
+    Run hourly from cron:
+
+        python manage.py purge_asset_uploads
+    """
+
+    help = 'Abort expired asset uploads and delete their partial files'
+
+    def handle(self, *args, **options):
+        expired = AssetUploadService().purge_expired()
+        self.stdout.write(self.style.SUCCESS(f'Aborted {len(expired)} expired uploads'))
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.23 on 2026-10-19 01:58
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('assets', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssetHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('statusChanged', 'Status Changed'), ('assignment', 'Assignment'), ('comment', 'Comment'), ('versionUpload', 'Version Upload')], max_length=20)),
+                ('from_status', models.CharField(blank=True, choices=[('Draft', 'Draft'), ('PendingReview', 'Pending Review'), ('UnderReview', 'Under Review'), ('Approved', 'Approved'), ('Rejected', 'Rejected'), ('Archived', 'Archived')], max_length=20)),
+                ('to_status', models.CharField(blank=True, choices=[('Draft', 'Draft'), ('PendingReview', 'Pending Review'), ('UnderReview', 'Under Review'), ('Approved', 'Approved'), ('Rejected', 'Rejected'), ('Archived', 'Archived')], max_length=20)),
+                ('comment', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('asset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='history', to='assets.asset')),
+                ('user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='asset_history', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['asset', 'created_at'], name='assets_asse_asset_i_1e70ad_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.23 on 2026-10-19 03:12
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def set_approved_versions(apps, schema_editor):
+    """Approved assets were served their latest version until now"""
+    Asset = apps.get_model('assets', 'Asset')
+    AssetVersion = apps.get_model('assets', 'AssetVersion')
+    Asset.objects.filter(status='Approved').update(
+        approved_version=Subquery(
+            AssetVersion.objects.filter(asset=OuterRef('pk')).order_by('-version_number').values('id')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0002_assethistory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='approved_version',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='assets.assetversion'),
+        ),
+        migrations.RunPython(set_approved_versions, migrations.RunPython.noop),
+    ]
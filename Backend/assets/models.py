@@ -0,0 +1,241 @@
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+import uuid
+
+from core.models import TimeStampedModel
+
+
+class AssetStatus(models.TextChoices):
+    """Asset review workflow states"""
+    DRAFT = 'Draft', 'Draft'
+    PENDING_REVIEW = 'PendingReview', 'Pending Review'
+    UNDER_REVIEW = 'UnderReview', 'Under Review'
+    APPROVED = 'Approved', 'Approved'
+    REJECTED = 'Rejected', 'Rejected'
+    ARCHIVED = 'Archived', 'Archived'
+
+
+class ScanStatus(models.TextChoices):
+    """Malware scan states of an uploaded file"""
+    PENDING = 'pending', 'Pending'
+    CLEAN = 'clean', 'Clean'
+    INFECTED = 'infected', 'Infected'
+
+
+class AssetQuerySet(models.QuerySet):
+    def visible_to(self, user):
+        """Undeleted assets the user owns or whose team they belong to"""
+        from teams.models import TeamMember
+
+        assets = self.filter(is_deleted=False)
+        if user.is_superuser:
+            return assets
+        return assets.filter(
+            models.Q(owner=user) |
+            models.Q(team_id__in=TeamMember.objects.filter(user_id=user.id).values('team_id'))
+        )
+
+
+class Asset(TimeStampedModel):
+    """
+    Creative asset under review
+
+    An asset carries the review status and metadata; its files are kept
+    as numbered AssetVersions. approved_version is the version the last
+    approval applied to, the one served as the asset's download. Deleting
+    an asset only marks it deleted.
+    """
+
+    task_id = models.PositiveIntegerField(null=True, blank=True)
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='assets'
+    )
+    team = models.ForeignKey(
+        'teams.Team',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='assets'
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=AssetStatus.choices,
+        default=AssetStatus.DRAFT
+    )
+    tags = models.JSONField(default=list, blank=True)
+    approved_version = models.ForeignKey(
+        'AssetVersion',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+
+    objects = AssetQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['owner', 'status']),
+            models.Index(fields=['team', 'status']),
+        ]
+
+    def __str__(self):
+        return f"Asset {self.pk} ({self.status})"
+
+
+class AssetVersion(models.Model):
+    """
+    One uploaded file of an asset
+
+    Files are stored under their content hash (see services.uploads), so
+    versions with identical content share one file.
+    """
+
+    asset = models.ForeignKey(
+        Asset,
+        on_delete=models.CASCADE,
+        related_name='versions'
+    )
+    version_number = models.PositiveIntegerField()
+    file = models.FileField(max_length=255)
+    original_filename = models.CharField(max_length=255, blank=True)
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.PositiveBigIntegerField()
+    checksum = models.CharField(
+        max_length=64,
+        db_index=True,
+        help_text="Content hash: SHA-256 of the SHA-256 digests of each 4 MiB block"
+    )
+    scan_status = models.CharField(
+        max_length=20,
+        choices=ScanStatus.choices,
+        default=ScanStatus.PENDING
+    )
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='asset_versions'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-version_number']
+        unique_together = ['asset', 'version_number']
+
+    def __str__(self):
+        return f"Asset {self.asset_id} v{self.version_number}"
+
+
+class UploadStatus(models.TextChoices):
+    """Resumable upload states"""
+    ACTIVE = 'active', 'Active'
+    COMPLETED = 'completed', 'Completed'
+    FAILED = 'failed', 'Failed'
+    ABORTED = 'aborted', 'Aborted'
+
+
+class AssetUpload(models.Model):
+    """
+    Resumable chunked upload of a new asset version
+
+    Chunks are appended to a part file under MEDIA_ROOT; offset is the
+    number of bytes durably written and block_hashes the hex SHA-256
+    digests of every complete hash block so far, so the content hash is
+    computed incrementally across requests.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    asset = models.ForeignKey(
+        Asset,
+        on_delete=models.CASCADE,
+        related_name='uploads'
+    )
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='asset_uploads'
+    )
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.PositiveBigIntegerField()
+    expected_checksum = models.CharField(max_length=64, blank=True)
+    offset = models.PositiveBigIntegerField(default=0)
+    block_hashes = models.TextField(blank=True, default='')
+    status = models.CharField(
+        max_length=20,
+        choices=UploadStatus.choices,
+        default=UploadStatus.ACTIVE
+    )
+    error = models.CharField(max_length=255, blank=True)
+    version = models.ForeignKey(
+        AssetVersion,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='uploads'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'updated_at']),
+        ]
+
+    def __str__(self):
+        return f"Upload {self.pk} ({self.offset}/{self.size})"
+
+    @property
+    def is_expired(self):
+        """Whether the upload has been idle longer than ASSET_UPLOAD_EXPIRY_HOURS"""
+        idle = timezone.now() - self.updated_at
+        return idle.total_seconds() > settings.ASSET_UPLOAD_EXPIRY_HOURS * 3600
+
+
+class HistoryEventType(models.TextChoices):
+    """Kinds of asset history events"""
+    STATUS_CHANGED = 'statusChanged', 'Status Changed'
+    ASSIGNMENT = 'assignment', 'Assignment'
+    COMMENT = 'comment', 'Comment'
+    VERSION_UPLOAD = 'versionUpload', 'Version Upload'
+
+
+class AssetHistory(models.Model):
+    """
+    Append-only review history of an asset
+
+    Rows are only ever inserted (in bulk by the review engine), never
+    updated.
+    """
+
+    asset = models.ForeignKey(
+        Asset,
+        on_delete=models.CASCADE,
+        related_name='history'
+    )
+    event_type = models.CharField(max_length=20, choices=HistoryEventType.choices)
+    from_status = models.CharField(max_length=20, choices=AssetStatus.choices, blank=True)
+    to_status = models.CharField(max_length=20, choices=AssetStatus.choices, blank=True)
+    comment = models.TextField(blank=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='asset_history'
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['asset', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"Asset {self.asset_id} {self.event_type} at {self.created_at}"
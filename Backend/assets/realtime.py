@@ -0,0 +1,18 @@
+from core.realtime.topics import publish, register_topic
+from .models import Asset
+
+ASSET_TOPIC = 'assets'
+
+
+def can_follow_asset(user, asset_id):
+    """Users can follow the assets they can see"""
+    return Asset.objects.visible_to(user).filter(pk=asset_id).exists()
+
+
+def publish_asset_events(events):
+    """Push (asset_id, event) pairs to /ws/assets/<id> subscribers"""
+    publish(ASSET_TOPIC, events)
+
+
+def register():
+    register_topic(ASSET_TOPIC, can_follow_asset)
@@ -0,0 +1,173 @@
+import re
+
+from django.conf import settings
+from django.urls import reverse
+from rest_framework import serializers
+
+from teams.models import Team
+from .models import Asset, AssetHistory, AssetUpload, AssetVersion
+from .services.review import AssetReviewService, REVIEW_ACTIONS
+
+
+class AssetSerializer(serializers.ModelSerializer):
+    """
+    Serializer for Asset model
+
+    owner_id is the requesting user on create; team_id must be a team
+    that exists. status and approved_version_id only change through the
+    review workflow.
+    """
+
+    owner_id = serializers.IntegerField(read_only=True)
+    approved_version_id = serializers.IntegerField(read_only=True)
+    team_id = serializers.PrimaryKeyRelatedField(
+        queryset=Team.objects.filter(deleted_at__isnull=True),
+        source='team',
+        required=False,
+        allow_null=True
+    )
+    tags = serializers.ListField(
+        child=serializers.CharField(max_length=50),
+        required=False,
+        max_length=50
+    )
+
+    class Meta:
+        model = Asset
+        fields = [
+            'id', 'task_id', 'owner_id', 'team_id', 'status', 'approved_version_id', 'tags',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'status', 'created_at', 'updated_at']
+
+
+class AssetVersionSerializer(serializers.ModelSerializer):
+    """
+    Serializer for AssetVersion model
+    """
+
+    asset_id = serializers.IntegerField(read_only=True)
+    uploaded_by = serializers.IntegerField(source='uploaded_by_id', read_only=True)
+    file_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = AssetVersion
+        fields = [
+            'id', 'asset_id', 'version_number', 'file_url', 'original_filename',
+            'content_type', 'size', 'checksum', 'scan_status', 'uploaded_by', 'created_at'
+        ]
+        read_only_fields = fields
+
+    def get_file_url(self, obj):
+        """Download URL of the version; files are not served from MEDIA_URL"""
+        url = reverse('assets:asset-download', args=[obj.asset_id]) + f'?version={obj.version_number}'
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
+class AssetUploadSerializer(serializers.ModelSerializer):
+    """
+    Serializer for starting and reporting resumable uploads
+
+    checksum optionally gives the expected content hash; the upload
+    fails if the received file does not match it
+    """
+
+    asset_id = serializers.IntegerField(read_only=True)
+    checksum = serializers.CharField(
+        source='expected_checksum',
+        required=False,
+        allow_blank=True,
+        write_only=True
+    )
+    version = AssetVersionSerializer(read_only=True)
+
+    class Meta:
+        model = AssetUpload
+        fields = [
+            'id', 'asset_id', 'filename', 'content_type', 'size', 'checksum',
+            'offset', 'status', 'error', 'version', 'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'offset', 'status', 'error', 'created_at', 'updated_at']
+
+    def validate_size(self, value):
+        """Validate the file fits the upload limit"""
+        if value > settings.ASSET_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                f'Files cannot be larger than {settings.ASSET_UPLOAD_MAX_SIZE} bytes.'
+            )
+        return value
+
+    def validate_checksum(self, value):
+        """Validate the checksum is a hex SHA-256 digest"""
+        if value and not re.fullmatch(r'[0-9a-fA-F]{64}', value):
+            raise serializers.ValidationError('Checksum must be a 64 character hex digest.')
+        return value
+
+
+class AssetHistorySerializer(serializers.ModelSerializer):
+    """
+    Serializer for AssetHistory entries, in the API's HistoryItem shape
+    """
+
+    type = serializers.CharField(source='event_type')
+    to = serializers.CharField(source='to_status')
+    by_user = serializers.IntegerField(source='user_id')
+    timestamp = serializers.DateTimeField(source='created_at')
+
+    class Meta:
+        model = AssetHistory
+        fields = ['id', 'type', 'from_status', 'to', 'comment', 'by_user', 'timestamp']
+        read_only_fields = fields
+
+    def to_representation(self, instance):
+        """Name the previous status 'from', which is a Python keyword"""
+        data = super().to_representation(instance)
+        data['from'] = data.pop('from_status')
+        return data
+
+
+class ReviewItemSerializer(serializers.Serializer):
+    """One review action of a bulk review"""
+    asset_id = serializers.IntegerField(min_value=1)
+    action = serializers.ChoiceField(choices=REVIEW_ACTIONS)
+    comment = serializers.CharField(required=False, allow_blank=True, default='', max_length=2000)
+
+
+class BulkReviewSerializer(serializers.Serializer):
+    """
+    Serializer for bulk review requests
+
+    Either reviews (one action per asset) or asset_ids with a single
+    action and comment applied to all of them.
+    """
+
+    reviewer_id = serializers.IntegerField(required=False)
+    reviews = ReviewItemSerializer(many=True, required=False)
+    asset_ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+    action = serializers.ChoiceField(choices=REVIEW_ACTIONS, required=False)
+    comment = serializers.CharField(required=False, allow_blank=True, default='', max_length=2000)
+
+    def validate(self, data):
+        if 'reviews' in data:
+            if 'asset_ids' in data:
+                raise serializers.ValidationError('Provide either reviews or asset_ids, not both.')
+            reviews = data['reviews']
+        elif 'asset_ids' in data and 'action' in data:
+            reviews = [
+                {'asset_id': asset_id, 'action': data['action'], 'comment': data['comment']}
+                for asset_id in data['asset_ids']
+            ]
+        else:
+            raise serializers.ValidationError('Provide reviews, or asset_ids with an action.')
+
+        if not reviews:
+            raise serializers.ValidationError('At least one asset is required.')
+        if len(reviews) > AssetReviewService.MAX_BATCH_SIZE:
+            raise serializers.ValidationError(
+                f'Cannot review more than {AssetReviewService.MAX_BATCH_SIZE} assets at once.'
+            )
+        if len({review['asset_id'] for review in reviews}) != len(reviews):
+            raise serializers.ValidationError('Each asset can only be reviewed once per request.')
+        data['reviews'] = reviews
+        return data
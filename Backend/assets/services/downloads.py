@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+from django.utils.http import content_disposition_header, parse_etags
+
+
+def get_etag(version):
+    """Strong ETag of a version: its content hash"""
+    return f'"{version.checksum}"'
+
+
+def serve_version(request, version):
+    """
+    Response sending the file of an asset version
+
+    With ASSET_DOWNLOAD_ACCEL_REDIRECT the response has no body: it carries
+    an X-Accel-Redirect to the internal nginx location mapped to MEDIA_ROOT,
+    and nginx streams the file with sendfile and answers Range and If-Range
+    requests itself, so a download costs the worker only the permission
+    check. Otherwise (development without nginx) Django streams the whole
+    file.
+
+    Files are stored under their content hash and never change, so the
+    hash is a strong ETag and a matching If-None-Match is answered with 304
+    right away.
+    """
+    etag = get_etag(version)
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match and (if_none_match.strip() == '*' or etag in parse_etags(if_none_match)):
+        response = HttpResponseNotModified()
+    elif settings.ASSET_DOWNLOAD_ACCEL_REDIRECT:
+        response = HttpResponse(content_type=version.content_type or 'application/octet-stream')
+        response['X-Accel-Redirect'] = settings.ASSET_DOWNLOAD_ACCEL_PREFIX + version.file.name
+        response['Content-Disposition'] = content_disposition_header(True, version.original_filename)
+    else:
+        response = FileResponse(
+            version.file.open('rb'),
+            as_attachment=True,
+            filename=version.original_filename,
+            content_type=version.content_type or 'application/octet-stream'
+        )
+        response['Accept-Ranges'] = 'none'
+
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, max-age=0, must-revalidate'
+    return response
@@ -0,0 +1,163 @@
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import Case, F, OuterRef, Subquery, Value, When
+from django.utils import timezone
+
+from access_control.services.permissions import PermissionCache
+from user_preferences.services.notification_queue import NotificationQueue
+from ..models import Asset, AssetHistory, AssetStatus, AssetVersion, HistoryEventType
+from ..realtime import publish_asset_events
+
+ASSET_REVIEWED_TRIGGER = 'asset_reviewed'
+
+# Workflow actions: action -> (statuses it applies to, resulting status)
+TRANSITIONS = {
+    'submit': ({AssetStatus.DRAFT, AssetStatus.REJECTED}, AssetStatus.PENDING_REVIEW),
+    'approve': ({AssetStatus.PENDING_REVIEW, AssetStatus.UNDER_REVIEW}, AssetStatus.APPROVED),
+    'reject': ({AssetStatus.PENDING_REVIEW, AssetStatus.UNDER_REVIEW}, AssetStatus.REJECTED),
+}
+
+# Actions that need the ASSET:APPROVE permission and notify the asset owner
+REVIEW_ACTIONS = ['approve', 'reject']
+
+
+class AssetReviewService:
+    """
+    Asset review workflow engine
+
+    Applies workflow actions to many assets in one transaction with a
+    fixed number of queries, whatever the number of assets: the assets are
+    locked with one SELECT ... FOR UPDATE (in id order, so concurrent
+    reviews cannot deadlock), moved to their new status with one UPDATE
+    (which also records the latest version as the approved one),
+    and the history rows and owner notifications are written with one
+    bulk INSERT each. Notifications are only queued; the
+    deliver_notifications worker sends them after the transaction commits.
+    statusChanged events for /ws/assets/<id> subscribers are published
+    together once it commits.
+
+    Every requested asset gets a result, so one invalid asset does not
+    fail the others.
+    """
+
+    MAX_BATCH_SIZE = 5000
+
+    def __init__(self, queue=None):
+        self.queue = queue or NotificationQueue()
+
+    def can_approve(self, user):
+        """Whether a currently valid role of user grants ASSET:APPROVE"""
+        return user.is_superuser or PermissionCache().has_permission(user.id, 'ASSET', 'APPROVE')
+
+    def review(self, reviewer, reviews, now=None):
+        """
+        Approve or reject assets
+
+        reviews is a list of dicts with asset_id, action and an optional
+        comment. Raises PermissionDenied if the reviewer may not approve
+        assets.
+        """
+        now = now or timezone.now()
+        if not self.can_approve(reviewer):
+            raise PermissionDenied('You do not have permission to review assets.')
+        return self.apply(reviewer, reviews, now)
+
+    def submit(self, user, asset_ids, now=None):
+        """Submit draft or rejected assets for review"""
+        return self.apply(user, [{'asset_id': asset_id, 'action': 'submit'} for asset_id in asset_ids], now)
+
+    def apply(self, user, actions, now=None):
+        """
+        Apply workflow actions and return one result per action, in order
+
+        Assets the user cannot see are reported as not found, and assets
+        whose status does not allow the action are left unchanged.
+        """
+        now = now or timezone.now()
+        asset_ids = [item['asset_id'] for item in actions]
+
+        with transaction.atomic():
+            assets = {
+                row['id']: row
+                for row in Asset.objects.visible_to(user)
+                .filter(id__in=asset_ids)
+                .order_by('id')
+                .select_for_update()
+                .values('id', 'status', 'owner_id')
+            }
+
+            results = []
+            ids_by_status = {}
+            history = []
+            messages_by_user = {}
+            for item in actions:
+                asset = assets.get(item['asset_id'])
+                if asset is None:
+                    results.append({'asset_id': item['asset_id'], 'success': False, 'error': 'Asset not found'})
+                    continue
+                from_statuses, to_status = TRANSITIONS[item['action']]
+                if asset['status'] not in from_statuses:
+                    results.append({
+                        'asset_id': asset['id'],
+                        'success': False,
+                        'status': asset['status'],
+                        'error': f"Cannot {item['action']} an asset in status {asset['status']}"
+                    })
+                    continue
+
+                ids_by_status.setdefault(to_status, []).append(asset['id'])
+                history.append(AssetHistory(
+                    asset_id=asset['id'],
+                    event_type=HistoryEventType.STATUS_CHANGED,
+                    from_status=asset['status'],
+                    to_status=to_status,
+                    comment=item.get('comment', ''),
+                    user=user,
+                    created_at=now
+                ))
+                if item['action'] in REVIEW_ACTIONS and asset['owner_id'] != user.id:
+                    message = f"Asset {asset['id']} was {to_status.lower()} by {user.username}"
+                    if item.get('comment'):
+                        message += f": {item['comment']}"
+                    messages_by_user.setdefault(asset['owner_id'], []).append(message)
+                results.append({
+                    'asset_id': asset['id'],
+                    'success': True,
+                    'status': to_status,
+                    'reviewed_at': now
+                })
+
+            if ids_by_status:
+                changes = {}
+                if AssetStatus.APPROVED in ids_by_status:
+                    # An approval applies to the version the reviewer saw, the latest
+                    changes['approved_version'] = Case(
+                        When(id__in=ids_by_status[AssetStatus.APPROVED], then=Subquery(
+                            AssetVersion.objects.filter(asset=OuterRef('pk'))
+                            .order_by('-version_number').values('id')[:1]
+                        )),
+                        default=F('approved_version')
+                    )
+                Asset.objects.filter(id__in=[pk for ids in ids_by_status.values() for pk in ids]).update(
+                    status=Case(*[
+                        When(id__in=ids, then=Value(to_status))
+                        for to_status, ids in ids_by_status.items()
+                    ]),
+                    updated_at=now,
+                    **changes
+                )
+                AssetHistory.objects.bulk_create(history)
+                publish_asset_events([
+                    (entry.asset_id, {
+                        'event': 'statusChanged',
+                        'asset_id': entry.asset_id,
+                        'from': entry.from_status,
+                        'to': entry.to_status,
+                        'changed_by': user.id,
+                    })
+                    for entry in history
+                ])
+            if messages_by_user:
+                self.queue.enqueue(ASSET_REVIEWED_TRIGGER, messages_by_user)
+
+        return results
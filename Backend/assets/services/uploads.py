@@ -0,0 +1,295 @@
+import fcntl
+import hashlib
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import (
+    Asset, AssetHistory, AssetStatus, AssetUpload, AssetVersion, HistoryEventType, UploadStatus
+)
+from ..realtime import publish_asset_events
+
+# Content hash block size: the hash is the SHA-256 of the concatenated
+# SHA-256 digests of each block (the Dropbox content_hash scheme), so it can
+# be continued from the stored block digests in any later request
+BLOCK_SIZE = 4 * 1024 * 1024
+
+# Bytes read from the request and written per iteration
+READ_SIZE = 1024 * 1024
+
+# Storage directories relative to MEDIA_ROOT
+UPLOAD_DIR = 'asset_uploads'
+BLOB_DIR = 'assets'
+
+
+class UploadError(Exception):
+    """An upload request that cannot be applied"""
+
+    def __init__(self, message, offset=None):
+        super().__init__(message)
+        self.offset = offset
+
+
+class UploadConflict(UploadError):
+    """The chunk does not start at the stored offset or the upload is busy"""
+
+
+def content_hash(block_hashes):
+    """Content hash from the concatenated hex digests of all blocks"""
+    return hashlib.sha256(bytes.fromhex(block_hashes)).hexdigest()
+
+
+def compute_content_hash(fileobj):
+    """Content hash of a whole file, read block by block"""
+    blocks = []
+    while True:
+        block = fileobj.read(BLOCK_SIZE)
+        if not block:
+            break
+        blocks.append(hashlib.sha256(block).hexdigest())
+    return content_hash(''.join(blocks))
+
+
+def get_blob_name(checksum):
+    """Storage name of the file with the given content hash"""
+    return f'{BLOB_DIR}/{checksum[:2]}/{checksum[2:4]}/{checksum}'
+
+
+class AssetUploadService:
+    """
+    Resumable chunked uploads of asset versions
+
+    Each chunk is streamed from the request into the upload's part file
+    under MEDIA_ROOT in READ_SIZE pieces, so worker memory does not grow
+    with the file size. The part file is locked while a chunk is written,
+    and the stored offset only moves after the bytes are flushed to disk;
+    bytes past it from an interrupted request are discarded on the next
+    chunk. Block digests are stored with the offset, and only the last
+    incomplete block (at most BLOCK_SIZE bytes) is re-read from disk to
+    continue the content hash.
+
+    A finished file is moved to a path derived from its content hash. If a
+    file with that hash is already stored the upload is dropped and the
+    stored file reused, and if it matches the asset's latest version no new
+    version is created. A new version of an approved asset sends the asset
+    back to PendingReview.
+    """
+
+    def get_part_path(self, upload):
+        return default_storage.path(f'{UPLOAD_DIR}/{upload.pk}.part')
+
+    def start(self, asset, user, filename, size, content_type='', expected_checksum=''):
+        """Open an upload session for a new version of asset"""
+        upload = AssetUpload.objects.create(
+            asset=asset,
+            uploaded_by=user,
+            filename=filename,
+            content_type=content_type,
+            size=size,
+            expected_checksum=expected_checksum.lower()
+        )
+        part_path = self.get_part_path(upload)
+        os.makedirs(os.path.dirname(part_path), exist_ok=True)
+        open(part_path, 'wb').close()
+        return upload
+
+    def append(self, upload, stream, start, length):
+        """
+        Append length bytes read from stream at offset start
+
+        Returns (upload, version, created): version is set once the upload
+        is complete, created tells whether a new version was added.
+        """
+        if upload.status == UploadStatus.COMPLETED:
+            return upload, upload.version, False
+        if upload.status != UploadStatus.ACTIVE:
+            raise UploadError(f'Upload is {upload.status}')
+        if start + length > upload.size:
+            raise UploadError('Chunk extends past the end of the upload', offset=upload.offset)
+
+        part_path = self.get_part_path(upload)
+        with open(part_path, 'r+b') as part:
+            try:
+                fcntl.flock(part, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                raise UploadConflict('Another chunk of this upload is being written', offset=upload.offset)
+
+            upload.refresh_from_db()
+            if upload.status == UploadStatus.COMPLETED:
+                return upload, upload.version, False
+            if upload.status != UploadStatus.ACTIVE:
+                raise UploadError(f'Upload is {upload.status}')
+            if start != upload.offset:
+                raise UploadConflict(
+                    f'Chunk starts at {start} but the upload continues at {upload.offset}',
+                    offset=upload.offset
+                )
+
+            block_hashes = upload.block_hashes
+            block_start = start - start % BLOCK_SIZE
+            block = hashlib.sha256()
+            block_length = start - block_start
+            if block_length:
+                part.seek(block_start)
+                block.update(part.read(block_length))
+
+            # Drop bytes beyond the stored offset left by an interrupted chunk
+            part.truncate(start)
+            part.seek(start)
+
+            received = 0
+            while received < length:
+                data = stream.read(min(READ_SIZE, length - received))
+                if not data:
+                    break
+                part.write(data)
+                received += len(data)
+                while data:
+                    take = min(BLOCK_SIZE - block_length, len(data))
+                    block.update(data[:take])
+                    block_length += take
+                    data = data[take:]
+                    if block_length == BLOCK_SIZE:
+                        block_hashes += block.hexdigest()
+                        block = hashlib.sha256()
+                        block_length = 0
+
+            part.flush()
+            os.fsync(part.fileno())
+
+            offset = start + received
+            updated = AssetUpload.objects.filter(
+                pk=upload.pk, offset=start, status=UploadStatus.ACTIVE
+            ).update(
+                offset=offset,
+                block_hashes=block_hashes,
+                updated_at=timezone.now()
+            )
+            if not updated:
+                raise UploadConflict('The upload was changed while the chunk was written')
+            upload.offset = offset
+            upload.block_hashes = block_hashes
+
+            if offset < upload.size:
+                return upload, None, False
+            if block_length:
+                block_hashes += block.hexdigest()
+            return self._complete(upload, part_path, content_hash(block_hashes))
+
+    def abort(self, upload):
+        """Cancel an unfinished upload and remove its part file"""
+        if upload.status != UploadStatus.ACTIVE:
+            return upload
+        AssetUpload.objects.filter(pk=upload.pk).update(status=UploadStatus.ABORTED, updated_at=timezone.now())
+        upload.status = UploadStatus.ABORTED
+        self._remove_part(upload)
+        return upload
+
+    def _complete(self, upload, part_path, checksum):
+        """Store the finished file under its hash and record the version"""
+        if upload.expected_checksum and upload.expected_checksum != checksum:
+            self._fail(upload, f'Content hash {checksum} does not match the expected {upload.expected_checksum}')
+            raise UploadError(upload.error)
+
+        blob_name = get_blob_name(checksum)
+        blob_path = default_storage.path(blob_name)
+        if os.path.exists(blob_path):
+            os.remove(part_path)
+        else:
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            os.replace(part_path, blob_path)
+
+        with transaction.atomic():
+            asset = Asset.objects.select_for_update().get(pk=upload.asset_id)
+            latest = asset.versions.order_by('-version_number').first()
+            created = not (latest and latest.checksum == checksum)
+            if created:
+                version = AssetVersion.objects.create(
+                    asset=asset,
+                    version_number=(latest.version_number if latest else 0) + 1,
+                    file=blob_name,
+                    original_filename=upload.filename,
+                    content_type=upload.content_type,
+                    size=upload.size,
+                    checksum=checksum,
+                    uploaded_by=upload.uploaded_by
+                )
+                now = timezone.now()
+                history = [AssetHistory(
+                    asset=asset,
+                    event_type=HistoryEventType.VERSION_UPLOAD,
+                    comment=f'Version {version.version_number} uploaded',
+                    user=upload.uploaded_by,
+                    created_at=now
+                )]
+                events = [(asset.pk, {
+                    'event': 'versionUploaded',
+                    'asset_id': asset.pk,
+                    'version_number': version.version_number,
+                    'uploaded_by': upload.uploaded_by_id,
+                })]
+                # The new version has not been reviewed, so an approved
+                # asset goes back to review
+                if asset.status == AssetStatus.APPROVED:
+                    Asset.objects.filter(pk=asset.pk).update(status=AssetStatus.PENDING_REVIEW, updated_at=now)
+                    history.append(AssetHistory(
+                        asset=asset,
+                        event_type=HistoryEventType.STATUS_CHANGED,
+                        from_status=AssetStatus.APPROVED,
+                        to_status=AssetStatus.PENDING_REVIEW,
+                        comment=f'Version {version.version_number} needs review',
+                        user=upload.uploaded_by,
+                        created_at=now
+                    ))
+                    events.append((asset.pk, {
+                        'event': 'statusChanged',
+                        'asset_id': asset.pk,
+                        'from': AssetStatus.APPROVED,
+                        'to': AssetStatus.PENDING_REVIEW,
+                        'changed_by': upload.uploaded_by_id,
+                    }))
+                else:
+                    Asset.objects.filter(pk=asset.pk).update(updated_at=now)
+                AssetHistory.objects.bulk_create(history)
+                publish_asset_events(events)
+            else:
+                version = latest
+
+            AssetUpload.objects.filter(pk=upload.pk).update(
+                status=UploadStatus.COMPLETED,
+                version=version,
+                updated_at=timezone.now()
+            )
+            upload.status = UploadStatus.COMPLETED
+            upload.version = version
+
+        return upload, version, created
+
+    def _fail(self, upload, error):
+        AssetUpload.objects.filter(pk=upload.pk).update(
+            status=UploadStatus.FAILED,
+            error=error[:255],
+            updated_at=timezone.now()
+        )
+        upload.status = UploadStatus.FAILED
+        upload.error = error[:255]
+        self._remove_part(upload)
+
+    def _remove_part(self, upload):
+        try:
+            os.remove(self.get_part_path(upload))
+        except FileNotFoundError:
+            pass
+
+    def purge_expired(self, now=None):
+        """Abort active uploads idle longer than ASSET_UPLOAD_EXPIRY_HOURS"""
+        now = now or timezone.now()
+        cutoff = now - timedelta(hours=settings.ASSET_UPLOAD_EXPIRY_HOURS)
+        expired = list(AssetUpload.objects.filter(status=UploadStatus.ACTIVE, updated_at__lt=cutoff))
+        for upload in expired:
+            self.abort(upload)
+        return expired
@@ -0,0 +1,158 @@
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from access_control.models import RolePermission, UserRole
+from assets.models import Asset, AssetStatus, AssetVersion
+from assets.services.uploads import get_blob_name
+from core.models import Organization, Permission, Role
+from teams.models import Team, TeamMember
+
+User = get_user_model()
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT,
+    ASSET_DOWNLOAD_ACCEL_REDIRECT=True,
+    ASSET_DOWNLOAD_ACCEL_PREFIX='/protected-media/'
+)
+class AssetDownloadTest(TestCase):
+    """
+    Test cases for asset downloads handed off to nginx
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.member = User.objects.create_user(
+            username='member',
+            email='member@example.com',
+            password='testpass123'
+        )
+        organization = Organization.objects.create(name='Agency')
+        team = Team.objects.create(name='Creative', organization_id=organization.id)
+        TeamMember.objects.create(user_id=self.owner.id, team_id=team.id)
+        TeamMember.objects.create(user_id=self.member.id, team_id=team.id)
+        self.asset = Asset.objects.create(owner=self.owner, team=team, status=AssetStatus.APPROVED)
+        self.v1 = self.create_version(1, 'a' * 64, b'first')
+        self.v2 = self.create_version(2, 'b' * 64, b'second')
+        Asset.objects.filter(pk=self.asset.pk).update(approved_version=self.v2)
+        self.client.force_authenticate(user=self.owner)
+        self.url = reverse('assets:asset-download', args=[self.asset.id])
+
+    def create_version(self, number, checksum, content):
+        name = get_blob_name(checksum)
+        if not default_storage.exists(name):
+            default_storage.save(name, ContentFile(content))
+        return AssetVersion.objects.create(
+            asset=self.asset,
+            version_number=number,
+            file=name,
+            original_filename=f'banner v{number}.png',
+            content_type='image/png',
+            size=len(content),
+            checksum=checksum,
+            uploaded_by=self.owner
+        )
+
+    def test_download_redirects_to_nginx(self):
+        """Test the latest version is handed to nginx with a strong ETag"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{get_blob_name("b" * 64)}')
+        self.assertEqual(response['ETag'], f'"{"b" * 64}"')
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="banner v2.png"')
+        self.assertEqual(response.content, b'')
+
+    def test_matching_etag_returns_not_modified(self):
+        """Test a cached copy is revalidated without handing off the file"""
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=f'"{"b" * 64}"')
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotIn('X-Accel-Redirect', response)
+
+    def test_unapproved_asset_has_no_default_download(self):
+        """Test an asset never approved has no default download, but its owner can fetch versions"""
+        Asset.objects.filter(pk=self.asset.pk).update(status=AssetStatus.UNDER_REVIEW, approved_version=None)
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(self.url, {'version': 1})
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{get_blob_name("a" * 64)}')
+        self.assertEqual(self.client.get(self.url, {'version': 9}).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_version_uploaded_after_approval_is_not_served(self):
+        """Test the default download stays on the approved version"""
+        self.create_version(3, 'c' * 64, b'third')
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{get_blob_name("b" * 64)}')
+
+    def test_unapproved_versions_need_owner_or_approver(self):
+        """Test team members only get the approved version, approvers any version"""
+        self.client.force_authenticate(user=self.member)
+
+        self.assertEqual(self.client.get(self.url, {'version': 1}).status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.client.get(self.url, {'version': 2}).status_code, status.HTTP_200_OK)
+
+        role = Role.objects.create(organization=Organization.objects.get(), name='Approver', level=2)
+        RolePermission.objects.create(role=role, permission=Permission.objects.create(module='ASSET', action='APPROVE'))
+        UserRole.objects.create(user=self.member, role=role)
+
+        response = self.client.get(self.url, {'version': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{get_blob_name("a" * 64)}')
+
+    def test_download_requires_access(self):
+        """Test other users cannot download the asset"""
+        self.client.force_authenticate(user=self.other_user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn('X-Accel-Redirect', response)
+
+    @override_settings(ASSET_DOWNLOAD_ACCEL_REDIRECT=False)
+    def test_download_without_nginx(self):
+        """Test Django streams the file when X-Accel-Redirect is disabled"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), b'second')
+        self.assertEqual(response['ETag'], f'"{"b" * 64}"')
+
+    def test_version_file_url_is_download_link(self):
+        """Test version listings link to the authorized download"""
+        response = self.client.get(reverse('assets:asset-versions', args=[self.asset.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['results'][0]['file_url'],
+            f'http://testserver{self.url}?version=2'
+        )
@@ -0,0 +1,160 @@
+import json
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from access_control.models import RolePermission, UserRole
+from assets.models import Asset, AssetStatus
+from assets.services.review import AssetReviewService
+from core.models import Organization, Permission, Role
+from core.realtime.layers import get_channel_layer
+from core.realtime.websocket import websocket_application
+from teams.models import Team, TeamMember
+
+User = get_user_model()
+
+
+@override_settings(REALTIME_CHANNEL_LAYER='memory')
+class AssetRealtimeTest(TransactionTestCase):
+    """
+    Test cases for /ws/assets/<id> subscriptions
+
+    Publishing happens when transactions commit, so these tests commit for
+    real instead of running in a rolled back transaction.
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.reviewer = User.objects.create_user(
+            username='reviewer',
+            email='reviewer@example.com',
+            password='testpass123'
+        )
+        self.outsider = User.objects.create_user(
+            username='outsider',
+            email='outsider@example.com',
+            password='testpass123'
+        )
+        organization = Organization.objects.create(name='Agency')
+        role = Role.objects.create(organization=organization, name='Approver', level=2)
+        RolePermission.objects.create(
+            role=role,
+            permission=Permission.objects.create(module='ASSET', action='APPROVE')
+        )
+        UserRole.objects.create(user=self.reviewer, role=role)
+        team = Team.objects.create(name='Creative', organization_id=organization.id)
+        TeamMember.objects.create(user_id=self.owner.id, team_id=team.id)
+        TeamMember.objects.create(user_id=self.reviewer.id, team_id=team.id)
+        self.asset = Asset.objects.create(owner=self.owner, team=team, status=AssetStatus.PENDING_REVIEW)
+
+    async def connect(self, path, user=None, token=None):
+        if token is None and user is not None:
+            token = AccessToken.for_user(user)
+        scope = {
+            'type': 'websocket',
+            'path': path,
+            'query_string': f'token={token}'.encode() if token else b'',
+            'headers': [],
+        }
+        communicator = ApplicationCommunicator(websocket_application, scope)
+        await communicator.send_input({'type': 'websocket.connect'})
+        return communicator, await communicator.receive_output(timeout=5)
+
+    async def receive_event(self, communicator):
+        message = await communicator.receive_output(timeout=5)
+        self.assertEqual(message['type'], 'websocket.send')
+        return json.loads(message['text'])
+
+    async def test_subscriber_receives_review(self):
+        """Test the owner's connection gets the status change of a review"""
+        communicator, message = await self.connect(f'/ws/assets/{self.asset.id}/', self.owner)
+        self.assertEqual(message, {'type': 'websocket.accept'})
+
+        await sync_to_async(AssetReviewService().review)(
+            self.reviewer,
+            [{'asset_id': self.asset.id, 'action': 'approve'}]
+        )
+
+        event = await self.receive_event(communicator)
+        self.assertEqual(event['event'], 'statusChanged')
+        self.assertEqual(event['asset_id'], self.asset.id)
+        self.assertEqual((event['from'], event['to']), (AssetStatus.PENDING_REVIEW, AssetStatus.APPROVED))
+        self.assertEqual(event['changed_by'], self.reviewer.id)
+        await communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        await communicator.wait(timeout=5)
+
+    async def test_subscriptions_are_authorized(self):
+        """Test anonymous users, other users and unknown topics are refused"""
+        path = f'/ws/assets/{self.asset.id}/'
+        for user, target, code in [
+            (None, path, 4401),
+            (self.outsider, path, 4403),
+            (self.owner, '/ws/assets/999999/', 4403),
+            (self.owner, f'/ws/unknown/{self.asset.id}/', 4404),
+            (self.owner, '/ws/assets/abc/', 4404),
+        ]:
+            _, message = await self.connect(target, user)
+            self.assertEqual(message, {'type': 'websocket.close', 'code': code}, target)
+
+    @override_settings(REALTIME_HEARTBEAT_SECONDS=1)
+    async def test_subscription_is_closed_when_access_is_lost(self):
+        """Test open connections are closed once the user can no longer see the asset"""
+        communicator, message = await self.connect(f'/ws/assets/{self.asset.id}/', self.reviewer)
+        self.assertEqual(message, {'type': 'websocket.accept'})
+        self.assertEqual(await self.receive_event(communicator), {'event': 'heartbeat'})
+
+        await sync_to_async(TeamMember.objects.filter(user_id=self.reviewer.id).delete)()
+
+        message = await communicator.receive_output(timeout=5)
+        self.assertEqual(message, {'type': 'websocket.close', 'code': 4403})
+        await communicator.wait(timeout=5)
+
+    @override_settings(REALTIME_HEARTBEAT_SECONDS=1)
+    async def test_subscription_is_closed_when_asset_is_deleted(self):
+        """Test open connections are closed once the asset is soft-deleted"""
+        communicator, message = await self.connect(f'/ws/assets/{self.asset.id}/', self.owner)
+        self.assertEqual(message, {'type': 'websocket.accept'})
+
+        await sync_to_async(Asset.objects.filter(pk=self.asset.id).update)(is_deleted=True)
+
+        message = await communicator.receive_output(timeout=5)
+        self.assertEqual(message, {'type': 'websocket.close', 'code': 4403})
+        await communicator.wait(timeout=5)
+
+    async def test_subscription_is_closed_when_token_expires(self):
+        """Test connections opened with a JWT are closed at the token's expiry"""
+        token = AccessToken.for_user(self.owner)
+        token.set_exp(lifetime=timedelta(seconds=2))
+        communicator, message = await self.connect(f'/ws/assets/{self.asset.id}/', token=token)
+        self.assertEqual(message, {'type': 'websocket.accept'})
+
+        message = await communicator.receive_output(timeout=5)
+        self.assertEqual(message, {'type': 'websocket.close', 'code': 4401})
+        await communicator.wait(timeout=5)
+
+    @override_settings(REALTIME_CHANNEL_LAYER='postgres')
+    async def test_postgres_layer_delivers_committed_events(self):
+        """Test events published through LISTEN/NOTIFY reach the subscriber"""
+        self.addCleanup(get_channel_layer().close)
+        communicator, message = await self.connect(f'/ws/assets/{self.asset.id}/', self.owner)
+        self.assertEqual(message, {'type': 'websocket.accept'})
+
+        await sync_to_async(AssetReviewService().review)(
+            self.reviewer,
+            [{'asset_id': self.asset.id, 'action': 'reject', 'comment': 'Missing logo'}]
+        )
+
+        event = await self.receive_event(communicator)
+        self.assertEqual(event['event'], 'statusChanged')
+        self.assertEqual(event['to'], AssetStatus.REJECTED)
+        await communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        await communicator.wait(timeout=5)
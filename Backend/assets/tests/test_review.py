@@ -0,0 +1,206 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from access_control.models import RolePermission, UserRole
+from assets.models import Asset, AssetHistory, AssetStatus, AssetVersion, HistoryEventType
+from core.models import Organization, Permission, Role
+from teams.models import Team, TeamMember
+from user_preferences.models import PendingNotification
+
+User = get_user_model()
+
+
+class BulkReviewTest(TestCase):
+    """
+    Test cases for the bulk asset review engine
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.reviewer = User.objects.create_user(
+            username='reviewer',
+            email='reviewer@example.com',
+            password='testpass123'
+        )
+        organization = Organization.objects.create(name='Agency')
+        role = Role.objects.create(organization=organization, name='Approver', level=2)
+        RolePermission.objects.create(
+            role=role,
+            permission=Permission.objects.create(module='ASSET', action='APPROVE')
+        )
+        UserRole.objects.create(user=self.reviewer, role=role)
+        self.team = Team.objects.create(name='Creative', organization_id=organization.id)
+        TeamMember.objects.create(user_id=self.owner.id, team_id=self.team.id)
+        TeamMember.objects.create(user_id=self.reviewer.id, team_id=self.team.id)
+        self.client.force_authenticate(user=self.reviewer)
+        self.url = reverse('assets:asset-bulk-review')
+
+    def create_assets(self, count, status=AssetStatus.PENDING_REVIEW):
+        return Asset.objects.bulk_create([
+            Asset(owner=self.owner, team=self.team, status=status) for _ in range(count)
+        ])
+
+    def test_bulk_review_reports_each_asset(self):
+        """Test approvals, rejections and invalid assets get their own results"""
+        pending = self.create_assets(2)
+        draft, = self.create_assets(1, status=AssetStatus.DRAFT)
+
+        response = self.client.post(self.url, {
+            'reviewer_id': self.reviewer.id,
+            'reviews': [
+                {'asset_id': pending[0].id, 'action': 'approve', 'comment': 'Well done'},
+                {'asset_id': pending[1].id, 'action': 'reject', 'comment': 'Missing logo'},
+                {'asset_id': draft.id, 'action': 'approve'},
+                {'asset_id': 999999, 'action': 'approve'},
+            ]
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertEqual([r['success'] for r in results], [True, True, False, False])
+        self.assertEqual(results[0]['status'], AssetStatus.APPROVED)
+        self.assertEqual(results[1]['status'], AssetStatus.REJECTED)
+        self.assertEqual(results[2]['status'], AssetStatus.DRAFT)
+        self.assertEqual(results[3]['error'], 'Asset not found')
+
+        statuses = dict(Asset.objects.values_list('id', 'status'))
+        self.assertEqual(statuses[pending[0].id], AssetStatus.APPROVED)
+        self.assertEqual(statuses[pending[1].id], AssetStatus.REJECTED)
+        self.assertEqual(statuses[draft.id], AssetStatus.DRAFT)
+
+        history = AssetHistory.objects.get(asset=pending[1])
+        self.assertEqual(history.event_type, HistoryEventType.STATUS_CHANGED)
+        self.assertEqual((history.from_status, history.to_status), (AssetStatus.PENDING_REVIEW, AssetStatus.REJECTED))
+        self.assertEqual(history.comment, 'Missing logo')
+        self.assertEqual(AssetHistory.objects.count(), 2)
+
+        notifications = PendingNotification.objects.filter(user=self.owner, sent_at__isnull=True)
+        self.assertEqual(notifications.count(), 2)
+
+    def test_query_count_does_not_grow_with_batch(self):
+        """Test a large batch runs the same number of queries as a small one"""
+        small = self.create_assets(2)
+        large = self.create_assets(200)
+
+        counts = []
+        for assets in (small, large):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    self.url,
+                    {'asset_ids': [asset.id for asset in assets], 'action': 'approve'},
+                    format='json'
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            counts.append(len(queries))
+
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(Asset.objects.filter(status=AssetStatus.APPROVED).count(), 202)
+        self.assertEqual(AssetHistory.objects.count(), 202)
+
+    def test_approval_records_latest_version(self):
+        """Test approving an asset records the version that was approved"""
+        asset, = self.create_assets(1)
+        versions = [
+            AssetVersion.objects.create(
+                asset=asset, version_number=number, file=f'assets/v{number}', size=1, checksum=str(number) * 64
+            )
+            for number in (1, 2)
+        ]
+        rejected, = self.create_assets(1)
+
+        self.client.post(self.url, {'reviews': [
+            {'asset_id': asset.id, 'action': 'approve'},
+            {'asset_id': rejected.id, 'action': 'reject'},
+        ]}, format='json')
+
+        self.assertEqual(Asset.objects.get(pk=asset.pk).approved_version, versions[1])
+        self.assertIsNone(Asset.objects.get(pk=rejected.pk).approved_version)
+
+    def test_requires_approve_permission(self):
+        """Test users without ASSET:APPROVE cannot review, even their own assets"""
+        asset, = self.create_assets(1)
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.post(self.url, {'asset_ids': [asset.id], 'action': 'approve'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Asset.objects.get().status, AssetStatus.PENDING_REVIEW)
+        self.assertFalse(AssetHistory.objects.exists())
+
+    def test_deleted_roles_do_not_grant_review(self):
+        """Test soft-deleted role assignments and role permissions no longer grant ASSET:APPROVE"""
+        asset, = self.create_assets(1)
+        for model in (UserRole, RolePermission):
+            model.objects.update(is_deleted=True)
+
+            response = self.client.post(self.url, {'asset_ids': [asset.id], 'action': 'approve'}, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+            model.objects.update(is_deleted=False)
+        self.assertEqual(Asset.objects.get().status, AssetStatus.PENDING_REVIEW)
+
+    def test_invalid_requests_are_rejected(self):
+        """Test duplicate assets, unknown actions and another reviewer_id are rejected"""
+        asset, = self.create_assets(1)
+
+        for payload in [
+            {'asset_ids': [asset.id, asset.id], 'action': 'approve'},
+            {'asset_ids': [asset.id], 'action': 'publish'},
+            {'reviews': []},
+        ]:
+            response = self.client.post(self.url, payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, payload)
+
+        response = self.client.post(
+            self.url,
+            {'reviewer_id': self.owner.id, 'asset_ids': [asset.id], 'action': 'approve'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Asset.objects.get().status, AssetStatus.PENDING_REVIEW)
+
+    def test_submit_and_history(self):
+        """Test the owner submits a draft and the history lists the review"""
+        asset, = self.create_assets(1, status=AssetStatus.DRAFT)
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.put(reverse('assets:asset-submit', args=[asset.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], AssetStatus.PENDING_REVIEW)
+        self.assertEqual(
+            self.client.put(reverse('assets:asset-submit', args=[asset.id])).status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+
+        self.client.force_authenticate(user=self.reviewer)
+        self.client.post(self.url, {'asset_ids': [asset.id], 'action': 'approve'}, format='json')
+        response = self.client.get(reverse('assets:asset-history', args=[asset.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(item['from'], item['to'], item['by_user']) for item in response.data['results']],
+            [
+                (AssetStatus.PENDING_REVIEW, AssetStatus.APPROVED, self.reviewer.id),
+                (AssetStatus.DRAFT, AssetStatus.PENDING_REVIEW, self.owner.id),
+            ]
+        )
+
+    def test_status_is_read_only(self):
+        """Test the status cannot be changed by editing the asset"""
+        asset, = self.create_assets(1)
+        self.client.force_authenticate(user=self.owner)
+
+        self.client.patch(reverse('assets:asset-detail', args=[asset.id]), {'status': 'Approved'}, format='json')
+
+        self.assertEqual(Asset.objects.get().status, AssetStatus.PENDING_REVIEW)
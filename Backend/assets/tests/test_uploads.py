@@ -0,0 +1,208 @@
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from datetime import timedelta
+
+from assets.models import Asset, AssetStatus, AssetUpload, AssetVersion, HistoryEventType, UploadStatus
+from assets.services.uploads import AssetUploadService, compute_content_hash
+
+User = get_user_model()
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, ASSET_UPLOAD_MAX_CHUNK_SIZE=64)
+@mock.patch('assets.services.uploads.READ_SIZE', 5)
+@mock.patch('assets.services.uploads.BLOCK_SIZE', 8)
+class AssetUploadTest(TestCase):
+    """
+    Test cases for resumable asset version uploads
+
+    Small block and read sizes make chunks cross hash block boundaries.
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.asset = Asset.objects.create(owner=self.owner)
+        self.client.force_authenticate(user=self.owner)
+        self.content = b'The quick brown fox jumps over the lazy dog'
+
+    def start(self, asset=None, content=None, **extra):
+        asset = asset or self.asset
+        content = self.content if content is None else content
+        response = self.client.post(
+            reverse('assets:asset-start-upload', args=[asset.id]),
+            {'filename': 'banner.png', 'content_type': 'image/png', 'size': len(content), **extra},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        return response.data['upload_url']
+
+    def put(self, url, start, data, size=None):
+        size = len(self.content) if size is None else size
+        return self.client.generic(
+            'PUT', url, data,
+            content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes {start}-{start + len(data) - 1}/{size}'
+        )
+
+    def upload(self, asset=None, content=None, chunk=10):
+        content = self.content if content is None else content
+        url = self.start(asset, content)
+        for start in range(0, len(content), chunk):
+            response = self.put(url, start, content[start:start + chunk], size=len(content))
+        return response
+
+    def test_chunked_upload_creates_version(self):
+        """Test chunks of odd sizes are assembled into a version with the content hash"""
+        response = self.upload(chunk=7)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(response.data['deduplicated'])
+        version = AssetVersion.objects.get(asset=self.asset)
+        self.assertEqual(version.version_number, 1)
+        self.assertEqual(version.size, len(self.content))
+        self.assertEqual(version.checksum, compute_content_hash(io.BytesIO(self.content)))
+        self.assertEqual(response.data['version']['checksum'], version.checksum)
+        with version.file.open('rb') as f:
+            self.assertEqual(f.read(), self.content)
+        self.assertFalse(os.path.exists(AssetUploadService().get_part_path(AssetUpload.objects.get())))
+
+    def test_chunk_must_start_at_offset(self):
+        """Test a chunk not starting at the stored offset is rejected with the offset"""
+        url = self.start()
+        self.put(url, 0, self.content[:10])
+
+        response = self.put(url, 20, self.content[20:30])
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['offset'], 10)
+        status_response = self.client.generic(
+            'PUT', url, b'', HTTP_CONTENT_RANGE=f'bytes */{len(self.content)}'
+        )
+        self.assertEqual(status_response.data['offset'], 10)
+
+    def test_interrupted_chunk_is_discarded(self):
+        """Test bytes written past the offset by a failed request are overwritten on resume"""
+        url = self.start()
+        self.put(url, 0, self.content[:10])
+        upload = AssetUpload.objects.get()
+        with open(AssetUploadService().get_part_path(upload), 'ab') as part:
+            part.write(b'garbage')
+
+        response = self.put(url, 10, self.content[10:])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        with AssetVersion.objects.get().file.open('rb') as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_same_content_is_deduplicated(self):
+        """Test re-uploading the latest content adds no version and other assets share the file"""
+        self.upload()
+        response = self.upload()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['deduplicated'])
+        self.assertEqual(AssetVersion.objects.filter(asset=self.asset).count(), 1)
+
+        other_asset = Asset.objects.create(owner=self.owner)
+        response = self.upload(asset=other_asset)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        files = set(AssetVersion.objects.values_list('file', flat=True))
+        self.assertEqual(len(files), 1)
+
+    def test_new_content_adds_version(self):
+        """Test different content becomes the next version"""
+        self.upload()
+        response = self.upload(content=b'Another file')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['version']['version_number'], 2)
+
+    def test_new_version_sends_approved_asset_back_to_review(self):
+        """Test a version uploaded after approval must be reviewed again"""
+        self.upload()
+        Asset.objects.filter(pk=self.asset.pk).update(status=AssetStatus.APPROVED)
+
+        self.upload(content=b'Another file')
+
+        self.asset.refresh_from_db()
+        self.assertEqual(self.asset.status, AssetStatus.PENDING_REVIEW)
+        entry = self.asset.history.get(event_type=HistoryEventType.STATUS_CHANGED)
+        self.assertEqual((entry.from_status, entry.to_status), (AssetStatus.APPROVED, AssetStatus.PENDING_REVIEW))
+        self.assertEqual(entry.user, self.owner)
+
+    def test_checksum_mismatch_fails_upload(self):
+        """Test an upload not matching the announced checksum fails"""
+        url = self.start(checksum='0' * 64)
+
+        response = self.put(url, 0, self.content)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(AssetUpload.objects.get().status, UploadStatus.FAILED)
+        self.assertFalse(AssetVersion.objects.exists())
+
+    def test_invalid_content_range(self):
+        """Test chunks with a wrong total size or too large are rejected"""
+        url = self.start()
+
+        response = self.put(url, 0, self.content[:10], size=100)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        with override_settings(ASSET_UPLOAD_MAX_CHUNK_SIZE=8):
+            response = self.put(url, 0, self.content[:10])
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(AssetUpload.objects.get().offset, 0)
+
+    def test_upload_requires_access(self):
+        """Test other users cannot start or continue uploads of an asset"""
+        url = self.start()
+        self.client.force_authenticate(user=self.other_user)
+
+        self.assertEqual(self.put(url, 0, self.content).status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.post(
+            reverse('assets:asset-start-upload', args=[self.asset.id]),
+            {'filename': 'x.png', 'size': 1},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_purge_expired_uploads(self):
+        """Test idle uploads are aborted and their part files removed"""
+        url = self.start()
+        self.put(url, 0, self.content[:10])
+        upload = AssetUpload.objects.get()
+        AssetUpload.objects.filter(pk=upload.pk).update(updated_at=timezone.now() - timedelta(hours=48))
+
+        call_command('purge_asset_uploads', stdout=io.StringIO())
+
+        upload.refresh_from_db()
+        self.assertEqual(upload.status, UploadStatus.ABORTED)
+        self.assertFalse(os.path.exists(AssetUploadService().get_part_path(upload)))
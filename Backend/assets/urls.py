@@ -0,0 +1,20 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from . import views
+
+# Create router for ViewSets
+router = DefaultRouter()
+router.register(r'assets', views.AssetViewSet, basename='asset')
+
+app_name = 'assets'
+
+urlpatterns = [
+    path('', include(router.urls)),
+
+    # Resumable version uploads
+    path(
+        'assets/<int:asset_id>/versions/uploads/<uuid:upload_id>/',
+        views.AssetUploadView.as_view(),
+        name='asset-upload'
+    ),
+]
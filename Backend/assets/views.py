@@ -0,0 +1,254 @@
+import logging
+import re
+
+from django.conf import settings
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from teams.models import TeamMember
+from .models import Asset, AssetUpload, UploadStatus
+from .serializers import (
+    AssetHistorySerializer, AssetSerializer, AssetUploadSerializer, AssetVersionSerializer,
+    BulkReviewSerializer
+)
+from .services.downloads import serve_version
+from .services.review import AssetReviewService
+from .services.uploads import AssetUploadService, UploadConflict, UploadError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+CONTENT_RANGE = re.compile(r'^bytes (?:(\d+)-(\d+)|\*)/(\d+)$')
+
+
+class AssetViewSet(viewsets.ModelViewSet):
+    """
+    ViewSet for Asset management
+
+    Users see the assets they own and those of their teams. Deleting an
+    asset only marks it deleted.
+    """
+
+    serializer_class = AssetSerializer
+    permission_classes = [IsAuthenticated]
+    filterset_fields = ['status', 'team', 'task_id']
+    ordering_fields = ['created_at', 'updated_at']
+    ordering = ['-created_at']
+
+    def get_queryset(self):
+        """Get assets based on user authorization"""
+        return Asset.objects.visible_to(self.request.user)
+
+    def _check_team(self, serializer):
+        """Verify the user belongs to the team an asset is assigned to"""
+        team = serializer.validated_data.get('team')
+        user = self.request.user
+        if team and not user.is_superuser and not TeamMember.objects.filter(
+            user_id=user.id, team_id=team.id
+        ).exists():
+            raise PermissionDenied('You are not a member of this team.')
+
+    def perform_create(self, serializer):
+        """Create asset owned by the current user"""
+        self._check_team(serializer)
+        serializer.save(owner=self.request.user)
+
+    def perform_update(self, serializer):
+        """Update asset with verification"""
+        self._check_team(serializer)
+        serializer.save()
+
+    def perform_destroy(self, instance):
+        """Soft delete the asset"""
+        Asset.objects.filter(pk=instance.pk).update(is_deleted=True, updated_at=timezone.now())
+
+    @action(detail=True, methods=['get'])
+    def versions(self, request, pk=None):
+        """List the versions of an asset, newest first"""
+        asset = self.get_object()
+        page = self.paginate_queryset(asset.versions.all())
+        serializer = AssetVersionSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=['get'])
+    def history(self, request, pk=None):
+        """List the review history of an asset, newest first"""
+        asset = self.get_object()
+        page = self.paginate_queryset(asset.history.all())
+        serializer = AssetHistorySerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=['put'])
+    def submit(self, request, pk=None):
+        """Submit a draft or rejected asset for review"""
+        asset = self.get_object()
+        result, = AssetReviewService().submit(request.user, [asset.pk])
+        if not result['success']:
+            return Response({"error": result['error']}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'id': asset.pk, 'status': result['status'], 'submitted_at': result['reviewed_at']})
+
+    @action(detail=False, methods=['post'], url_path='bulk-review')
+    def bulk_review(self, request):
+        """
+        Approve or reject many assets at once
+
+        Needs the ASSET:APPROVE permission. Returns one result per asset;
+        invalid assets are reported without failing the others.
+        """
+        serializer = BulkReviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        reviewer_id = serializer.validated_data.get('reviewer_id')
+        if reviewer_id is not None and reviewer_id != request.user.id:
+            raise PermissionDenied('reviewer_id must be the authenticated user.')
+
+        results = AssetReviewService().review(request.user, serializer.validated_data['reviews'])
+        reviewed = sum(result['success'] for result in results)
+        logger.info(f"User {request.user.id} bulk reviewed {reviewed}/{len(results)} assets")
+        return Response({'results': results})
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        """
+        Download the latest approved version of an asset
+
+        ?version=<number> downloads a given version; versions other than the
+        approved one are only available to the asset owner and users with
+        ASSET:APPROVE. The file itself is sent by nginx, see serve_version.
+        """
+        asset = self.get_object()
+        version_number = request.query_params.get('version')
+        if version_number is not None:
+            if not version_number.isdigit():
+                return Response({"error": "version must be a version number"}, status=status.HTTP_400_BAD_REQUEST)
+            version = asset.versions.filter(version_number=int(version_number)).first()
+            if version is None:
+                return Response({"error": "Version not found"}, status=status.HTTP_404_NOT_FOUND)
+            if (
+                version.pk != asset.approved_version_id and asset.owner_id != request.user.id
+                and not AssetReviewService().can_approve(request.user)
+            ):
+                raise PermissionDenied('You can only download the approved version of this asset.')
+        else:
+            version = asset.approved_version
+
+        if version is None:
+            return Response({"error": "No approved version found"}, status=status.HTTP_404_NOT_FOUND)
+        return serve_version(request, version)
+
+    @action(detail=True, methods=['post'], url_path='versions/uploads')
+    def start_upload(self, request, pk=None):
+        """
+        Start a resumable upload of a new version
+
+        The file is then sent with PUT requests to the returned upload's
+        URL, see AssetUploadView.
+        """
+        asset = self.get_object()
+        serializer = AssetUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = AssetUploadService().start(
+            asset,
+            request.user,
+            filename=serializer.validated_data['filename'],
+            size=serializer.validated_data['size'],
+            content_type=serializer.validated_data.get('content_type', ''),
+            expected_checksum=serializer.validated_data.get('expected_checksum', '')
+        )
+        data = AssetUploadSerializer(upload, context=self.get_serializer_context()).data
+        data['upload_url'] = request.build_absolute_uri(
+            reverse('assets:asset-upload', args=[asset.pk, upload.pk])
+        )
+        data['max_chunk_size'] = settings.ASSET_UPLOAD_MAX_CHUNK_SIZE
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class AssetUploadView(APIView):
+    """
+    Resumable upload of an asset version
+
+    GET reports the upload offset, DELETE aborts the upload and PUT sends
+    the next chunk as the raw request body with a Content-Range header
+    ("bytes <first>-<last>/<size>"; "bytes */<size>" with an empty body
+    queries the offset). A chunk must start at the current offset; after
+    a failed request, query the offset and continue from there. Chunks
+    that are multiples of 4 MiB avoid re-reading data to continue the
+    content hash.
+
+    The body is read as a stream and never parsed, so no parser classes
+    are used.
+    """
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = []
+
+    def get_upload(self, request, asset_id, upload_id):
+        uploads = AssetUpload.objects.select_related('version').filter(
+            asset__in=Asset.objects.visible_to(request.user),
+            asset_id=asset_id
+        )
+        if not request.user.is_superuser:
+            uploads = uploads.filter(uploaded_by=request.user)
+        return get_object_or_404(uploads, pk=upload_id)
+
+    def get(self, request, asset_id, upload_id):
+        upload = self.get_upload(request, asset_id, upload_id)
+        return Response(AssetUploadSerializer(upload, context={'request': request}).data)
+
+    def delete(self, request, asset_id, upload_id):
+        upload = self.get_upload(request, asset_id, upload_id)
+        AssetUploadService().abort(upload)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def put(self, request, asset_id, upload_id):
+        upload = self.get_upload(request, asset_id, upload_id)
+
+        match = CONTENT_RANGE.match(request.META.get('HTTP_CONTENT_RANGE', ''))
+        if not match or int(match.group(3)) != upload.size:
+            return Response(
+                {"error": f"Content-Range must be 'bytes <first>-<last>/{upload.size}' or 'bytes */{upload.size}'"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if match.group(1) is None:
+            return Response(AssetUploadSerializer(upload, context={'request': request}).data)
+
+        start, last = int(match.group(1)), int(match.group(2))
+        length = last - start + 1
+        if length <= 0:
+            return Response({"error": "Invalid Content-Range"}, status=status.HTTP_400_BAD_REQUEST)
+        if length > settings.ASSET_UPLOAD_MAX_CHUNK_SIZE:
+            return Response(
+                {"error": f"Chunks cannot be larger than {settings.ASSET_UPLOAD_MAX_CHUNK_SIZE} bytes"},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+        if request.META.get('CONTENT_LENGTH') != str(length):
+            return Response(
+                {"error": "Content-Length must match the Content-Range"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if upload.status == UploadStatus.COMPLETED:
+            return Response(AssetUploadSerializer(upload, context={'request': request}).data)
+        if upload.status == UploadStatus.ACTIVE and upload.is_expired:
+            AssetUploadService().abort(upload)
+            return Response({"error": "Upload expired"}, status=status.HTTP_410_GONE)
+
+        try:
+            upload, version, created = AssetUploadService().append(upload, request.stream, start, length)
+        except UploadConflict as e:
+            return Response({"error": str(e), "offset": e.offset}, status=status.HTTP_409_CONFLICT)
+        except UploadError as e:
+            return Response({"error": str(e), "offset": e.offset}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = AssetUploadSerializer(upload, context={'request': request}).data
+        if version is None:
+            return Response(data)
+
+        logger.info(f"Asset {upload.asset_id} upload {upload.pk} completed as version {version.version_number}")
+        data['deduplicated'] = not created
+        return Response(data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
@@ -0,0 +1,89 @@
+from django.contrib import admin
+from .models import BudgetApprovalRecord, BudgetLedgerEntry, BudgetPool, BudgetRequest, PendingApproval
+
+
+class BudgetApprovalRecordInline(admin.TabularInline):
+    """Inline display of the approval history"""
+    model = BudgetApprovalRecord
+    extra = 0
+    can_delete = False
+    fields = ['stage', 'role', 'user', 'decision', 'comment', 'created_at']
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(BudgetRequest)
+class BudgetRequestAdmin(admin.ModelAdmin):
+    """
+    Admin interface for BudgetRequest model
+    """
+
+    list_display = ['id', 'task_id', 'requested_by', 'team', 'amount', 'currency', 'status', 'current_stage', 'submitted_at']
+    list_filter = ['status', 'is_escalated', 'currency', 'submitted_at']
+    search_fields = ['requested_by__username', 'requested_by__email', 'team__name', 'notes']
+    list_select_related = ['requested_by', 'team']
+    readonly_fields = [
+        'status', 'current_stage', 'required_stages', 'is_escalated', 'submitted_at', 'decided_at',
+        'created_at', 'updated_at'
+    ]
+    inlines = [BudgetApprovalRecordInline]
+
+
+@admin.register(PendingApproval)
+class PendingApprovalAdmin(admin.ModelAdmin):
+    """
+    Admin interface for PendingApproval model
+
+    Read-only: inbox entries are managed by the approval workflow
+    """
+
+    list_display = ['request', 'stage', 'approver', 'created_at']
+    search_fields = ['approver__username']
+    list_select_related = ['request', 'approver']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(BudgetPool)
+class BudgetPoolAdmin(admin.ModelAdmin):
+    """
+    Admin interface for BudgetPool model
+
+    Balances are read-only: they only change through the ledger
+    """
+
+    list_display = ['id', 'team', 'month', 'project_id', 'ad_channel', 'currency', 'total_amount', 'used_amount', 'available']
+    list_filter = ['month', 'currency']
+    search_fields = ['team__name', 'ad_channel']
+    list_select_related = ['team']
+    readonly_fields = ['total_amount', 'used_amount', 'available', 'created_at', 'updated_at']
+
+
+@admin.register(BudgetLedgerEntry)
+class BudgetLedgerEntryAdmin(admin.ModelAdmin):
+    """
+    Admin interface for BudgetLedgerEntry model
+
+    Read-only: the ledger is append-only
+    """
+
+    list_display = ['transaction_id', 'pool', 'account', 'entry_type', 'amount', 'budget_request', 'created_at']
+    list_filter = ['account', 'entry_type', 'created_at']
+    search_fields = ['transaction_id', 'comment']
+    list_select_related = ['pool']
+    date_hierarchy = 'created_at'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,54 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from budgets.services.escalation import BudgetEscalationService
+
+
+class Command(BaseCommand):
+    """
+    Escalate budget requests whose approval stage is overdue
+
+    Run once per tick from cron, or with --interval as a long-running
+    worker loop:
+
+        python manage.py escalate_budget_requests
+        python manage.py escalate_budget_requests --interval 300
+    """
+
+    help = 'Escalate budget requests left undecided past their due date to the next approver role level'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BudgetEscalationService.DEFAULT_BATCH_SIZE,
+            help='Number of requests escalated per transaction'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Keep running and repeat every N seconds (0 runs a single tick)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many requests are overdue'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be a positive integer')
+
+        service = BudgetEscalationService(batch_size=options['batch_size'])
+
+        while True:
+            if options['dry_run']:
+                self.stdout.write(self.style.SUCCESS(f'Due: {service.count_due()} requests'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'Escalated: {service.run()} requests'))
+
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
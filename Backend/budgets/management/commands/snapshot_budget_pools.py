@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from budgets.services.ledger import BudgetLedgerService
+
+
+class Command(BaseCommand):
+    """
+    Snapshot budget pool balances from the ledger and verify them
+
+    Run nightly from cron:
+
+        python manage.py snapshot_budget_pools
+        python manage.py snapshot_budget_pools --keep-days 90
+    """
+
+    help = 'Snapshot budget pool balances, report pools whose balances do not match their ledger and compact old snapshots'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BudgetLedgerService.DEFAULT_BATCH_SIZE,
+            help='Number of pools snapshotted per transaction'
+        )
+        parser.add_argument(
+            '--keep-days',
+            type=int,
+            default=0,
+            help='Delete snapshots older than N days that a newer snapshot replaces (0 keeps all)'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be a positive integer')
+
+        ledger = BudgetLedgerService(batch_size=options['batch_size'])
+        created, mismatched = ledger.take_snapshots()
+        self.stdout.write(self.style.SUCCESS(f'Snapshotted {created} pools'))
+        if mismatched:
+            self.stderr.write(self.style.ERROR(
+                f"Balances do not match the ledger for pools: {', '.join(map(str, mismatched))}"
+            ))
+
+        if options['keep_days']:
+            deleted = ledger.compact_snapshots(options['keep_days'])
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} old snapshots'))
@@ -0,0 +1,86 @@
+# Generated by Django 4.2.23 on 2026-10-19 02:09
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('teams', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BudgetRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.PositiveIntegerField()),
+                ('budget_pool_id', models.PositiveIntegerField(help_text='Budget pool the request draws on')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('currency', models.CharField(max_length=3)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('pendingSubmission', 'Pending Submission'), ('underApproval', 'Under Approval'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('locked', 'Locked')], default='draft', max_length=20)),
+                ('current_stage', models.PositiveSmallIntegerField(default=0)),
+                ('required_stages', models.PositiveSmallIntegerField(default=0)),
+                ('is_escalated', models.BooleanField(default=False)),
+                ('submitted_at', models.DateTimeField(blank=True, null=True)),
+                ('decided_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='budget_requests', to=settings.AUTH_USER_MODEL)),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='budget_requests', to='teams.team')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BudgetApprovalRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stage', models.PositiveSmallIntegerField()),
+                ('role', models.CharField(max_length=100)),
+                ('decision', models.CharField(choices=[('approve', 'Approve'), ('reject', 'Reject')], max_length=10)),
+                ('comment', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('request', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='approval_records', to='budgets.budgetrequest')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='budget_approval_records', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['stage', 'created_at', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PendingApproval',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stage', models.PositiveSmallIntegerField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('approver', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_budget_approvals', to=settings.AUTH_USER_MODEL)),
+                ('request', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_approvals', to='budgets.budgetrequest')),
+            ],
+            options={
+                'ordering': ['created_at', 'id'],
+                'indexes': [models.Index(fields=['approver', 'created_at'], name='budgets_pen_approve_4d6368_idx')],
+                'unique_together': {('request', 'approver')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='budgetrequest',
+            index=models.Index(fields=['team', 'status'], name='budgets_bud_team_id_c7795f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='budgetrequest',
+            index=models.Index(fields=['requested_by', 'status'], name='budgets_bud_request_d0aec0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='budgetapprovalrecord',
+            index=models.Index(fields=['request', 'stage'], name='budgets_bud_request_7ae8c7_idx'),
+        ),
+    ]
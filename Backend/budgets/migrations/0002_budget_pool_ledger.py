@@ -0,0 +1,98 @@
+# Generated by Django 4.2.23 on 2026-10-19 02:13
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.expressions
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('teams', '0001_initial'),
+        ('budgets', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BudgetPool',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('ad_channel', models.CharField(blank=True, max_length=50)),
+                ('month', models.DateField(help_text='First day of the month the budget is for')),
+                ('currency', models.CharField(max_length=3)),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('used_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('available', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='budget_pools', to='teams.team')),
+            ],
+            options={
+                'ordering': ['-month', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BudgetLedgerEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('transaction_id', models.UUIDField(db_index=True)),
+                ('account', models.CharField(choices=[('funding', 'Funding'), ('available', 'Available'), ('committed', 'Committed')], max_length=20)),
+                ('entry_type', models.CharField(choices=[('allocation', 'Allocation'), ('reallocation', 'Reallocation'), ('commitment', 'Commitment')], max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('comment', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('budget_request', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='ledger_entries', to='budgets.budgetrequest')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='budget_ledger_entries', to=settings.AUTH_USER_MODEL)),
+                ('pool', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='ledger_entries', to='budgets.budgetpool')),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BudgetPoolSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_entry_id', models.BigIntegerField()),
+                ('available', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('used_amount', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('pool', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='budgets.budgetpool')),
+            ],
+            options={
+                'ordering': ['-last_entry_id'],
+                'indexes': [models.Index(fields=['pool', '-last_entry_id'], name='budgets_bud_pool_id_1c3073_idx')],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='budgetpool',
+            index=models.Index(fields=['team', 'month'], name='budgets_bud_team_id_3f744e_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='budgetpool',
+            constraint=models.CheckConstraint(check=models.Q(('available__gte', 0)), name='budget_pool_available_non_negative'),
+        ),
+        migrations.AddConstraint(
+            model_name='budgetpool',
+            constraint=models.CheckConstraint(check=models.Q(('total_amount', django.db.models.expressions.CombinedExpression(models.F('available'), '+', models.F('used_amount')))), name='budget_pool_balanced'),
+        ),
+        migrations.AddIndex(
+            model_name='budgetledgerentry',
+            index=models.Index(fields=['pool', 'id'], name='budgets_bud_pool_id_0b776a_idx'),
+        ),
+        # Budget requests referenced pools by plain ID until pools existed
+        migrations.RenameField(
+            model_name='budgetrequest',
+            old_name='budget_pool_id',
+            new_name='budget_pool',
+        ),
+        migrations.AlterField(
+            model_name='budgetrequest',
+            name='budget_pool',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='budget_requests', to='budgets.budgetpool'),
+        ),
+    ]
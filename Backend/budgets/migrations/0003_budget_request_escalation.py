@@ -0,0 +1,27 @@
+# Generated by Django 4.2.23 on 2026-10-19 02:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0002_budget_pool_ledger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='budgetrequest',
+            name='due_at',
+            field=models.DateTimeField(blank=True, help_text='When the current stage is escalated if still undecided', null=True),
+        ),
+        migrations.AddField(
+            model_name='budgetrequest',
+            name='escalation_level',
+            field=models.PositiveIntegerField(blank=True, help_text='Role level the current stage has been escalated to', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='budgetrequest',
+            index=models.Index(fields=['status', 'due_at'], name='budgets_bud_status_3bead1_idx'),
+        ),
+    ]
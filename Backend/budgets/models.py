@@ -0,0 +1,295 @@
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+
+
+class BudgetRequestStatus(models.TextChoices):
+    """Budget request workflow states"""
+    DRAFT = 'draft', 'Draft'
+    PENDING_SUBMISSION = 'pendingSubmission', 'Pending Submission'
+    UNDER_APPROVAL = 'underApproval', 'Under Approval'
+    APPROVED = 'approved', 'Approved'
+    REJECTED = 'rejected', 'Rejected'
+    LOCKED = 'locked', 'Locked'
+
+
+class ApprovalDecision(models.TextChoices):
+    """Decisions an approver can take at a stage"""
+    APPROVE = 'approve', 'Approve'
+    REJECT = 'reject', 'Reject'
+
+
+class BudgetPool(models.Model):
+    """
+    Budget of a team for a month, optionally per project and ad channel
+
+    total_amount is the money allocated to the pool, used_amount what
+    approved requests have committed and available the rest. The three
+    balances are only changed by BudgetLedgerService, together with the
+    ledger entries that explain them, with conditional UPDATEs so that
+    concurrent approvals can never overdraw a pool.
+    """
+
+    team = models.ForeignKey(
+        'teams.Team',
+        on_delete=models.PROTECT,
+        related_name='budget_pools'
+    )
+    project_id = models.PositiveIntegerField(null=True, blank=True)
+    ad_channel = models.CharField(max_length=50, blank=True)
+    month = models.DateField(help_text="First day of the month the budget is for")
+    currency = models.CharField(max_length=3)
+    total_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    used_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    available = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-month', 'id']
+        indexes = [
+            models.Index(fields=['team', 'month']),
+        ]
+        constraints = [
+            models.CheckConstraint(check=models.Q(available__gte=0), name='budget_pool_available_non_negative'),
+            models.CheckConstraint(
+                check=models.Q(total_amount=models.F('available') + models.F('used_amount')),
+                name='budget_pool_balanced'
+            ),
+        ]
+
+    def __str__(self):
+        return f"Budget pool {self.pk} (team {self.team_id}, {self.month:%Y-%m}, {self.available} {self.currency})"
+
+
+class LedgerAccount(models.TextChoices):
+    """Accounts of the budget pool ledger"""
+    FUNDING = 'funding', 'Funding'
+    AVAILABLE = 'available', 'Available'
+    COMMITTED = 'committed', 'Committed'
+
+
+class LedgerEntryType(models.TextChoices):
+    """Kinds of budget pool ledger transactions"""
+    ALLOCATION = 'allocation', 'Allocation'
+    REALLOCATION = 'reallocation', 'Reallocation'
+    COMMITMENT = 'commitment', 'Commitment'
+
+
+class BudgetLedgerEntry(models.Model):
+    """
+    Double-entry ledger of budget pool movements
+
+    Every transaction writes entries sharing a transaction_id whose
+    amounts sum to zero: an allocation moves money from a pool's funding
+    account to its available account, a reallocation from one pool's
+    available account to another's, and an approved request from
+    available to committed. A pool's available balance is the sum of its
+    available entries and its used_amount the sum of its committed
+    entries. Entries are only ever inserted.
+    """
+
+    transaction_id = models.UUIDField(db_index=True)
+    pool = models.ForeignKey(
+        BudgetPool,
+        on_delete=models.PROTECT,
+        related_name='ledger_entries'
+    )
+    account = models.CharField(max_length=20, choices=LedgerAccount.choices)
+    entry_type = models.CharField(max_length=20, choices=LedgerEntryType.choices)
+    amount = models.DecimalField(max_digits=14, decimal_places=2)
+    budget_request = models.ForeignKey(
+        'BudgetRequest',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='ledger_entries'
+    )
+    comment = models.TextField(null=True, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='budget_ledger_entries'
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['pool', 'id']),
+        ]
+
+    def __str__(self):
+        return f"Pool {self.pool_id} {self.account} {self.amount} ({self.entry_type})"
+
+
+class BudgetPoolSnapshot(models.Model):
+    """
+    Balances of a pool as of a ledger position
+
+    Written by the snapshot_budget_pools job, so a pool's balances can be
+    verified from its latest snapshot plus the entries written after
+    last_entry_id instead of the whole ledger.
+    """
+
+    pool = models.ForeignKey(
+        BudgetPool,
+        on_delete=models.CASCADE,
+        related_name='snapshots'
+    )
+    last_entry_id = models.BigIntegerField()
+    available = models.DecimalField(max_digits=14, decimal_places=2)
+    used_amount = models.DecimalField(max_digits=14, decimal_places=2)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-last_entry_id']
+        indexes = [
+            models.Index(fields=['pool', '-last_entry_id']),
+        ]
+
+    def __str__(self):
+        return f"Pool {self.pool_id} snapshot at entry {self.last_entry_id}"
+
+
+class BudgetRequest(models.Model):
+    """
+    Request for budget for a task
+
+    A submitted request goes through the approval stages of
+    BUDGET_APPROVAL_STAGES one after the other; current_stage is the stage
+    waiting for a decision and required_stages the number of stages its
+    amount needs. A stage left undecided past due_at is escalated to the
+    approvers of the next role level.
+    """
+
+    task_id = models.PositiveIntegerField()
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='budget_requests'
+    )
+    team = models.ForeignKey(
+        'teams.Team',
+        on_delete=models.PROTECT,
+        related_name='budget_requests'
+    )
+    budget_pool = models.ForeignKey(
+        BudgetPool,
+        on_delete=models.PROTECT,
+        related_name='budget_requests'
+    )
+    amount = models.DecimalField(max_digits=14, decimal_places=2)
+    currency = models.CharField(max_length=3)
+    notes = models.TextField(null=True, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=BudgetRequestStatus.choices,
+        default=BudgetRequestStatus.DRAFT
+    )
+    current_stage = models.PositiveSmallIntegerField(default=0)
+    required_stages = models.PositiveSmallIntegerField(default=0)
+    due_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the current stage is escalated if still undecided"
+    )
+    is_escalated = models.BooleanField(default=False)
+    escalation_level = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Role level the current stage has been escalated to"
+    )
+    submitted_at = models.DateTimeField(null=True, blank=True)
+    decided_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['team', 'status']),
+            models.Index(fields=['requested_by', 'status']),
+            models.Index(fields=['status', 'due_at']),
+        ]
+
+    def __str__(self):
+        return f"Budget request {self.pk} ({self.amount} {self.currency}, {self.status})"
+
+
+class BudgetApprovalRecord(models.Model):
+    """
+    Append-only approval history of a budget request
+
+    One row per decision taken at a stage. Rows are never updated or
+    deleted, and the request and user they refer to cannot be deleted
+    while they exist.
+    """
+
+    request = models.ForeignKey(
+        BudgetRequest,
+        on_delete=models.PROTECT,
+        related_name='approval_records'
+    )
+    stage = models.PositiveSmallIntegerField()
+    role = models.CharField(max_length=100)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name='budget_approval_records'
+    )
+    decision = models.CharField(max_length=10, choices=ApprovalDecision.choices)
+    comment = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['stage', 'created_at', 'id']
+        indexes = [
+            models.Index(fields=['request', 'stage']),
+        ]
+
+    def __str__(self):
+        return f"Budget request {self.request_id} stage {self.stage}: {self.decision}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Budget approval records are append-only.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Budget approval records are append-only.")
+
+
+class PendingApproval(models.Model):
+    """
+    Approver inbox entry of a request waiting at a stage
+
+    The approval service writes one row per approver when a request
+    reaches a stage and deletes them once the stage is decided, so an
+    approver's inbox is an index range scan on (approver, created_at)
+    whatever the number of requests in the system.
+    """
+
+    request = models.ForeignKey(
+        BudgetRequest,
+        on_delete=models.CASCADE,
+        related_name='pending_approvals'
+    )
+    stage = models.PositiveSmallIntegerField()
+    approver = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='pending_budget_approvals'
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['created_at', 'id']
+        unique_together = ['request', 'approver']
+        indexes = [
+            models.Index(fields=['approver', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"Budget request {self.request_id} stage {self.stage} for user {self.approver_id}"
@@ -0,0 +1,97 @@
+import re
+from decimal import Decimal
+
+from rest_framework import serializers
+
+from .models import ApprovalDecision, BudgetApprovalRecord, BudgetPool, BudgetRequest
+
+
+class BudgetRequestSerializer(serializers.ModelSerializer):
+    """
+    Serializer for BudgetRequest model
+
+    requested_by is the requesting user and team_id comes from the
+    X-Team-Id header; the workflow fields only change through decisions.
+    """
+
+    requested_by = serializers.IntegerField(source='requested_by_id', read_only=True)
+    team_id = serializers.IntegerField(read_only=True)
+    budget_pool_id = serializers.PrimaryKeyRelatedField(queryset=BudgetPool.objects.all(), source='budget_pool')
+    amount = serializers.DecimalField(max_digits=14, decimal_places=2, min_value=Decimal('0.01'))
+
+    class Meta:
+        model = BudgetRequest
+        fields = [
+            'id', 'task_id', 'requested_by', 'team_id', 'budget_pool_id', 'amount', 'currency', 'notes',
+            'status', 'current_stage', 'required_stages', 'is_escalated', 'submitted_at', 'decided_at',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = [
+            'id', 'status', 'current_stage', 'required_stages', 'is_escalated', 'submitted_at',
+            'decided_at', 'created_at', 'updated_at'
+        ]
+
+    def validate_currency(self, value):
+        """Currencies are three-letter ISO 4217 codes"""
+        value = value.upper()
+        if not re.fullmatch(r'[A-Z]{3}', value):
+            raise serializers.ValidationError("Currency must be a three-letter code.")
+        return value
+
+    def validate(self, attrs):
+        """Requests are in the currency of their budget pool"""
+        if attrs['currency'] != attrs['budget_pool'].currency:
+            raise serializers.ValidationError({
+                'currency': f"The budget pool is in {attrs['budget_pool'].currency}."
+            })
+        return attrs
+
+
+class ApprovalDecisionSerializer(serializers.Serializer):
+    """Serializer for a decision on the current stage of a request"""
+
+    decision = serializers.ChoiceField(choices=ApprovalDecision.choices)
+    comment = serializers.CharField(required=False, allow_blank=True, allow_null=True, max_length=2000)
+
+
+class ApprovalRecordSerializer(serializers.ModelSerializer):
+    """
+    Serializer for BudgetApprovalRecord model
+    """
+
+    user_id = serializers.IntegerField(read_only=True)
+    timestamp = serializers.DateTimeField(source='created_at', read_only=True)
+
+    class Meta:
+        model = BudgetApprovalRecord
+        fields = ['stage', 'role', 'user_id', 'decision', 'comment', 'timestamp']
+        read_only_fields = fields
+
+
+class BudgetPoolSummarySerializer(serializers.ModelSerializer):
+    """
+    Serializer for BudgetPool balances
+    """
+
+    team_id = serializers.IntegerField(read_only=True)
+    month = serializers.DateField(format='%Y-%m', read_only=True)
+
+    class Meta:
+        model = BudgetPool
+        fields = [
+            'id', 'team_id', 'project_id', 'ad_channel', 'month', 'currency',
+            'total_amount', 'used_amount', 'available', 'updated_at'
+        ]
+        read_only_fields = fields
+
+
+class ReallocateSerializer(serializers.Serializer):
+    """Serializer for moving available funds to another pool"""
+
+    to_pool_id = serializers.IntegerField(min_value=1)
+    amount = serializers.DecimalField(max_digits=14, decimal_places=2, min_value=Decimal('0.01'))
+    currency = serializers.CharField(min_length=3, max_length=3)
+    comment = serializers.CharField(required=False, allow_blank=True, allow_null=True, max_length=2000)
+
+    def validate_currency(self, value):
+        return value.upper()
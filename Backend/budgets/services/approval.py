@@ -0,0 +1,195 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from access_control.models import UserRole
+from access_control.services.approvers import ApproverService
+from teams.models import TeamMember
+from user_preferences.services.notification_queue import NotificationQueue
+from ..models import (
+    ApprovalDecision, BudgetApprovalRecord, BudgetRequest, BudgetRequestStatus, PendingApproval
+)
+from .ledger import BudgetLedgerService, InsufficientFunds
+
+logger = logging.getLogger(__name__)
+
+APPROVAL_REQUESTED_TRIGGER = 'budget_approval_requested'
+APPROVED_TRIGGER = 'budget_approved'
+REJECTED_TRIGGER = 'budget_rejected'
+
+
+class DecisionConflict(Exception):
+    """The request cannot be decided or changed in its current status or stage"""
+
+
+def get_required_stages(amount):
+    """
+    Approval stages a request for amount goes through
+
+    Stage 1 always applies; each next stage applies while the amount is
+    above the threshold of the stage before it.
+    """
+    stages = []
+    for stage in settings.BUDGET_APPROVAL_STAGES:
+        if stages and amount <= stages[-1]['threshold']:
+            break
+        stages.append(stage)
+    return stages
+
+
+class BudgetApprovalService:
+    """
+    Multi-stage budget approval workflow
+
+    Approvers of a stage are the BUDGET:APPROVE approvers of the in-memory
+    approver index who currently hold the stage's role, resolved with one
+    query, and are given PendingApproval inbox rows with one bulk INSERT. A
+    decision locks the request row, appends a BudgetApprovalRecord and
+    either routes the request to its next stage or closes it; the final
+    approval commits the amount in the budget pool ledger. Approvers
+    and requesters are notified through the NotificationQueue, so nothing
+    is sent unless the transaction commits.
+    """
+
+    def __init__(self, queue=None, ledger=None):
+        self.queue = queue or NotificationQueue()
+        self.ledger = ledger or BudgetLedgerService()
+
+    def get_stage(self, budget_request, number=None):
+        """Policy of a stage of the request (its current stage by default)"""
+        return settings.BUDGET_APPROVAL_STAGES[(number or budget_request.current_stage) - 1]
+
+    def resolve_approvers(self, stage, budget_request, now=None):
+        """IDs of the users who may decide the request at stage"""
+        now = now or timezone.now()
+        approvers = UserRole.objects.filter(
+            user_id__in=ApproverService().get_approver_ids('BUDGET', 'APPROVE'),
+            role__name=stage['role'],
+            role__is_deleted=False,
+            is_deleted=False,
+            valid_from__lte=now,
+            user__is_active=True
+        ).filter(Q(valid_to__gte=now) | Q(valid_to__isnull=True)).exclude(user_id=budget_request.requested_by_id)
+        if stage['team']:
+            approvers = approvers.filter(
+                user_id__in=TeamMember.objects.filter(team_id=budget_request.team_id).values('user_id')
+            )
+        return list(approvers.order_by('user_id').values_list('user_id', flat=True).distinct())
+
+    def submit(self, budget_request, now=None):
+        """Send a saved request to its first approval stage"""
+        now = now or timezone.now()
+        with transaction.atomic():
+            budget_request.status = BudgetRequestStatus.UNDER_APPROVAL
+            budget_request.required_stages = len(get_required_stages(budget_request.amount))
+            budget_request.submitted_at = now
+            budget_request.decided_at = None
+            self._route(budget_request, 1, now)
+            budget_request.save(update_fields=[
+                'status', 'required_stages', 'current_stage', 'due_at', 'is_escalated', 'escalation_level',
+                'submitted_at', 'decided_at', 'updated_at'
+            ])
+        return budget_request
+
+    def resubmit(self, budget_request, now=None):
+        """
+        Route an edited request again from stage 1
+
+        Only requests no approver has decided on yet can be edited.
+        """
+        if (budget_request.status != BudgetRequestStatus.UNDER_APPROVAL
+                or budget_request.approval_records.exists()):
+            raise DecisionConflict('Only requests awaiting their first decision can be changed.')
+        return self.submit(budget_request, now)
+
+    def decide(self, user, request_id, decision, comment=None, now=None):
+        """
+        Record an approver's decision on the current stage of a request
+
+        Raises BudgetRequest.DoesNotExist, PermissionDenied if the user is
+        not an approver of the current stage, and DecisionConflict if the
+        request is not awaiting a decision or its pool cannot cover an
+        approved amount.
+        """
+        now = now or timezone.now()
+        with transaction.atomic():
+            budget_request = BudgetRequest.objects.select_for_update().get(pk=request_id)
+            if budget_request.status != BudgetRequestStatus.UNDER_APPROVAL:
+                raise DecisionConflict(f'Cannot decide a request in status {budget_request.status}.')
+            if not user.is_superuser and not PendingApproval.objects.filter(
+                request=budget_request, approver=user
+            ).exists():
+                raise PermissionDenied('You are not an approver of this stage.')
+
+            stage = self.get_stage(budget_request)
+            BudgetApprovalRecord.objects.create(
+                request=budget_request,
+                stage=budget_request.current_stage,
+                role=stage['role'],
+                user=user,
+                decision=decision,
+                comment=comment,
+                created_at=now
+            )
+
+            if decision == ApprovalDecision.APPROVE and budget_request.current_stage < budget_request.required_stages:
+                self._route(budget_request, budget_request.current_stage + 1, now)
+                budget_request.save(update_fields=[
+                    'current_stage', 'due_at', 'is_escalated', 'escalation_level', 'updated_at'
+                ])
+            else:
+                if decision == ApprovalDecision.APPROVE:
+                    try:
+                        self.ledger.commit(budget_request, user)
+                    except InsufficientFunds as e:
+                        raise DecisionConflict(str(e))
+                PendingApproval.objects.filter(request=budget_request).delete()
+                self._close(budget_request, decision, user, comment, now)
+
+        logger.info(f"Budget request {budget_request.pk} stage {stage['stage']} {decision} by user {user.id}")
+        return budget_request
+
+    def _route(self, budget_request, stage_number, now):
+        """Replace the request's inbox entries with the approvers of a stage"""
+        stage = self.get_stage(budget_request, stage_number)
+        approver_ids = self.resolve_approvers(stage, budget_request, now)
+        PendingApproval.objects.filter(request=budget_request).delete()
+        PendingApproval.objects.bulk_create([
+            PendingApproval(request=budget_request, stage=stage_number, approver_id=approver_id, created_at=now)
+            for approver_id in approver_ids
+        ])
+        budget_request.current_stage = stage_number
+        budget_request.due_at = now + timedelta(hours=settings.BUDGET_APPROVAL_SLA_HOURS)
+        budget_request.is_escalated = False
+        budget_request.escalation_level = None
+
+        if not approver_ids:
+            logger.warning(
+                f"No approver with role {stage['role']} for budget request {budget_request.pk} stage {stage_number}"
+            )
+            return
+        message = (
+            f"Budget request {budget_request.pk} for {budget_request.amount} {budget_request.currency} "
+            f"awaits your approval (stage {stage_number}, {stage['role']})"
+        )
+        self.queue.enqueue(APPROVAL_REQUESTED_TRIGGER, {approver_id: [message] for approver_id in approver_ids})
+
+    def _close(self, budget_request, decision, user, comment, now):
+        approved = decision == ApprovalDecision.APPROVE
+        budget_request.status = BudgetRequestStatus.APPROVED if approved else BudgetRequestStatus.REJECTED
+        budget_request.decided_at = now
+        budget_request.due_at = None
+        budget_request.save(update_fields=['status', 'decided_at', 'due_at', 'updated_at'])
+
+        message = f"Budget request {budget_request.pk} was {budget_request.status} by {user.username}"
+        if comment:
+            message += f": {comment}"
+        self.queue.enqueue(
+            APPROVED_TRIGGER if approved else REJECTED_TRIGGER,
+            {budget_request.requested_by_id: [message]}
+        )
@@ -0,0 +1,147 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Min, Q
+from django.utils import timezone
+
+from access_control.models import UserRole
+from access_control.services.approvers import ApproverService
+from core.models import Role
+from user_preferences.services.notification_queue import NotificationQueue
+from ..models import BudgetRequest, BudgetRequestStatus, PendingApproval
+
+logger = logging.getLogger(__name__)
+
+ESCALATED_TRIGGER = 'budget_escalated'
+
+
+class BudgetEscalationService:
+    """
+    Escalation of budget requests left undecided past their due date
+
+    Overdue requests are found with a range scan on the (status, due_at)
+    index and escalated in batches claimed with SELECT ... FOR UPDATE SKIP
+    LOCKED, so several workers can sweep at once. A stage is escalated to
+    the next role level up (a lower Role.level is a higher privilege): its
+    BUDGET:APPROVE approvers are added to the request's inbox, keeping the
+    current approvers, and are notified through the NotificationQueue. Each
+    batch costs the same few queries whatever its size: one UPDATE per
+    target role level, and approvers are resolved once per role level and
+    run. Requests with no higher level left are no longer due.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, queue=None):
+        self.batch_size = batch_size
+        self.queue = queue or NotificationQueue()
+        self._tiers = {}
+
+    def overdue(self, now):
+        return BudgetRequest.objects.filter(status=BudgetRequestStatus.UNDER_APPROVAL, due_at__lte=now)
+
+    def count_due(self, now=None):
+        """Count overdue requests without changing anything"""
+        return self.overdue(now or timezone.now()).count()
+
+    def run(self, now=None):
+        """Escalate every overdue request and return how many were escalated"""
+        now = now or timezone.now()
+        self._tiers = {}
+        total = 0
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    self.overdue(now)
+                    .order_by('due_at')
+                    .select_for_update(skip_locked=True)
+                    .values('id', 'requested_by_id', 'current_stage', 'escalation_level', 'amount', 'currency')
+                    [:self.batch_size]
+                )
+                if not batch:
+                    break
+                total += self._escalate_batch(batch, now)
+
+            if len(batch) < self.batch_size:
+                break
+        return total
+
+    def _get_stage_level(self, stage_number):
+        """Role level of the approvers of a stage"""
+        role_name = settings.BUDGET_APPROVAL_STAGES[stage_number - 1]['role']
+        return Role.objects.filter(name=role_name, is_deleted=False).aggregate(level=Min('level'))['level']
+
+    def _get_tier(self, level, now):
+        """(next role level up, its approver IDs) from a level, cached per run"""
+        if level not in self._tiers:
+            next_level = None
+            if level is not None:
+                next_level = Role.objects.filter(
+                    level__lt=level, is_deleted=False
+                ).aggregate(level=Max('level'))['level']
+            approver_ids = []
+            if next_level is not None:
+                approver_ids = list(UserRole.objects.filter(
+                    user_id__in=ApproverService().get_approver_ids('BUDGET', 'APPROVE'),
+                    role__level=next_level,
+                    role__is_deleted=False,
+                    is_deleted=False,
+                    valid_from__lte=now,
+                    user__is_active=True
+                ).filter(
+                    Q(valid_to__gte=now) | Q(valid_to__isnull=True)
+                ).order_by('user_id').values_list('user_id', flat=True).distinct())
+            self._tiers[level] = (next_level, approver_ids)
+        return self._tiers[level]
+
+    def _escalate_batch(self, batch, now):
+        stage_levels = {}
+        escalations = {}
+        inbox = []
+        messages_by_user = {}
+        for request in batch:
+            level = request['escalation_level']
+            if level is None:
+                if request['current_stage'] not in stage_levels:
+                    stage_levels[request['current_stage']] = self._get_stage_level(request['current_stage'])
+                level = stage_levels[request['current_stage']]
+
+            next_level, approver_ids = self._get_tier(level, now)
+            escalations.setdefault(next_level, []).append(request['id'])
+            if next_level is None:
+                logger.warning(f"Budget request {request['id']} is overdue with no higher role level left")
+                continue
+            approver_ids = [user_id for user_id in approver_ids if user_id != request['requested_by_id']]
+            if not approver_ids:
+                # Still escalated, so the next run moves it a level further up
+                logger.warning(f"No approver at role level {next_level} for budget request {request['id']}")
+                continue
+
+            inbox.extend(
+                PendingApproval(
+                    request_id=request['id'], stage=request['current_stage'], approver_id=approver_id, created_at=now
+                )
+                for approver_id in approver_ids
+            )
+            message = (
+                f"Budget request {request['id']} for {request['amount']} {request['currency']} "
+                f"was escalated to you (stage {request['current_stage']})"
+            )
+            for approver_id in approver_ids:
+                messages_by_user.setdefault(approver_id, []).append(message)
+
+        due_at = now + timedelta(hours=settings.BUDGET_APPROVAL_SLA_HOURS)
+        escalated = 0
+        for level, request_ids in escalations.items():
+            if level is None:
+                BudgetRequest.objects.filter(id__in=request_ids).update(due_at=None, updated_at=now)
+                continue
+            escalated += BudgetRequest.objects.filter(id__in=request_ids).update(
+                is_escalated=True, escalation_level=level, due_at=due_at, updated_at=now
+            )
+        PendingApproval.objects.bulk_create(inbox, batch_size=self.batch_size, ignore_conflicts=True)
+        if messages_by_user:
+            self.queue.enqueue(ESCALATED_TRIGGER, messages_by_user)
+        return escalated
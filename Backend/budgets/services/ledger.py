@@ -0,0 +1,241 @@
+import logging
+import uuid
+from datetime import timedelta
+
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import F, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from access_control.services.permissions import PermissionCache
+from teams.models import TeamMember
+from ..models import BudgetLedgerEntry, BudgetPool, BudgetPoolSnapshot, LedgerAccount, LedgerEntryType
+
+logger = logging.getLogger(__name__)
+
+
+class LedgerError(Exception):
+    """A budget pool movement that cannot be applied"""
+
+
+class InsufficientFunds(LedgerError):
+    """The pool's available balance does not cover the amount"""
+
+
+class BudgetLedgerService:
+    """
+    Budget pool balances and their double-entry ledger
+
+    Balances live on the BudgetPool rows, so reading them is a primary
+    key lookup however long the ledger grows. Every movement changes them
+    with a conditional UPDATE ... WHERE available >= amount in the same
+    transaction as its ledger entries, so concurrent approvals cannot
+    overdraw a pool: the second one finds the row already debited and
+    updates nothing. Reallocations lock both pools in primary key order,
+    so two opposite reallocations cannot deadlock.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+
+    def can_manage(self, user):
+        """Whether a currently valid role of user grants BUDGET:APPROVE"""
+        return user.is_superuser or PermissionCache().has_permission(user.id, 'BUDGET', 'APPROVE')
+
+    def allocate(self, pool_id, amount, user=None, comment=None):
+        """Add money to a pool from its funding account"""
+        if amount <= 0:
+            raise LedgerError('The amount must be positive.')
+        with transaction.atomic():
+            credited = BudgetPool.objects.filter(pk=pool_id).update(
+                total_amount=F('total_amount') + amount,
+                available=F('available') + amount,
+                updated_at=timezone.now()
+            )
+            if not credited:
+                raise BudgetPool.DoesNotExist('Budget pool not found.')
+            self._write(LedgerEntryType.ALLOCATION, [
+                (pool_id, LedgerAccount.FUNDING, -amount),
+                (pool_id, LedgerAccount.AVAILABLE, amount),
+            ], user=user, comment=comment)
+
+    def commit(self, budget_request, user=None):
+        """
+        Move an approved request's amount from available to committed
+
+        Raises InsufficientFunds if the pool no longer has the money.
+        """
+        with transaction.atomic():
+            debited = BudgetPool.objects.filter(
+                pk=budget_request.budget_pool_id,
+                available__gte=budget_request.amount
+            ).update(
+                available=F('available') - budget_request.amount,
+                used_amount=F('used_amount') + budget_request.amount,
+                updated_at=timezone.now()
+            )
+            if not debited:
+                raise InsufficientFunds('The budget pool does not have enough available funds.')
+            self._write(LedgerEntryType.COMMITMENT, [
+                (budget_request.budget_pool_id, LedgerAccount.AVAILABLE, -budget_request.amount),
+                (budget_request.budget_pool_id, LedgerAccount.COMMITTED, budget_request.amount),
+            ], user=user, budget_request=budget_request)
+
+    def reallocate(self, source_id, target_id, amount, currency, user=None, comment=None):
+        """
+        Move available money from one pool to another
+
+        Returns the (source, target) pools after the move. Raises
+        BudgetPool.DoesNotExist, PermissionDenied if user is not a member of
+        both pools' teams, LedgerError if the pools cannot exchange money
+        and InsufficientFunds if the source does not have it.
+        """
+        if amount <= 0:
+            raise LedgerError('The amount must be positive.')
+        if source_id == target_id:
+            raise LedgerError('Cannot reallocate funds to the same pool.')
+
+        with transaction.atomic():
+            pools = {
+                pool.pk: pool
+                for pool in BudgetPool.objects.filter(pk__in=[source_id, target_id])
+                .order_by('pk')
+                .select_for_update()
+            }
+            if len(pools) != 2:
+                raise BudgetPool.DoesNotExist('Budget pool not found.')
+            team_ids = {pool.team_id for pool in pools.values()}
+            if user is not None and not user.is_superuser and TeamMember.objects.filter(
+                user_id=user.id, team_id__in=team_ids
+            ).count() != len(team_ids):
+                raise PermissionDenied('You are not a member of the teams of both budget pools.')
+            if {pool.currency for pool in pools.values()} != {currency}:
+                raise LedgerError(f'Both pools must be in {currency}.')
+
+            now = timezone.now()
+            debited = BudgetPool.objects.filter(pk=source_id, available__gte=amount).update(
+                total_amount=F('total_amount') - amount,
+                available=F('available') - amount,
+                updated_at=now
+            )
+            if not debited:
+                raise InsufficientFunds('The budget pool does not have enough available funds.')
+            BudgetPool.objects.filter(pk=target_id).update(
+                total_amount=F('total_amount') + amount,
+                available=F('available') + amount,
+                updated_at=now
+            )
+            self._write(LedgerEntryType.REALLOCATION, [
+                (source_id, LedgerAccount.AVAILABLE, -amount),
+                (target_id, LedgerAccount.AVAILABLE, amount),
+            ], user=user, comment=comment)
+
+        logger.info(f"Reallocated {amount} {currency} from pool {source_id} to pool {target_id}")
+        pools = BudgetPool.objects.in_bulk([source_id, target_id])
+        return pools[source_id], pools[target_id]
+
+    def _write(self, entry_type, entries, user=None, budget_request=None, comment=None):
+        """Insert the balanced entries of one ledger transaction"""
+        transaction_id = uuid.uuid4()
+        now = timezone.now()
+        BudgetLedgerEntry.objects.bulk_create([
+            BudgetLedgerEntry(
+                transaction_id=transaction_id,
+                pool_id=pool_id,
+                account=account,
+                entry_type=entry_type,
+                amount=amount,
+                budget_request=budget_request,
+                comment=comment,
+                created_by=user,
+                created_at=now
+            )
+            for pool_id, account, amount in entries
+        ])
+
+    def take_snapshots(self):
+        """
+        Snapshot the balances of every pool with new ledger entries
+
+        Each new snapshot is the pool's previous snapshot plus the sums of
+        its entries written since, read through the (pool, id) index, so a
+        run only reads the new part of the ledger. Pools are locked batch
+        by batch in primary key order (as reallocations do), so no
+        movement of a batch is in flight while it is summed, and snapshots
+        that do not match the pool's balances are real drift. Returns
+        (number of snapshots, IDs of mismatched pools).
+        """
+        created = 0
+        mismatched = []
+        last_id = 0
+        while True:
+            with transaction.atomic():
+                pools = list(
+                    BudgetPool.objects.filter(pk__gt=last_id)
+                    .order_by('pk')
+                    .select_for_update()[:self.batch_size]
+                )
+                if not pools:
+                    return created, mismatched
+                count, drifted = self._snapshot_batch(pools)
+            created += count
+            mismatched.extend(drifted)
+            last_id = pools[-1].pk
+
+    def _snapshot_batch(self, pools):
+        pool_ids = [pool.pk for pool in pools]
+        previous = {
+            snapshot.pool_id: snapshot
+            for snapshot in BudgetPoolSnapshot.objects.filter(pool_id__in=pool_ids)
+            .order_by('pool_id', '-last_entry_id').distinct('pool_id')
+        }
+        latest_snapshot = BudgetPoolSnapshot.objects.filter(
+            pool_id=OuterRef('pool_id')
+        ).order_by('-last_entry_id').values('last_entry_id')[:1]
+        deltas = {}
+        last_entries = {}
+        for row in (
+            BudgetLedgerEntry.objects.filter(pool_id__in=pool_ids)
+            .filter(id__gt=Coalesce(Subquery(latest_snapshot), 0))
+            .values('pool_id', 'account')
+            .annotate(total=Sum('amount'), last_entry_id=Max('id'))
+            .order_by()
+        ):
+            deltas[row['pool_id'], row['account']] = row['total']
+            last_entries[row['pool_id']] = max(last_entries.get(row['pool_id'], 0), row['last_entry_id'])
+
+        snapshots = []
+        mismatched = []
+        for pool in pools:
+            if pool.pk not in last_entries:
+                continue
+            prev = previous.get(pool.pk)
+            available = (prev.available if prev else 0) + deltas.get((pool.pk, LedgerAccount.AVAILABLE), 0)
+            used_amount = (prev.used_amount if prev else 0) + deltas.get((pool.pk, LedgerAccount.COMMITTED), 0)
+            snapshots.append(BudgetPoolSnapshot(
+                pool=pool,
+                last_entry_id=last_entries[pool.pk],
+                available=available,
+                used_amount=used_amount
+            ))
+            if (pool.available, pool.used_amount) != (available, used_amount):
+                logger.error(
+                    f"Budget pool {pool.pk} balances {pool.available}/{pool.used_amount} "
+                    f"do not match its ledger {available}/{used_amount}"
+                )
+                mismatched.append(pool.pk)
+        BudgetPoolSnapshot.objects.bulk_create(snapshots)
+        return len(snapshots), mismatched
+
+    def compact_snapshots(self, keep_days):
+        """Delete snapshots older than keep_days that a newer snapshot of their pool replaces"""
+        newer = BudgetPoolSnapshot.objects.filter(pool_id=OuterRef('pool_id')).order_by('-last_entry_id')
+        deleted, _ = BudgetPoolSnapshot.objects.filter(
+            created_at__lt=timezone.now() - timedelta(days=keep_days)
+        ).exclude(
+            last_entry_id=Subquery(newer.values('last_entry_id')[:1])
+        ).delete()
+        return deleted
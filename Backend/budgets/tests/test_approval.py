@@ -0,0 +1,208 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from access_control.models import PermissionApprover, UserRole
+from budgets.models import BudgetApprovalRecord, BudgetPool, BudgetRequest, BudgetRequestStatus, PendingApproval
+from budgets.services.ledger import BudgetLedgerService
+from core.models import Organization, Permission, Role
+from teams.models import Team, TeamMember
+from user_preferences.models import PendingNotification
+
+User = get_user_model()
+
+
+class BudgetApprovalTest(TestCase):
+    """
+    Test cases for the budget request approval workflow
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        organization = Organization.objects.create(name='Agency')
+        approve = Permission.objects.create(module='BUDGET', action='APPROVE')
+        team_leader = Role.objects.create(organization=organization, name='team_leader', level=2)
+        org_admin = Role.objects.create(organization=organization, name='org_admin', level=1)
+        self.team = Team.objects.create(name='Creative', organization_id=organization.id)
+        other_team = Team.objects.create(name='Media', organization_id=organization.id)
+
+        self.requester = self.create_user('requester', self.team)
+        self.leader = self.create_user('leader', self.team, team_leader, approve)
+        self.other_leader = self.create_user('otherleader', other_team, team_leader, approve)
+        self.admin = self.create_user('admin', None, org_admin, approve)
+        self.member = self.create_user('member', self.team, team_leader)
+        self.pool = BudgetPool.objects.create(team_id=self.team.id, month='2026-10-01', currency='AUD')
+        BudgetLedgerService().allocate(self.pool.id, Decimal('30000'))
+
+        self.client.force_authenticate(user=self.requester)
+        self.url = reverse('budgets:budget-request-list')
+
+    def create_user(self, username, team, role=None, permission=None):
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password='testpass123')
+        if team:
+            TeamMember.objects.create(user_id=user.id, team_id=team.id)
+        if role:
+            UserRole.objects.create(user=user, role=role)
+        if permission:
+            PermissionApprover.objects.create(permission=permission, user=user)
+        return user
+
+    def submit(self, amount, **extra):
+        return self.client.post(
+            self.url,
+            {'task_id': 123, 'amount': amount, 'currency': 'aud', 'budget_pool_id': self.pool.id, **extra},
+            format='json',
+            HTTP_X_TEAM_ID=str(self.team.id),
+            HTTP_X_USER_ROLE='member'
+        )
+
+    def decide(self, user, request_id, decision, comment=''):
+        self.client.force_authenticate(user=user)
+        return self.client.patch(
+            reverse('budgets:budget-request-decision', args=[request_id]),
+            {'decision': decision, 'comment': comment},
+            format='json'
+        )
+
+    def inbox(self, request_id):
+        return set(PendingApproval.objects.filter(request_id=request_id).values_list('approver_id', flat=True))
+
+    def test_submit_routes_to_team_approvers(self):
+        """Test a request goes to the approvers holding the stage role in its team"""
+        response = self.submit('2500.00')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['status'], BudgetRequestStatus.UNDER_APPROVAL)
+        self.assertEqual(response.data['currency'], 'AUD')
+        self.assertEqual(response.data['requested_by'], self.requester.id)
+        self.assertEqual((response.data['current_stage'], response.data['required_stages']), (1, 1))
+        self.assertEqual(self.inbox(response.data['id']), {self.leader.id})
+        self.assertTrue(PendingNotification.objects.filter(
+            user=self.leader, trigger_type='budget_approval_requested'
+        ).exists())
+
+    def test_deleted_role_assignments_are_not_approvers(self):
+        """Test users whose stage role was soft-deleted get no inbox entry and cannot decide"""
+        UserRole.objects.filter(user=self.leader).update(is_deleted=True)
+
+        response = self.submit('2500.00')
+
+        self.assertEqual(self.inbox(response.data['id']), set())
+        response = self.decide(self.leader, response.data['id'], 'approve')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_multi_stage_approval(self):
+        """Test an over-threshold request needs both stages and keeps its history"""
+        request_id = self.submit('25000').data['id']
+
+        response = self.decide(self.leader, request_id, 'approve', 'Looks good')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['status'], response.data['current_stage']), (BudgetRequestStatus.UNDER_APPROVAL, 2))
+        self.assertEqual(self.inbox(request_id), {self.admin.id})
+
+        self.assertEqual(self.decide(self.leader, request_id, 'approve').status_code, status.HTTP_403_FORBIDDEN)
+        response = self.decide(self.admin, request_id, 'approve')
+        self.assertEqual(response.data['status'], BudgetRequestStatus.APPROVED)
+        self.assertEqual(self.inbox(request_id), set())
+
+        response = self.client.get(reverse('budgets:budget-request-history', args=[request_id]))
+        self.assertEqual(
+            [(item['stage'], item['role'], item['user_id'], item['decision']) for item in response.data],
+            [(1, 'team_leader', self.leader.id, 'approve'), (2, 'org_admin', self.admin.id, 'approve')]
+        )
+        self.assertTrue(PendingNotification.objects.filter(user=self.requester, trigger_type='budget_approved').exists())
+        self.pool.refresh_from_db()
+        self.assertEqual((self.pool.available, self.pool.used_amount), (Decimal('5000'), Decimal('25000')))
+
+    def test_approval_needs_available_funds(self):
+        """Test the final approval conflicts when the pool cannot cover the amount"""
+        first = self.submit('8000').data['id']
+        second = self.submit('9000').data['id']
+        other_pool = BudgetPool.objects.create(team_id=self.team.id, month='2026-11-01', currency='AUD')
+        BudgetLedgerService().reallocate(self.pool.id, other_pool.id, Decimal('15000'), 'AUD')
+
+        self.assertEqual(self.decide(self.leader, first, 'approve').status_code, status.HTTP_200_OK)
+        response = self.decide(self.leader, second, 'approve')
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(BudgetRequest.objects.get(pk=second).status, BudgetRequestStatus.UNDER_APPROVAL)
+        self.assertEqual(BudgetApprovalRecord.objects.filter(request_id=second).count(), 0)
+
+    def test_rejection_closes_request(self):
+        """Test a rejection ends the workflow and later decisions conflict"""
+        request_id = self.submit('500').data['id']
+
+        response = self.decide(self.leader, request_id, 'reject', 'Insufficient justification')
+        self.assertEqual(response.data['status'], BudgetRequestStatus.REJECTED)
+        self.assertEqual(self.inbox(request_id), set())
+
+        self.client.force_authenticate(user=self.leader)
+        response = self.client.patch(
+            reverse('budgets:budget-request-decision', args=[request_id]), {'decision': 'approve'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_only_stage_approvers_decide(self):
+        """Test team members without an inbox entry cannot decide"""
+        request_id = self.submit('500').data['id']
+
+        response = self.decide(self.member, request_id, 'approve')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(BudgetApprovalRecord.objects.exists())
+
+    def test_pending_inbox(self):
+        """Test the inbox lists the requests waiting for the user, in constant queries"""
+        first = self.submit('100').data['id']
+        second = self.submit('200').data['id']
+        self.client.force_authenticate(user=self.leader)
+        url = reverse('budgets:budget-request-pending')
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual([item['id'] for item in response.data['results']], [first, second])
+
+        self.decide(self.leader, first, 'approve')
+        self.client.force_authenticate(user=self.other_leader)
+        self.assertEqual(self.client.get(url).data['count'], 0)
+
+    def test_update_before_decision_reroutes(self):
+        """Test the requester can change a request until the first decision"""
+        request_id = self.submit('500').data['id']
+        url = reverse('budgets:budget-request-detail', args=[request_id])
+        payload = {'task_id': 123, 'amount': '15000', 'currency': 'AUD', 'budget_pool_id': self.pool.id}
+
+        response = self.client.put(url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['required_stages'], 2)
+
+        self.decide(self.leader, request_id, 'approve')
+        self.client.force_authenticate(user=self.requester)
+        self.assertEqual(self.client.put(url, payload, format='json').status_code, status.HTTP_409_CONFLICT)
+
+    def test_invalid_submissions(self):
+        """Test the team header and currency are validated"""
+        self.assertEqual(self.submit('100', currency='A1').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.submit('100', currency='USD').status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(
+            self.url, {'task_id': 1, 'amount': '100', 'currency': 'AUD', 'budget_pool_id': self.pool.id}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(BudgetRequest.objects.exists())
+
+    def test_history_is_append_only(self):
+        """Test approval records cannot be changed or deleted"""
+        request_id = self.submit('500').data['id']
+        self.decide(self.leader, request_id, 'approve')
+        record = BudgetApprovalRecord.objects.get()
+
+        record.comment = 'changed'
+        with self.assertRaises(ValueError):
+            record.save()
+        with self.assertRaises(ValueError):
+            record.delete()
@@ -0,0 +1,161 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from access_control.models import PermissionApprover, UserRole
+from budgets.models import BudgetPool, BudgetRequest, BudgetRequestStatus, PendingApproval
+from budgets.services.approval import BudgetApprovalService
+from budgets.services.escalation import BudgetEscalationService
+from core.models import Organization, Permission, Role
+from teams.models import Team, TeamMember
+from user_preferences.models import PendingNotification
+
+User = get_user_model()
+
+
+class BudgetEscalationTest(TestCase):
+    """
+    Test cases for the escalation of overdue budget requests
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        organization = Organization.objects.create(name='Agency')
+        approve = Permission.objects.create(module='BUDGET', action='APPROVE')
+        team_leader = Role.objects.create(organization=organization, name='team_leader', level=2)
+        org_admin = Role.objects.create(organization=organization, name='org_admin', level=1)
+        self.team = Team.objects.create(name='Creative', organization_id=organization.id)
+
+        self.requester = self.create_user('requester')
+        self.leader = self.create_user('leader', team_leader, approve)
+        self.admin = self.create_user('admin', org_admin, approve)
+        TeamMember.objects.create(user_id=self.leader.id, team_id=self.team.id)
+        self.pool = BudgetPool.objects.create(team_id=self.team.id, month='2026-10-01', currency='AUD')
+        self.service = BudgetEscalationService()
+
+    def create_user(self, username, role=None, permission=None):
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password='testpass123')
+        if role:
+            UserRole.objects.create(user=user, role=role, valid_from=timezone.now() - timedelta(days=30))
+        if permission:
+            PermissionApprover.objects.create(permission=permission, user=user)
+        return user
+
+    def create_requests(self, count, submitted_at, amount=Decimal('2500')):
+        requests = []
+        for i in range(count):
+            budget_request = BudgetRequest.objects.create(
+                task_id=i, requested_by=self.requester, team_id=self.team.id, budget_pool=self.pool,
+                amount=amount, currency='AUD'
+            )
+            requests.append(BudgetApprovalService().submit(budget_request, now=submitted_at))
+        return requests
+
+    def test_overdue_request_escalates(self):
+        """Test an overdue stage goes to the next role level up and its approvers are notified"""
+        now = timezone.now()
+        overdue, on_time = self.create_requests(2, now - timedelta(days=3))
+        BudgetRequest.objects.filter(pk=on_time.pk).update(due_at=now + timedelta(hours=1))
+
+        self.assertEqual(self.service.count_due(now), 1)
+        self.assertEqual(self.service.run(now), 1)
+
+        overdue.refresh_from_db()
+        self.assertTrue(overdue.is_escalated)
+        self.assertEqual(overdue.escalation_level, 1)
+        self.assertEqual(overdue.due_at, now + timedelta(hours=48))
+        self.assertEqual(
+            set(PendingApproval.objects.filter(request=overdue).values_list('approver_id', flat=True)),
+            {self.leader.id, self.admin.id}
+        )
+        self.assertTrue(PendingNotification.objects.filter(user=self.admin, trigger_type='budget_escalated').exists())
+        self.assertFalse(PendingApproval.objects.filter(request=on_time, approver=self.admin).exists())
+
+    def test_no_higher_level(self):
+        """Test a request escalated to the top level is no longer due"""
+        now = timezone.now()
+        budget_request, = self.create_requests(1, now - timedelta(days=3))
+        self.service.run(now)
+
+        later = now + timedelta(days=3)
+        self.assertEqual(self.service.run(later), 0)
+
+        budget_request.refresh_from_db()
+        self.assertEqual((budget_request.escalation_level, budget_request.due_at), (1, None))
+        self.assertEqual(self.service.count_due(later), 0)
+
+    def test_deleted_roles_are_skipped(self):
+        """Test soft-deleted roles are no escalation tier and deleted assignments are no approvers"""
+        now = timezone.now()
+        first, second = self.create_requests(2, now - timedelta(days=3))
+        UserRole.objects.filter(user=self.admin).update(is_deleted=True)
+
+        self.assertEqual(self.service.run(now), 2)
+
+        first.refresh_from_db()
+        self.assertEqual(first.escalation_level, 1)
+        self.assertFalse(PendingApproval.objects.filter(approver=self.admin).exists())
+
+        Role.objects.filter(name='org_admin').update(is_deleted=True)
+        BudgetRequest.objects.filter(pk=second.pk).update(escalation_level=None, due_at=now)
+        self.assertEqual(BudgetEscalationService().run(now), 0)
+
+        second.refresh_from_db()
+        self.assertIsNone(second.due_at)
+
+    def test_next_stage_is_not_escalated(self):
+        """Test a request routed to its next stage is no longer reported as escalated"""
+        now = timezone.now()
+        budget_request, = self.create_requests(1, now - timedelta(days=3), amount=Decimal('25000'))
+        self.service.run(now)
+
+        budget_request = BudgetApprovalService().decide(self.leader, budget_request.pk, 'approve', now=now)
+
+        budget_request.refresh_from_db()
+        self.assertEqual(budget_request.current_stage, 2)
+        self.assertFalse(budget_request.is_escalated)
+        self.assertIsNone(budget_request.escalation_level)
+        self.assertEqual(budget_request.due_at, now + timedelta(hours=48))
+
+    def test_decided_requests_are_not_escalated(self):
+        """Test closed requests are never escalated"""
+        now = timezone.now()
+        budget_request, = self.create_requests(1, now - timedelta(days=3))
+        BudgetRequest.objects.filter(pk=budget_request.pk).update(status=BudgetRequestStatus.REJECTED)
+
+        self.assertEqual(self.service.run(now), 0)
+        self.assertFalse(PendingApproval.objects.filter(approver=self.admin).exists())
+
+    def test_batch_queries_do_not_grow(self):
+        """Test a batch costs the same number of queries whatever its size"""
+        now = timezone.now()
+        self.create_requests(2, now - timedelta(days=3))
+        with CaptureQueriesContext(connection) as small:
+            self.assertEqual(BudgetEscalationService().run(now), 2)
+
+        BudgetRequest.objects.update(due_at=None, escalation_level=None)
+        self.create_requests(20, now - timedelta(days=3))
+        with CaptureQueriesContext(connection) as large:
+            self.assertEqual(BudgetEscalationService().run(now), 20)
+
+        self.assertEqual(len(small), len(large))
+
+    def test_command(self):
+        """Test the command reports overdue requests and escalates them"""
+        self.create_requests(3, timezone.now() - timedelta(days=3))
+
+        out = StringIO()
+        call_command('escalate_budget_requests', '--dry-run', stdout=out)
+        self.assertIn('Due: 3 requests', out.getvalue())
+        self.assertFalse(BudgetRequest.objects.filter(is_escalated=True).exists())
+
+        call_command('escalate_budget_requests', '--batch-size', '2', stdout=out)
+        self.assertIn('Escalated: 3 requests', out.getvalue())
+        self.assertEqual(BudgetRequest.objects.filter(is_escalated=True).count(), 3)
@@ -0,0 +1,273 @@
+import threading
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Sum
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from access_control.models import RolePermission, UserRole
+from budgets.models import BudgetLedgerEntry, BudgetPool, BudgetPoolSnapshot, BudgetRequest
+from budgets.services.ledger import BudgetLedgerService, InsufficientFunds, LedgerError
+from core.models import Organization, Permission, Role
+from teams.models import Team, TeamMember
+
+User = get_user_model()
+
+
+class BudgetLedgerTest(TestCase):
+    """
+    Test cases for budget pool balances and their ledger
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='manager',
+            email='manager@example.com',
+            password='testpass123'
+        )
+        organization = Organization.objects.create(name='Agency')
+        role = Role.objects.create(organization=organization, name='org_admin', level=1)
+        RolePermission.objects.create(
+            role=role,
+            permission=Permission.objects.create(module='BUDGET', action='APPROVE')
+        )
+        UserRole.objects.create(user=self.user, role=role)
+        self.team = Team.objects.create(name='Creative', organization_id=organization.id)
+        TeamMember.objects.create(user_id=self.user.id, team_id=self.team.id)
+        self.ledger = BudgetLedgerService()
+        self.source = self.create_pool(Decimal('1000'))
+        self.target = self.create_pool(Decimal('0'), ad_channel='search')
+        self.client.force_authenticate(user=self.user)
+
+    def create_pool(self, amount, **fields):
+        fields.setdefault('month', '2026-10-01')
+        pool = BudgetPool.objects.create(team_id=self.team.id, currency='AUD', **fields)
+        if amount:
+            self.ledger.allocate(pool.id, amount)
+        return pool
+
+    def assert_balanced(self):
+        """Every ledger transaction sums to zero"""
+        totals = BudgetLedgerEntry.objects.values('transaction_id').annotate(total=Sum('amount'))
+        self.assertTrue(totals.exists())
+        self.assertTrue(all(row['total'] == 0 for row in totals))
+
+    def test_reallocate(self):
+        """Test a reallocation moves available funds and writes balanced entries"""
+        url = reverse('budgets:budget-pool-reallocate', args=[self.source.id])
+
+        response = self.client.patch(
+            url, {'to_pool_id': self.target.id, 'amount': '250.00', 'currency': 'aud', 'comment': 'Search push'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['available'], '750.00')
+        self.assertEqual(response.data['month'], '2026-10')
+        self.target.refresh_from_db()
+        self.assertEqual((self.target.total_amount, self.target.available), (Decimal('250'), Decimal('250')))
+        self.assert_balanced()
+
+    def test_reallocate_rejects_invalid_moves(self):
+        """Test overdrafts, currency mismatches and unknown pools are refused"""
+        url = reverse('budgets:budget-pool-reallocate', args=[self.source.id])
+        for payload, expected in [
+            ({'to_pool_id': self.target.id, 'amount': '1000.01', 'currency': 'AUD'}, status.HTTP_400_BAD_REQUEST),
+            ({'to_pool_id': self.target.id, 'amount': '10', 'currency': 'USD'}, status.HTTP_400_BAD_REQUEST),
+            ({'to_pool_id': self.source.id, 'amount': '10', 'currency': 'AUD'}, status.HTTP_400_BAD_REQUEST),
+            ({'to_pool_id': 999999, 'amount': '10', 'currency': 'AUD'}, status.HTTP_404_NOT_FOUND),
+        ]:
+            self.assertEqual(self.client.patch(url, payload, format='json').status_code, expected, payload)
+
+        self.source.refresh_from_db()
+        self.assertEqual(self.source.available, Decimal('1000'))
+        self.assertEqual(BudgetLedgerEntry.objects.count(), 2)
+
+    def test_reallocate_requires_permission(self):
+        """Test users without BUDGET:APPROVE cannot move funds"""
+        member = User.objects.create_user(username='member', email='member@example.com', password='testpass123')
+        self.client.force_authenticate(user=member)
+
+        response = self.client.patch(
+            reverse('budgets:budget-pool-reallocate', args=[self.source.id]),
+            {'to_pool_id': self.target.id, 'amount': '10', 'currency': 'AUD'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_deleted_roles_do_not_grant_reallocation(self):
+        """Test soft-deleted role assignments and role permissions no longer grant BUDGET:APPROVE"""
+        for model in (UserRole, RolePermission):
+            model.objects.update(is_deleted=True)
+
+            response = self.client.patch(
+                reverse('budgets:budget-pool-reallocate', args=[self.source.id]),
+                {'to_pool_id': self.target.id, 'amount': '10', 'currency': 'AUD'},
+                format='json'
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+            model.objects.update(is_deleted=False)
+        self.source.refresh_from_db()
+        self.assertEqual(self.source.available, Decimal('1000'))
+
+    def test_reallocate_requires_team_membership(self):
+        """Test approvers cannot move funds from or to pools of teams they are not in"""
+        other_team = Team.objects.create(name='Media', organization_id=self.team.organization_id)
+        other_pool = BudgetPool.objects.create(team_id=other_team.id, month='2026-10-01', currency='AUD')
+        self.ledger.allocate(other_pool.id, Decimal('500'))
+        outsider = User.objects.create_user(username='outsider', email='outsider@example.com', password='testpass123')
+        UserRole.objects.create(user=outsider, role=Role.objects.get(name='org_admin'))
+        TeamMember.objects.create(user_id=outsider.id, team_id=other_team.id)
+
+        self.client.force_authenticate(user=outsider)
+        response = self.client.patch(
+            reverse('budgets:budget-pool-reallocate', args=[self.source.id]),
+            {'to_pool_id': other_pool.id, 'amount': '100', 'currency': 'AUD'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.patch(
+            reverse('budgets:budget-pool-reallocate', args=[self.source.id]),
+            {'to_pool_id': other_pool.id, 'amount': '100', 'currency': 'AUD'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            list(BudgetPool.objects.order_by('pk').values_list('available', flat=True)),
+            [Decimal('1000'), Decimal('0'), Decimal('500')]
+        )
+
+    def test_team_pools(self):
+        """Test members see their team's pools, filtered by month"""
+        self.create_pool(Decimal('50'), month='2026-11-01')
+        url = reverse('budgets:budget-pool-list', args=[self.team.id])
+
+        response = self.client.get(url, {'month': '2026-10'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({pool['id'] for pool in response.data['results']}, {self.source.id, self.target.id})
+        self.assertEqual(self.client.get(url, {'month': 'October'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+        outsider = User.objects.create_user(username='outsider', email='outsider@example.com', password='testpass123')
+        self.client.force_authenticate(user=outsider)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_commit_is_conditional(self):
+        """Test a commitment larger than the available balance changes nothing"""
+        budget_request = BudgetRequest.objects.create(
+            task_id=1, requested_by=self.user, team_id=self.team.id, budget_pool=self.source,
+            amount=Decimal('1000.01'), currency='AUD'
+        )
+
+        with self.assertRaises(InsufficientFunds):
+            self.ledger.commit(budget_request)
+
+        budget_request.amount = Decimal('1000')
+        self.ledger.commit(budget_request)
+        self.source.refresh_from_db()
+        self.assertEqual((self.source.available, self.source.used_amount), (Decimal('0'), Decimal('1000')))
+        with self.assertRaises(LedgerError):
+            self.ledger.allocate(self.source.id, Decimal('-5'))
+
+    def test_snapshots(self):
+        """Test snapshots add up new entries, detect drift and are compacted"""
+        out = StringIO()
+        call_command('snapshot_budget_pools', stdout=out)
+        self.assertIn('Snapshotted 1 pools', out.getvalue())
+
+        self.ledger.reallocate(self.source.id, self.target.id, Decimal('300'), 'AUD')
+        BudgetPool.objects.filter(pk=self.target.pk).update(
+            available=Decimal('301'), total_amount=Decimal('301')
+        )
+        with self.assertLogs('budgets.services.ledger', level='ERROR'):
+            created, mismatched = self.ledger.take_snapshots()
+
+        self.assertEqual((created, mismatched), (2, [self.target.id]))
+        snapshot = BudgetPoolSnapshot.objects.filter(pool=self.source).first()
+        self.assertEqual((snapshot.available, snapshot.used_amount), (Decimal('700'), Decimal('0')))
+        self.assertEqual(self.ledger.take_snapshots(), (0, []))
+
+        BudgetPoolSnapshot.objects.update(created_at='2020-01-01T00:00:00Z')
+        self.assertEqual(self.ledger.compact_snapshots(keep_days=30), 1)
+        self.assertEqual(BudgetPoolSnapshot.objects.count(), 2)
+
+
+class BudgetLedgerConcurrencyTest(TransactionTestCase):
+    """
+    Test cases for concurrent budget pool movements
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(username='requester', email='requester@example.com', password='testpass123')
+        self.team = Team.objects.create(name='Creative', organization_id=1)
+        self.ledger = BudgetLedgerService()
+        self.pools = [
+            BudgetPool.objects.create(team_id=self.team.id, month='2026-10-01', currency='AUD', ad_channel=channel)
+            for channel in ('social', 'search')
+        ]
+        for pool in self.pools:
+            self.ledger.allocate(pool.id, Decimal('10000'))
+
+    def run_threads(self, targets):
+        errors = []
+
+        def run(target):
+            try:
+                target()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run, args=(target,)) for target in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def test_concurrent_commits_cannot_overdraw(self):
+        """Test only the commitments the pool can cover succeed"""
+        requests = [
+            BudgetRequest.objects.create(
+                task_id=i, requested_by=self.user, team_id=self.team.id, budget_pool=self.pools[0],
+                amount=Decimal('3000'), currency='AUD'
+            )
+            for i in range(6)
+        ]
+
+        errors = self.run_threads([lambda r=r: self.ledger.commit(r) for r in requests])
+
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(all(isinstance(e, InsufficientFunds) for e in errors))
+        pool = BudgetPool.objects.get(pk=self.pools[0].pk)
+        self.assertEqual((pool.available, pool.used_amount), (Decimal('1000'), Decimal('9000')))
+
+    def test_opposite_reallocations_do_not_deadlock(self):
+        """Test reallocations in both directions at once all complete"""
+        first, second = (pool.id for pool in self.pools)
+
+        def move(source, target):
+            for _ in range(10):
+                self.ledger.reallocate(source, target, Decimal('10'), 'AUD')
+
+        errors = self.run_threads([lambda: move(first, second), lambda: move(second, first)] * 2)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            list(BudgetPool.objects.order_by('pk').values_list('available', flat=True)),
+            [Decimal('10000'), Decimal('10000')]
+        )
+        self.assertEqual(BudgetLedgerEntry.objects.filter(entry_type='reallocation').count(), 80)
@@ -0,0 +1,19 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from . import views
+
+# Create router for ViewSets
+router = DefaultRouter()
+router.register(r'budgets/requests', views.BudgetRequestViewSet, basename='budget-request')
+
+app_name = 'budgets'
+
+urlpatterns = [
+    path('', include(router.urls)),
+    path('budgets/pools/<int:team_id>/', views.BudgetPoolListView.as_view(), name='budget-pool-list'),
+    path(
+        'budgets/pools/<int:pool_id>/reallocate/',
+        views.BudgetPoolReallocateView.as_view(),
+        name='budget-pool-reallocate'
+    ),
+]
@@ -0,0 +1,194 @@
+import logging
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import Q
+from rest_framework import generics, mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from teams.models import Team, TeamMember
+from .models import BudgetApprovalRecord, BudgetPool, BudgetRequest, PendingApproval
+from .serializers import (
+    ApprovalDecisionSerializer, ApprovalRecordSerializer, BudgetPoolSummarySerializer, BudgetRequestSerializer,
+    ReallocateSerializer
+)
+from .services.approval import BudgetApprovalService, DecisionConflict
+from .services.ledger import BudgetLedgerService, LedgerError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+def check_team_member(user, team_id):
+    """Verify the user belongs to a team"""
+    if not user.is_superuser and not TeamMember.objects.filter(user_id=user.id, team_id=team_id).exists():
+        raise PermissionDenied('You are not a member of this team.')
+
+
+class BudgetRequestViewSet(mixins.CreateModelMixin,
+                           mixins.RetrieveModelMixin,
+                           mixins.ListModelMixin,
+                           viewsets.GenericViewSet):
+    """
+    ViewSet for budget requests and their approval
+
+    Users see the requests they made, those of their teams and those
+    waiting for their approval. Requests are submitted for approval on
+    creation and cannot be deleted.
+    """
+
+    serializer_class = BudgetRequestSerializer
+    permission_classes = [IsAuthenticated]
+    filterset_fields = ['status', 'task_id', 'budget_pool']
+    ordering_fields = ['created_at', 'submitted_at', 'amount']
+    ordering = ['-created_at']
+
+    def get_queryset(self):
+        """Get budget requests based on user authorization"""
+        user = self.request.user
+        requests = BudgetRequest.objects.all()
+        if not user.is_superuser:
+            requests = requests.filter(
+                Q(requested_by=user) |
+                Q(team_id__in=TeamMember.objects.filter(user_id=user.id).values('team_id')) |
+                Q(id__in=PendingApproval.objects.filter(approver=user).values('request_id')) |
+                Q(id__in=BudgetApprovalRecord.objects.filter(user=user).values('request_id'))
+            )
+
+        team_id = self.request.query_params.get('team_id')
+        if self.action == 'list' and team_id is not None:
+            if not team_id.isdigit():
+                raise ValidationError({'team_id': 'team_id must be a team ID.'})
+            check_team_member(user, int(team_id))
+            requests = requests.filter(team_id=int(team_id))
+        return requests
+
+    def perform_create(self, serializer):
+        """Create a request for the X-Team-Id team and submit it for approval"""
+        team_id = self.request.headers.get('X-Team-Id', '')
+        if not team_id.isdigit() or not Team.objects.filter(id=int(team_id), deleted_at__isnull=True).exists():
+            raise ValidationError({'team_id': 'The X-Team-Id header must be the ID of an existing team.'})
+        check_team_member(self.request.user, int(team_id))
+        if serializer.validated_data['budget_pool'].team_id != int(team_id):
+            raise ValidationError({'budget_pool_id': 'The budget pool does not belong to this team.'})
+
+        with transaction.atomic():
+            budget_request = serializer.save(requested_by=self.request.user, team_id=int(team_id))
+            BudgetApprovalService().submit(budget_request)
+        logger.info(f"Budget request {budget_request.pk} submitted by user {self.request.user.id}")
+
+    def update(self, request, pk=None):
+        """
+        Change a request that no approver has decided on yet
+
+        Only the requester can change it; it is routed again from stage 1.
+        """
+        budget_request = self.get_object()
+        if budget_request.requested_by_id != request.user.id:
+            raise PermissionDenied('Only the requester can change a budget request.')
+        serializer = self.get_serializer(budget_request, data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if serializer.validated_data['budget_pool'].team_id != budget_request.team_id:
+            raise ValidationError({'budget_pool_id': 'The budget pool does not belong to the team of the request.'})
+
+        try:
+            with transaction.atomic():
+                budget_request = BudgetRequest.objects.select_for_update().get(pk=budget_request.pk)
+                serializer.instance = budget_request
+                BudgetApprovalService().resubmit(serializer.save())
+        except DecisionConflict as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+        return Response(self.get_serializer(budget_request).data)
+
+    @action(detail=True, methods=['patch'])
+    def decision(self, request, pk=None):
+        """Approve or reject the current stage of a request"""
+        budget_request = self.get_object()
+        serializer = ApprovalDecisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            budget_request = BudgetApprovalService().decide(
+                request.user,
+                budget_request.pk,
+                serializer.validated_data['decision'],
+                serializer.validated_data.get('comment')
+            )
+        except DecisionConflict as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+        return Response(self.get_serializer(budget_request).data)
+
+    @action(detail=True, methods=['get'])
+    def history(self, request, pk=None):
+        """List the approval decisions of a request, by stage"""
+        budget_request = self.get_object()
+        return Response(ApprovalRecordSerializer(budget_request.approval_records.all(), many=True).data)
+
+    @action(detail=False, methods=['get'])
+    def pending(self, request):
+        """List the requests waiting for the user's approval, oldest first"""
+        inbox = PendingApproval.objects.filter(approver=request.user).select_related('request')
+        page = self.paginate_queryset(inbox)
+        serializer = self.get_serializer([entry.request for entry in page], many=True)
+        return self.get_paginated_response(serializer.data)
+
+
+class BudgetPoolListView(generics.ListAPIView):
+    """
+    Budget pools of a team with their balances
+
+    ?month=YYYY-MM limits the pools to a month.
+    """
+
+    serializer_class = BudgetPoolSummarySerializer
+    permission_classes = [IsAuthenticated]
+    filterset_fields = ['project_id', 'ad_channel', 'currency']
+
+    def get_queryset(self):
+        team_id = self.kwargs['team_id']
+        if not Team.objects.filter(id=team_id, deleted_at__isnull=True).exists():
+            raise NotFound('Team not found.')
+        check_team_member(self.request.user, team_id)
+
+        pools = BudgetPool.objects.filter(team_id=team_id)
+        month = self.request.query_params.get('month')
+        if month:
+            try:
+                pools = pools.filter(month=datetime.strptime(month, '%Y-%m').date())
+            except ValueError:
+                raise ValidationError({'month': 'month must be formatted as YYYY-MM.'})
+        return pools
+
+
+class BudgetPoolReallocateView(APIView):
+    """
+    Move available funds from a budget pool to another one
+
+    Needs the BUDGET:APPROVE permission. Returns the balances of the pool
+    the funds were taken from.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def patch(self, request, pool_id):
+        serializer = ReallocateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ledger = BudgetLedgerService()
+        if not ledger.can_manage(request.user):
+            raise PermissionDenied('You do not have permission to reallocate budget.')
+
+        data = serializer.validated_data
+        try:
+            source, _ = ledger.reallocate(
+                pool_id, data['to_pool_id'], data['amount'], data['currency'],
+                user=request.user, comment=data.get('comment')
+            )
+        except BudgetPool.DoesNotExist:
+            return Response({"error": "Budget pool not found"}, status=status.HTTP_404_NOT_FOUND)
+        except LedgerError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(BudgetPoolSummarySerializer(source).data)
@@ -2,8 +2,10 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
-from .models import Campaign, CampaignAssignment, CampaignMetric, CampaignNote
-from django.db.models import Q
+from django.utils import timezone
+from .models import Campaign, CampaignAssignment, CampaignHourlyMetric, CampaignMetric, CampaignNote
+from .services.response_cache import invalidate_campaign_responses
+from django.db.models import F, Q
 
 
 @admin.register(Campaign)
@@ -82,9 +84,19 @@ class CampaignAdmin(admin.ModelAdmin):
 
     actions = ['activate_campaigns', 'pause_campaigns', 'complete_campaigns']
 
+    def _set_status(self, queryset, new_status):
+        """Bulk update the status of the selected campaigns"""
+        campaign_ids = list(queryset.values_list('id', flat=True))
+        updated = Campaign.objects.filter(id__in=campaign_ids).update(
+            status=new_status, version=F('version') + 1, updated_at=timezone.now()
+        )
+        # update() does not send post_save
+        invalidate_campaign_responses(campaign_ids)
+        return updated
+
     def activate_campaigns(self, request, queryset):
         """Bulk action to activate campaigns"""
-        updated = queryset.update(status='active')
+        updated = self._set_status(queryset, 'active')
         self.message_user(
             request,
             f'Successfully activated {updated} campaign(s).'
@@ -93,7 +105,7 @@ class CampaignAdmin(admin.ModelAdmin):
 
     def pause_campaigns(self, request, queryset):
         """Bulk action to pause campaigns"""
-        updated = queryset.update(status='paused')
+        updated = self._set_status(queryset, 'paused')
         self.message_user(
             request,
             f'Successfully paused {updated} campaign(s).'
@@ -102,7 +114,7 @@ class CampaignAdmin(admin.ModelAdmin):
 
     def complete_campaigns(self, request, queryset):
         """Bulk action to complete campaigns"""
-        updated = queryset.update(status='completed')
+        updated = self._set_status(queryset, 'completed')
         self.message_user(
             request,
             f'Successfully completed {updated} campaign(s).'
@@ -143,7 +155,7 @@ class CampaignMetricAdmin(admin.ModelAdmin):
     ]
     list_filter = ['date', 'recorded_at']
     search_fields = ['campaign__name']
-    readonly_fields = ['recorded_at', 'click_through_rate', 'conversion_rate']
+    readonly_fields = ['recorded_at', 'spend', 'click_through_rate', 'conversion_rate']
 
     fieldsets = (
         ('Campaign Data', {
@@ -153,7 +165,7 @@ class CampaignMetricAdmin(admin.ModelAdmin):
             'fields': ('impressions', 'clicks', 'conversions')
         }),
         ('Financial Data', {
-            'fields': ('cost_per_click', 'cost_per_impression', 'cost_per_conversion')
+            'fields': ('cost_per_click', 'cost_per_impression', 'cost_per_conversion', 'spend')
         }),
         ('Computed Metrics', {
             'fields': ('click_through_rate', 'conversion_rate'),
@@ -184,6 +196,34 @@ class CampaignMetricAdmin(admin.ModelAdmin):
     cpc_display.admin_order_field = 'cost_per_click'
 
 
+@admin.register(CampaignHourlyMetric)
+class CampaignHourlyMetricAdmin(admin.ModelAdmin):
+    """
+    Admin interface for CampaignHourlyMetric model
+
+    Read-only: hourly metrics are recorded through the API so that the
+    daily rollup and campaign spend stay in sync
+    """
+
+    list_display = ['campaign', 'hour', 'impressions', 'clicks', 'conversions', 'spend_display']
+    list_filter = ['hour']
+    search_fields = ['campaign__name']
+    list_select_related = ['campaign']
+    date_hierarchy = 'hour'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def spend_display(self, obj):
+        """Display spend with currency formatting"""
+        return f"${obj.spend:,.2f}"
+    spend_display.short_description = 'Spend'
+    spend_display.admin_order_field = 'spend_micros'
+
+
 @admin.register(CampaignNote)
 class CampaignNoteAdmin(admin.ModelAdmin):
     """
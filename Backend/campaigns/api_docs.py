@@ -135,6 +135,20 @@ The API uses standard HTTP status codes and returns detailed error messages in J
                         "description": "Number of results per page",
                         "required": False,
                         "schema": {"type": "integer", "default": 20, "maximum": 100}
+                    },
+                    {
+                        "name": "fields",
+                        "in": "query",
+                        "description": "Comma separated fields to return (default: all fields)",
+                        "required": False,
+                        "schema": {"type": "string", "example": "id,name,status"}
+                    },
+                    {
+                        "name": "expand",
+                        "in": "query",
+                        "description": "Relations to embed as nested objects when fields is given (owner); otherwise they are returned as IDs",
+                        "required": False,
+                        "schema": {"type": "string", "example": "owner"}
                     }
                 ],
                 "responses": {
@@ -280,6 +294,20 @@ The API uses standard HTTP status codes and returns detailed error messages in J
                         "required": True,
                         "description": "Campaign UUID",
                         "schema": {"type": "string", "format": "uuid"}
+                    },
+                    {
+                        "name": "fields",
+                        "in": "query",
+                        "description": "Comma separated fields to return (default: all fields)",
+                        "required": False,
+                        "schema": {"type": "string", "example": "id,name,status"}
+                    },
+                    {
+                        "name": "expand",
+                        "in": "query",
+                        "description": "Relations to embed as nested objects when fields is given (owner); otherwise they are returned as IDs",
+                        "required": False,
+                        "schema": {"type": "string", "example": "owner"}
                     }
                 ],
                 "responses": {
@@ -414,6 +442,97 @@ The API uses standard HTTP status codes and returns detailed error messages in J
                 }
             }
         },
+        "/campaigns/bulk-status/": {
+            "post": {
+                "summary": "Bulk update campaign status",
+                "description": "Move many campaigns to one status in a single request. Each transition is validated against the campaign status workflow; allowed ones are applied together and a note is created for each updated campaign.",
+                "operationId": "bulkUpdateCampaignStatus",
+                "tags": ["Campaigns"],
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "required": ["campaign_ids", "status"],
+                                "properties": {
+                                    "campaign_ids": {
+                                        "type": "array",
+                                        "items": {"type": "string", "format": "uuid"},
+                                        "minItems": 1,
+                                        "maxItems": 1000
+                                    },
+                                    "status": {
+                                        "type": "string",
+                                        "enum": ["draft", "active", "paused", "completed", "cancelled"]
+                                    },
+                                    "reason": {"type": "string", "maxLength": 500}
+                                }
+                            },
+                            "example": {
+                                "campaign_ids": [
+                                    "123e4567-e89b-12d3-a456-426614174000",
+                                    "123e4567-e89b-12d3-a456-426614174001"
+                                ],
+                                "status": "paused",
+                                "reason": "Quarter-end budget review"
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Per-campaign outcomes",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "status": {"type": "string"},
+                                        "updated_count": {"type": "integer"},
+                                        "results": {
+                                            "type": "array",
+                                            "items": {
+                                                "type": "object",
+                                                "properties": {
+                                                    "id": {"type": "string", "format": "uuid"},
+                                                    "outcome": {
+                                                        "type": "string",
+                                                        "enum": ["updated", "invalid_transition", "not_found"]
+                                                    },
+                                                    "previous_status": {"type": "string"},
+                                                    "error": {"type": "string"}
+                                                }
+                                            }
+                                        }
+                                    }
+                                },
+                                "example": {
+                                    "status": "paused",
+                                    "updated_count": 1,
+                                    "results": [
+                                        {
+                                            "id": "123e4567-e89b-12d3-a456-426614174000",
+                                            "outcome": "updated",
+                                            "previous_status": "active"
+                                        },
+                                        {
+                                            "id": "123e4567-e89b-12d3-a456-426614174001",
+                                            "outcome": "invalid_transition",
+                                            "previous_status": "draft",
+                                            "error": "Cannot transition from \"draft\" to \"paused\"."
+                                        }
+                                    ]
+                                }
+                            }
+                        }
+                    },
+                    "400": {"$ref": "#/components/responses/BadRequest"},
+                    "401": {"$ref": "#/components/responses/Unauthorized"},
+                    "403": {"$ref": "#/components/responses/Forbidden"}
+                }
+            }
+        },
         "/campaigns/{campaign_id}/metrics_summary/": {
             "get": {
                 "summary": "Get campaign metrics summary",
@@ -631,6 +750,94 @@ The API uses standard HTTP status codes and returns detailed error messages in J
                 }
             }
         },
+        "/hourly-metrics/": {
+            "get": {
+                "summary": "List hourly metrics",
+                "description": "Retrieve hourly performance counters for accessible campaigns.",
+                "operationId": "listHourlyMetrics",
+                "tags": ["Metrics"],
+                "parameters": [
+                    {"name": "campaign", "in": "query", "schema": {"type": "string", "format": "uuid"}},
+                    {"name": "hour__gte", "in": "query", "schema": {"type": "string", "format": "date-time"}},
+                    {"name": "hour__lt", "in": "query", "schema": {"type": "string", "format": "date-time"}},
+                    {
+                        "name": "ordering",
+                        "in": "query",
+                        "schema": {
+                            "type": "string",
+                            "enum": ["hour", "-hour", "recorded_at", "-recorded_at", "impressions", "-impressions", "clicks", "-clicks"]
+                        }
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "List of hourly metrics",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "count": {"type": "integer"},
+                                        "next": {"type": "string", "nullable": True},
+                                        "previous": {"type": "string", "nullable": True},
+                                        "results": {
+                                            "type": "array",
+                                            "items": {"$ref": "#/components/schemas/CampaignHourlyMetric"}
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    },
+                    "401": {"$ref": "#/components/responses/Unauthorized"}
+                }
+            },
+            "post": {
+                "summary": "Record hourly metrics",
+                "description": "Record counters for one hour, or a list of up to 1000 (campaign, hour) entries. Re-sending an hour replaces its counters. The affected days are rolled up into the daily metrics and campaign spend is adjusted.",
+                "operationId": "recordHourlyMetrics",
+                "tags": ["Metrics"],
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "oneOf": [
+                                    {"$ref": "#/components/schemas/CampaignHourlyMetricCreate"},
+                                    {"type": "array", "items": {"$ref": "#/components/schemas/CampaignHourlyMetricCreate"}}
+                                ]
+                            },
+                            "example": {
+                                "campaign_id": "550e8400-e29b-41d4-a716-446655440000",
+                                "hour": "2024-03-01T14:00:00Z",
+                                "impressions": 1000,
+                                "clicks": 40,
+                                "conversions": 3,
+                                "spend_micros": 52500000
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "201": {
+                        "description": "Metrics recorded",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "oneOf": [
+                                        {"$ref": "#/components/schemas/CampaignHourlyMetric"},
+                                        {"type": "array", "items": {"$ref": "#/components/schemas/CampaignHourlyMetric"}}
+                                    ]
+                                }
+                            }
+                        }
+                    },
+                    "400": {"$ref": "#/components/responses/BadRequest"},
+                    "401": {"$ref": "#/components/responses/Unauthorized"},
+                    "403": {"$ref": "#/components/responses/Forbidden"}
+                }
+            }
+        },
         "/notes/": {
             "get": {
                 "summary": "List notes",
@@ -873,6 +1080,7 @@ The API uses standard HTTP status codes and returns detailed error messages in J
                     "cost_per_click": {"type": "string"},
                     "cost_per_impression": {"type": "string"},
                     "cost_per_conversion": {"type": "string"},
+                    "spend": {"type": "string", "description": "Spend of the day"},
                     "click_through_rate": {"type": "string", "description": "Calculated CTR"},
                     "conversion_rate": {"type": "string", "description": "Calculated CVR"},
                     "recorded_at": {"type": "string", "format": "date-time"},
@@ -889,10 +1097,38 @@ The API uses standard HTTP status codes and returns detailed error messages in J
                     "conversions": {"type": "integer", "minimum": 0},
                     "cost_per_click": {"type": "string", "pattern": "^\\d+\\.\\d{2}$"},
                     "cost_per_impression": {"type": "string", "pattern": "^\\d+\\.\\d{4}$"},
-                    "cost_per_conversion": {"type": "string", "pattern": "^\\d+\\.\\d{2}$"}
+                    "cost_per_conversion": {"type": "string", "pattern": "^\\d+\\.\\d{2}$"},
+                    "date": {"type": "string", "format": "date", "description": "Defaults to today"}
                 },
                 "required": ["campaign", "impressions", "clicks", "conversions"]
             },
+            "CampaignHourlyMetric": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "campaign_id": {"type": "string", "format": "uuid"},
+                    "hour": {"type": "string", "format": "date-time", "description": "Start of the hour (UTC)"},
+                    "impressions": {"type": "integer"},
+                    "clicks": {"type": "integer"},
+                    "conversions": {"type": "integer"},
+                    "spend_micros": {"type": "integer", "description": "Spend in millionths of the currency unit"},
+                    "spend": {"type": "string", "description": "Spend in currency units"},
+                    "recorded_at": {"type": "string", "format": "date-time"}
+                },
+                "required": ["id", "campaign_id", "hour", "impressions", "clicks", "conversions", "spend_micros", "recorded_at"]
+            },
+            "CampaignHourlyMetricCreate": {
+                "type": "object",
+                "properties": {
+                    "campaign_id": {"type": "string", "format": "uuid"},
+                    "hour": {"type": "string", "format": "date-time", "description": "Any time within the hour; truncated to its start"},
+                    "impressions": {"type": "integer", "minimum": 0},
+                    "clicks": {"type": "integer", "minimum": 0},
+                    "conversions": {"type": "integer", "minimum": 0},
+                    "spend_micros": {"type": "integer", "minimum": 0}
+                },
+                "required": ["campaign_id", "hour"]
+            },
             "CampaignNote": {
                 "type": "object",
                 "properties": {
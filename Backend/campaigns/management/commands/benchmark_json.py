@@ -0,0 +1,154 @@
+import io
+import statistics
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+from campaigns.api_docs import OPENAPI_SPEC
+
+
+class Command(BaseCommand):
+    """
+    Compare the stock DRF JSON renderer/parser with the orjson ones
+
+    Renders and parses representative campaign payloads (the OpenAPI spec,
+    a page of campaigns, raw metric rows and a bulk status result) and
+    reports throughput and latency percentiles for each backend. No
+    database access is needed.
+    """
+
+    help = 'Benchmark the DRF and orjson JSON renderers/parsers on campaign payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=200,
+            help='Number of timed runs per payload and backend (default: 200)'
+        )
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=100,
+            help='Rows in the list payloads (default: 100)'
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        payloads = self.build_payloads(options['rows'])
+        backends = [
+            ('drf', JSONRenderer(), JSONParser()),
+            ('orjson', ORJSONRenderer(), ORJSONParser()),
+        ]
+
+        self.stdout.write(
+            f'{"payload":<18} {"backend":<8} {"op":<6} {"bytes":>9} '
+            f'{"ops/s":>10} {"p50 ms":>8} {"p99 ms":>8}'
+        )
+        for payload_name, data in payloads.items():
+            for backend_name, renderer, parser in backends:
+                rendered = renderer.render(data)
+                timings = self.time(lambda: renderer.render(data), iterations)
+                self.write_row(payload_name, backend_name, 'render', len(rendered), timings)
+
+                timings = self.time(lambda: parser.parse(io.BytesIO(rendered)), iterations)
+                self.write_row(payload_name, backend_name, 'parse', len(rendered), timings)
+
+    def build_payloads(self, rows):
+        """Build representative campaign API payloads"""
+        now = timezone.now()
+        campaign_page = {
+            'count': rows * 10,
+            'next': 'http://localhost/api/campaigns/?page=2',
+            'previous': None,
+            'results': [
+                {
+                    'id': str(uuid.uuid4()),
+                    'name': f'Campaign {i}',
+                    'description': 'Spring awareness push across display and social channels',
+                    'campaign_type': 'digital_display',
+                    'campaign_type_display': 'Digital Display',
+                    'status': 'active',
+                    'status_display': 'Active',
+                    'budget': '10000.00',
+                    'spent_amount': f'{i * 37.5:.2f}',
+                    'budget_utilization': i * 0.375,
+                    'start_date': (now - timedelta(days=i)).isoformat(),
+                    'end_date': (now + timedelta(days=30)).isoformat(),
+                    'duration_days': 30 + i,
+                    'owner': {
+                        'id': i,
+                        'username': f'user{i}',
+                        'email': f'user{i}@example.com',
+                        'first_name': 'Alex',
+                        'last_name': 'Doe',
+                        'full_name': 'Alex Doe',
+                    },
+                    'team_member_count': i % 5,
+                    'created_at': now.isoformat(),
+                    'updated_at': now.isoformat(),
+                    'is_active': True,
+                    'version': i,
+                }
+                for i in range(rows)
+            ],
+        }
+        # Raw values() style rows with native Decimal, UUID and datetime values
+        metric_rows = [
+            {
+                'id': i,
+                'campaign_id': uuid.uuid4(),
+                'impressions': 10000 + i,
+                'clicks': 250 + i,
+                'conversions': 12,
+                'cost_per_click': Decimal('1.25'),
+                'cost_per_impression': Decimal('0.0125'),
+                'click_through_rate': Decimal('0.0250'),
+                'recorded_at': now - timedelta(hours=i),
+                'date': (now - timedelta(days=i)).date(),
+            }
+            for i in range(rows * 10)
+        ]
+        bulk_result = {
+            'status': 'paused',
+            'updated_count': rows * 10,
+            'results': [
+                {'id': uuid.uuid4(), 'outcome': 'updated', 'previous_status': 'active', 'error': None}
+                for _ in range(rows * 10)
+            ],
+        }
+        return {
+            'openapi_spec': OPENAPI_SPEC,
+            'campaign_page': campaign_page,
+            'metric_rows': metric_rows,
+            'bulk_status': bulk_result,
+        }
+
+    def time(self, func, iterations):
+        """Run func iterations times and return the per-run durations in seconds"""
+        func()  # warm up
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return timings
+
+    def write_row(self, payload_name, backend_name, operation, size, timings):
+        """Write one result line"""
+        timings = sorted(timings)
+        p50 = statistics.median(timings) * 1000
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000
+        ops = len(timings) / sum(timings) if sum(timings) else float('inf')
+        self.stdout.write(
+            f'{payload_name:<18} {backend_name:<8} {operation:<6} {size:>9} '
+            f'{ops:>10.0f} {p50:>8.3f} {p99:>8.3f}'
+        )
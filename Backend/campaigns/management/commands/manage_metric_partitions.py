@@ -0,0 +1,81 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from campaigns.services.metric_partitions import PARTITION_KEYS, MetricPartitionManager
+
+
+class Command(BaseCommand):
+    """
+    Create upcoming and detach expired campaign metric partitions
+
+    Handles the daily and the hourly metrics tables. Run daily from cron so next months' partitions always exist:
+
+        python manage.py manage_metric_partitions
+        python manage.py manage_metric_partitions --retain-months 24 --archive-schema metrics_archive
+    """
+
+    help = 'Create monthly campaign metric partitions ahead of time and detach old ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=3,
+            help='Create partitions up to this many months after the current one (default: 3)'
+        )
+        parser.add_argument(
+            '--retain-months',
+            type=int,
+            default=None,
+            help='Detach partitions whose month ended more than this many months ago (default: keep all)'
+        )
+        parser.add_argument(
+            '--archive-schema',
+            default=None,
+            help='Move detached partitions to this schema instead of leaving them in public'
+        )
+        parser.add_argument(
+            '--drop',
+            action='store_true',
+            help='Drop detached partitions instead of keeping them as tables'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report what would be created and detached'
+        )
+
+    def handle(self, *args, **options):
+        if options['months_ahead'] < 0:
+            raise CommandError('--months-ahead must not be negative')
+        if options['retain_months'] is not None and options['retain_months'] < 1:
+            raise CommandError('--retain-months must be a positive integer')
+        if options['drop'] and options['archive_schema']:
+            raise CommandError('--drop and --archive-schema are mutually exclusive')
+
+        for model in PARTITION_KEYS:
+            self.manage_table(MetricPartitionManager(model), options)
+
+    def manage_table(self, manager, options):
+        if not manager.is_partitioned():
+            raise CommandError(f'{manager.table} is not partitioned')
+
+        if options['dry_run']:
+            created = [str(month) for month in manager.get_missing_months(options['months_ahead'])]
+            detached = []
+            if options['retain_months'] is not None:
+                detached = manager.get_expired_partitions(options['retain_months'])
+            self.stdout.write(f"{manager.table}: would create: {', '.join(created) or 'none'}")
+            self.stdout.write(f"{manager.table}: would detach: {', '.join(detached) or 'none'}")
+            return
+
+        created = manager.ensure_partitions(options['months_ahead'])
+        self.stdout.write(self.style.SUCCESS(f"{manager.table}: created: {', '.join(created) or 'none'}"))
+
+        if options['retain_months'] is not None:
+            detached = manager.detach_partitions(
+                options['retain_months'],
+                archive_schema=options['archive_schema'],
+                drop=options['drop']
+            )
+            action = 'dropped' if options['drop'] else 'detached'
+            self.stdout.write(self.style.SUCCESS(f"{manager.table}: {action}: {', '.join(detached) or 'none'}"))
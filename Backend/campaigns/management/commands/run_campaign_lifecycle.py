@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from campaigns.services.lifecycle import CampaignLifecycleEngine
+
+
+class Command(BaseCommand):
+    """
+    Apply scheduled campaign status transitions
+
+    Run once per tick from cron, or with --interval as a long-running
+    worker loop:
+
+        python manage.py run_campaign_lifecycle
+        python manage.py run_campaign_lifecycle --interval 60
+    """
+
+    help = 'Activate campaigns whose start date has been reached and complete campaigns whose end date has passed'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=CampaignLifecycleEngine.DEFAULT_BATCH_SIZE,
+            help='Number of campaigns transitioned per UPDATE'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Keep running and repeat every N seconds (0 runs a single tick)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many campaigns are due'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be a positive integer')
+
+        engine = CampaignLifecycleEngine(batch_size=options['batch_size'])
+
+        while True:
+            if options['dry_run']:
+                results = engine.count_due()
+                label = 'Due'
+            else:
+                results = engine.run()
+                label = 'Transitioned'
+
+            summary = ', '.join(f'{count} -> {status}' for status, count in results.items())
+            self.stdout.write(self.style.SUCCESS(f'{label}: {summary}'))
+
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0002_campaign_lifecycle_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='budget_alert_level',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Highest budget utilization threshold (percent) already alerted'),
+        ),
+    ]
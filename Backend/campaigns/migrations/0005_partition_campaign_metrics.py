@@ -0,0 +1,108 @@
+from datetime import date
+
+from django.db import migrations
+
+TABLE = 'campaigns_campaignmetric'
+OLD_TABLE = 'campaigns_campaignmetric_unpartitioned'
+SEQUENCE = 'campaigns_campaignmetric_id_seq'
+MONTHS_AHEAD = 3
+
+
+def _month_start(day, offset=0):
+    index = day.year * 12 + day.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _constraints_sql():
+    return [
+        # The partition key has to be part of every unique constraint
+        f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, date)',
+        f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_campaign_id_date_77a58d83_uniq UNIQUE (campaign_id, date)',
+        f'ALTER TABLE {TABLE} ADD CONSTRAINT campaigns_campaignme_campaign_id_5264fbae_fk_campaigns '
+        f'FOREIGN KEY (campaign_id) REFERENCES campaigns_campaign (id) DEFERRABLE INITIALLY DEFERRED',
+        f'CREATE INDEX campaigns_c_campaig_296e25_idx ON {TABLE} (campaign_id, date)',
+        f'CREATE INDEX campaigns_c_recorde_ae95e8_idx ON {TABLE} (recorded_at)',
+        f'CREATE INDEX {TABLE}_campaign_id_5264fbae ON {TABLE} (campaign_id)',
+    ]
+
+
+def partition_metrics(apps, schema_editor):
+    """
+    Turn the metrics table into a table range partitioned by month on date
+
+    Rows are copied into monthly partitions covering the existing data and
+    the next MONTHS_AHEAD months, plus a default partition for anything
+    else. manage_metric_partitions creates later months. The id column
+    keeps its values and continues from a sequence, as identity columns
+    are not supported on partitioned tables before PostgreSQL 17.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    execute = schema_editor.execute
+    execute(f'ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}')
+    execute(
+        f'CREATE TABLE {TABLE} (LIKE {OLD_TABLE} INCLUDING CONSTRAINTS) '
+        f'PARTITION BY RANGE (date)'
+    )
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'SELECT MIN(date), MAX(id) FROM {OLD_TABLE}')
+        first_date, max_id = cursor.fetchone()
+
+    today = date.today()
+    month = _month_start(min(first_date or today, today))
+    last_month = _month_start(today, MONTHS_AHEAD)
+    while month <= last_month:
+        next_month = _month_start(month, 1)
+        execute(
+            f'CREATE TABLE {TABLE}_p{month.year:04d}_{month.month:02d} PARTITION OF {TABLE} '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+        )
+        month = next_month
+    execute(f'CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT')
+
+    execute(f'INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE}')
+    execute(f'DROP TABLE {OLD_TABLE}')
+
+    execute(f'CREATE SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id')
+    if max_id:
+        execute(f"SELECT setval('{SEQUENCE}', {int(max_id)})")
+    execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}')")
+
+    for sql in _constraints_sql():
+        execute(sql)
+
+
+def unpartition_metrics(apps, schema_editor):
+    """Copy the metrics back into a plain table with an identity column"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    execute = schema_editor.execute
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'SELECT MAX(id) FROM {TABLE}')
+        max_id = cursor.fetchone()[0]
+
+    execute(f'ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}')
+    execute(f'CREATE TABLE {TABLE} (LIKE {OLD_TABLE} INCLUDING CONSTRAINTS)')
+    execute(f'INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE}')
+    # Drops the partitions and the sequence with it
+    execute(f'DROP TABLE {OLD_TABLE}')
+    execute(f'ALTER TABLE {TABLE} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY')
+    if max_id:
+        execute(f"SELECT setval(pg_get_serial_sequence('{TABLE}', 'id'), {int(max_id)})")
+
+    for sql in _constraints_sql():
+        execute(sql.replace('PRIMARY KEY (id, date)', 'PRIMARY KEY (id)'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0004_campaign_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_metrics, unpartition_metrics),
+    ]
@@ -0,0 +1,106 @@
+from datetime import date
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+TABLE = 'campaigns_campaignhourlymetric'
+SEQUENCE = 'campaigns_campaignhourlymetric_id_seq'
+MONTHS_AHEAD = 3
+
+
+def _month_start(day, offset=0):
+    index = day.year * 12 + day.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_hourly_metrics(apps, schema_editor):
+    """
+    Replace the new, empty hourly metrics table with one range partitioned
+    by month on hour
+
+    Partitions cover the current and the next MONTHS_AHEAD months (in UTC),
+    plus a default partition; manage_metric_partitions creates later months.
+    As for campaign metrics, the primary key includes the partition key and
+    id comes from a sequence. Constraint and index names are the ones
+    CreateModel gave the plain table.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    # CreateModel's foreign key and index are still deferred; they are
+    # created on the new table below instead
+    schema_editor.deferred_sql = [
+        sql for sql in schema_editor.deferred_sql
+        if not (hasattr(sql, 'references_table') and sql.references_table(TABLE))
+    ]
+
+    execute = schema_editor.execute
+    execute(f'DROP TABLE {TABLE}')
+    execute(
+        f"""
+        CREATE TABLE {TABLE} (
+            id bigint NOT NULL,
+            hour timestamp with time zone NOT NULL,
+            impressions bigint NOT NULL CHECK (impressions >= 0),
+            clicks bigint NOT NULL CHECK (clicks >= 0),
+            conversions bigint NOT NULL CHECK (conversions >= 0),
+            spend_micros bigint NOT NULL CHECK (spend_micros >= 0),
+            recorded_at timestamp with time zone NOT NULL,
+            campaign_id uuid NOT NULL,
+            CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, hour),
+            CONSTRAINT campaigns_hourly_metric_campaign_hour_uniq UNIQUE (campaign_id, hour),
+            CONSTRAINT campaigns_campaignho_campaign_id_0155e7f6_fk_campaigns
+                FOREIGN KEY (campaign_id) REFERENCES campaigns_campaign (id) DEFERRABLE INITIALLY DEFERRED
+        ) PARTITION BY RANGE (hour)
+        """
+    )
+    execute(f'CREATE SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id')
+    execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}')")
+    execute(f'CREATE INDEX {TABLE}_campaign_id_0155e7f6 ON {TABLE} (campaign_id)')
+
+    today = date.today()
+    for offset in range(MONTHS_AHEAD + 1):
+        month, next_month = _month_start(today, offset), _month_start(today, offset + 1)
+        execute(
+            f'CREATE TABLE {TABLE}_p{month.year:04d}_{month.month:02d} PARTITION OF {TABLE} '
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') TO ('{next_month.isoformat()} 00:00+00')"
+        )
+    execute(f'CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0005_partition_campaign_metrics'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='campaignmetric',
+            name='date',
+            field=models.DateField(default=django.utils.timezone.localdate),
+        ),
+        migrations.CreateModel(
+            name='CampaignHourlyMetric',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField()),
+                ('impressions', models.PositiveBigIntegerField(default=0)),
+                ('clicks', models.PositiveBigIntegerField(default=0)),
+                ('conversions', models.PositiveBigIntegerField(default=0)),
+                ('spend_micros', models.PositiveBigIntegerField(default=0)),
+                ('recorded_at', models.DateTimeField(auto_now=True)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hourly_metrics', to='campaigns.campaign')),
+            ],
+            options={
+                'ordering': ['-hour'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='campaignhourlymetric',
+            constraint=models.UniqueConstraint(fields=('campaign', 'hour'), name='campaigns_hourly_metric_campaign_hour_uniq'),
+        ),
+        # Reversing CreateModel drops the partitioned table
+        migrations.RunPython(partition_hourly_metrics, migrations.RunPython.noop),
+    ]
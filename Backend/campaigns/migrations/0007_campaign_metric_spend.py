@@ -0,0 +1,24 @@
+# Generated by Django 4.2.23 on 2026-10-19 02:55
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0006_hourly_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaignmetric',
+            name='spend',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14),
+        ),
+        # Existing rows recorded their spend as clicks * cost_per_click
+        migrations.RunSQL(
+            'UPDATE campaigns_campaignmetric SET spend = clicks * cost_per_click',
+            migrations.RunSQL.noop,
+        ),
+    ]
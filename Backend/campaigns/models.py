@@ -3,11 +3,22 @@ from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from datetime import timedelta
 from decimal import Decimal
 import uuid
 
+from .services.response_cache import invalidate_campaign_responses
+
 User = get_user_model()
 
+
+class CampaignVersionConflict(Exception):
+    """
+    Raised when a versioned campaign save finds that another writer
+    has changed the row since it was loaded
+    """
+
+
 class CampaignStatus(models.TextChoices):
     """
     Campaign status choices representing the workflow states
@@ -51,6 +62,15 @@ class Campaign(models.Model):
     - Team assignments and ownership
     """
     
+    # Status workflow: allowed target statuses for each status
+    STATUS_TRANSITIONS = {
+        CampaignStatus.DRAFT: [CampaignStatus.ACTIVE, CampaignStatus.CANCELLED],
+        CampaignStatus.ACTIVE: [CampaignStatus.PAUSED, CampaignStatus.COMPLETED, CampaignStatus.CANCELLED],
+        CampaignStatus.PAUSED: [CampaignStatus.ACTIVE, CampaignStatus.CANCELLED],
+        CampaignStatus.COMPLETED: [],
+        CampaignStatus.CANCELLED: [],
+    }
+    
     # Primary identification
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(
@@ -89,6 +109,16 @@ class Campaign(models.Model):
         default=Decimal('0.00'),
         help_text="Amount spent so far on the campaign"
     )
+    budget_alert_level = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Highest budget utilization threshold (percent) already alerted"
+    )
+    
+    # Optimistic concurrency control
+    version = models.PositiveIntegerField(
+        default=0,
+        help_text="Incremented on every update; used for conditional writes and ETags"
+    )
     
     # Timeline and scheduling
     start_date = models.DateTimeField(
@@ -127,12 +157,47 @@ class Campaign(models.Model):
             models.Index(fields=['campaign_type']),
             models.Index(fields=['start_date', 'end_date']),
             models.Index(fields=['owner']),
+            # Used by the lifecycle engine to find due transitions
+            models.Index(fields=['status', 'start_date']),
+            models.Index(fields=['status', 'end_date']),
         ]
     
     def __str__(self):
         """String representation of the campaign"""
         return f"{self.name} ({self.get_status_display()})"
     
+    def save(self, *args, **kwargs):
+        """Increment the version on every update of an existing campaign"""
+        if not self._state.adding:
+            self.version += 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'version'}
+        super().save(*args, **kwargs)
+    
+    def save_with_version(self, update_fields):
+        """
+        Save update_fields only if the row is still at this instance's version
+        
+        Issues a single UPDATE ... WHERE id = ... AND version = N that also
+        increments the version, so concurrent writers cannot silently
+        overwrite each other. Raises CampaignVersionConflict when another
+        writer got there first.
+        """
+        self.updated_at = timezone.now()
+        values = {name: getattr(self, name) for name in set(update_fields) | {'updated_at'}}
+        updated = Campaign.objects.filter(pk=self.pk, version=self.version).update(
+            version=models.F('version') + 1,
+            **values
+        )
+        if not updated:
+            raise CampaignVersionConflict(
+                f'Campaign {self.pk} was modified by another request'
+            )
+        self.version += 1
+        # update() does not send post_save
+        invalidate_campaign_responses([self.pk])
+    
     def clean(self):
         """Custom validation for campaign data"""
         super().clean()
@@ -170,6 +235,17 @@ class Campaign(models.Model):
             return (self.end_date - self.start_date).days
         return 0
     
+    @property
+    def earliest_metric_date(self):
+        """
+        Earliest date metrics can have: the day before the campaign started
+        or was created, whichever is first (the day of margin covers
+        server-local metric dates). Used to bound metric queries so that
+        PostgreSQL skips older metric partitions.
+        """
+        first = min(self.created_at or timezone.now(), self.start_date)
+        return timezone.localdate(first) - timedelta(days=1)
+    
     @property
     def is_running(self) -> bool:
         """Check if campaign is currently running"""
@@ -181,14 +257,15 @@ class Campaign(models.Model):
     
     def can_transition_to(self, new_status: str) -> bool:
         """Check if status transition is valid"""
-        valid_transitions = {
-            CampaignStatus.DRAFT: [CampaignStatus.ACTIVE, CampaignStatus.CANCELLED],
-            CampaignStatus.ACTIVE: [CampaignStatus.PAUSED, CampaignStatus.COMPLETED, CampaignStatus.CANCELLED],
-            CampaignStatus.PAUSED: [CampaignStatus.ACTIVE, CampaignStatus.CANCELLED],
-            CampaignStatus.COMPLETED: [],
-            CampaignStatus.CANCELLED: [],
-        }
-        return new_status in valid_transitions.get(self.status, [])
+        return new_status in self.STATUS_TRANSITIONS.get(self.status, [])
+    
+    @classmethod
+    def statuses_allowing_transition_to(cls, new_status: str) -> list:
+        """Get the statuses from which a campaign may move to new_status"""
+        return [
+            from_status for from_status, targets in cls.STATUS_TRANSITIONS.items()
+            if new_status in targets
+        ]
 
 
 class CampaignAssignment(models.Model):
@@ -268,6 +345,13 @@ class CampaignMetric(models.Model):
         decimal_places=2,
         default=Decimal('0.00')
     )
+    # Spend of the day; stored rather than derived from clicks *
+    # cost_per_click so days with spend and no clicks keep it
+    spend = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00')
+    )
     
     # Calculated metrics
     click_through_rate = models.DecimalField(
@@ -283,9 +367,10 @@ class CampaignMetric(models.Model):
         validators=[MinValueValidator(Decimal('0.0000')), MaxValueValidator(Decimal('1.0000'))]
     )
     
-    # Timestamp for when metrics were recorded
+    # Timestamp for when metrics were recorded; date defaults to today but
+    # can be set for backfills and daily rollups of hourly metrics
     recorded_at = models.DateTimeField(auto_now_add=True)
-    date = models.DateField(auto_now_add=True)
+    date = models.DateField(default=timezone.localdate)
     
     class Meta:
         ordering = ['-recorded_at']
@@ -304,10 +389,61 @@ class CampaignMetric(models.Model):
             self.click_through_rate = Decimal(str(self.clicks / self.impressions))
             if self.clicks > 0:
                 self.conversion_rate = Decimal(str(self.conversions / self.clicks))
+        # New rows without a spend record clicks * cost_per_click; saving an
+        # existing row (e.g. a rollup, whose cost_per_click is rounded)
+        # keeps the spend already counted in the campaign's spent_amount
+        if self._state.adding and not self.spend:
+            self.spend = self.cost_per_click * self.clicks
         
         super().save(*args, **kwargs)
 
 
+class CampaignHourlyMetric(models.Model):
+    """
+    Campaign performance counters for one hour
+    
+    Stores one row per campaign and hour (hour is the timestamp truncated
+    to the hour) with integer counters only; spend is kept in micros
+    (millionths of the currency unit). Hourly rows are rolled up into the
+    daily CampaignMetric rows the reporting endpoints read, see
+    services.metric_rollup. The table is range partitioned by month on
+    hour, like campaign metrics.
+    """
+    
+    MICROS = 1_000_000
+    
+    campaign = models.ForeignKey(
+        Campaign,
+        on_delete=models.CASCADE,
+        related_name='hourly_metrics'
+    )
+    hour = models.DateTimeField()
+    
+    impressions = models.PositiveBigIntegerField(default=0)
+    clicks = models.PositiveBigIntegerField(default=0)
+    conversions = models.PositiveBigIntegerField(default=0)
+    spend_micros = models.PositiveBigIntegerField(default=0)
+    
+    recorded_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['-hour']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['campaign', 'hour'],
+                name='campaigns_hourly_metric_campaign_hour_uniq'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.campaign.name} - {self.hour:%Y-%m-%d %H:00} ({self.impressions} impressions)"
+    
+    @property
+    def spend(self):
+        """Spend in currency units"""
+        return Decimal(self.spend_micros) / self.MICROS
+
+
 class CampaignNote(models.Model):
     """
     Notes and comments for campaigns
@@ -0,0 +1,38 @@
+import uuid
+
+from django.db.models import Q
+
+from core.realtime.topics import publish, register_topic
+from .models import Campaign
+
+CAMPAIGN_TOPIC = 'campaigns'
+
+
+def can_follow_campaign(user, campaign_id):
+    """Users can follow the campaigns they own or are a team member of"""
+    if user.is_superuser:
+        return Campaign.objects.filter(pk=campaign_id).exists()
+    return Campaign.objects.filter(pk=campaign_id).filter(Q(owner=user) | Q(team_members=user)).exists()
+
+
+def publish_campaign_events(events):
+    """Push (campaign_id, event) pairs to /ws/campaigns/<id> subscribers"""
+    publish(CAMPAIGN_TOPIC, events)
+
+
+def publish_status_changes(changes, changed_by=None):
+    """Publish statusChanged events for (campaign_id, from_status, to_status) triples"""
+    publish_campaign_events([
+        (campaign_id, {
+            'event': 'statusChanged',
+            'campaign_id': campaign_id,
+            'from': from_status,
+            'to': to_status,
+            'changed_by': changed_by,
+        })
+        for campaign_id, from_status, to_status in changes
+    ])
+
+
+def register():
+    register_topic(CAMPAIGN_TOPIC, can_follow_campaign, id_type=uuid.UUID)
@@ -4,7 +4,7 @@ from django.utils import timezone
 from django.db import models
 from decimal import Decimal
 from .models import (
-    Campaign, CampaignAssignment, CampaignMetric, CampaignNote,
+    Campaign, CampaignAssignment, CampaignHourlyMetric, CampaignMetric, CampaignNote,
     CampaignStatus, CampaignType
 )
 
@@ -81,15 +81,22 @@ class CampaignMetricSerializer(serializers.ModelSerializer):
     Handles campaign performance metrics with automatic calculations
     """
     
+    campaign_id = serializers.PrimaryKeyRelatedField(
+        queryset=Campaign.objects.all(),
+        source='campaign',
+        write_only=True
+    )
+    date = serializers.DateField(default=timezone.localdate)
+    
     class Meta:
         model = CampaignMetric
         fields = [
-            'id', 'impressions', 'clicks', 'conversions',
+            'id', 'campaign_id', 'impressions', 'clicks', 'conversions',
             'cost_per_click', 'cost_per_impression', 'cost_per_conversion',
-            'click_through_rate', 'conversion_rate',
+            'spend', 'click_through_rate', 'conversion_rate',
             'recorded_at', 'date'
         ]
-        read_only_fields = ['id', 'click_through_rate', 'conversion_rate', 'recorded_at']
+        read_only_fields = ['id', 'spend', 'click_through_rate', 'conversion_rate', 'recorded_at']
     
     def validate(self, attrs):
         """Validate metric data"""
@@ -109,6 +116,65 @@ class CampaignMetricSerializer(serializers.ModelSerializer):
                 'conversions': 'Conversions cannot exceed clicks.'
             })
         
+        # Validate backfilled dates fall within the campaign
+        campaign = attrs.get('campaign')
+        if campaign and attrs.get('date') and attrs['date'] < campaign.earliest_metric_date:
+            raise serializers.ValidationError({
+                'date': 'Metrics cannot predate the campaign.'
+            })
+        
+        return attrs
+
+
+class CampaignHourlyMetricSerializer(serializers.ModelSerializer):
+    """
+    Serializer for CampaignHourlyMetric model
+    
+    Accepts counters for an explicit hour; the timestamp is truncated to
+    the start of its hour and spend is given in micros
+    """
+    
+    campaign_id = serializers.PrimaryKeyRelatedField(
+        queryset=Campaign.objects.all(),
+        source='campaign'
+    )
+    spend = serializers.DecimalField(max_digits=20, decimal_places=6, read_only=True)
+    
+    class Meta:
+        model = CampaignHourlyMetric
+        fields = [
+            'id', 'campaign_id', 'hour', 'impressions', 'clicks', 'conversions',
+            'spend_micros', 'spend', 'recorded_at'
+        ]
+        read_only_fields = ['id', 'recorded_at']
+    
+    def validate_hour(self, value):
+        """Validate the hour has started"""
+        if value > timezone.now():
+            raise serializers.ValidationError('Hour cannot be in the future.')
+        return value
+    
+    def validate(self, attrs):
+        """Validate metric data"""
+        impressions = attrs.get('impressions', 0)
+        clicks = attrs.get('clicks', 0)
+        conversions = attrs.get('conversions', 0)
+        
+        if clicks > impressions:
+            raise serializers.ValidationError({
+                'clicks': 'Clicks cannot exceed impressions.'
+            })
+        
+        if conversions > clicks:
+            raise serializers.ValidationError({
+                'conversions': 'Conversions cannot exceed clicks.'
+            })
+        
+        if timezone.localdate(attrs['hour']) < attrs['campaign'].earliest_metric_date:
+            raise serializers.ValidationError({
+                'hour': 'Metrics cannot predate the campaign.'
+            })
+        
         return attrs
 
 
@@ -136,13 +202,97 @@ class CampaignNoteSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class CampaignListSerializer(serializers.ModelSerializer):
+class SparseFieldsetMixin:
+    """
+    Limit serializer output with the ``?fields=`` and ``?expand=`` query parameters
+    
+    - ``fields``: comma separated top-level fields to return. All fields
+      are returned when it is omitted.
+    - ``expand``: relations from ``expandable_fields`` to embed as nested
+      objects. When ``fields`` is given, a relation that is requested but
+      not expanded is returned as its primary key.
+    
+    ``field_dependencies`` maps computed fields to the model fields they
+    read, so views can load only the columns the requested fields need.
+    """
+    
+    expandable_fields = []
+    field_dependencies = {}
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None:
+            return
+        requested, expand = self.parse_sparse_fieldset(request.query_params)
+        if requested is None:
+            return
+        
+        for name in list(self.fields):
+            if name not in requested and name not in expand:
+                self.fields.pop(name)
+        for name in self.expandable_fields:
+            if name in self.fields and name not in expand:
+                self.fields[name] = serializers.PrimaryKeyRelatedField(read_only=True)
+    
+    @staticmethod
+    def _split(value):
+        """Split a comma separated query parameter"""
+        return [name.strip() for name in (value or '').split(',') if name.strip()]
+    
+    @classmethod
+    def parse_sparse_fieldset(cls, query_params):
+        """Return (requested field names or None for all fields, expanded relation names)"""
+        expand = set(cls._split(query_params.get('expand')))
+        requested = cls._split(query_params.get('fields'))
+        if not requested:
+            return None, expand
+        return set(requested), expand
+    
+    @classmethod
+    def get_invalid_sparse_fields(cls, query_params):
+        """Get requested field and expand names this serializer does not support"""
+        requested, expand = cls.parse_sparse_fieldset(query_params)
+        invalid = (requested or set()) - set(cls.Meta.fields)
+        invalid |= expand - set(cls.expandable_fields)
+        return sorted(invalid)
+    
+    @classmethod
+    def get_required_model_fields(cls, query_params):
+        """
+        Get the model fields needed to render the requested fields
+        
+        Returns None when all fields are requested.
+        """
+        requested, expand = cls.parse_sparse_fieldset(query_params)
+        if requested is None:
+            return None
+        
+        concrete_fields = {field.name for field in cls.Meta.model._meta.concrete_fields}
+        required = {'id'}
+        for name in requested | expand:
+            for dependency in cls.field_dependencies.get(name, [name]):
+                if dependency in concrete_fields:
+                    required.add(dependency)
+        return required
+
+
+class CampaignListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Campaign list view
     
-    Optimized for listing campaigns with essential information
+    Optimized for listing campaigns with essential information.
+    Supports sparse fieldsets (see SparseFieldsetMixin).
     """
     
+    expandable_fields = ['owner']
+    field_dependencies = {
+        'status_display': ['status'],
+        'campaign_type_display': ['campaign_type'],
+        'budget_utilization': ['budget', 'spent_amount'],
+        'duration_days': ['start_date', 'end_date'],
+    }
+    
     owner = UserSerializer(read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     campaign_type_display = serializers.CharField(source='get_campaign_type_display', read_only=True)
@@ -156,22 +306,34 @@ class CampaignListSerializer(serializers.ModelSerializer):
             'id', 'name', 'description', 'campaign_type', 'campaign_type_display',
             'status', 'status_display', 'budget', 'spent_amount', 'budget_utilization',
             'start_date', 'end_date', 'duration_days', 'owner', 'team_member_count',
-            'created_at', 'updated_at', 'is_active'
+            'created_at', 'updated_at', 'is_active', 'version'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at', 'updated_at', 'version']
     
     def get_team_member_count(self, obj):
         """Get count of active team members"""
         return obj.team_members.filter(campaign_assignments__is_active=True).count()
 
 
-class CampaignDetailSerializer(serializers.ModelSerializer):
+class CampaignDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Campaign detail view
     
-    Comprehensive campaign information with related data
+    Comprehensive campaign information with related data.
+    Supports sparse fieldsets (see SparseFieldsetMixin).
     """
     
+    expandable_fields = ['owner']
+    field_dependencies = {
+        'status_display': ['status'],
+        'campaign_type_display': ['campaign_type'],
+        'budget_utilization': ['budget', 'spent_amount'],
+        'duration_days': ['start_date', 'end_date'],
+        'is_running': ['status', 'start_date', 'end_date'],
+        'is_over_budget': ['budget', 'spent_amount'],
+        'available_status_transitions': ['status'],
+    }
+    
     owner = UserSerializer(read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     campaign_type_display = serializers.CharField(source='get_campaign_type_display', read_only=True)
@@ -194,15 +356,15 @@ class CampaignDetailSerializer(serializers.ModelSerializer):
             'id', 'name', 'description', 'campaign_type', 'campaign_type_display',
             'status', 'status_display', 'budget', 'spent_amount', 'budget_utilization',
             'start_date', 'end_date', 'duration_days', 'owner', 'is_running',
-            'is_over_budget', 'is_active', 'tags', 'created_at', 'updated_at',
+            'is_over_budget', 'is_active', 'tags', 'created_at', 'updated_at', 'version',
             'assignments', 'metrics', 'notes', 'available_status_transitions'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at', 'updated_at', 'version']
     
     def get_notes(self, obj):
         """Get notes based on user permissions"""
         user = self.context['request'].user
-        notes = obj.notes.filter(is_active=True)
+        notes = obj.notes.all()
         
         # Show private notes only to the author
         if not user.is_superuser:
@@ -305,8 +467,9 @@ class CampaignUpdateSerializer(serializers.ModelSerializer):
         fields = [
             'name', 'description', 'campaign_type', 'status',
             'budget', 'spent_amount', 'start_date', 'end_date',
-            'tags', 'is_active'
+            'tags', 'is_active', 'version'
         ]
+        read_only_fields = ['version']
     
     def validate_status(self, value):
         """Validate status transitions"""
@@ -330,6 +493,17 @@ class CampaignUpdateSerializer(serializers.ModelSerializer):
             })
         
         return attrs
+    
+    def update(self, instance, validated_data):
+        """
+        Save only the submitted fields, conditional on the loaded version
+        
+        Raises CampaignVersionConflict if the campaign changed since it was read
+        """
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save_with_version(update_fields=validated_data.keys())
+        return instance
 
 
 class CampaignStatusUpdateSerializer(serializers.Serializer):
@@ -353,6 +527,25 @@ class CampaignStatusUpdateSerializer(serializers.Serializer):
         return value
 
 
+class CampaignBulkStatusUpdateSerializer(serializers.Serializer):
+    """
+    Serializer for bulk campaign status updates
+    
+    Validates the request shape only; each transition is checked
+    against the Campaign state machine when the update is applied
+    """
+    
+    MAX_CAMPAIGNS = 1000
+    
+    campaign_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=MAX_CAMPAIGNS
+    )
+    status = serializers.ChoiceField(choices=CampaignStatus.choices)
+    reason = serializers.CharField(max_length=500, required=False, allow_blank=True)
+
+
 class CampaignMetricsSummarySerializer(serializers.Serializer):
     """
     Serializer for campaign metrics summary
@@ -0,0 +1,112 @@
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from ..models import Campaign, CampaignNote, CampaignStatus
+from ..realtime import publish_status_changes
+from .response_cache import invalidate_campaign_responses
+
+
+class CampaignLifecycleEngine:
+    """
+    Scheduled campaign lifecycle engine
+
+    Moves campaigns along the Campaign state machine when their schedule
+    says so:
+    - draft -> active once start_date has been reached
+    - active -> completed once end_date has been reached
+
+    Due campaigns are found with range scans on the (status, start_date)
+    and (status, end_date) indexes and transitioned in batches: one bulk
+    UPDATE and one bulk_create of CampaignNote audit rows per batch.
+    Rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so several
+    workers can run at the same time without processing a campaign twice.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+
+    def get_scheduled_transitions(self, now):
+        """
+        Return the scheduled transitions as
+        (from_status, to_status, due filter, index ordering field, reason)
+        """
+        return [
+            (
+                CampaignStatus.ACTIVE,
+                CampaignStatus.COMPLETED,
+                Q(end_date__lte=now),
+                'end_date',
+                'Scheduled end date reached',
+            ),
+            (
+                CampaignStatus.DRAFT,
+                CampaignStatus.ACTIVE,
+                Q(start_date__lte=now, end_date__gt=now, is_active=True),
+                'start_date',
+                'Scheduled start date reached',
+            ),
+        ]
+
+    def count_due(self, now=None):
+        """Count campaigns with a due transition without changing anything"""
+        now = now or timezone.now()
+        return {
+            to_status: Campaign.objects.filter(due, status=from_status).count()
+            for from_status, to_status, due, _, _ in self.get_scheduled_transitions(now)
+        }
+
+    def run(self, now=None):
+        """
+        Apply every due transition
+
+        Returns a dict mapping the target status to the number of
+        campaigns moved into it.
+        """
+        now = now or timezone.now()
+        results = {}
+        for from_status, to_status, due, order_field, reason in self.get_scheduled_transitions(now):
+            results[to_status] = self._apply_transition(
+                from_status, to_status, due, order_field, reason, now
+            )
+        return results
+
+    def _apply_transition(self, from_status, to_status, due, order_field, reason, now):
+        """Transition all due campaigns in batches and return the count"""
+        total = 0
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    Campaign.objects.filter(due, status=from_status)
+                    .order_by(order_field)
+                    .select_for_update(skip_locked=True)
+                    .values_list('id', 'owner_id')[:self.batch_size]
+                )
+                if not batch:
+                    break
+
+                # update() bypasses auto_now, so stamp updated_at explicitly
+                Campaign.objects.filter(
+                    id__in=[campaign_id for campaign_id, _ in batch],
+                    status=from_status
+                ).update(status=to_status, version=F('version') + 1, updated_at=now)
+
+                CampaignNote.objects.bulk_create([
+                    CampaignNote(
+                        campaign_id=campaign_id,
+                        author_id=owner_id,
+                        title='Status Updated',
+                        content=f'Status changed to {to_status}. Reason: {reason}',
+                        is_private=False
+                    )
+                    for campaign_id, owner_id in batch
+                ], batch_size=self.batch_size)
+                invalidate_campaign_responses([campaign_id for campaign_id, _ in batch])
+                publish_status_changes([(campaign_id, from_status, to_status) for campaign_id, _ in batch])
+
+            total += len(batch)
+            if len(batch) < self.batch_size:
+                break
+        return total
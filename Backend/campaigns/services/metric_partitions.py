@@ -0,0 +1,153 @@
+import re
+from datetime import date, datetime, time, timezone as dt_timezone
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from ..models import CampaignHourlyMetric, CampaignMetric
+
+TABLE = CampaignMetric._meta.db_table
+DEFAULT_PARTITION = f'{TABLE}_default'
+
+# Partitioned model -> partition key field
+PARTITION_KEYS = {
+    CampaignMetric: 'date',
+    CampaignHourlyMetric: 'hour',
+}
+
+
+def month_start(day, offset=0):
+    """First day of the month offset months away from day's month"""
+    index = day.year * 12 + day.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month, table=TABLE):
+    return f'{table}_p{month.year:04d}_{month.month:02d}'
+
+
+class MetricPartitionManager:
+    """
+    Maintain the monthly range partitions of a metrics table
+
+    The daily metrics table is partitioned on date (see migration 0005),
+    the hourly one on hour with months starting at midnight UTC (see
+    migration 0006). Each month has its own partition; rows outside every
+    monthly partition land in the default partition and are moved out
+    when their month is created. Partitions older than the retention
+    period are detached, and then either kept as standalone tables for
+    archiving (optionally in another schema) or dropped.
+    """
+
+    def __init__(self, model=CampaignMetric, using=None):
+        self.connection = connection if using is None else using
+        self.table = model._meta.db_table
+        self.key = PARTITION_KEYS[model]
+        self.timestamp_key = isinstance(model._meta.get_field(self.key), models.DateTimeField)
+        self.default_partition = f'{self.table}_default'
+        self.partition_pattern = re.compile(rf'^{self.table}_p(\d{{4}})_(\d{{2}})$')
+
+    def partition_name(self, month):
+        return partition_name(month, self.table)
+
+    def _bound(self, month):
+        """Partition bound value for the first day of a month"""
+        if self.timestamp_key:
+            return datetime.combine(month, time.min, tzinfo=dt_timezone.utc)
+        return month
+
+    def is_partitioned(self):
+        """Whether the metrics table is a partitioned table"""
+        if self.connection.vendor != 'postgresql':
+            return False
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)',
+                [self.table]
+            )
+            return cursor.fetchone() is not None
+
+    def get_partitions(self):
+        """Month start -> partition name for every attached monthly partition"""
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = to_regclass(%s)
+                """,
+                [self.table]
+            )
+            names = [row[0] for row in cursor.fetchall()]
+
+        partitions = {}
+        for name in names:
+            match = self.partition_pattern.match(name)
+            if match:
+                partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+        return dict(sorted(partitions.items()))
+
+    def get_missing_months(self, months_ahead=3, today=None):
+        """Months from the current one to months_ahead ahead without a partition"""
+        today = today or timezone.localdate()
+        existing = self.get_partitions()
+        months = [month_start(today, offset) for offset in range(months_ahead + 1)]
+        return [month for month in months if month not in existing]
+
+    def create_partition(self, month):
+        """
+        Create the partition for a month
+
+        Rows of that month already in the default partition are moved into
+        the new partition before it is attached.
+        """
+        name = self.partition_name(month)
+        start, end = self._bound(month), self._bound(month_start(month, 1))
+        quote = self.connection.ops.quote_name
+        with transaction.atomic(using=self.connection.alias), self.connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TABLE {quote(name)} '
+                f'(LIKE {quote(self.table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+            )
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {quote(self.default_partition)} '
+                f'WHERE {quote(self.key)} >= %s AND {quote(self.key)} < %s RETURNING *) '
+                f'INSERT INTO {quote(name)} SELECT * FROM moved',
+                [start, end]
+            )
+            cursor.execute(
+                f'ALTER TABLE {quote(self.table)} ATTACH PARTITION {quote(name)} '
+                f'FOR VALUES FROM (%s) TO (%s)',
+                [start, end]
+            )
+        return name
+
+    def ensure_partitions(self, months_ahead=3, today=None):
+        """Create the missing partitions up to months_ahead; returns their names"""
+        return [self.create_partition(month) for month in self.get_missing_months(months_ahead, today)]
+
+    def get_expired_partitions(self, retain_months, today=None):
+        """Partitions whose whole month is older than retain_months months"""
+        cutoff = month_start(today or timezone.localdate(), -retain_months)
+        return [name for month, name in self.get_partitions().items() if month < cutoff]
+
+    def detach_partitions(self, retain_months, archive_schema=None, drop=False, today=None):
+        """
+        Detach partitions older than retain_months months; returns their names
+
+        Detached partitions stay as standalone tables, moved to
+        archive_schema if given, unless drop is set.
+        """
+        quote = self.connection.ops.quote_name
+        detached = []
+        for name in self.get_expired_partitions(retain_months, today):
+            with transaction.atomic(using=self.connection.alias), self.connection.cursor() as cursor:
+                cursor.execute(f'ALTER TABLE {quote(self.table)} DETACH PARTITION {quote(name)}')
+                if drop:
+                    cursor.execute(f'DROP TABLE {quote(name)}')
+                elif archive_schema:
+                    cursor.execute(f'CREATE SCHEMA IF NOT EXISTS {quote(archive_schema)}')
+                    cursor.execute(f'ALTER TABLE {quote(name)} SET SCHEMA {quote(archive_schema)}')
+            detached.append(name)
+        return detached
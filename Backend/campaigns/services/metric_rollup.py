@@ -0,0 +1,194 @@
+from collections import defaultdict
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from ..models import Campaign, CampaignHourlyMetric, CampaignMetric
+from ..realtime import publish_campaign_events
+from .response_cache import invalidate_campaign_responses
+
+HOURLY_COUNTERS = ['impressions', 'clicks', 'conversions', 'spend_micros']
+
+# Daily fields written by the rollup
+DAILY_ROLLUP_FIELDS = [
+    'impressions', 'clicks', 'conversions', 'spend',
+    'cost_per_click', 'cost_per_impression', 'cost_per_conversion',
+    'click_through_rate', 'conversion_rate',
+]
+
+
+def truncate_to_hour(value):
+    """Truncate an aware datetime to the start of its hour in UTC"""
+    return value.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+class MetricRollupService:
+    """
+    Hourly metric ingestion and the daily rollup
+
+    Hourly rows are upserted by (campaign, hour), so a delivery can be
+    repeated or corrected and any past hour backfilled. Every day touched
+    by an ingest is then rebuilt from its hourly rows into the daily
+    CampaignMetric row the reporting endpoints read, in the same
+    transaction. Days are local dates in the current time zone.
+
+    The daily row stores the day's spend rounded to cents, next to the
+    cost_per_click derived from it; the hourly rows keep the exact spend in
+    micros. Campaign spent_amount moves by the change in daily spend, so a
+    daily row posted directly and later rebuilt from hourly rows is counted
+    once.
+    """
+
+    def record_hourly(self, rows):
+        """
+        Upsert hourly metrics and roll them up into daily metrics
+
+        rows are dicts with campaign (a Campaign), hour and the
+        HOURLY_COUNTERS; for the same campaign and hour the last row wins.
+        Returns the stored hourly metrics and the IDs of campaigns whose
+        spend went up.
+        """
+        metrics = {}
+        for row in rows:
+            hour = truncate_to_hour(row['hour'])
+            metrics[(row['campaign'].pk, hour)] = CampaignHourlyMetric(
+                campaign=row['campaign'],
+                hour=hour,
+                **{counter: row.get(counter, 0) for counter in HOURLY_COUNTERS}
+            )
+        if not metrics:
+            return [], []
+
+        campaign_ids = sorted({campaign_id for campaign_id, _ in metrics})
+        hours = {hour for _, hour in metrics}
+
+        with transaction.atomic():
+            # Lock the campaigns in a fixed order so concurrent ingests for a
+            # campaign see each other's spend
+            list(Campaign.objects.select_for_update().filter(pk__in=campaign_ids).order_by('pk').values_list('pk'))
+
+            CampaignHourlyMetric.objects.bulk_create(
+                metrics.values(),
+                update_conflicts=True,
+                unique_fields=['campaign', 'hour'],
+                update_fields=HOURLY_COUNTERS + ['recorded_at']
+            )
+
+            _, spend_changes = self.rollup_days(
+                {(campaign_id, timezone.localdate(hour)) for campaign_id, hour in metrics}
+            )
+            invalidate_campaign_responses(campaign_ids)
+
+            stored = [
+                metric for metric in CampaignHourlyMetric.objects.filter(
+                    campaign_id__in=campaign_ids, hour__in=hours
+                ).order_by('campaign_id', 'hour')
+                if (metric.campaign_id, metric.hour) in metrics
+            ]
+
+        return stored, [campaign_id for campaign_id, change in spend_changes.items() if change > 0]
+
+    def rollup_days(self, days):
+        """
+        Rebuild the daily metrics of (campaign_id, date) pairs from hourly rows
+
+        The rebuilt rows replace the existing daily rows of those days, and
+        campaign spent_amount moves by the difference in their spend. Runs
+        one aggregate query over the hour range covering all days, one read
+        of the existing daily spend and one upsert of the daily rows.
+        Returns the daily metrics and the change in spend per campaign ID;
+        the campaigns must be locked by the caller.
+        """
+        days = set(days)
+        if not days:
+            return [], {}
+
+        tz = timezone.get_current_timezone()
+        dates = [day for _, day in days]
+        start = timezone.make_aware(datetime.combine(min(dates), time.min), tz)
+        end = timezone.make_aware(datetime.combine(max(dates) + timedelta(days=1), time.min), tz)
+
+        totals = (
+            CampaignHourlyMetric.objects
+            .filter(campaign_id__in={campaign_id for campaign_id, _ in days}, hour__gte=start, hour__lt=end)
+            .annotate(day=TruncDate('hour', tzinfo=tz))
+            .values('campaign_id', 'day')
+            .annotate(
+                total_impressions=Sum('impressions'),
+                total_clicks=Sum('clicks'),
+                total_conversions=Sum('conversions'),
+                total_spend_micros=Sum('spend_micros')
+            )
+            .order_by()
+        )
+
+        daily = [
+            self._build_daily_metric(row)
+            for row in totals
+            if (row['campaign_id'], row['day']) in days
+        ]
+        # Spend already counted for these days, whether rolled up before or
+        # posted as a daily metric
+        previous_spend = {
+            (campaign_id, day): spend
+            for campaign_id, day, spend in CampaignMetric.objects.filter(
+                campaign_id__in={campaign_id for campaign_id, _ in days}, date__in=set(dates)
+            ).values_list('campaign_id', 'date', 'spend')
+        }
+        spend_changes = defaultdict(Decimal)
+        for metric in daily:
+            spend_changes[metric.campaign_id] += (
+                metric.spend - previous_spend.get((metric.campaign_id, metric.date), Decimal('0'))
+            )
+
+        CampaignMetric.objects.bulk_create(
+            daily,
+            update_conflicts=True,
+            unique_fields=['campaign', 'date'],
+            update_fields=DAILY_ROLLUP_FIELDS
+        )
+        # bulk_create does not send post_save
+        publish_campaign_events([
+            (metric.campaign_id, {'event': 'metricsUpdated', 'campaign_id': metric.campaign_id, 'date': metric.date})
+            for metric in daily
+        ])
+
+        now = timezone.now()
+        for campaign_id, change in spend_changes.items():
+            if change:
+                Campaign.objects.filter(pk=campaign_id).update(
+                    spent_amount=F('spent_amount') + change,
+                    version=F('version') + 1,
+                    updated_at=now
+                )
+        return daily, spend_changes
+
+    def _build_daily_metric(self, row):
+        """Daily metric with the costs and rates derived from hourly totals"""
+        impressions = row['total_impressions']
+        clicks = row['total_clicks']
+        conversions = row['total_conversions']
+        spend = Decimal(row['total_spend_micros']) / CampaignHourlyMetric.MICROS
+
+        def ratio(numerator, denominator, places):
+            if not denominator:
+                return Decimal('0').quantize(places)
+            return (Decimal(numerator) / Decimal(denominator)).quantize(places)
+
+        return CampaignMetric(
+            campaign_id=row['campaign_id'],
+            date=row['day'],
+            impressions=impressions,
+            clicks=clicks,
+            conversions=conversions,
+            spend=spend.quantize(Decimal('0.01')),
+            cost_per_click=ratio(spend, clicks, Decimal('0.01')),
+            cost_per_impression=ratio(spend, impressions, Decimal('0.0001')),
+            cost_per_conversion=ratio(spend, conversions, Decimal('0.01')),
+            click_through_rate=ratio(clicks, impressions, Decimal('0.0001')),
+            conversion_rate=ratio(conversions, clicks, Decimal('0.0001'))
+        )
@@ -0,0 +1,95 @@
+import gzip
+import hashlib
+import json
+import threading
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it only gzip is offered
+    brotli = None
+
+# Content codings in order of preference
+ENCODING_PREFERENCE = ['br', 'gzip', 'identity']
+
+
+class CompiledOpenAPISpec:
+    """
+    The OpenAPI spec rendered once to canonical JSON bytes
+
+    Holds the identity, gzip and (when brotli is installed) brotli encoded
+    bodies and a content-hash ETag, so requests for the spec only pick a
+    pre-built byte string. The spec dict in campaigns.api_docs is imported
+    on first use, not when the views module is loaded.
+    """
+
+    def __init__(self, spec):
+        self.body = json.dumps(
+            spec, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+        ).encode('utf-8')
+        self.digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.bodies = {
+            'identity': self.body,
+            'gzip': gzip.compress(self.body, compresslevel=9, mtime=0),
+        }
+        if brotli is not None:
+            self.bodies['br'] = brotli.compress(self.body, quality=11)
+
+    def get_etag(self, encoding):
+        """Strong ETag for an encoded variant; each coding gets its own tag"""
+        if encoding == 'identity':
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+    def etag_matches(self, if_none_match):
+        """Check an If-None-Match header against any variant of the spec"""
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(','):
+            tag = tag.strip()
+            if tag.startswith('W/'):
+                tag = tag[2:]
+            if tag == '*' or tag.strip('"').split('-', 1)[0] == self.digest:
+                return True
+        return False
+
+    def choose_encoding(self, accept_encoding):
+        """Pick the preferred available content coding allowed by Accept-Encoding"""
+        accepted = {}
+        for item in (accept_encoding or '').split(','):
+            coding, _, params = item.strip().partition(';')
+            coding = coding.strip().lower()
+            if not coding:
+                continue
+            quality = 1.0
+            params = params.strip()
+            if params.startswith('q='):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            accepted[coding] = quality
+
+        for encoding in ENCODING_PREFERENCE:
+            if encoding not in self.bodies:
+                continue
+            if encoding == 'identity':
+                return encoding
+            quality = accepted.get(encoding, accepted.get('*', 0.0))
+            if quality > 0:
+                return encoding
+        return 'identity'
+
+
+_compiled_spec = None
+_compiled_spec_lock = threading.Lock()
+
+
+def get_compiled_openapi_spec():
+    """Get the compiled spec, building it on first use"""
+    global _compiled_spec
+    if _compiled_spec is None:
+        with _compiled_spec_lock:
+            if _compiled_spec is None:
+                from ..api_docs import OPENAPI_SPEC
+                _compiled_spec = CompiledOpenAPISpec(OPENAPI_SPEC)
+    return _compiled_spec
@@ -0,0 +1,174 @@
+import logging
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (
+    Case, DecimalField, ExpressionWrapper, F, Sum, Value, When, Window
+)
+from django.utils import timezone
+
+from user_preferences.services.notification_dispatcher import NotificationDispatcher
+from ..models import Campaign, CampaignAssignment, CampaignMetric
+
+logger = logging.getLogger(__name__)
+
+BUDGET_ALERT_TRIGGER = 'budget_alert'
+
+# Spend recorded by a single metric row
+METRIC_SPEND = F('spend')
+
+
+class BudgetPacingService:
+    """
+    Budget pacing and overspend alert engine
+
+    - Compares actual spend per day (from CampaignMetric history) with the
+      linear spend expected from the campaign budget and date range.
+    - Detects campaigns whose utilization crossed one of the configured
+      BUDGET_ALERT_THRESHOLDS since the last check and emits budget_alert
+      notifications through the users' NotificationSettings.
+
+    Spend and threshold levels are computed in the database, so checking a
+    batch of campaigns costs a fixed number of queries.
+    """
+
+    def __init__(self, thresholds=None, dispatcher=None):
+        self.thresholds = sorted(thresholds or settings.BUDGET_ALERT_THRESHOLDS)
+        self.dispatcher = dispatcher or NotificationDispatcher()
+
+    def get_expected_spend(self, campaign, now=None):
+        """Spend expected by now if the budget is spread evenly over the date range"""
+        now = now or timezone.now()
+        total_seconds = (campaign.end_date - campaign.start_date).total_seconds()
+        if total_seconds <= 0:
+            return campaign.budget
+        elapsed = min(max((now - campaign.start_date).total_seconds(), 0), total_seconds)
+        return (campaign.budget * Decimal(elapsed / total_seconds)).quantize(Decimal('0.01'))
+
+    def get_daily_pacing(self, campaign, now=None):
+        """
+        Expected versus actual spend for each day with recorded metrics
+
+        Daily and cumulative spend come from a single windowed query over
+        the campaign's metric history.
+        """
+        now = now or timezone.now()
+        duration_days = max(campaign.duration_days, 1)
+        daily_budget = campaign.budget / duration_days
+        start_day = campaign.start_date.date()
+
+        rows = (
+            CampaignMetric.objects.filter(campaign=campaign)
+            .order_by('date')
+            .annotate(
+                cumulative_spend=Window(expression=Sum(METRIC_SPEND), order_by=F('date').asc()),
+            )
+            .values('date', 'spend', 'cumulative_spend')
+        )
+
+        daily = []
+        for row in rows:
+            elapsed_days = min(max((row['date'] - start_day).days + 1, 0), duration_days)
+            expected_cumulative = daily_budget * elapsed_days
+            daily.append({
+                'date': row['date'],
+                'expected_spend': float(round(daily_budget, 2)),
+                'actual_spend': float(row['spend'] or 0),
+                'expected_cumulative_spend': float(round(expected_cumulative, 2)),
+                'actual_cumulative_spend': float(row['cumulative_spend'] or 0),
+            })
+
+        expected_spend = self.get_expected_spend(campaign, now)
+        return {
+            'budget': float(campaign.budget),
+            'spent_amount': float(campaign.spent_amount),
+            'expected_spend_to_date': float(expected_spend),
+            'pacing_ratio': round(float(campaign.spent_amount / expected_spend), 4) if expected_spend > 0 else None,
+            'daily': daily,
+        }
+
+    def check_thresholds(self, campaign_ids):
+        """
+        Alert on campaigns that crossed a utilization threshold
+
+        The highest threshold reached by each campaign is computed in one
+        query and compared with Campaign.budget_alert_level, so a threshold
+        is only alerted once. Returns the list of alerts that were raised.
+        """
+        if not self.thresholds:
+            return []
+
+        utilization = ExpressionWrapper(
+            F('spent_amount') * 100 / F('budget'),
+            output_field=DecimalField(max_digits=20, decimal_places=4)
+        )
+        reached_level = Case(
+            *[
+                When(utilization__gte=threshold, then=Value(threshold))
+                for threshold in reversed(self.thresholds)
+            ],
+            default=Value(0)
+        )
+
+        with transaction.atomic():
+            crossed = list(
+                Campaign.objects.filter(id__in=campaign_ids, budget__gt=0)
+                .annotate(utilization=utilization)
+                .annotate(reached_level=reached_level)
+                .filter(reached_level__gt=F('budget_alert_level'))
+                .select_for_update()
+                .values('id', 'name', 'owner_id', 'utilization', 'reached_level')
+            )
+            if not crossed:
+                return []
+
+            # One conditional UPDATE per threshold level
+            by_level = {}
+            for row in crossed:
+                by_level.setdefault(row['reached_level'], []).append(row['id'])
+            for level, ids in by_level.items():
+                Campaign.objects.filter(
+                    id__in=ids, budget_alert_level__lt=level
+                ).update(budget_alert_level=level)
+
+        alerts = [
+            {
+                'campaign_id': row['id'],
+                'campaign_name': row['name'],
+                'threshold': row['reached_level'],
+                'utilization': round(float(row['utilization']), 2),
+                'recipient_ids': {row['owner_id']},
+            }
+            for row in crossed
+        ]
+        self._add_manager_recipients(alerts)
+        self._notify(alerts)
+        return alerts
+
+    def _add_manager_recipients(self, alerts):
+        """Add active campaign managers to each alert's recipients in one query"""
+        alerts_by_campaign = {alert['campaign_id']: alert for alert in alerts}
+        managers = CampaignAssignment.objects.filter(
+            campaign_id__in=list(alerts_by_campaign),
+            role__in=['owner', 'manager'],
+            is_active=True
+        ).values_list('campaign_id', 'user_id')
+        for campaign_id, user_id in managers:
+            alerts_by_campaign[campaign_id]['recipient_ids'].add(user_id)
+
+    def _notify(self, alerts):
+        """Emit budget_alert notifications for the raised alerts"""
+        messages_by_user = {}
+        for alert in alerts:
+            message = (
+                f'Campaign "{alert["campaign_name"]}" has used {alert["utilization"]}% '
+                f'of its budget (threshold {alert["threshold"]}%)'
+            )
+            for user_id in alert['recipient_ids']:
+                messages_by_user.setdefault(user_id, []).append(message)
+
+        results = self.dispatcher.dispatch_bulk_notifications(BUDGET_ALERT_TRIGGER, messages_by_user)
+        for result in results.values():
+            for log_line in result.get('mock_logs', []):
+                logger.info(log_line)
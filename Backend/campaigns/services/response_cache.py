@@ -0,0 +1,167 @@
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.db.routers import replica_reads_used
+
+# Data version shared by every campaign collection response (list, dashboard)
+COLLECTION_VERSION_KEY = 'campaigns:data-version:all'
+# Data version of a single campaign and everything shown with it
+CAMPAIGN_VERSION_KEY = 'campaigns:data-version:{}'
+RESPONSE_KEY = 'campaigns:response:{}'
+
+
+def _new_version():
+    """Return a fresh data version token"""
+    return uuid.uuid4().hex
+
+
+def bump_data_versions(campaign_ids):
+    """Give the campaign collection and each of the campaigns a new data version"""
+    versions = {COLLECTION_VERSION_KEY: _new_version()}
+    for campaign_id in campaign_ids:
+        versions[CAMPAIGN_VERSION_KEY.format(campaign_id)] = _new_version()
+    cache.set_many(versions, timeout=None)
+
+
+def invalidate_campaign_responses(campaign_ids):
+    """
+    Invalidate cached responses for the given campaigns
+
+    The data versions are bumped once the current transaction commits, so a
+    concurrent request cannot cache uncommitted state under the new version.
+    """
+    campaign_ids = [str(campaign_id) for campaign_id in campaign_ids]
+    transaction.on_commit(lambda: bump_data_versions(campaign_ids))
+
+
+class CampaignResponseCache:
+    """
+    Response cache and conditional GET handling for campaign read endpoints
+
+    Cached entries are keyed on the view, the user scope, the accepted
+    renderer, the query parameters and the current data version of the
+    campaign (detail endpoints) or of the whole collection (list endpoints).
+    Writes never delete entries: model signals and bulk writers bump the data
+    version instead, so stale entries are simply no longer addressed and
+    expire on their own.
+
+    Every 200 response carries a strong ETag computed from the response data
+    and a Last-Modified header set by the view. A request whose If-None-Match
+    matches the current ETag is answered with 304 without running queries or
+    serialization.
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = settings.CAMPAIGN_RESPONSE_CACHE_TIMEOUT if timeout is None else timeout
+
+    def respond(self, request, view_name, build, campaign_id=None):
+        """
+        Serve a cached response for the request, calling build() on a miss
+
+        build() must return a DRF Response. Only 200 responses are cached.
+        An ETag set by build() (e.g. the campaign version) is kept as the
+        prefix of the strong ETag, so If-Match checks on writes keep working.
+        """
+        if campaign_id is not None:
+            try:
+                campaign_id = uuid.UUID(str(campaign_id))
+            except ValueError:
+                return build()
+
+        key = self.get_cache_key(request, view_name, self.get_data_version(campaign_id))
+        entry = cache.get(key) if self.timeout else None
+        if entry is None:
+            response = build()
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            entry = {
+                'data': response.data,
+                'etag': self.compute_etag(request, response.data, response.get('ETag')),
+                'last_modified': response.get('Last-Modified'),
+            }
+            if self.timeout:
+                cache.set(key, entry, self.get_entry_timeout())
+
+        if self.etag_matches(request.META.get('HTTP_IF_NONE_MATCH'), entry['etag']):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(entry['data'])
+        return self.add_validators(response, entry)
+
+    def get_entry_timeout(self):
+        """
+        Timeout for an entry that was just built
+
+        Data read from a replica may predate the current data version, so
+        such entries are only kept for as long as the replica may lag.
+        """
+        if replica_reads_used():
+            return max(1, min(self.timeout, int(settings.DB_REPLICA_MAX_LAG)))
+        return self.timeout
+
+    def get_data_version(self, campaign_id=None):
+        """Get the current data version of a campaign, or of the collection"""
+        if campaign_id is None:
+            key = COLLECTION_VERSION_KEY
+        else:
+            key = CAMPAIGN_VERSION_KEY.format(campaign_id)
+        return cache.get_or_set(key, _new_version, timeout=None)
+
+    def get_cache_key(self, request, view_name, data_version):
+        """Build the cache key for a request"""
+        user = request.user
+        scope = 'anon' if user.is_anonymous else f'user:{user.pk}'
+        renderer = getattr(request, 'accepted_renderer', None)
+        params = sorted(
+            (name, sorted(values)) for name, values in request.query_params.lists()
+        )
+        raw = json.dumps([
+            view_name,
+            scope,
+            getattr(renderer, 'format', None),
+            params,
+            data_version,
+        ])
+        return RESPONSE_KEY.format(hashlib.sha256(raw.encode()).hexdigest())
+
+    def compute_etag(self, request, data, prefix=None):
+        """Strong ETag over the canonical JSON form of the response data"""
+        renderer = getattr(request, 'accepted_renderer', None)
+        payload = json.dumps(
+            [getattr(renderer, 'format', None), data],
+            cls=DjangoJSONEncoder,
+            sort_keys=True
+        )
+        digest = hashlib.sha256(payload.encode()).hexdigest()[:32]
+        if prefix:
+            prefix = prefix.strip('"')
+            return f'"{prefix}-{digest}"'
+        return f'"{digest}"'
+
+    def etag_matches(self, if_none_match, etag):
+        """Check an If-None-Match header against an ETag (weak comparison)"""
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(','):
+            tag = tag.strip()
+            if tag == '*' or tag == etag or tag == f'W/{etag}':
+                return True
+        return False
+
+    def add_validators(self, response, entry):
+        """Add ETag, Last-Modified and revalidation headers to a response"""
+        response['ETag'] = entry['etag']
+        if entry['last_modified']:
+            response['Last-Modified'] = entry['last_modified']
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Accept', 'Authorization', 'Cookie'])
+        return response
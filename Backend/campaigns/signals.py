@@ -0,0 +1,47 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Campaign, CampaignAssignment, CampaignMetric, CampaignNote
+from .realtime import publish_campaign_events
+from .services.response_cache import invalidate_campaign_responses
+
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+def invalidate_campaign(sender, instance, **kwargs):
+    """Invalidate cached responses for a changed campaign"""
+    invalidate_campaign_responses([instance.pk])
+
+
+@receiver(post_save, sender=CampaignAssignment)
+@receiver(post_delete, sender=CampaignAssignment)
+@receiver(post_save, sender=CampaignMetric)
+@receiver(post_delete, sender=CampaignMetric)
+@receiver(post_save, sender=CampaignNote)
+@receiver(post_delete, sender=CampaignNote)
+def invalidate_related_campaign(sender, instance, **kwargs):
+    """Invalidate cached responses for the campaign a changed row belongs to"""
+    invalidate_campaign_responses([instance.campaign_id])
+
+
+@receiver(post_save, sender=CampaignNote)
+def publish_note_added(sender, instance, created, **kwargs):
+    """Push new public notes to the campaign's WebSocket subscribers"""
+    if created and not instance.is_private:
+        publish_campaign_events([(instance.campaign_id, {
+            'event': 'noteAdded',
+            'campaign_id': instance.campaign_id,
+            'note_id': instance.pk,
+            'title': instance.title,
+            'author_id': instance.author_id,
+        })])
+
+
+@receiver(post_save, sender=CampaignMetric)
+def publish_metrics_updated(sender, instance, **kwargs):
+    """Push recorded daily metrics to the campaign's WebSocket subscribers"""
+    publish_campaign_events([(instance.campaign_id, {
+        'event': 'metricsUpdated',
+        'campaign_id': instance.campaign_id,
+        'date': instance.date,
+    })])
@@ -0,0 +1,138 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from datetime import timedelta
+from decimal import Decimal
+
+from campaigns.models import Campaign, CampaignStatus, CampaignVersionConflict
+
+User = get_user_model()
+
+
+class CampaignConcurrencyTest(TestCase):
+    """
+    Test cases for optimistic concurrency control on campaigns
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        now = timezone.now()
+        self.campaign = Campaign.objects.create(
+            name='Concurrent Campaign',
+            status=CampaignStatus.DRAFT,
+            budget=Decimal('1000.00'),
+            spent_amount=Decimal('100.00'),
+            start_date=now + timedelta(days=1),
+            end_date=now + timedelta(days=30),
+            owner=self.owner
+        )
+        self.client.force_authenticate(user=self.owner)
+        self.detail_url = reverse('campaigns:campaign-detail', args=[self.campaign.id])
+
+    def test_retrieve_returns_etag(self):
+        """Test the detail endpoint exposes the version as ETag"""
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'].startswith('"0-'))
+        self.assertEqual(response.data['version'], 0)
+
+    def test_update_with_matching_if_match(self):
+        """Test a matching If-Match allows the update and bumps the version"""
+        etag = self.client.get(self.detail_url)['ETag']
+
+        response = self.client.patch(
+            self.detail_url, {'name': 'Renamed'}, format='json', HTTP_IF_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], '"1"')
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.name, 'Renamed')
+        self.assertEqual(self.campaign.version, 1)
+
+    def test_update_with_stale_if_match_rejected(self):
+        """Test a stale If-Match is rejected with 412"""
+        Campaign.objects.filter(pk=self.campaign.pk).update(version=3)
+
+        response = self.client.patch(
+            self.detail_url, {'name': 'Renamed'}, format='json', HTTP_IF_MATCH='"2"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response.data['current_version'], 3)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.name, 'Concurrent Campaign')
+
+    def test_partial_update_only_writes_submitted_fields(self):
+        """Test a PATCH does not overwrite fields changed by another writer"""
+        Campaign.objects.filter(pk=self.campaign.pk).update(description='Written elsewhere')
+
+        response = self.client.patch(self.detail_url, {'name': 'Renamed'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.name, 'Renamed')
+        self.assertEqual(self.campaign.description, 'Written elsewhere')
+
+    def test_save_with_version_detects_lost_update(self):
+        """Test the second of two writers from the same version gets a conflict"""
+        first = Campaign.objects.get(pk=self.campaign.pk)
+        second = Campaign.objects.get(pk=self.campaign.pk)
+
+        first.name = 'First writer'
+        first.save_with_version(update_fields=['name'])
+
+        second.name = 'Second writer'
+        with self.assertRaises(CampaignVersionConflict):
+            second.save_with_version(update_fields=['name'])
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.name, 'First writer')
+        self.assertEqual(self.campaign.version, 1)
+
+    def test_metric_ingestion_increments_spend_in_database(self):
+        """Test metric ingestion adds spend without overwriting concurrent changes"""
+        stale = Campaign.objects.get(pk=self.campaign.pk)
+        Campaign.objects.filter(pk=self.campaign.pk).update(spent_amount=Decimal('200.00'))
+
+        response = self.client.post(reverse('campaigns:metric-list'), {
+            'campaign_id': str(stale.id),
+            'impressions': 1000,
+            'clicks': 50,
+            'conversions': 5,
+            'cost_per_click': '2.00'
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.spent_amount, Decimal('300.00'))
+        self.assertEqual(self.campaign.version, 1)
+
+    def test_metric_ingestion_requires_campaign_access(self):
+        """Test users cannot record metrics for campaigns they cannot see"""
+        self.client.force_authenticate(user=self.other_user)
+
+        response = self.client.post(reverse('campaigns:metric-list'), {
+            'campaign_id': str(self.campaign.id),
+            'impressions': 10,
+            'clicks': 1,
+            'conversions': 0,
+            'cost_per_click': '1.00'
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
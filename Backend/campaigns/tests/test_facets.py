@@ -0,0 +1,108 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from datetime import timedelta
+from decimal import Decimal
+
+from campaigns.models import Campaign, CampaignAssignment, CampaignStatus, CampaignType
+
+User = get_user_model()
+
+
+class CampaignFacetsTest(TestCase):
+    """
+    Test cases for the ?facets= mode of the campaign list endpoint
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.member = User.objects.create_user(
+            username='member',
+            email='member@example.com',
+            password='testpass123'
+        )
+
+        now = timezone.now()
+        specs = [
+            (CampaignStatus.DRAFT, CampaignType.VIDEO),
+            (CampaignStatus.DRAFT, CampaignType.SOCIAL_MEDIA),
+            (CampaignStatus.ACTIVE, CampaignType.VIDEO),
+        ]
+        self.campaigns = []
+        for index, (campaign_status, campaign_type) in enumerate(specs):
+            campaign = Campaign.objects.create(
+                name=f'Campaign {index}',
+                campaign_type=campaign_type,
+                status=campaign_status,
+                budget=Decimal('1000.00'),
+                start_date=now + timedelta(days=1),
+                end_date=now + timedelta(days=30),
+                owner=self.owner
+            )
+            self.campaigns.append(campaign)
+
+        # Two assignments on the same campaign must not double count it
+        CampaignAssignment.objects.create(campaign=self.campaigns[0], user=self.owner, role='owner')
+        CampaignAssignment.objects.create(campaign=self.campaigns[0], user=self.member, role='viewer')
+
+        self.url = reverse('campaigns:campaign-list')
+
+    def test_list_without_facets_has_no_facet_block(self):
+        """Test that facets are only computed when requested"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('facets', response.data)
+
+    def test_facet_counts_returned_with_page(self):
+        """Test grouped counts are returned alongside the results"""
+        response = self.client.get(self.url, {'facets': 'status,campaign_type'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(
+            response.data['facets']['status'],
+            [{'value': 'active', 'count': 1}, {'value': 'draft', 'count': 2}]
+        )
+        self.assertEqual(
+            response.data['facets']['campaign_type'],
+            [{'value': 'social_media', 'count': 1}, {'value': 'video', 'count': 2}]
+        )
+
+    def test_facet_counts_respect_filters(self):
+        """Test facets are computed on the filtered queryset"""
+        response = self.client.get(self.url, {'facets': 'status', 'campaign_type': 'video'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['facets']['status'],
+            [{'value': 'active', 'count': 1}, {'value': 'draft', 'count': 1}]
+        )
+
+    def test_facet_counts_distinct_for_team_scoped_queryset(self):
+        """Test joined team members do not inflate counts for regular users"""
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.get(self.url, {'facets': 'owner'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['facets']['owner'],
+            [{'value': self.owner.id, 'count': 3}]
+        )
+
+    def test_invalid_facet_rejected(self):
+        """Test that only filterable fields can be used as facets"""
+        response = self.client.get(self.url, {'facets': 'status,budget'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'Invalid facets')
@@ -0,0 +1,152 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from datetime import timedelta
+from decimal import Decimal
+
+from campaigns.fast_serializers import CampaignListFastSerializer
+from campaigns.models import Campaign, CampaignAssignment, CampaignStatus, CampaignType
+from campaigns.serializers import CampaignListSerializer
+
+User = get_user_model()
+
+
+class CampaignListFastSerializerParityTest(TestCase):
+    """
+    Parity tests: the fast list serializer must render exactly what
+    CampaignListSerializer renders
+    """
+
+    def setUp(self):
+        """Set up a varied set of campaigns"""
+        cache.clear()
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123',
+            first_name='Olive',
+            last_name='Owner'
+        )
+        self.nameless = User.objects.create_user(
+            username='nameless',
+            email='nameless@example.com',
+            password='testpass123'
+        )
+        self.members = [
+            User.objects.create_user(
+                username=f'member{i}',
+                email=f'member{i}@example.com',
+                password='testpass123'
+            )
+            for i in range(3)
+        ]
+        now = timezone.now().replace(microsecond=123456)
+
+        specs = [
+            ('Alpha', CampaignStatus.ACTIVE, CampaignType.VIDEO, '1000.00', '333.33', self.owner),
+            ('Beta', CampaignStatus.DRAFT, CampaignType.SOCIAL_MEDIA, '0.01', '0.00', self.owner),
+            ('Gamma', CampaignStatus.PAUSED, CampaignType.PRINT, '99999.99', '123456.78', self.nameless),
+            ('Delta', CampaignStatus.COMPLETED, CampaignType.INFLUENCER, '250.50', '250.50', self.nameless),
+            ('Epsilon', CampaignStatus.CANCELLED, CampaignType.DIGITAL_DISPLAY, '10.00', '3.33', self.owner),
+        ]
+        self.campaigns = []
+        for index, (name, campaign_status, campaign_type, budget, spent, owner) in enumerate(specs):
+            self.campaigns.append(Campaign.objects.create(
+                name=name,
+                description='' if index % 2 else f'{name} description with "quotes" and ünïcode',
+                status=campaign_status,
+                campaign_type=campaign_type,
+                budget=Decimal(budget),
+                spent_amount=Decimal(spent),
+                start_date=now - timedelta(days=index, hours=index),
+                end_date=now + timedelta(days=10 * index + 1, minutes=7),
+                owner=owner,
+                is_active=bool(index % 3),
+                tags=['a', 'b'] if index % 2 else []
+            ))
+
+        CampaignAssignment.objects.create(campaign=self.campaigns[0], user=self.members[0], role='manager')
+        CampaignAssignment.objects.create(campaign=self.campaigns[0], user=self.members[1], role='viewer')
+        CampaignAssignment.objects.create(
+            campaign=self.campaigns[0], user=self.members[2], role='analyst', is_active=False
+        )
+        CampaignAssignment.objects.create(campaign=self.campaigns[2], user=self.members[0], role='viewer')
+
+    def _make_request(self, query=None):
+        """Build a DRF request for serializer context"""
+        return Request(APIRequestFactory().get('/api/campaigns/', query or {}))
+
+    def _render_default(self, query=None):
+        """Render with CampaignListSerializer"""
+        request = self._make_request(query)
+        queryset = Campaign.objects.order_by('name')
+        data = CampaignListSerializer(queryset, many=True, context={'request': request}).data
+        return JSONRenderer().render(data)
+
+    def _render_fast(self, query=None):
+        """Render with CampaignListFastSerializer"""
+        requested, expand = CampaignListSerializer.parse_sparse_fieldset(self._make_request(query).query_params)
+        serializer = CampaignListFastSerializer(fields=requested, expand=expand)
+        rows = serializer.get_values_queryset(Campaign.objects.order_by('name'))
+        return JSONRenderer().render(serializer.serialize(rows))
+
+    def test_full_representation_is_identical(self):
+        """Test every field renders byte-identically"""
+        self.assertEqual(self._render_fast(), self._render_default())
+
+    def test_sparse_fieldsets_are_identical(self):
+        """Test sparse fieldsets render byte-identically"""
+        for query in [
+            {'fields': 'id,name,status'},
+            {'fields': 'owner,budget_utilization,duration_days'},
+            {'fields': 'id,team_member_count', 'expand': 'owner'},
+            {'fields': 'status_display,campaign_type_display,start_date,version'},
+        ]:
+            with self.subTest(query=query):
+                self.assertEqual(self._render_fast(query), self._render_default(query))
+
+    def test_team_member_counts_only_active_assignments(self):
+        """Test team member counts match the serializer method"""
+        rows = CampaignListFastSerializer().serialize(
+            CampaignListFastSerializer().get_values_queryset(Campaign.objects.order_by('name'))
+        )
+        counts = {row['name']: row['team_member_count'] for row in rows}
+
+        self.assertEqual(counts['Alpha'], 2)
+        self.assertEqual(counts['Gamma'], 1)
+        self.assertEqual(counts['Beta'], 0)
+
+    def test_list_endpoint_output_is_identical(self):
+        """Test the list endpoint renders the same bytes on both paths"""
+        url = reverse('campaigns:campaign-list')
+        for query in [
+            {},
+            {'ordering': 'budget'},
+            {'status': 'active'},
+            {'search': 'a', 'page_size': 2},
+            {'facets': 'status', 'fields': 'id,name'},
+        ]:
+            with self.subTest(query=query):
+                cache.clear()
+                with override_settings(CAMPAIGN_FAST_LIST_SERIALIZER=False):
+                    default = self.client.get(url, query)
+                cache.clear()
+                with override_settings(CAMPAIGN_FAST_LIST_SERIALIZER=True):
+                    fast = self.client.get(url, query)
+
+                self.assertEqual(fast.status_code, 200)
+                self.assertEqual(fast.content, default.content)
+
+    def test_fast_list_query_count_is_constant(self):
+        """Test the fast path does not issue per-row queries"""
+        url = reverse('campaigns:campaign-list')
+
+        # count, page, team member counts, Last-Modified
+        with self.assertNumQueries(4):
+            self.client.get(url)
@@ -0,0 +1,112 @@
+from io import StringIO
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+from datetime import timedelta
+from decimal import Decimal
+
+from campaigns.models import Campaign, CampaignNote, CampaignStatus
+from campaigns.services.lifecycle import CampaignLifecycleEngine
+
+User = get_user_model()
+
+
+class CampaignLifecycleEngineTest(TestCase):
+    """
+    Test cases for scheduled campaign status transitions
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.now = timezone.now()
+
+    def _create_campaign(self, campaign_status, start_offset, end_offset, **kwargs):
+        return Campaign.objects.create(
+            name=f'{campaign_status} campaign',
+            status=campaign_status,
+            budget=Decimal('1000.00'),
+            start_date=self.now + timedelta(days=start_offset),
+            end_date=self.now + timedelta(days=end_offset),
+            owner=self.owner,
+            **kwargs
+        )
+
+    def test_due_draft_campaign_activated(self):
+        """Test drafts are activated once their start date is reached"""
+        campaign = self._create_campaign(CampaignStatus.DRAFT, -1, 10)
+
+        results = CampaignLifecycleEngine().run(now=self.now)
+
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.status, CampaignStatus.ACTIVE)
+        self.assertEqual(results[CampaignStatus.ACTIVE], 1)
+        note = CampaignNote.objects.get(campaign=campaign)
+        self.assertEqual(note.author, self.owner)
+        self.assertIn('Scheduled start date reached', note.content)
+
+    def test_expired_active_campaign_completed(self):
+        """Test active campaigns are completed once their end date has passed"""
+        campaign = self._create_campaign(CampaignStatus.ACTIVE, -10, -1)
+
+        results = CampaignLifecycleEngine().run(now=self.now)
+
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.status, CampaignStatus.COMPLETED)
+        self.assertEqual(results[CampaignStatus.COMPLETED], 1)
+
+    def test_campaigns_not_due_untouched(self):
+        """Test future, paused, inactive and already-ended drafts are left alone"""
+        future = self._create_campaign(CampaignStatus.DRAFT, 1, 10)
+        paused = self._create_campaign(CampaignStatus.PAUSED, -10, -1)
+        inactive = self._create_campaign(CampaignStatus.DRAFT, -1, 10, is_active=False)
+        ended_draft = self._create_campaign(CampaignStatus.DRAFT, -10, -1)
+
+        CampaignLifecycleEngine().run(now=self.now)
+
+        for campaign, expected in [
+            (future, CampaignStatus.DRAFT),
+            (paused, CampaignStatus.PAUSED),
+            (inactive, CampaignStatus.DRAFT),
+            (ended_draft, CampaignStatus.DRAFT),
+        ]:
+            campaign.refresh_from_db()
+            self.assertEqual(campaign.status, expected)
+        self.assertFalse(CampaignNote.objects.exists())
+
+    def test_processes_in_batches(self):
+        """Test all due campaigns are processed when they span several batches"""
+        for _ in range(5):
+            self._create_campaign(CampaignStatus.DRAFT, -1, 10)
+
+        results = CampaignLifecycleEngine(batch_size=2).run(now=self.now)
+
+        self.assertEqual(results[CampaignStatus.ACTIVE], 5)
+        self.assertEqual(Campaign.objects.filter(status=CampaignStatus.ACTIVE).count(), 5)
+        self.assertEqual(CampaignNote.objects.count(), 5)
+
+    def test_command_dry_run_changes_nothing(self):
+        """Test the management command reports due campaigns in dry-run mode"""
+        campaign = self._create_campaign(CampaignStatus.DRAFT, -1, 10)
+        out = StringIO()
+
+        call_command('run_campaign_lifecycle', '--dry-run', stdout=out)
+
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.status, CampaignStatus.DRAFT)
+        self.assertIn('1 -> active', out.getvalue())
+
+    def test_command_applies_transitions(self):
+        """Test the management command applies due transitions"""
+        campaign = self._create_campaign(CampaignStatus.DRAFT, -1, 10)
+
+        call_command('run_campaign_lifecycle', stdout=StringIO())
+
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.status, CampaignStatus.ACTIVE)
@@ -0,0 +1,206 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from campaigns.models import Campaign, CampaignHourlyMetric, CampaignMetric, CampaignStatus
+from campaigns.services.metric_partitions import (
+    DEFAULT_PARTITION, MetricPartitionManager, partition_name
+)
+
+User = get_user_model()
+
+
+class MetricPartitionTestMixin:
+    """Helpers shared by the partition tests"""
+
+    def create_campaign(self, owner, name='Partitioned Campaign'):
+        now = timezone.now()
+        return Campaign.objects.create(
+            name=name,
+            status=CampaignStatus.ACTIVE,
+            budget=Decimal('1000.00'),
+            start_date=now - timedelta(days=1),
+            end_date=now + timedelta(days=30),
+            owner=owner
+        )
+
+    def create_metric(self, campaign, day, **values):
+        # date is auto_now_add, so it is set after the insert (a campaign's
+        # metric for today has to be created last)
+        metric = CampaignMetric.objects.create(campaign=campaign, **values)
+        CampaignMetric.objects.filter(pk=metric.pk).update(date=day)
+        return metric
+
+    def get_partition_of(self, metric):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT tableoid::regclass::text FROM {CampaignMetric._meta.db_table} WHERE id = %s',
+                [metric.pk]
+            )
+            return cursor.fetchone()[0]
+
+    def table_exists(self, name, schema='public'):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT to_regclass(%s)', [f'{schema}.{name}'])
+            return cursor.fetchone()[0] is not None
+
+
+class MetricPartitionManagerTest(MetricPartitionTestMixin, TestCase):
+    """
+    Test cases for creating and detaching the monthly metric partitions
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.manager = MetricPartitionManager()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.campaign = self.create_campaign(self.owner)
+
+    def test_table_is_partitioned(self):
+        """Test the metrics table is partitioned with current months covered"""
+        self.assertTrue(self.manager.is_partitioned())
+        self.assertEqual(self.manager.get_missing_months(months_ahead=2), [])
+
+    def test_new_metrics_land_in_monthly_partition(self):
+        """Test a metric for today is stored in this month's partition"""
+        metric = CampaignMetric.objects.create(campaign=self.campaign)
+
+        self.assertEqual(self.get_partition_of(metric), partition_name(timezone.localdate().replace(day=1)))
+
+    def test_ensure_partitions_moves_rows_out_of_default(self):
+        """Test creating a month moves its rows out of the default partition"""
+        metric = self.create_metric(self.campaign, date(2040, 1, 10), impressions=5)
+        self.assertEqual(self.get_partition_of(metric), DEFAULT_PARTITION)
+
+        created = self.manager.ensure_partitions(months_ahead=1, today=date(2040, 1, 15))
+
+        self.assertEqual(created, [partition_name(date(2040, 1, 1)), partition_name(date(2040, 2, 1))])
+        self.assertEqual(self.get_partition_of(metric), partition_name(date(2040, 1, 1)))
+        self.assertEqual(CampaignMetric.objects.get(pk=metric.pk).impressions, 5)
+        self.assertEqual(self.manager.ensure_partitions(months_ahead=1, today=date(2040, 1, 15)), [])
+
+    def test_hourly_partitions_use_utc_months(self):
+        """Test hourly partitions are created and filled on UTC month bounds"""
+        manager = MetricPartitionManager(CampaignHourlyMetric)
+        metric = CampaignHourlyMetric.objects.create(
+            campaign=self.campaign, hour=datetime(2040, 3, 1, tzinfo=dt_timezone.utc)
+        )
+
+        manager.ensure_partitions(months_ahead=0, today=date(2040, 3, 1))
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT tableoid::regclass::text FROM {manager.table} WHERE id = %s', [metric.pk]
+            )
+            self.assertEqual(cursor.fetchone()[0], manager.partition_name(date(2040, 3, 1)))
+        self.assertEqual(manager.get_missing_months(months_ahead=2), [])
+
+    def test_detach_partitions_to_archive_schema(self):
+        """Test expired partitions are detached and kept in the archive schema"""
+        self.manager.create_partition(date(2001, 1, 1))
+        metric = self.create_metric(self.campaign, date(2001, 1, 20))
+
+        detached = self.manager.detach_partitions(retain_months=12, archive_schema='metrics_archive')
+
+        self.assertEqual(detached, [partition_name(date(2001, 1, 1))])
+        self.assertFalse(CampaignMetric.objects.filter(pk=metric.pk).exists())
+        self.assertTrue(self.table_exists(partition_name(date(2001, 1, 1)), schema='metrics_archive'))
+        self.assertNotIn(date(2001, 1, 1), self.manager.get_partitions())
+
+    def test_detach_partitions_with_drop(self):
+        """Test expired partitions can be dropped instead of archived"""
+        self.manager.create_partition(date(2001, 2, 1))
+
+        detached = self.manager.detach_partitions(retain_months=12, drop=True)
+
+        self.assertEqual(detached, [partition_name(date(2001, 2, 1))])
+        self.assertFalse(self.table_exists(partition_name(date(2001, 2, 1))))
+
+    def test_date_range_prunes_partitions(self):
+        """Test a query bounded to one month only scans that month's partition"""
+        this_month = timezone.localdate().replace(day=1)
+        plan = CampaignMetric.objects.filter(
+            date__gte=this_month, date__lt=this_month + timedelta(days=28)
+        ).explain()
+
+        self.assertIn(partition_name(this_month), plan)
+        self.assertNotIn(DEFAULT_PARTITION, plan)
+
+
+class MetricTrendsTest(MetricPartitionTestMixin, TestCase):
+    """
+    Test cases for the metric trends endpoint
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.campaign = self.create_campaign(self.owner)
+        self.campaign.team_members.add(self.other_user, self.owner)
+        self.hidden_campaign = self.create_campaign(self.other_user, name='Hidden Campaign')
+        self.today = timezone.localdate()
+        for days_ago, clicks in [(40, 30), (1, 20), (0, 10)]:
+            self.create_metric(
+                self.campaign,
+                self.today - timedelta(days=days_ago),
+                impressions=100,
+                clicks=clicks,
+                cost_per_click=Decimal('0.50')
+            )
+        self.create_metric(self.hidden_campaign, self.today, impressions=999, clicks=999)
+        self.client.force_authenticate(user=self.owner)
+        self.url = reverse('campaigns:metric-trends')
+
+    def test_daily_trends_default_to_last_30_days(self):
+        """Test the default range covers 30 days and excludes other users' campaigns"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['interval'], 'day')
+        self.assertEqual(response.data['start_date'], self.today - timedelta(days=29))
+        results = response.data['results']
+        self.assertEqual([row['period'] for row in results], [self.today - timedelta(days=1), self.today])
+        self.assertEqual(results[1]['impressions'], 100)
+        self.assertEqual(results[1]['clicks'], 10)
+        self.assertEqual(results[1]['spend'], 5.0)
+        self.assertEqual(results[1]['ctr'], 10.0)
+
+    def test_monthly_trends_sum_each_month(self):
+        """Test monthly buckets aggregate without duplicating team member rows"""
+        response = self.client.get(self.url, {
+            'interval': 'month',
+            'start_date': (self.today - timedelta(days=60)).isoformat(),
+            'campaign': str(self.campaign.id),
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sum(row['clicks'] for row in response.data['results']), 60)
+        self.assertEqual(sum(row['impressions'] for row in response.data['results']), 300)
+
+    def test_invalid_parameters_are_rejected(self):
+        """Test invalid dates and intervals return 400"""
+        for params in [{'interval': 'hour'}, {'start_date': 'yesterday'}, {'end_date': '2024-02-30'},
+                       {'start_date': '2024-02-01', 'end_date': '2024-01-01'}, {'campaign': 'abc'}]:
+            response = self.client.get(self.url, params)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
@@ -0,0 +1,205 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from datetime import timedelta
+from decimal import Decimal
+
+from campaigns.models import Campaign, CampaignHourlyMetric, CampaignMetric, CampaignStatus
+
+User = get_user_model()
+
+
+class HourlyMetricRollupTest(TestCase):
+    """
+    Test cases for hourly metric ingestion and the daily rollup
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        now = timezone.now()
+        self.campaign = Campaign.objects.create(
+            name='Hourly Campaign',
+            status=CampaignStatus.ACTIVE,
+            budget=Decimal('10000.00'),
+            start_date=now - timedelta(days=30),
+            end_date=now + timedelta(days=30),
+            owner=self.owner
+        )
+        self.client.force_authenticate(user=self.owner)
+        self.url = reverse('campaigns:hourly-metric-list')
+        self.yesterday = (now - timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+    def hourly(self, hour, **counters):
+        return {'campaign_id': str(self.campaign.id), 'hour': hour.isoformat(), **counters}
+
+    def test_batch_rolls_up_into_daily_metric(self):
+        """Test a batch of hours is summed into one daily metric"""
+        response = self.client.post(self.url, [
+            self.hourly(self.yesterday, impressions=1000, clicks=40, conversions=4, spend_micros=20_000_000),
+            self.hourly(self.yesterday + timedelta(hours=1), impressions=3000, clicks=60, conversions=1,
+                        spend_micros=30_000_000),
+        ], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data[0]['spend'], '20.000000')
+
+        daily = CampaignMetric.objects.get(campaign=self.campaign, date=self.yesterday.date())
+        self.assertEqual(daily.impressions, 4000)
+        self.assertEqual(daily.clicks, 100)
+        self.assertEqual(daily.conversions, 5)
+        self.assertEqual(daily.cost_per_click, Decimal('0.50'))
+        self.assertEqual(daily.cost_per_conversion, Decimal('10.00'))
+        self.assertEqual(daily.click_through_rate, Decimal('0.0250'))
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.spent_amount, Decimal('50.00'))
+
+    def test_resending_an_hour_replaces_it(self):
+        """Test a repeated hour replaces its counters and spend is not double counted"""
+        self.client.post(self.url, self.hourly(self.yesterday, impressions=100, clicks=10, spend_micros=5_000_000),
+                         format='json')
+
+        response = self.client.post(
+            self.url,
+            self.hourly(self.yesterday + timedelta(minutes=37), impressions=200, clicks=20, spend_micros=8_000_000),
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['hour'], self.yesterday.isoformat().replace('+00:00', 'Z'))
+        self.assertEqual(CampaignHourlyMetric.objects.filter(campaign=self.campaign).count(), 1)
+        daily = CampaignMetric.objects.get(campaign=self.campaign, date=self.yesterday.date())
+        self.assertEqual((daily.impressions, daily.clicks), (200, 20))
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.spent_amount, Decimal('8.00'))
+
+    def test_backfill_shows_in_metrics_summary(self):
+        """Test backfilled hours reach the endpoints reading daily metrics"""
+        past_hour = self.yesterday - timedelta(days=10)
+
+        self.client.post(self.url, self.hourly(past_hour, impressions=500, clicks=25, spend_micros=12_500_000),
+                         format='json')
+        response = self.client.get(reverse('campaigns:campaign-metrics-summary', args=[self.campaign.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['total_impressions'], 500)
+        self.assertEqual(response.data['data']['total_clicks'], 25)
+        self.assertTrue(CampaignMetric.objects.filter(campaign=self.campaign, date=past_hour.date()).exists())
+
+    def test_invalid_metrics_are_rejected(self):
+        """Test future or pre-campaign hours and inconsistent counters return 400"""
+        future = timezone.now() + timedelta(hours=2)
+        for payload in [
+            self.hourly(future, impressions=10),
+            self.hourly(self.yesterday, impressions=10, clicks=20),
+            self.hourly(self.yesterday, impressions=10, spend_micros=-1),
+            self.hourly(self.yesterday - timedelta(days=40), impressions=10),
+        ]:
+            response = self.client.post(self.url, payload, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, payload)
+        self.assertFalse(CampaignHourlyMetric.objects.exists())
+
+    def test_requires_campaign_access(self):
+        """Test users cannot record or list hourly metrics of other campaigns"""
+        self.client.post(self.url, self.hourly(self.yesterday, impressions=10), format='json')
+        self.client.force_authenticate(user=self.other_user)
+
+        response = self.client.post(self.url, [self.hourly(self.yesterday, impressions=99)], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(CampaignHourlyMetric.objects.get().impressions, 10)
+        self.assertEqual(self.client.get(self.url).data['count'], 0)
+
+    def test_daily_metric_accepts_explicit_date(self):
+        """Test daily metrics can be backfilled for a past date"""
+        day = self.yesterday.date() - timedelta(days=3)
+
+        response = self.client.post(reverse('campaigns:metric-list'), {
+            'campaign_id': str(self.campaign.id),
+            'impressions': 100,
+            'clicks': 5,
+            'conversions': 1,
+            'date': day.isoformat(),
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(CampaignMetric.objects.get(campaign=self.campaign).date, day)
+
+    def test_spend_without_clicks_is_kept(self):
+        """Test spend on a day with no clicks reaches the daily metric"""
+        self.client.post(self.url, self.hourly(self.yesterday, impressions=500, spend_micros=3_000_000),
+                         format='json')
+
+        daily = CampaignMetric.objects.get(campaign=self.campaign, date=self.yesterday.date())
+        self.assertEqual(daily.cost_per_click, Decimal('0.00'))
+        self.assertEqual(daily.spend, Decimal('3.00'))
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.spent_amount, Decimal('3.00'))
+
+    def test_saving_rolled_up_metric_keeps_spend(self):
+        """Test saving a rolled-up day does not recompute spend from the rounded cost per click"""
+        self.client.post(self.url, self.hourly(self.yesterday, impressions=100, clicks=7, spend_micros=3_330_000),
+                         format='json')
+        daily = CampaignMetric.objects.get(campaign=self.campaign, date=self.yesterday.date())
+        self.assertEqual(daily.cost_per_click, Decimal('0.48'))
+
+        daily.conversions = 1
+        daily.save()
+
+        daily.refresh_from_db()
+        self.assertEqual(daily.spend, Decimal('3.33'))
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.spent_amount, Decimal('3.33'))
+
+    def test_rollup_replaces_posted_daily_spend(self):
+        """Test hours rolled up over a posted daily metric do not count its spend twice"""
+        response = self.client.post(reverse('campaigns:metric-list'), {
+            'campaign_id': str(self.campaign.id),
+            'impressions': 100,
+            'clicks': 10,
+            'conversions': 1,
+            'cost_per_click': '1.00',
+            'date': self.yesterday.date().isoformat(),
+        }, format='json')
+        self.assertEqual(response.data['spend'], '10.00')
+
+        self.client.post(self.url, self.hourly(self.yesterday, impressions=200, clicks=20, spend_micros=8_000_000),
+                         format='json')
+
+        daily = CampaignMetric.objects.get(campaign=self.campaign, date=self.yesterday.date())
+        self.assertEqual((daily.clicks, daily.spend), (20, Decimal('8.00')))
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.spent_amount, Decimal('8.00'))
+
+    def test_daily_metric_rejected_for_rolled_up_day(self):
+        """Test a daily metric cannot be posted over a day rolled up from hours"""
+        self.client.post(self.url, self.hourly(self.yesterday, impressions=200, clicks=20, spend_micros=8_000_000),
+                         format='json')
+
+        response = self.client.post(reverse('campaigns:metric-list'), {
+            'campaign_id': str(self.campaign.id),
+            'impressions': 100,
+            'clicks': 10,
+            'conversions': 1,
+            'cost_per_click': '1.00',
+            'date': self.yesterday.date().isoformat(),
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.spent_amount, Decimal('8.00'))
@@ -0,0 +1,84 @@
+import gzip
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from campaigns.api_docs import OPENAPI_SPEC
+from campaigns.services.openapi_spec import CompiledOpenAPISpec, brotli
+
+
+class OpenAPISpecServingTest(SimpleTestCase):
+    """
+    Test cases for the precomputed OpenAPI spec endpoint
+    """
+
+    def setUp(self):
+        """Set up test client"""
+        self.client = APIClient()
+        self.url = reverse('campaigns:openapi-docs')
+
+    def test_returns_canonical_spec_with_cache_headers(self):
+        """Test the spec is served as JSON with ETag and long-lived caching"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='identity')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content), OPENAPI_SPEC)
+        self.assertNotIn('Content-Encoding', response)
+        self.assertIn(f'max-age={settings.OPENAPI_SPEC_MAX_AGE}', response['Cache-Control'])
+        self.assertIn('public', response['Cache-Control'])
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(response['ETag'], CompiledOpenAPISpec(OPENAPI_SPEC).get_etag('identity'))
+
+    def test_gzip_variant(self):
+        """Test gzip is served when brotli is not accepted"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(response.content)), OPENAPI_SPEC)
+        self.assertTrue(response['ETag'].endswith('-gzip"'))
+
+    def test_brotli_variant_preferred(self):
+        """Test brotli is preferred when accepted and available"""
+        if brotli is None:
+            self.skipTest('brotli is not installed')
+
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip, br')
+
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(json.loads(brotli.decompress(response.content)), OPENAPI_SPEC)
+
+    def test_refused_encoding_not_used(self):
+        """Test q=0 disables a content coding"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='br;q=0, gzip;q=0')
+
+        self.assertNotIn('Content-Encoding', response)
+
+    def test_if_none_match_returns_304(self):
+        """Test revalidation with any variant's ETag returns 304"""
+        etag = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+    def test_views_import_does_not_build_spec(self):
+        """Test importing campaigns.views does not import the spec module"""
+        code = (
+            'import sys, django; django.setup(); import campaigns.views; '
+            'print("campaigns.api_docs" in sys.modules)'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True, text=True, env=os.environ.copy(), cwd=settings.BASE_DIR
+        )
+
+        self.assertEqual(result.stdout.strip(), 'False', result.stderr)
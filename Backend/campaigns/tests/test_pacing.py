@@ -0,0 +1,128 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from datetime import timedelta
+from decimal import Decimal
+
+from campaigns.models import Campaign, CampaignAssignment, CampaignMetric, CampaignStatus
+from campaigns.services.pacing import BudgetPacingService
+from user_preferences.models import NotificationSettings
+
+User = get_user_model()
+
+
+@override_settings(BUDGET_ALERT_THRESHOLDS=[50, 80, 100])
+class BudgetPacingServiceTest(TestCase):
+    """
+    Test cases for budget pacing and threshold alerts
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.manager = User.objects.create_user(
+            username='manager',
+            email='manager@example.com',
+            password='testpass123'
+        )
+        self.now = timezone.now()
+        self.campaign = Campaign.objects.create(
+            name='Pacing Campaign',
+            status=CampaignStatus.ACTIVE,
+            budget=Decimal('1000.00'),
+            start_date=self.now - timedelta(days=5),
+            end_date=self.now + timedelta(days=5),
+            owner=self.owner
+        )
+        CampaignAssignment.objects.create(campaign=self.campaign, user=self.manager, role='manager')
+        NotificationSettings.objects.create(
+            user=self.owner,
+            channel_id=2,
+            channel_name='Email',
+            enabled=True,
+            setting_key='budget_alert',
+            module_scope='budget'
+        )
+
+    def test_expected_spend_is_linear_over_date_range(self):
+        """Test half the budget is expected halfway through the campaign"""
+        expected = BudgetPacingService().get_expected_spend(self.campaign, now=self.now)
+
+        self.assertEqual(expected, Decimal('500.00'))
+
+    def test_daily_pacing_uses_metric_history(self):
+        """Test daily and cumulative spend are computed from metrics"""
+        CampaignMetric.objects.create(
+            campaign=self.campaign, impressions=1000, clicks=100, cost_per_click=Decimal('1.50')
+        )
+        self.campaign.spent_amount = Decimal('150.00')
+
+        pacing = BudgetPacingService().get_daily_pacing(self.campaign, now=self.now)
+
+        self.assertEqual(pacing['expected_spend_to_date'], 500.0)
+        self.assertEqual(pacing['pacing_ratio'], 0.3)
+        self.assertEqual(len(pacing['daily']), 1)
+        self.assertEqual(pacing['daily'][0]['actual_spend'], 150.0)
+        self.assertEqual(pacing['daily'][0]['actual_cumulative_spend'], 150.0)
+        self.assertEqual(pacing['daily'][0]['expected_spend'], 100.0)
+
+    def test_crossing_threshold_alerts_once(self):
+        """Test an alert is raised for the highest crossed threshold only once"""
+        Campaign.objects.filter(pk=self.campaign.pk).update(spent_amount=Decimal('850.00'))
+        service = BudgetPacingService()
+
+        alerts = service.check_thresholds([self.campaign.id])
+
+        self.assertEqual(len(alerts), 1)
+        self.assertEqual(alerts[0]['threshold'], 80)
+        self.assertEqual(alerts[0]['recipient_ids'], {self.owner.id, self.manager.id})
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.budget_alert_level, 80)
+
+        self.assertEqual(service.check_thresholds([self.campaign.id]), [])
+
+    def test_next_threshold_alerts_again(self):
+        """Test crossing a higher threshold raises a new alert"""
+        Campaign.objects.filter(pk=self.campaign.pk).update(
+            spent_amount=Decimal('1000.00'), budget_alert_level=80
+        )
+
+        alerts = BudgetPacingService().check_thresholds([self.campaign.id])
+
+        self.assertEqual([alert['threshold'] for alert in alerts], [100])
+
+    def test_below_threshold_no_alert(self):
+        """Test campaigns under every threshold are not alerted"""
+        Campaign.objects.filter(pk=self.campaign.pk).update(spent_amount=Decimal('100.00'))
+
+        self.assertEqual(BudgetPacingService().check_thresholds([self.campaign.id]), [])
+
+    def test_alert_dispatched_to_enabled_channels(self):
+        """Test budget_alert notifications go through NotificationSettings"""
+        Campaign.objects.filter(pk=self.campaign.pk).update(spent_amount=Decimal('600.00'))
+        service = BudgetPacingService()
+
+        with self.assertLogs('campaigns.services.pacing', level='INFO') as logs:
+            service.check_thresholds([self.campaign.id])
+
+        output = '\n'.join(logs.output)
+        self.assertIn('[MOCK EMAIL] Recipient: owner@example.com', output)
+        self.assertIn('No enabled channels found for user manager', output)
+
+    def test_pacing_endpoint(self):
+        """Test the pacing action returns the pacing summary"""
+        client = APIClient()
+        url = reverse('campaigns:campaign-pacing', args=[self.campaign.id])
+
+        response = client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['budget'], 1000.0)
+        self.assertEqual(response.data['data']['daily'], [])
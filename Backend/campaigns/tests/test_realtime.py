@@ -0,0 +1,91 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from campaigns.models import Campaign, CampaignStatus
+from core.realtime.websocket import websocket_application
+
+User = get_user_model()
+
+
+@override_settings(REALTIME_CHANNEL_LAYER='memory', CORS_ALLOWED_ORIGINS=['http://localhost:3000'])
+class CampaignRealtimeTest(TransactionTestCase):
+    """
+    Test cases for /ws/campaigns/<id> subscriptions
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        now = timezone.now()
+        self.campaign = Campaign.objects.create(
+            name='Launch',
+            status=CampaignStatus.DRAFT,
+            budget=Decimal('1000.00'),
+            start_date=now + timedelta(days=1),
+            end_date=now + timedelta(days=30),
+            owner=self.owner
+        )
+        self.client.force_login(self.owner)
+        self.session_key = self.client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    async def connect(self, origin):
+        scope = {
+            'type': 'websocket',
+            'path': f'/ws/campaigns/{self.campaign.id}/',
+            'query_string': b'',
+            'headers': [
+                (b'host', b'api.example.com'),
+                (b'origin', origin.encode()),
+                (b'cookie', f'{settings.SESSION_COOKIE_NAME}={self.session_key}'.encode()),
+            ],
+        }
+        communicator = ApplicationCommunicator(websocket_application, scope)
+        await communicator.send_input({'type': 'websocket.connect'})
+        return communicator, await communicator.receive_output(timeout=5)
+
+    async def test_status_change_and_note_are_published(self):
+        """Test a session subscriber gets the status change and the audit note"""
+        communicator, message = await self.connect('http://localhost:3000')
+        self.assertEqual(message, {'type': 'websocket.accept'})
+
+        def update_status():
+            client = APIClient()
+            client.force_authenticate(user=self.owner)
+            return client.post(
+                reverse('campaigns:campaign-update-status', args=[self.campaign.id]),
+                {'status': 'cancelled'},
+                format='json'
+            )
+
+        response = await sync_to_async(update_status)()
+        self.assertEqual(response.status_code, 200)
+
+        events = [
+            json.loads((await communicator.receive_output(timeout=5))['text'])
+            for _ in range(2)
+        ]
+        self.assertEqual([event['event'] for event in events], ['statusChanged', 'noteAdded'])
+        self.assertEqual(events[0]['campaign_id'], str(self.campaign.id))
+        self.assertEqual((events[0]['from'], events[0]['to']), (CampaignStatus.DRAFT, CampaignStatus.CANCELLED))
+        await communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        await communicator.wait(timeout=5)
+
+    async def test_session_requires_allowed_origin(self):
+        """Test session cookies sent from another site are not accepted"""
+        _, message = await self.connect('https://evil.example.org')
+
+        self.assertEqual(message, {'type': 'websocket.close', 'code': 4401})
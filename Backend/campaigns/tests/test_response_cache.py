@@ -0,0 +1,146 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from datetime import timedelta
+from decimal import Decimal
+
+from campaigns.models import Campaign, CampaignMetric, CampaignNote, CampaignStatus
+
+User = get_user_model()
+
+
+@override_settings(CAMPAIGN_RESPONSE_CACHE_TIMEOUT=300)
+class CampaignResponseCacheTest(TestCase):
+    """
+    Test cases for the campaign response cache and conditional GET
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        now = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign = Campaign.objects.create(
+                name='Cached Campaign',
+                status=CampaignStatus.ACTIVE,
+                budget=Decimal('1000.00'),
+                spent_amount=Decimal('250.00'),
+                start_date=now - timedelta(days=1),
+                end_date=now + timedelta(days=30),
+                owner=self.owner
+            )
+        self.client.force_authenticate(user=self.owner)
+        self.list_url = reverse('campaigns:campaign-list')
+        self.detail_url = reverse('campaigns:campaign-detail', args=[self.campaign.id])
+        self.dashboard_url = reverse('campaigns:campaign-dashboard-stats')
+        self.summary_url = reverse('campaigns:campaign-metrics-summary', args=[self.campaign.id])
+
+    def test_responses_carry_validators(self):
+        """Test cached endpoints return ETag, Last-Modified and Cache-Control"""
+        for url in [self.list_url, self.detail_url, self.dashboard_url, self.summary_url]:
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+            self.assertTrue(response['ETag'].startswith('"'))
+            self.assertIn('Last-Modified', response)
+            self.assertIn('no-cache', response['Cache-Control'])
+
+    def test_if_none_match_returns_304(self):
+        """Test a matching If-None-Match is answered with 304 and no body"""
+        etag = self.client.get(self.dashboard_url)['ETag']
+
+        response = self.client.get(self.dashboard_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_repeated_get_is_served_from_cache(self):
+        """Test writes that bypass signals are not visible until invalidated"""
+        self.client.get(self.detail_url)
+        Campaign.objects.filter(pk=self.campaign.pk).update(name='Changed in place')
+
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.data['name'], 'Cached Campaign')
+
+    @override_settings(CAMPAIGN_RESPONSE_CACHE_TIMEOUT=0)
+    def test_disabled_cache_sees_writes_from_other_processes(self):
+        """Test responses are rebuilt when the response cache is off, as with LocMemCache"""
+        etag = self.client.get(self.detail_url)['ETag']
+        Campaign.objects.filter(pk=self.campaign.pk).update(name='Changed in place')
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['name'], 'Changed in place')
+
+    def test_model_save_invalidates_detail_and_list(self):
+        """Test saving a campaign bumps its data version"""
+        detail_etag = self.client.get(self.detail_url)['ETag']
+        list_etag = self.client.get(self.list_url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.name = 'Renamed'
+            self.campaign.save()
+
+        detail = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        listing = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=list_etag)
+
+        self.assertEqual(detail.status_code, status.HTTP_200_OK)
+        self.assertEqual(detail.data['name'], 'Renamed')
+        self.assertEqual(listing.status_code, status.HTTP_200_OK)
+        self.assertEqual(listing.data['results'][0]['name'], 'Renamed')
+
+    def test_related_changes_invalidate_campaign(self):
+        """Test notes and metrics invalidate the campaign they belong to"""
+        etag = self.client.get(self.summary_url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CampaignMetric.objects.create(
+                campaign=self.campaign, impressions=1000, clicks=10, cost_per_click=Decimal('2.00')
+            )
+
+        response = self.client.get(self.summary_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['total_spent'], 20.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CampaignNote.objects.create(
+                campaign=self.campaign, author=self.owner, title='Note', content='Content'
+            )
+
+        response = self.client.get(self.detail_url)
+        self.assertEqual(len(response.data['notes']), 1)
+
+    def test_cache_is_scoped_per_user(self):
+        """Test a user never receives another user's cached response"""
+        self.client.get(self.list_url)
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.data['count'], 0)
+
+    def test_query_parameters_are_part_of_the_key(self):
+        """Test different filters are cached separately"""
+        self.client.get(self.list_url, {'status': 'active'})
+
+        response = self.client.get(self.list_url, {'status': 'draft'})
+
+        self.assertEqual(response.data['count'], 0)
@@ -0,0 +1,104 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from datetime import timedelta
+from decimal import Decimal
+
+from campaigns.models import Campaign, CampaignMetric, CampaignStatus
+
+User = get_user_model()
+
+
+class SparseFieldsetTest(TestCase):
+    """
+    Test cases for ?fields= and ?expand= on campaign endpoints
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        now = timezone.now()
+        self.campaign = Campaign.objects.create(
+            name='Sparse Campaign',
+            description='Long description',
+            status=CampaignStatus.ACTIVE,
+            budget=Decimal('1000.00'),
+            spent_amount=Decimal('250.00'),
+            start_date=now - timedelta(days=1),
+            end_date=now + timedelta(days=9),
+            owner=self.owner
+        )
+        CampaignMetric.objects.create(campaign=self.campaign, impressions=100, clicks=10)
+        self.client.force_authenticate(user=self.owner)
+        self.list_url = reverse('campaigns:campaign-list')
+        self.detail_url = reverse('campaigns:campaign-detail', args=[self.campaign.id])
+
+    def test_list_returns_only_requested_fields(self):
+        """Test ?fields= limits the list output"""
+        response = self.client.get(self.list_url, {'fields': 'id,name,status'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data['results'][0]), {'id', 'name', 'status'})
+
+    def test_list_without_fields_is_unchanged(self):
+        """Test the full representation is returned by default"""
+        response = self.client.get(self.list_url)
+
+        row = response.data['results'][0]
+        self.assertEqual(row['owner']['username'], 'owner')
+        self.assertEqual(row['budget_utilization'], 25.0)
+
+    def test_relation_is_collapsed_unless_expanded(self):
+        """Test owner is returned as an ID unless expanded"""
+        collapsed = self.client.get(self.list_url, {'fields': 'id,owner'})
+        expanded = self.client.get(self.list_url, {'fields': 'id', 'expand': 'owner'})
+
+        self.assertEqual(collapsed.data['results'][0]['owner'], self.owner.id)
+        self.assertEqual(expanded.data['results'][0]['owner']['email'], 'owner@example.com')
+
+    def test_computed_fields_load_their_dependencies(self):
+        """Test computed fields still work with a restricted queryset"""
+        response = self.client.get(self.list_url, {'fields': 'budget_utilization,duration_days'})
+
+        row = response.data['results'][0]
+        self.assertEqual(row['budget_utilization'], 25.0)
+        self.assertEqual(row['duration_days'], 10)
+
+    def test_sparse_list_skips_joins_and_columns(self):
+        """Test unrequested relations and columns are not queried"""
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.list_url, {'fields': 'id,name,status'})
+
+        sql = '\n'.join(query['sql'] for query in queries.captured_queries)
+        self.assertNotIn('campaigns_campaignmetric', sql)
+        self.assertNotIn(f'JOIN "{User._meta.db_table}"', sql)
+        self.assertNotIn('"campaigns_campaign"."description"', sql)
+
+    def test_detail_returns_only_requested_fields(self):
+        """Test ?fields= limits the detail output, including nested collections"""
+        response = self.client.get(self.detail_url, {'fields': 'id,name,metrics'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {'id', 'name', 'metrics'})
+        self.assertEqual(len(response.data['metrics']), 1)
+
+    def test_unknown_fields_rejected(self):
+        """Test unknown fields and non-expandable relations return 400"""
+        unknown = self.client.get(self.list_url, {'fields': 'id,password'})
+        bad_expand = self.client.get(self.detail_url, {'fields': 'id', 'expand': 'metrics'})
+
+        self.assertEqual(unknown.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('password', unknown.data['details'])
+        self.assertEqual(bad_expand.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,115 @@
+import uuid
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from datetime import timedelta
+from decimal import Decimal
+
+from campaigns.models import Campaign, CampaignNote, CampaignStatus
+
+User = get_user_model()
+
+
+class CampaignStatusUpdateTest(TestCase):
+    """
+    Test cases for single and bulk campaign status transitions
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.owner)
+        self.bulk_url = reverse('campaigns:campaign-bulk-update-status')
+
+    def _create_campaign(self, campaign_status, owner=None):
+        now = timezone.now()
+        return Campaign.objects.create(
+            name=f'{campaign_status} campaign',
+            status=campaign_status,
+            budget=Decimal('1000.00'),
+            start_date=now + timedelta(days=1),
+            end_date=now + timedelta(days=30),
+            owner=owner or self.owner
+        )
+
+    def test_update_status_uses_model_state_machine(self):
+        """Test single updates accept transitions allowed by Campaign.can_transition_to"""
+        campaign = self._create_campaign(CampaignStatus.DRAFT)
+        url = reverse('campaigns:campaign-update-status', args=[campaign.id])
+
+        response = self.client.post(url, {'status': 'cancelled'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.status, CampaignStatus.CANCELLED)
+
+    def test_update_status_rejects_invalid_transition(self):
+        """Test single updates reject transitions the model does not allow"""
+        campaign = self._create_campaign(CampaignStatus.DRAFT)
+        url = reverse('campaigns:campaign-update-status', args=[campaign.id])
+
+        response = self.client.post(url, {'status': 'paused'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.status, CampaignStatus.DRAFT)
+
+    def test_bulk_update_reports_per_id_outcomes(self):
+        """Test allowed transitions are applied and the rest are reported"""
+        draft = self._create_campaign(CampaignStatus.DRAFT)
+        paused = self._create_campaign(CampaignStatus.PAUSED)
+        completed = self._create_campaign(CampaignStatus.COMPLETED)
+        hidden = self._create_campaign(CampaignStatus.DRAFT, owner=self.other_user)
+        missing_id = uuid.uuid4()
+
+        response = self.client.post(self.bulk_url, {
+            'campaign_ids': [str(draft.id), str(paused.id), str(completed.id), str(hidden.id), str(missing_id)],
+            'status': 'active',
+            'reason': 'Launch'
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated_count'], 2)
+        outcomes = {str(item['id']): item['outcome'] for item in response.data['results']}
+        self.assertEqual(outcomes, {
+            str(draft.id): 'updated',
+            str(paused.id): 'updated',
+            str(completed.id): 'invalid_transition',
+            str(hidden.id): 'not_found',
+            str(missing_id): 'not_found',
+        })
+
+        draft.refresh_from_db()
+        completed.refresh_from_db()
+        hidden.refresh_from_db()
+        self.assertEqual(draft.status, CampaignStatus.ACTIVE)
+        self.assertEqual(completed.status, CampaignStatus.COMPLETED)
+        self.assertEqual(hidden.status, CampaignStatus.DRAFT)
+
+        notes = CampaignNote.objects.filter(title='Status Updated')
+        self.assertEqual(notes.count(), 2)
+        self.assertTrue(all(note.author == self.owner for note in notes))
+        self.assertTrue(all('Reason: Launch' in note.content for note in notes))
+
+    def test_bulk_update_requires_campaign_ids(self):
+        """Test an empty ID list is rejected"""
+        response = self.client.post(self.bulk_url, {
+            'campaign_ids': [],
+            'status': 'active'
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
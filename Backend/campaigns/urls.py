@@ -7,6 +7,7 @@ router = DefaultRouter()
 router.register(r'campaigns', views.CampaignViewSet, basename='campaign')
 router.register(r'assignments', views.CampaignAssignmentViewSet, basename='assignment')
 router.register(r'metrics', views.CampaignMetricViewSet, basename='metric')
+router.register(r'hourly-metrics', views.CampaignHourlyMetricViewSet, basename='hourly-metric')
 router.register(r'notes', views.CampaignNoteViewSet, basename='note')
 
 app_name = 'campaigns'
@@ -1,30 +1,44 @@
-from rest_framework import viewsets, status, filters
+from rest_framework import viewsets, mixins, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.views import APIView
 from rest_framework.exceptions import ValidationError, PermissionDenied
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Sum, Avg, Count, F
+from django.db.models import Q, Sum, Avg, Count, F, Max, Prefetch
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils.dateparse import parse_date
 from django.utils import timezone
+from django.utils.http import http_date
+from django.conf import settings
 from django.shortcuts import get_object_or_404, render
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.decorators import method_decorator
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from decimal import Decimal
 from datetime import timedelta
 import logging
+import uuid
 
 from .models import (
-    Campaign, CampaignAssignment, CampaignMetric, CampaignNote,
-    CampaignStatus, CampaignType
+    Campaign, CampaignAssignment, CampaignHourlyMetric, CampaignMetric, CampaignNote,
+    CampaignStatus, CampaignType, CampaignVersionConflict
 )
 from .serializers import (
     CampaignListSerializer, CampaignDetailSerializer, CampaignCreateSerializer,
-    CampaignUpdateSerializer, CampaignStatusUpdateSerializer,
+    CampaignUpdateSerializer, CampaignStatusUpdateSerializer, CampaignBulkStatusUpdateSerializer,
     CampaignAssignmentSerializer, CampaignMetricSerializer, CampaignNoteSerializer,
-    CampaignMetricsSummarySerializer
+    CampaignMetricsSummarySerializer, CampaignHourlyMetricSerializer
 )
-from .api_docs import OPENAPI_SPEC
+from .fast_serializers import CampaignListFastSerializer
+from .services.pacing import BudgetPacingService, METRIC_SPEND
+from .services.metric_rollup import MetricRollupService
+from .realtime import publish_status_changes
+from .services.response_cache import CampaignResponseCache, invalidate_campaign_responses
+from .services.openapi_spec import get_compiled_openapi_spec
+from core.db.routers import use_read_replica
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -34,7 +48,10 @@ class OpenAPIDocumentationView(APIView):
     """
     OpenAPI 3.0 Documentation endpoint
     
-    Provides the complete OpenAPI specification for the Campaign Administration API
+    Provides the complete OpenAPI specification for the Campaign Administration API.
+    The spec is rendered once per process to canonical JSON bytes and served
+    pre-compressed (gzip/brotli) with a content-hash ETag and long-lived
+    caching headers.
     """
     
     permission_classes = [AllowAny]  # No authentication required for API docs
@@ -42,7 +59,21 @@ class OpenAPIDocumentationView(APIView):
     def get(self, request):
         """Return the OpenAPI specification"""
         try:
-            return Response(OPENAPI_SPEC)
+            spec = get_compiled_openapi_spec()
+            encoding = spec.choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING'))
+            
+            if spec.etag_matches(request.META.get('HTTP_IF_NONE_MATCH')):
+                response = HttpResponseNotModified()
+            else:
+                response = HttpResponse(spec.bodies[encoding], content_type='application/json')
+                if encoding != 'identity':
+                    response['Content-Encoding'] = encoding
+                response['Content-Length'] = len(spec.bodies[encoding])
+            
+            response['ETag'] = spec.get_etag(encoding)
+            patch_cache_control(response, public=True, max_age=settings.OPENAPI_SPEC_MAX_AGE)
+            patch_vary_headers(response, ['Accept-Encoding'])
+            return response
         except Exception as e:
             logger.error(f"Error serving OpenAPI docs: {str(e)}")
             return Response(
@@ -90,6 +121,7 @@ class CampaignViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'description']
     ordering_fields = ['name', 'created_at', 'start_date', 'end_date', 'budget']
     ordering = ['-created_at']
+    response_cache_class = CampaignResponseCache
     
     def get_queryset(self):
         """
@@ -104,24 +136,60 @@ class CampaignViewSet(viewsets.ModelViewSet):
             
             # For development, allow anonymous users to see all campaigns
             if user.is_anonymous:
-                return Campaign.objects.select_related('owner').prefetch_related(
-                    'team_members', 'assignments', 'metrics'
-                )
+                return self._optimize_queryset(Campaign.objects.all())
             
             if user.is_superuser:
-                return Campaign.objects.select_related('owner').prefetch_related(
-                    'team_members', 'assignments', 'metrics'
-                )
+                return self._optimize_queryset(Campaign.objects.all())
             
-            return Campaign.objects.filter(
+            return self._optimize_queryset(Campaign.objects.filter(
                 Q(owner=user) | Q(team_members=user)
-            ).select_related('owner').prefetch_related(
-                'team_members', 'assignments', 'metrics'
-            ).distinct()
+            ).distinct())
         except Exception as e:
             logger.error(f"Error getting campaigns queryset: {str(e)}")
             return Campaign.objects.none()
     
+    def _optimize_queryset(self, queryset):
+        """
+        Add the joins and prefetches needed to serialize campaigns
+        
+        For list and retrieve requests with ``?fields=``, only the relations
+        and columns the requested fields need are loaded.
+        """
+        required_fields = None
+        if self.action in ('list', 'retrieve'):
+            serializer_class = self.get_serializer_class()
+            required_fields = serializer_class.get_required_model_fields(self.request.query_params)
+        
+        if required_fields is None:
+            return queryset.select_related('owner').prefetch_related(
+                'team_members', 'assignments', 'metrics'
+            )
+        
+        requested, expand = serializer_class.parse_sparse_fieldset(self.request.query_params)
+        if 'owner' in expand:
+            queryset = queryset.select_related('owner')
+        if 'assignments' in requested:
+            queryset = queryset.prefetch_related(
+                Prefetch('assignments', queryset=CampaignAssignment.objects.select_related('user'))
+            )
+        if 'metrics' in requested:
+            queryset = queryset.prefetch_related('metrics')
+        # version and updated_at back the ETag and Last-Modified headers
+        return queryset.only(*required_fields, 'version', 'updated_at')
+    
+    def _get_invalid_fields_response(self, request):
+        """Return a 400 response if ?fields= or ?expand= name unknown fields"""
+        invalid = self.get_serializer_class().get_invalid_sparse_fields(request.query_params)
+        if not invalid:
+            return None
+        return Response(
+            {
+                "error": "Invalid fields",
+                "details": f"Unknown or non-expandable fields: {', '.join(invalid)}"
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
         try:
@@ -133,6 +201,8 @@ class CampaignViewSet(viewsets.ModelViewSet):
                 return CampaignDetailSerializer
             elif self.action == 'update_status':
                 return CampaignStatusUpdateSerializer
+            elif self.action == 'bulk_update_status':
+                return CampaignBulkStatusUpdateSerializer
             return CampaignListSerializer
         except Exception as e:
             logger.error(f"Error getting serializer class: {str(e)}")
@@ -201,9 +271,35 @@ class CampaignViewSet(viewsets.ModelViewSet):
             )
     
     def list(self, request, *args, **kwargs):
-        """List campaigns with error handling"""
+        """
+        List campaigns with error handling
+        
+        Supports an optional ``?facets=status,campaign_type,owner`` parameter
+        that adds grouped counts for the current filtered queryset to the
+        response, so the UI can render filter counts in the same round-trip.
+        
+        ``?fields=`` and ``?expand=`` limit the returned fields (see
+        SparseFieldsetMixin). Responses are cached and support conditional
+        GET (see CampaignResponseCache).
+        """
         try:
-            return super().list(request, *args, **kwargs)
+            facets = self._parse_facets(request)
+            if facets is None:
+                return Response(
+                    {
+                        "error": "Invalid facets",
+                        "details": f"Allowed facets: {', '.join(self.filterset_fields)}"
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            invalid_fields_response = self._get_invalid_fields_response(request)
+            if invalid_fields_response:
+                return invalid_fields_response
+            
+            return self.response_cache_class().respond(
+                request, 'list', lambda: self._build_list_response(request, facets, *args, **kwargs)
+            )
         except Exception as e:
             logger.error(f"Error listing campaigns: {str(e)}")
             return Response(
@@ -211,10 +307,112 @@ class CampaignViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    def _build_list_response(self, request, facets, *args, **kwargs):
+        """Build the (uncached) list response"""
+        queryset = self.filter_queryset(self.get_queryset())
+        if settings.CAMPAIGN_FAST_LIST_SERIALIZER:
+            response = self._fast_list(request, queryset)
+        else:
+            response = super().list(request, *args, **kwargs)
+        
+        if facets:
+            facet_counts = self._get_facet_counts(queryset, facets)
+            if isinstance(response.data, dict):
+                response.data['facets'] = facet_counts
+            else:
+                response.data = {'results': response.data, 'facets': facet_counts}
+        
+        self._set_last_modified(response, queryset)
+        return response
+    
+    def _fast_list(self, request, queryset):
+        """
+        List campaigns through CampaignListFastSerializer
+        
+        Produces the same output as the default list() with
+        CampaignListSerializer, from a single values() query per page.
+        """
+        requested, expand = CampaignListSerializer.parse_sparse_fieldset(request.query_params)
+        serializer = CampaignListFastSerializer(fields=requested, expand=expand)
+        rows = serializer.get_values_queryset(queryset)
+        
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page))
+        return Response(serializer.serialize(rows))
+    
+    def _set_last_modified(self, response, queryset):
+        """Set Last-Modified from the most recently updated campaign in queryset"""
+        last_modified = queryset.order_by().aggregate(last_modified=Max('updated_at'))['last_modified']
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+    
+    def _parse_facets(self, request):
+        """
+        Parse the ``facets`` query parameter
+        
+        Returns a list of facet field names (empty when not requested),
+        or None if any requested facet is not a filterable field.
+        """
+        raw = request.query_params.get('facets', '')
+        facets = [name.strip() for name in raw.split(',') if name.strip()]
+        if any(name not in self.filterset_fields for name in facets):
+            return None
+        return list(dict.fromkeys(facets))
+    
+    def _get_facet_counts(self, queryset, facets):
+        """
+        Count campaigns per value of each requested facet
+        
+        Runs one grouped ``values().annotate(Count)`` query per facet.
+        Counting distinct ids keeps the numbers correct when the
+        queryset joins through team members.
+        """
+        queryset = queryset.order_by()
+        facet_counts = {}
+        for field in facets:
+            rows = (
+                queryset.values(field)
+                .annotate(count=Count('id', distinct=True))
+                .order_by(field)
+            )
+            facet_counts[field] = [
+                {'value': row[field], 'count': row['count']} for row in rows
+            ]
+        return facet_counts
+    
+    def _get_etag(self, campaign):
+        """Strong ETag for a campaign, derived from its version"""
+        return f'"{campaign.version}"'
+    
+    def _if_match_satisfied(self, request, campaign):
+        """
+        Check the If-Match header against the campaign's current ETag
+        
+        A missing header or ``*`` always matches; otherwise one of the
+        listed entity tags must carry the current version. Tags returned by
+        retrieve have the form ``"<version>-<content digest>"``; only the
+        version part is compared.
+        """
+        if_match = request.headers.get('If-Match')
+        if not if_match or if_match.strip() == '*':
+            return True
+        version = str(campaign.version)
+        return any(
+            tag.strip().strip('"').split('-', 1)[0] == version
+            for tag in if_match.split(',')
+        )
+    
     def retrieve(self, request, *args, **kwargs):
-        """Retrieve a single campaign with error handling"""
+        """Retrieve a single campaign with error handling (cached, supports conditional GET)"""
         try:
-            return super().retrieve(request, *args, **kwargs)
+            invalid_fields_response = self._get_invalid_fields_response(request)
+            if invalid_fields_response:
+                return invalid_fields_response
+            
+            return self.response_cache_class().respond(
+                request, 'retrieve', self._build_retrieve_response, campaign_id=kwargs.get('pk')
+            )
         except ObjectDoesNotExist:
             return Response(
                 {"error": "Campaign not found"}, 
@@ -227,11 +425,33 @@ class CampaignViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    def _build_retrieve_response(self):
+        """Build the (uncached) detail response"""
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        response = Response(serializer.data)
+        response['ETag'] = self._get_etag(instance)
+        response['Last-Modified'] = http_date(instance.updated_at.timestamp())
+        return response
+    
     def update(self, request, *args, **kwargs):
         """Update campaign with comprehensive verification"""
         try:
             with transaction.atomic():
                 instance = self.get_object()
+                
+                # Optimistic concurrency: reject writes based on a stale representation
+                if not self._if_match_satisfied(request, instance):
+                    return Response(
+                        {
+                            "error": "Precondition failed",
+                            "details": "Campaign has been modified since it was retrieved",
+                            "current_version": instance.version
+                        },
+                        status=status.HTTP_412_PRECONDITION_FAILED,
+                        headers={'ETag': self._get_etag(instance)}
+                    )
+                
                 serializer = self.get_serializer(instance, data=request.data, partial=kwargs.get('partial', False))
                 
                 if serializer.is_valid():
@@ -255,6 +475,10 @@ class CampaignViewSet(viewsets.ModelViewSet):
                     
                     # Log status changes
                     if old_status != new_status:
+                        publish_status_changes(
+                            [(campaign.pk, old_status, new_status)],
+                            changed_by=request.user.id
+                        )
                         CampaignNote.objects.create(
                             campaign=campaign,
                             author=request.user if not request.user.is_anonymous else serializer.validated_data.get('owner'),
@@ -264,7 +488,7 @@ class CampaignViewSet(viewsets.ModelViewSet):
                         )
                     
                     logger.info(f"Campaign updated successfully: {campaign.id} by user {request.user.id if not request.user.is_anonymous else 'anonymous'}")
-                    return Response(serializer.data)
+                    return Response(serializer.data, headers={'ETag': self._get_etag(campaign)})
                 else:
                     logger.warning(f"Campaign update validation failed: {serializer.errors}")
                     return Response(
@@ -277,6 +501,12 @@ class CampaignViewSet(viewsets.ModelViewSet):
                 {"error": "Validation error", "details": str(e)}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
+        except CampaignVersionConflict as e:
+            logger.warning(f"Campaign update conflict: {str(e)}")
+            return Response(
+                {"error": "Conflict", "details": "Campaign was modified by another request. Reload and retry."}, 
+                status=status.HTTP_409_CONFLICT
+            )
         except ObjectDoesNotExist:
             return Response(
                 {"error": "Campaign not found"}, 
@@ -330,30 +560,21 @@ class CampaignViewSet(viewsets.ModelViewSet):
         """
         try:
             campaign = self.get_object()
-            serializer = self.get_serializer(data=request.data)
+            context = self.get_serializer_context()
+            context['campaign'] = campaign
+            serializer = self.get_serializer(data=request.data, context=context)
             
             if serializer.is_valid():
                 new_status = serializer.validated_data['status']
                 reason = serializer.validated_data.get('reason', '')
                 
-                # Validate status transition
+                # The serializer has validated the transition against Campaign.can_transition_to
                 old_status = campaign.status
-                valid_transitions = {
-                    'draft': ['active', 'paused'],
-                    'active': ['paused', 'completed'],
-                    'paused': ['active', 'completed'],
-                    'completed': []  # No transitions from completed
-                }
                 
-                if new_status not in valid_transitions.get(old_status, []):
-                    return Response(
-                        {"error": f"Invalid status transition from {old_status} to {new_status}"}, 
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-                
-                # Update status
+                # Update status, conditional on the version that was validated
                 campaign.status = new_status
-                campaign.save()
+                campaign.save_with_version(update_fields=['status'])
+                publish_status_changes([(campaign.pk, old_status, new_status)], changed_by=request.user.id)
                 
                 # Log the status change
                 note_content = f'Status changed to {new_status}'
@@ -385,6 +606,12 @@ class CampaignViewSet(viewsets.ModelViewSet):
                 {"error": "Campaign not found"}, 
                 status=status.HTTP_404_NOT_FOUND
             )
+        except CampaignVersionConflict as e:
+            logger.warning(f"Status update conflict: {str(e)}")
+            return Response(
+                {"error": "Conflict", "details": "Campaign was modified by another request. Reload and retry."}, 
+                status=status.HTTP_409_CONFLICT
+            )
         except Exception as e:
             logger.error(f"Status update error: {str(e)}")
             return Response(
@@ -392,7 +619,113 @@ class CampaignViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    @action(detail=False, methods=['post'], url_path='bulk-status')
+    def bulk_update_status(self, request):
+        """
+        Update the status of many campaigns at once
+        
+        Every transition is validated against the Campaign state machine.
+        Allowed transitions are applied with a single UPDATE and audited
+        with one bulk insert of notes. Returns an outcome per campaign ID:
+        - updated: the status was changed
+        - invalid_transition: the campaign's current status does not allow it
+        - not_found: the campaign does not exist or is not visible to the user
+        """
+        try:
+            serializer = self.get_serializer(data=request.data)
+            if not serializer.is_valid():
+                logger.warning(f"Bulk status update validation failed: {serializer.errors}")
+                return Response(
+                    {"error": "Validation failed", "details": serializer.errors}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            campaign_ids = list(dict.fromkeys(serializer.validated_data['campaign_ids']))
+            new_status = serializer.validated_data['status']
+            reason = serializer.validated_data.get('reason', '')
+            allowed_from = Campaign.statuses_allowing_transition_to(new_status)
+            
+            with transaction.atomic():
+                visible_ids = self.get_queryset().prefetch_related(None).filter(
+                    id__in=campaign_ids
+                ).values_list('id', flat=True)
+                
+                # Lock the rows so the validated status cannot change before the UPDATE
+                current = {
+                    campaign_id: (old_status, owner_id)
+                    for campaign_id, old_status, owner_id in Campaign.objects.filter(
+                        id__in=visible_ids
+                    ).select_for_update().values_list('id', 'status', 'owner_id')
+                }
+                
+                results = []
+                to_update = []
+                for campaign_id in campaign_ids:
+                    if campaign_id not in current:
+                        results.append({'id': campaign_id, 'outcome': 'not_found'})
+                        continue
+                    
+                    old_status, _ = current[campaign_id]
+                    if old_status not in allowed_from:
+                        results.append({
+                            'id': campaign_id,
+                            'outcome': 'invalid_transition',
+                            'previous_status': old_status,
+                            'error': f'Cannot transition from "{old_status}" to "{new_status}".'
+                        })
+                        continue
+                    
+                    to_update.append(campaign_id)
+                    results.append({
+                        'id': campaign_id,
+                        'outcome': 'updated',
+                        'previous_status': old_status
+                    })
+                
+                if to_update:
+                    # update() bypasses auto_now, so stamp updated_at explicitly
+                    Campaign.objects.filter(
+                        id__in=to_update,
+                        status__in=allowed_from
+                    ).update(status=new_status, version=F('version') + 1, updated_at=timezone.now())
+                    
+                    # Log the status changes
+                    note_content = f'Status changed to {new_status}'
+                    if reason:
+                        note_content += f'. Reason: {reason}'
+                    
+                    CampaignNote.objects.bulk_create([
+                        CampaignNote(
+                            campaign_id=campaign_id,
+                            author_id=request.user.id if not request.user.is_anonymous else current[campaign_id][1],
+                            title='Status Updated',
+                            content=note_content,
+                            is_private=False
+                        )
+                        for campaign_id in to_update
+                    ])
+                    invalidate_campaign_responses(to_update)
+                    publish_status_changes(
+                        [(campaign_id, current[campaign_id][0], new_status) for campaign_id in to_update],
+                        changed_by=request.user.id
+                    )
+            
+            logger.info(f"Bulk status update to {new_status}: {len(to_update)} of {len(campaign_ids)} campaigns updated")
+            
+            return Response({
+                'status': new_status,
+                'updated_count': len(to_update),
+                'results': results
+            })
+        except Exception as e:
+            logger.error(f"Bulk status update error: {str(e)}")
+            return Response(
+                {"error": "Failed to update statuses"}, 
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
     @action(detail=True, methods=['get'])
+    @method_decorator(use_read_replica)
     def metrics_summary(self, request, pk=None):
         """
         Get aggregated metrics summary for a campaign
@@ -402,75 +735,120 @@ class CampaignViewSet(viewsets.ModelViewSet):
         - Average rates and costs
         - Budget utilization
         - Days remaining
+        
+        Responses are cached and support conditional GET. Reads may be
+        served by a read replica.
         """
         try:
-            campaign = self.get_object()
-            
-            # Get metrics for the campaign
-            metrics = campaign.metrics.all()
-            
-            if not metrics.exists():
-                return Response({
-                    'message': 'No metrics available for this campaign',
-                    'data': {
-                        'total_impressions': 0,
-                        'total_clicks': 0,
-                        'total_conversions': 0,
-                        'total_spent': 0,
-                        'average_ctr': 0,
-                        'average_cvr': 0,
-                        'average_cpc': 0,
-                        'average_cpm': 0,
-                        'budget_utilization': 0,
-                        'days_remaining': max(0, (campaign.end_date - timezone.now().date()).days)
-                    }
-                })
-            
-            # Calculate aggregated metrics
-            total_impressions = metrics.aggregate(total=Sum('impressions'))['total'] or 0
-            total_clicks = metrics.aggregate(total=Sum('clicks'))['total'] or 0
-            total_conversions = metrics.aggregate(total=Sum('conversions'))['total'] or 0
-            total_spent = metrics.aggregate(total=Sum('spent_amount'))['total'] or 0
-            
-            # Calculate averages
-            avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
-            avg_cvr = (total_conversions / total_clicks * 100) if total_clicks > 0 else 0
-            avg_cpc = total_spent / total_clicks if total_clicks > 0 else 0
-            avg_cpm = (total_spent / total_impressions * 1000) if total_impressions > 0 else 0
-            
-            # Budget utilization
-            budget_utilization = (total_spent / campaign.budget * 100) if campaign.budget > 0 else 0
-            
-            # Days remaining
-            days_remaining = max(0, (campaign.end_date - timezone.now().date()).days)
-            
-            return Response({
+            return self.response_cache_class().respond(
+                request, 'metrics_summary', self._build_metrics_summary_response, campaign_id=pk
+            )
+        except ObjectDoesNotExist:
+            return Response(
+                {"error": "Campaign not found"}, 
+                status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            logger.error(f"Metrics summary error: {str(e)}")
+            return Response(
+                {"error": "Failed to retrieve metrics summary"}, 
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
+    def _build_metrics_summary_response(self):
+        """Build the (uncached) metrics summary response"""
+        campaign = self.get_object()
+        days_remaining = max(0, (campaign.end_date - timezone.now()).days)
+        
+        # Aggregate all metric totals in one query; the date bound lets
+        # PostgreSQL skip metric partitions older than the campaign
+        totals = CampaignMetric.objects.filter(
+            campaign=campaign,
+            date__gte=campaign.earliest_metric_date
+        ).aggregate(
+            metric_count=Count('id'),
+            total_impressions=Sum('impressions'),
+            total_clicks=Sum('clicks'),
+            total_conversions=Sum('conversions'),
+            total_spent=Sum(METRIC_SPEND)
+        )
+        
+        if not totals['metric_count']:
+            response = Response({
+                'message': 'No metrics available for this campaign',
                 'data': {
-                    'total_impressions': total_impressions,
-                    'total_clicks': total_clicks,
-                    'total_conversions': total_conversions,
-                    'total_spent': float(total_spent),
-                    'average_ctr': round(avg_ctr, 2),
-                    'average_cvr': round(avg_cvr, 2),
-                    'average_cpc': float(avg_cpc),
-                    'average_cpm': float(avg_cpm),
-                    'budget_utilization': round(budget_utilization, 2),
+                    'total_impressions': 0,
+                    'total_clicks': 0,
+                    'total_conversions': 0,
+                    'total_spent': 0,
+                    'average_ctr': 0,
+                    'average_cvr': 0,
+                    'average_cpc': 0,
+                    'average_cpm': 0,
+                    'budget_utilization': 0,
                     'days_remaining': days_remaining
                 }
             })
+            response['Last-Modified'] = http_date(campaign.updated_at.timestamp())
+            return response
+        
+        total_impressions = totals['total_impressions'] or 0
+        total_clicks = totals['total_clicks'] or 0
+        total_conversions = totals['total_conversions'] or 0
+        total_spent = totals['total_spent'] or 0
+        
+        # Calculate averages
+        avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
+        avg_cvr = (total_conversions / total_clicks * 100) if total_clicks > 0 else 0
+        avg_cpc = total_spent / total_clicks if total_clicks > 0 else 0
+        avg_cpm = (total_spent / total_impressions * 1000) if total_impressions > 0 else 0
+        
+        # Budget utilization
+        budget_utilization = (total_spent / campaign.budget * 100) if campaign.budget > 0 else 0
+        
+        response = Response({
+            'data': {
+                'total_impressions': total_impressions,
+                'total_clicks': total_clicks,
+                'total_conversions': total_conversions,
+                'total_spent': float(total_spent),
+                'average_ctr': round(avg_ctr, 2),
+                'average_cvr': round(avg_cvr, 2),
+                'average_cpc': float(avg_cpc),
+                'average_cpm': float(avg_cpm),
+                'budget_utilization': round(float(budget_utilization), 2),
+                'days_remaining': days_remaining
+            }
+        })
+        response['Last-Modified'] = http_date(campaign.updated_at.timestamp())
+        return response
+    
+    @action(detail=True, methods=['get'])
+    def pacing(self, request, pk=None):
+        """
+        Get budget pacing for a campaign
+        
+        Compares actual spend with the spend expected from an even
+        distribution of the budget over the campaign date range,
+        overall and for each day with recorded metrics.
+        """
+        try:
+            campaign = self.get_object()
+            return Response({'data': BudgetPacingService().get_daily_pacing(campaign)})
         except ObjectDoesNotExist:
             return Response(
                 {"error": "Campaign not found"}, 
                 status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Metrics summary error: {str(e)}")
+            logger.error(f"Budget pacing error: {str(e)}")
             return Response(
-                {"error": "Failed to retrieve metrics summary"}, 
+                {"error": "Failed to retrieve budget pacing"}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
     @action(detail=False, methods=['get'])
+    @method_decorator(use_read_replica)
     def dashboard_stats(self, request):
         """
         Get dashboard statistics for all campaigns
@@ -479,69 +857,65 @@ class CampaignViewSet(viewsets.ModelViewSet):
         - Total campaigns by status
         - Budget utilization
         - Performance data
+        
+        Responses are cached and support conditional GET, so polling
+        dashboards mostly receive 304 responses. Reads may be served by a
+        read replica.
         """
         try:
-            # Get campaigns for the user
-            campaigns = self.get_queryset()
-            
-            # Calculate status counts
-            status_counts = campaigns.values('status').annotate(count=Count('id'))
-            status_stats = {item['status']: item['count'] for item in status_counts}
-            
-            # Ensure all statuses are represented
-            all_statuses = ['draft', 'active', 'paused', 'completed']
-            for status in all_statuses:
-                if status not in status_stats:
-                    status_stats[status] = 0
-            
-            # Calculate total campaigns
-            total_campaigns = campaigns.count()
-            
-            # Calculate budget metrics
-            total_budget = campaigns.aggregate(total=Sum('budget'))['total'] or 0
-            
-            # Fix the spent amount calculation - use direct field instead of related lookup
-            total_spent = 0
-            for campaign in campaigns:
-                campaign_spent = campaign.metrics.aggregate(total=Sum('spent_amount'))['total'] or 0
-                total_spent += campaign_spent
-            
-            budget_utilization = (total_spent / total_budget * 100) if total_budget > 0 else 0
-            
-            # Calculate performance metrics
-            total_impressions = 0
-            total_clicks = 0
-            total_conversions = 0
-            
-            for campaign in campaigns:
-                campaign_metrics = campaign.metrics.aggregate(
-                    impressions=Sum('impressions'),
-                    clicks=Sum('clicks'),
-                    conversions=Sum('conversions')
-                )
-                total_impressions += campaign_metrics['impressions'] or 0
-                total_clicks += campaign_metrics['clicks'] or 0
-                total_conversions += campaign_metrics['conversions'] or 0
-            
-            return Response({
-                'total_campaigns': total_campaigns,
-                'active': status_stats.get('active', 0),
-                'paused': status_stats.get('paused', 0),
-                'completed': status_stats.get('completed', 0),
-                'draft': status_stats.get('draft', 0),
-                'total_budget': float(total_budget),
-                'total_spent': float(total_spent),
-                'budget_utilization': round(budget_utilization, 2),
-                'total_impressions': total_impressions,
-                'total_clicks': total_clicks,
-                'total_conversions': total_conversions
-            })
+            return self.response_cache_class().respond(
+                request, 'dashboard_stats', self._build_dashboard_stats_response
+            )
         except Exception as e:
             logger.error(f"Dashboard stats error: {str(e)}")
             return Response(
                 {"error": "Failed to retrieve dashboard statistics"}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+    
+    def _build_dashboard_stats_response(self):
+        """Build the (uncached) dashboard statistics response"""
+        # Get campaigns for the user
+        campaigns = self.get_queryset()
+        
+        # Calculate status counts
+        status_counts = campaigns.order_by().values('status').annotate(count=Count('id', distinct=True))
+        status_stats = {item['status']: item['count'] for item in status_counts}
+        
+        # Calculate total campaigns
+        total_campaigns = campaigns.count()
+        
+        # Calculate budget metrics from the campaign spend field
+        budget_totals = campaigns.aggregate(total_budget=Sum('budget'), total_spent=Sum('spent_amount'))
+        total_budget = budget_totals['total_budget'] or 0
+        total_spent = budget_totals['total_spent'] or 0
+        
+        budget_utilization = (total_spent / total_budget * 100) if total_budget > 0 else 0
+        
+        # Calculate performance metrics in one query across all campaigns
+        metric_totals = CampaignMetric.objects.filter(
+            campaign__in=campaigns.order_by().values('id')
+        ).aggregate(
+            total_impressions=Sum('impressions'),
+            total_clicks=Sum('clicks'),
+            total_conversions=Sum('conversions')
+        )
+        
+        response = Response({
+            'total_campaigns': total_campaigns,
+            'active': status_stats.get('active', 0),
+            'paused': status_stats.get('paused', 0),
+            'completed': status_stats.get('completed', 0),
+            'draft': status_stats.get('draft', 0),
+            'total_budget': float(total_budget),
+            'total_spent': float(total_spent),
+            'budget_utilization': round(float(budget_utilization), 2),
+            'total_impressions': metric_totals['total_impressions'] or 0,
+            'total_clicks': metric_totals['total_clicks'] or 0,
+            'total_conversions': metric_totals['total_conversions'] or 0
+        })
+        self._set_last_modified(response, campaigns)
+        return response
 
 
 class CampaignAssignmentViewSet(viewsets.ModelViewSet):
@@ -616,6 +990,10 @@ class CampaignMetricViewSet(viewsets.ModelViewSet):
     ordering_fields = ['date', 'recorded_at', 'impressions', 'clicks']
     ordering = ['-date']
     
+    # Trend interval -> date truncation (None keeps single days)
+    TREND_INTERVALS = {'day': None, 'week': TruncWeek, 'month': TruncMonth}
+    DEFAULT_TREND_DAYS = 30
+    
     def get_queryset(self):
         """Get metrics based on user authorization"""
         user = self.request.user
@@ -629,25 +1007,192 @@ class CampaignMetricViewSet(viewsets.ModelViewSet):
     
     def perform_create(self, serializer):
         """Create metric with verification"""
-        metric = serializer.save()
+        campaign = serializer.validated_data['campaign']
+        user = self.request.user
+        if not user.is_superuser and not (
+            campaign.owner_id == user.id or
+            campaign.team_members.filter(id=user.id).exists()
+        ):
+            raise PermissionDenied('You do not have access to this campaign.')
+        
+        with transaction.atomic():
+            # Lock the campaign as hourly ingestion does, so a rollup of the
+            # same day sees this row and replaces its spend rather than
+            # adding to it
+            list(Campaign.objects.select_for_update().filter(pk=campaign.pk).values_list('pk'))
+            metric = serializer.save()
+            if metric.spend:
+                Campaign.objects.filter(pk=campaign.pk).update(
+                    spent_amount=F('spent_amount') + metric.spend,
+                    version=F('version') + 1,
+                    updated_at=timezone.now()
+                )
         
-        # Update campaign spent amount (simplified calculation)
-        campaign = metric.campaign
-        if metric.cost_per_click and metric.clicks:
-            additional_spent = metric.cost_per_click * metric.clicks
-            campaign.spent_amount += additional_spent
-            campaign.save()
+        if metric.spend:
+            invalidate_campaign_responses([campaign.pk])
+            
+            # Alert if the new spend crossed a budget utilization threshold
+            BudgetPacingService().check_thresholds([campaign.id])
+    
+    @staticmethod
+    def _parse_date_param(request, name):
+        """Parse an optional YYYY-MM-DD query parameter; ValueError if invalid"""
+        value = request.query_params.get(name)
+        if not value:
+            return None
+        parsed = parse_date(value)
+        if parsed is None:
+            raise ValueError(f"Invalid date: {value}")
+        return parsed
     
     @action(detail=False, methods=['get'])
+    @method_decorator(use_read_replica)
     def trends(self, request):
         """
         Get metric trends for analysis
         
-        Provides time-series data for trend evaluation
+        Provides time-series data for trend evaluation: impressions, clicks,
+        conversions, spend and CTR per day, week or month (interval) between
+        start_date and end_date (default: the last 30 days), optionally for
+        one campaign. The date range lets PostgreSQL skip the metric
+        partitions outside it.
         """
-        # Implementation for trend analysis
-        # This would include date range filtering and aggregation
-        return Response({'message': 'Trend analysis endpoint - to be implemented'})
+        interval = request.query_params.get('interval', 'day')
+        if interval not in self.TREND_INTERVALS:
+            return Response(
+                {"error": f"interval must be one of: {', '.join(self.TREND_INTERVALS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            end_date = self._parse_date_param(request, 'end_date') or timezone.localdate()
+            start_date = (
+                self._parse_date_param(request, 'start_date')
+                or end_date - timedelta(days=self.DEFAULT_TREND_DAYS - 1)
+            )
+        except ValueError:
+            return Response(
+                {"error": "start_date and end_date must be valid dates (YYYY-MM-DD)"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if start_date > end_date:
+            return Response(
+                {"error": "start_date must not be after end_date"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # Filter on visible campaign IDs rather than joining team members,
+        # which would repeat metric rows and inflate the sums
+        user = request.user
+        metrics = CampaignMetric.objects.filter(date__gte=start_date, date__lte=end_date)
+        if not user.is_superuser:
+            metrics = metrics.filter(
+                campaign__in=Campaign.objects.filter(Q(owner=user) | Q(team_members=user)).values('id')
+            )
+        campaign_id = request.query_params.get('campaign')
+        if campaign_id:
+            try:
+                metrics = metrics.filter(campaign_id=uuid.UUID(campaign_id))
+            except ValueError:
+                return Response({"error": "Invalid campaign ID"}, status=status.HTTP_400_BAD_REQUEST)
+        
+        period = self.TREND_INTERVALS[interval]
+        rows = (
+            metrics.order_by()
+            .annotate(period=period('date') if period else F('date'))
+            .values('period')
+            .annotate(
+                total_impressions=Sum('impressions'),
+                total_clicks=Sum('clicks'),
+                total_conversions=Sum('conversions'),
+                total_spend=Sum(METRIC_SPEND)
+            )
+            .order_by('period')
+        )
+        
+        return Response({
+            'interval': interval,
+            'start_date': start_date,
+            'end_date': end_date,
+            'results': [
+                {
+                    'period': row['period'],
+                    'impressions': row['total_impressions'],
+                    'clicks': row['total_clicks'],
+                    'conversions': row['total_conversions'],
+                    'spend': float(row['total_spend'] or 0),
+                    'ctr': (
+                        round(row['total_clicks'] / row['total_impressions'] * 100, 2)
+                        if row['total_impressions'] else 0
+                    ),
+                }
+                for row in rows
+            ]
+        })
+
+
+class CampaignHourlyMetricViewSet(mixins.ListModelMixin,
+                                  mixins.RetrieveModelMixin,
+                                  viewsets.GenericViewSet):
+    """
+    ViewSet for hourly Campaign Metrics
+    
+    Ingests hourly counters (one object or a list) and rolls them up into
+    the daily metrics; re-sending an hour replaces its counters
+    """
+    
+    serializer_class = CampaignHourlyMetricSerializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_fields = {'campaign': ['exact'], 'hour': ['gte', 'lt']}
+    ordering_fields = ['hour', 'recorded_at', 'impressions', 'clicks']
+    ordering = ['-hour']
+    
+    MAX_BATCH_SIZE = 1000
+    
+    def get_queryset(self):
+        """Get hourly metrics based on user authorization"""
+        user = self.request.user
+        
+        if user.is_superuser:
+            return CampaignHourlyMetric.objects.all()
+        
+        return CampaignHourlyMetric.objects.filter(
+            campaign__in=Campaign.objects.filter(Q(owner=user) | Q(team_members=user)).values('id')
+        )
+    
+    def create(self, request, *args, **kwargs):
+        """Record hourly metrics for one or more campaigns and hours"""
+        many = isinstance(request.data, list)
+        if many and len(request.data) > self.MAX_BATCH_SIZE:
+            return Response(
+                {"error": f"At most {self.MAX_BATCH_SIZE} metrics can be recorded per request"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        serializer = self.get_serializer(data=request.data, many=many)
+        serializer.is_valid(raise_exception=True)
+        rows = serializer.validated_data if many else [serializer.validated_data]
+        
+        # Verify access to every campaign in one query
+        user = request.user
+        campaign_ids = {row['campaign'].pk for row in rows}
+        if not user.is_superuser:
+            accessible = set(
+                Campaign.objects.filter(id__in=campaign_ids)
+                .filter(Q(owner=user) | Q(team_members=user))
+                .values_list('id', flat=True)
+            )
+            if accessible != campaign_ids:
+                raise PermissionDenied('You do not have access to this campaign.')
+        
+        stored, spend_increased = MetricRollupService().record_hourly(rows)
+        
+        # Alert if the new spend crossed a budget utilization threshold
+        if spend_increased:
+            BudgetPacingService().check_thresholds(spend_increased)
+        
+        data = self.get_serializer(stored, many=True).data
+        return Response(data if many else data[0], status=status.HTTP_201_CREATED)
 
 
 class CampaignNoteViewSet(viewsets.ModelViewSet):
@@ -0,0 +1,127 @@
+import functools
+import threading
+from contextlib import contextmanager
+
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from core.db.pool import ConnectionPool, PoolTimeout
+
+# connection.info.transaction_status when no transaction is open
+# (TRANSACTION_STATUS_IDLE in psycopg2, TransactionStatus.IDLE in psycopg 3)
+TRANSACTION_STATUS_IDLE = 0
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _check_connection(connection):
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    if not connection.autocommit:
+        connection.rollback()
+    return True
+
+
+def _reset_connection(connection):
+    """Roll back anything left open; False if the connection is unusable"""
+    if connection.closed:
+        return False
+    try:
+        if connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+            connection.rollback()
+    except Exception:
+        return False
+    return connection.info.transaction_status == TRANSACTION_STATUS_IDLE
+
+
+def _close_connection(connection):
+    connection.close()
+
+
+def get_pools():
+    """All connection pools of this process"""
+    with _pools_lock:
+        return list(_pools.values())
+
+
+def close_pools():
+    """Close and forget all connection pools of this process"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend that takes connections from a per-process pool
+
+    Closing a connection (which Django does at the end of every request
+    when CONN_MAX_AGE is 0) returns it to the pool instead, so threads
+    share a bounded set of open connections. This matters under ASGI,
+    where each request runs its sync code in its own thread.
+
+    Pool settings are read from the POOL key of the database settings:
+    MAX_SIZE, TIMEOUT, MAX_IDLE, MAX_LIFETIME and CHECK_AFTER (see
+    core.db.pool.ConnectionPool).
+    """
+
+    def get_pool(self, conn_params):
+        """Get the pool for this database and connection parameters"""
+        # Connection parameters are part of the key, so switching NAME to the
+        # test database never hands out connections to the old one
+        key = (self.alias, repr(sorted(conn_params.items())))
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                options = self.settings_dict.get('POOL', {})
+                database = conn_params.get('database') or conn_params.get('dbname')
+                pool = ConnectionPool(
+                    f'{self.alias}:{database}',
+                    check=_check_connection,
+                    reset=_reset_connection,
+                    close=_close_connection,
+                    max_size=options.get('MAX_SIZE', 10),
+                    timeout=options.get('TIMEOUT', 30.0),
+                    max_idle=options.get('MAX_IDLE', 600.0),
+                    max_lifetime=options.get('MAX_LIFETIME', 3600.0),
+                    check_after=options.get('CHECK_AFTER', 30.0),
+                )
+                _pools[key] = pool
+        return pool
+
+    def get_new_connection(self, conn_params):
+        self._pool = None
+        if self.alias == NO_DB_ALIAS:
+            return super().get_new_connection(conn_params)
+
+        pool = self.get_pool(conn_params)
+        try:
+            connection = pool.getconn(functools.partial(super().get_new_connection, conn_params))
+        except PoolTimeout as e:
+            raise self.Database.OperationalError(str(e)) from e
+        self._pool = pool
+
+        # Set by the parent when it opens a connection; reused ones need it too
+        options = self.settings_dict['OPTIONS']
+        self.isolation_level = IsolationLevel(
+            options.get('isolation_level', IsolationLevel.READ_COMMITTED)
+        )
+        return connection
+
+    def _close(self):
+        pool = getattr(self, '_pool', None)
+        if pool is None or self.connection is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            pool.putconn(self.connection)
+
+    @contextmanager
+    def _nodb_cursor(self):
+        # CREATE / DROP DATABASE fail while pooled sessions are connected
+        close_pools()
+        with super()._nodb_cursor() as cursor:
+            yield cursor
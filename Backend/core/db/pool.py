@@ -0,0 +1,209 @@
+import collections
+import threading
+import time
+
+
+class PoolTimeout(Exception):
+    """No connection became available within the pool timeout"""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of database connections
+
+    Connections are opened on demand up to max_size and handed back with
+    putconn() instead of being closed. Idle connections are reused most
+    recently returned first, so a small hot set stays warm, and those idle
+    longer than max_idle or older than max_lifetime are closed. A
+    connection that has been idle for more than check_after seconds is
+    checked before it is handed out.
+
+    The pool does not know how to talk to the database; connect() is
+    passed to getconn(), and check(), reset() and close() are given to the
+    constructor. Counters for monitoring are returned by get_stats().
+    """
+
+    def __init__(self, name, check, reset, close, max_size=10, timeout=30.0,
+                 max_idle=600.0, max_lifetime=3600.0, check_after=30.0):
+        self.name = name
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.check_after = check_after
+        self._check = check
+        self._reset = reset
+        self._close = close
+
+        self._cond = threading.Condition()
+        # (connection, opened_at, returned_at); returned connections are appended
+        self._idle = collections.deque()
+        # id(connection) -> opened_at
+        self._in_use = {}
+        # Open connections, including ones being opened or checked
+        self._size = 0
+        self._waiting = 0
+        self._closed = False
+        self._counters = collections.Counter()
+
+    def getconn(self, connect):
+        """
+        Check out a connection, opening one with connect() if needed
+
+        Waits up to timeout seconds when max_size connections are in use
+        and raises PoolTimeout if none is returned in time.
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        waited = False
+
+        with self._cond:
+            self._counters['requests'] += 1
+
+        while True:
+            conn = None
+            with self._cond:
+                expired = self._pop_expired_idle(time.monotonic())
+                while True:
+                    if self._idle:
+                        conn, opened_at, returned_at = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._counters['timeouts'] += 1
+                        self._close_all(expired)
+                        raise PoolTimeout(
+                            f'No connection available in pool {self.name!r} '
+                            f'within {self.timeout}s ({self.max_size} in use)'
+                        )
+                    if not waited:
+                        waited = True
+                        self._counters['requests_waited'] += 1
+                    self._waiting += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                if waited:
+                    self._counters['wait_ms'] += int((time.monotonic() - start) * 1000)
+            self._close_all(expired)
+
+            if conn is None:
+                try:
+                    conn = connect()
+                except Exception:
+                    self._release_slot()
+                    raise
+                with self._cond:
+                    self._counters['connections_opened'] += 1
+                    self._in_use[id(conn)] = time.monotonic()
+                return conn
+
+            if self._is_reusable(conn, opened_at, returned_at):
+                with self._cond:
+                    self._in_use[id(conn)] = opened_at
+                return conn
+
+            self._discard(conn)
+
+    def putconn(self, conn, discard=False):
+        """
+        Return a checked out connection to the pool
+
+        The connection is closed instead if discard is set, it is too old,
+        or it cannot be reset (for example because it is broken).
+        """
+        with self._cond:
+            opened_at = self._in_use.pop(id(conn), None)
+        if opened_at is None:
+            # Not checked out from this pool
+            self._close(conn)
+            return
+
+        now = time.monotonic()
+        if discard or self._closed or now - opened_at > self.max_lifetime or not self._reset(conn):
+            self._discard(conn)
+            return
+
+        with self._cond:
+            self._idle.append((conn, opened_at, now))
+            self._cond.notify()
+
+    def close(self):
+        """
+        Close all idle connections
+
+        Connections still checked out are closed when they are returned.
+        """
+        with self._cond:
+            idle = [conn for conn, _, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._counters['connections_closed'] += len(idle)
+            self._closed = True
+            self._cond.notify_all()
+        self._close_all(idle)
+
+    def get_stats(self):
+        """Current pool state and cumulative counters"""
+        with self._cond:
+            stats = {
+                'name': self.name,
+                'max_size': self.max_size,
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'waiting': self._waiting,
+            }
+            for key in [
+                'requests', 'requests_waited', 'wait_ms', 'timeouts',
+                'connections_opened', 'connections_closed'
+            ]:
+                stats[key] = self._counters[key]
+        return stats
+
+    def _is_reusable(self, conn, opened_at, returned_at):
+        """Check an idle connection before handing it out"""
+        now = time.monotonic()
+        if now - opened_at > self.max_lifetime:
+            return False
+        if now - returned_at <= self.check_after:
+            return True
+        try:
+            return self._check(conn)
+        except Exception:
+            return False
+
+    def _pop_expired_idle(self, now):
+        """Remove connections idle for more than max_idle; call with the lock held"""
+        expired = []
+        # The left end holds the connections returned longest ago
+        while self._idle and now - self._idle[0][2] > self.max_idle:
+            expired.append(self._idle.popleft()[0])
+        self._size -= len(expired)
+        self._counters['connections_closed'] += len(expired)
+        return expired
+
+    def _discard(self, conn):
+        """Close a connection that is not returned to the pool"""
+        self._close(conn)
+        with self._cond:
+            self._size -= 1
+            self._counters['connections_closed'] += 1
+            self._cond.notify()
+
+    def _release_slot(self):
+        """Give back a slot reserved for a connection that could not be opened"""
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _close_all(self, connections):
+        for conn in connections:
+            try:
+                self._close(conn)
+            except Exception:
+                pass
@@ -0,0 +1,196 @@
+import contextvars
+import functools
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+STICKY_KEY = 'db:primary-pin:{}'
+
+# The read replica scope of the current view, if it opted in
+_replica_scope = contextvars.ContextVar('replica_scope', default=None)
+
+# alias -> (checked_at, lag in seconds or None when unreachable)
+_lag_cache = {}
+_lag_lock = threading.Lock()
+
+LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+class ReplicaScope:
+    """
+    Read replica state of one opted-in view call
+
+    The replica is picked on the first read and kept for the rest of the
+    view, so all of its reads see the same point in time.
+    """
+
+    def __init__(self):
+        self.alias = None
+
+
+def get_replica_aliases():
+    """Configured read replica aliases"""
+    return list(getattr(settings, 'DB_READ_REPLICAS', []))
+
+
+def get_replica_lag(alias):
+    """
+    Replication lag of a replica in seconds, or None if it is unreachable
+
+    Measured at most once per DB_REPLICA_LAG_CHECK_INTERVAL seconds per
+    process. A replica that has replayed everything it received counts as
+    not lagging, even if the primary has been idle for a while.
+    """
+    now = time.monotonic()
+    with _lag_lock:
+        cached = _lag_cache.get(alias)
+    if cached is not None and now - cached[0] < settings.DB_REPLICA_LAG_CHECK_INTERVAL:
+        return cached[1]
+
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(LAG_SQL)
+            lag = float(cursor.fetchone()[0])
+    except Exception:
+        connections[alias].close()
+        lag = None
+
+    with _lag_lock:
+        _lag_cache[alias] = (now, lag)
+    return lag
+
+
+def get_replica_status():
+    """Last measured lag of every replica, for monitoring"""
+    return {
+        alias: {
+            'lag': get_replica_lag(alias),
+            'max_lag': settings.DB_REPLICA_MAX_LAG,
+        }
+        for alias in get_replica_aliases()
+    }
+
+
+def get_read_alias():
+    """
+    Pick the database alias for a read that may go to a replica
+
+    Returns a random replica within DB_REPLICA_MAX_LAG, or the primary when
+    there is none or a transaction is open on the primary (a replica would
+    not see its writes).
+    """
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return DEFAULT_DB_ALIAS
+    healthy = []
+    for alias in get_replica_aliases():
+        lag = get_replica_lag(alias)
+        if lag is not None and lag <= settings.DB_REPLICA_MAX_LAG:
+            healthy.append(alias)
+    if not healthy:
+        return DEFAULT_DB_ALIAS
+    return random.choice(healthy)
+
+
+def pin_to_primary(user):
+    """Read from the primary for this user's next DB_REPLICA_STICKY_SECONDS"""
+    if get_replica_aliases() and user is not None and user.is_authenticated:
+        cache.set(STICKY_KEY.format(user.pk), True, settings.DB_REPLICA_STICKY_SECONDS)
+
+
+def is_pinned_to_primary(user):
+    """Whether the user wrote recently and must read their own writes"""
+    if user is None or not user.is_authenticated:
+        return False
+    return bool(cache.get(STICKY_KEY.format(user.pk)))
+
+
+def replica_reads_used():
+    """Whether the current view read from a replica so far"""
+    scope = _replica_scope.get()
+    return scope is not None and scope.alias not in (None, DEFAULT_DB_ALIAS)
+
+
+def use_read_replica(view_func):
+    """
+    Let a read-only view read from a replica
+
+    Reads in the view are routed by ReplicaRouter. Unsafe methods and
+    users pinned to the primary after their own writes still use the
+    primary. Use method_decorator() for viewset actions.
+    """
+    @functools.wraps(view_func)
+    def wrapper_view(request, *args, **kwargs):
+        if (
+            not get_replica_aliases()
+            or request.method not in SAFE_METHODS
+            or is_pinned_to_primary(getattr(request, 'user', None))
+        ):
+            return view_func(request, *args, **kwargs)
+
+        token = _replica_scope.set(ReplicaScope())
+        try:
+            return view_func(request, *args, **kwargs)
+        finally:
+            _replica_scope.reset(token)
+
+    return wrapper_view
+
+
+def on_replica(queryset, user=None):
+    """
+    Hint that a queryset may be read from a replica
+
+    For reads outside views decorated with use_read_replica (services,
+    exports, management commands). Pass the user whose writes must stay
+    visible to keep read-your-writes.
+    """
+    if not get_replica_aliases() or is_pinned_to_primary(user):
+        return queryset
+    return queryset.using(get_read_alias())
+
+
+class ReplicaRouter:
+    """
+    Route reads of opted-in views to read replicas
+
+    Only reads inside views decorated with use_read_replica (or querysets
+    passed through on_replica) go to a replica; other reads and every
+    write use the primary. Migrations only run on the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        scope = _replica_scope.get()
+        if scope is None:
+            # Related objects of on_replica() results follow their instance
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        if scope.alias is None:
+            scope.alias = get_read_alias()
+        return scope.alias
+
+    def db_for_write(self, model, **hints):
+        # Never fall back to the database an instance was read from
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_replica_aliases():
+            return False
+        return None
@@ -0,0 +1,23 @@
+from rest_framework.permissions import SAFE_METHODS
+
+from core.db.routers import pin_to_primary
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pin users to the primary database after their own writes
+
+    After a successful unsafe request, the user's replica-enabled reads go
+    to the primary for DB_REPLICA_STICKY_SECONDS, so they never see a
+    replica that has not caught up with what they just changed. The user
+    is read after the view ran, so DRF token authentication is included.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            pin_to_primary(getattr(request, 'user', None))
+        return response
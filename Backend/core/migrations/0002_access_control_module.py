@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-10-19 02:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='permission',
+            name='module',
+            field=models.CharField(choices=[('ASSET', 'Asset'), ('CAMPAIGN', 'Campaign'), ('BUDGET', 'Budget'), ('ACCESS_CONTROL', 'Access control')], max_length=20),
+        ),
+    ]
@@ -59,6 +59,7 @@ class Permission(TimeStampedModel):
         ("ASSET", "Asset"),
         ("CAMPAIGN", "Campaign"),
         ("BUDGET", "Budget"),
+        ("ACCESS_CONTROL", "Access control"),
     ]
     ACTION_CHOICES = [
         ("VIEW", "View"),
@@ -0,0 +1,201 @@
+import asyncio
+import json
+import logging
+import threading
+
+import psycopg2
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+# Postgres NOTIFY channel carrying the events of the postgres layer
+NOTIFY_CHANNEL = 'realtime_events'
+
+# Sent instead of the dropped backlog when a subscriber falls behind
+RESYNC_EVENT = {'event': 'resync'}
+
+# name -> layer instance, created on first use
+_layers = {}
+_layers_lock = threading.Lock()
+
+
+class Subscription:
+    """
+    Events of one topic for one WebSocket connection
+
+    Events are queued on the connection's event loop. When more than
+    REALTIME_MAX_QUEUE events are waiting, the backlog is dropped and
+    replaced by a single resync event, so a slow client cannot make the
+    process buffer without bound; it reloads the state over HTTP instead.
+    """
+
+    def __init__(self, topic, loop, max_queue):
+        self.topic = topic
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=max_queue)
+
+    def put(self, event):
+        """Queue an event; must run on the subscription's loop"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class InMemoryChannelLayer:
+    """
+    In-process publish/subscribe of realtime events
+
+    Subscribers are WebSocket connections on this process's event loop.
+    Events are published once the current transaction commits, from any
+    thread, and handed to the subscribers' loop thread-safely. Only events
+    published in the same process reach the subscribers, so this layer
+    suits a single ASGI process that also does all the writing.
+    """
+
+    def __init__(self):
+        self.subscriptions = {}
+        self.lock = threading.Lock()
+
+    def subscribe(self, topic):
+        subscription = Subscription(topic, asyncio.get_running_loop(), settings.REALTIME_MAX_QUEUE)
+        with self.lock:
+            self.subscriptions.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscribers = self.subscriptions.get(subscription.topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self.subscriptions[subscription.topic]
+
+    def publish(self, events):
+        """Publish a list of (topic, event) pairs when the transaction commits"""
+        if events:
+            transaction.on_commit(lambda: self.deliver(events))
+
+    def close(self):
+        pass
+
+    def deliver(self, events):
+        """Hand events to the local subscribers of their topics"""
+        with self.lock:
+            targets = [
+                (subscription, event)
+                for topic, event in events
+                for subscription in self.subscriptions.get(topic, ())
+            ]
+        for subscription, event in targets:
+            subscription.loop.call_soon_threadsafe(subscription.put, event)
+
+
+class PostgresChannelLayer(InMemoryChannelLayer):
+    """
+    Realtime events brokered by Postgres LISTEN/NOTIFY
+
+    publish() sends all events with a single pg_notify query in the current
+    transaction. Postgres only delivers notifications of committed
+    transactions, so writers in any process (API workers, management
+    commands) reach every ASGI process. Each ASGI process keeps one
+    listening connection, read from its event loop, and fans the events
+    out to its local subscribers.
+
+    LISTEN needs a session: when DB_HOST is a pgbouncer in transaction
+    mode, point REALTIME_LISTEN_DB_HOST at the database server itself.
+    """
+
+    RECONNECT_DELAY = 5
+
+    def __init__(self):
+        super().__init__()
+        self.listener = None
+        self.listener_loop = None
+
+    def subscribe(self, topic):
+        subscription = super().subscribe(topic)
+        if self.listener_loop is not subscription.loop:
+            self.close()
+            self.listener_loop = subscription.loop
+            self._listen()
+        return subscription
+
+    def close(self):
+        """Close the listening connection"""
+        if self.listener is not None:
+            self.listener_loop.remove_reader(self.listener.fileno())
+            self.listener.close()
+            self.listener = None
+
+    def publish(self, events):
+        if not events:
+            return
+        payloads = [
+            json.dumps({'topic': topic, 'event': event}, cls=DjangoJSONEncoder)
+            for topic, event in events
+        ]
+        with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload',
+                [NOTIFY_CHANNEL, payloads]
+            )
+
+    def _get_listen_params(self):
+        params = connections[DEFAULT_DB_ALIAS].get_connection_params()
+        params.pop('cursor_factory', None)
+        if settings.REALTIME_LISTEN_DB_HOST:
+            params['host'] = settings.REALTIME_LISTEN_DB_HOST
+        return params
+
+    def _listen(self):
+        """Open the listening connection and read it from the event loop"""
+        loop = self.listener_loop
+        try:
+            listener = psycopg2.connect(**self._get_listen_params())
+            listener.autocommit = True
+            with listener.cursor() as cursor:
+                cursor.execute(f'LISTEN {NOTIFY_CHANNEL}')
+        except psycopg2.Error as e:
+            logger.error(f"Realtime listener could not connect: {e}")
+            loop.call_later(self.RECONNECT_DELAY, self._listen)
+            return
+        self.listener = listener
+        loop.add_reader(listener.fileno(), self._read_notifications)
+
+    def _read_notifications(self):
+        try:
+            self.listener.poll()
+        except psycopg2.Error as e:
+            logger.error(f"Realtime listener connection lost: {e}")
+            self.close()
+            self.listener_loop.call_later(self.RECONNECT_DELAY, self._listen)
+            return
+
+        events = []
+        while self.listener.notifies:
+            message = json.loads(self.listener.notifies.pop(0).payload)
+            events.append((message['topic'], message['event']))
+        self.deliver(events)
+
+
+LAYERS = {
+    'memory': InMemoryChannelLayer,
+    'postgres': PostgresChannelLayer,
+}
+
+
+def get_channel_layer():
+    """The process's channel layer selected by REALTIME_CHANNEL_LAYER"""
+    name = settings.REALTIME_CHANNEL_LAYER
+    with _layers_lock:
+        if name not in _layers:
+            _layers[name] = LAYERS[name]()
+        return _layers[name]
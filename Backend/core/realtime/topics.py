@@ -0,0 +1,42 @@
+from django.utils import timezone
+
+from .layers import get_channel_layer
+
+# Topic kind (the URL segment of /ws/<kind>/<id>) -> (id type, authorization check)
+_topics = {}
+
+
+def register_topic(kind, authorize, id_type=int):
+    """
+    Make /ws/<kind>/<id> subscribable
+
+    The id from the URL is converted with id_type (e.g. int or uuid.UUID).
+    authorize(user, object_id) is called (synchronously, in a thread) when
+    a client subscribes, and returns whether the user may receive the
+    events of that object. Apps register their topics in AppConfig.ready().
+    """
+    _topics[kind] = (id_type, authorize)
+
+
+def get_topic_type(kind):
+    """(id type, authorization check) of a registered topic kind, or None"""
+    return _topics.get(kind)
+
+
+def get_topic(kind, object_id):
+    return f'{kind}.{object_id}'
+
+
+def publish(kind, events):
+    """
+    Publish events to subscribers of the objects they concern
+
+    events is a list of (object_id, event dict) pairs; event dicts get a
+    timestamp if they have none. All events are sent together once the
+    current transaction commits, whatever their number.
+    """
+    now = timezone.now()
+    get_channel_layer().publish([
+        (get_topic(kind, object_id), {'timestamp': now, **event})
+        for object_id, event in events
+    ])
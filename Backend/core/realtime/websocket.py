@@ -0,0 +1,188 @@
+import asyncio
+import json
+import re
+from datetime import datetime, timezone as dt_timezone
+from http.cookies import SimpleCookie
+from importlib import import_module
+from urllib.parse import parse_qs, urlsplit
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections
+from django.http import HttpRequest
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .layers import get_channel_layer
+from .topics import get_topic, get_topic_type
+
+WEBSOCKET_PATH = re.compile(r'^/ws/(?P<kind>[a-z_]+)/(?P<object_id>[0-9A-Za-z-]+)/?$')
+
+# Close codes sent when a subscription is refused
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_FORBIDDEN = 4403
+CLOSE_NOT_FOUND = 4404
+
+
+def _origin_allowed(headers):
+    """Whether a cookie-authenticated handshake comes from our own frontend"""
+    origin = headers.get(b'origin', b'').decode('latin1')
+    if not origin:
+        return False
+    if origin in getattr(settings, 'CORS_ALLOWED_ORIGINS', []):
+        return True
+    return urlsplit(origin).netloc == headers.get(b'host', b'').decode('latin1')
+
+
+def authenticate(scope):
+    """
+    (user, expires_at) of a WebSocket handshake, or (None, None)
+
+    Browsers cannot set an Authorization header on WebSockets, so the JWT
+    access token is passed as the token query parameter; expires_at is the
+    token's exp. Otherwise the session cookie is used, but only from an
+    allowed Origin, so other sites cannot open connections with the user's
+    cookie. Sessions have no fixed expiry, so expires_at is None.
+    """
+    token = parse_qs(scope.get('query_string', b'').decode()).get('token')
+    if token:
+        authentication = JWTAuthentication()
+        try:
+            validated_token = authentication.get_validated_token(token[0])
+            user = authentication.get_user(validated_token)
+        except AuthenticationFailed:
+            return None, None
+        return user, datetime.fromtimestamp(validated_token['exp'], tz=dt_timezone.utc)
+
+    headers = dict(scope.get('headers', []))
+    if b'cookie' not in headers or not _origin_allowed(headers):
+        return None, None
+    session_cookie = SimpleCookie(headers[b'cookie'].decode('latin1')).get(settings.SESSION_COOKIE_NAME)
+    if session_cookie is None:
+        return None, None
+    request = HttpRequest()
+    request.session = import_module(settings.SESSION_ENGINE).SessionStore(session_cookie.value)
+    user = auth.get_user(request)
+    return (user, None) if user.is_authenticated else (None, None)
+
+
+def _check_subscription(scope, authorize, object_id):
+    """Return (user, allowed, expires_at) for a subscription request"""
+    close_old_connections()
+    try:
+        user, expires_at = authenticate(scope)
+        if user is None or not user.is_active:
+            return None, False, None
+        return user, bool(authorize(user, object_id)), expires_at
+    finally:
+        close_old_connections()
+
+
+def _close_code(user, allowed):
+    """Close code refusing a subscription, or None when it is allowed"""
+    if user is None:
+        return CLOSE_UNAUTHORIZED
+    if not allowed:
+        return CLOSE_FORBIDDEN
+    return None
+
+
+async def websocket_application(scope, receive, send):
+    """
+    ASGI application serving /ws/<kind>/<id> subscriptions
+
+    After the handshake the user is authenticated and the topic's
+    registered authorization check decides whether they may follow the
+    object. Events published for it are then pushed as JSON text frames;
+    messages from the client are ignored. A heartbeat event is sent after
+    REALTIME_HEARTBEAT_SECONDS without events, so proxies keep idle
+    connections open.
+
+    Both checks run again every REALTIME_HEARTBEAT_SECONDS, and the socket
+    is closed once they fail (the user left the team, the object was
+    deleted, the session ended) or when the JWT access token expires.
+    """
+    message = await receive()
+    if message['type'] != 'websocket.connect':
+        return
+
+    match = WEBSOCKET_PATH.match(scope['path'])
+    topic_type = get_topic_type(match['kind']) if match else None
+    try:
+        id_type, authorize = topic_type
+        object_id = id_type(match['object_id'])
+    except (TypeError, ValueError):
+        await send({'type': 'websocket.close', 'code': CLOSE_NOT_FOUND})
+        return
+
+    user, allowed, expires_at = await sync_to_async(_check_subscription)(scope, authorize, object_id)
+    code = _close_code(user, allowed)
+    if code is not None:
+        await send({'type': 'websocket.close', 'code': code})
+        return
+
+    async def recheck():
+        user, allowed, _ = await sync_to_async(_check_subscription)(scope, authorize, object_id)
+        return _close_code(user, allowed)
+
+    layer = get_channel_layer()
+    subscription = layer.subscribe(get_topic(match['kind'], object_id))
+    try:
+        await send({'type': 'websocket.accept'})
+        await _send_events(subscription, receive, send, recheck, expires_at)
+    except OSError:
+        # The client went away while an event was being sent
+        pass
+    finally:
+        layer.unsubscribe(subscription)
+
+
+async def _send_events(subscription, receive, send, recheck, expires_at):
+    loop = asyncio.get_running_loop()
+    interval = settings.REALTIME_HEARTBEAT_SECONDS
+    expires = None
+    if expires_at is not None:
+        expires = loop.time() + (expires_at - timezone.now()).total_seconds()
+    next_check = loop.time() + interval
+    sent = False
+    receiving = asyncio.ensure_future(receive())
+    getting = asyncio.ensure_future(subscription.get())
+    try:
+        while True:
+            deadline = next_check if expires is None else min(next_check, expires)
+            done, _ = await asyncio.wait(
+                {receiving, getting},
+                timeout=max(deadline - loop.time(), 0),
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            if receiving in done:
+                if receiving.result()['type'] == 'websocket.disconnect':
+                    return
+                receiving = asyncio.ensure_future(receive())
+            if getting in done:
+                await send({
+                    'type': 'websocket.send',
+                    'text': json.dumps(getting.result(), cls=DjangoJSONEncoder)
+                })
+                getting = asyncio.ensure_future(subscription.get())
+                sent = True
+
+            now = loop.time()
+            if expires is not None and now >= expires:
+                await send({'type': 'websocket.close', 'code': CLOSE_UNAUTHORIZED})
+                return
+            if now >= next_check:
+                code = await recheck()
+                if code is not None:
+                    await send({'type': 'websocket.close', 'code': code})
+                    return
+                if not sent:
+                    await send({'type': 'websocket.send', 'text': json.dumps({'event': 'heartbeat'})})
+                sent = False
+                next_check = now + interval
+    finally:
+        receiving.cancel()
+        getting.cancel()
@@ -1,3 +1,403 @@
-from django.test import TestCase
+import asyncio
+import io
+import threading
+import uuid
+from types import SimpleNamespace
+from unittest.mock import patch
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.db.utils import load_backend
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from core.db.backends.postgresql_pool.base import close_pools, get_pools
+from core.db.pool import ConnectionPool, PoolTimeout
+from core.db import routers
+from core.db.routers import ReplicaRouter, on_replica, use_read_replica
+from core.middleware.read_your_writes import ReadYourWritesMiddleware
+from core.parsers import ORJSONParser
+from core.realtime.layers import RESYNC_EVENT, InMemoryChannelLayer
+from core.renderers import ORJSONRenderer
+from campaigns.models import Campaign
+from campaigns.services.response_cache import CampaignResponseCache
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    """
+    Test cases for the orjson renderer
+    """
+
+    def test_output_matches_drf_renderer(self):
+        """Test native and fallback types render exactly like the DRF renderer"""
+        data = ReturnDict({
+            'id': uuid.uuid4(),
+            'budget': Decimal('1234.50'),
+            'created_at': timezone.now(),
+            'date': timezone.now().date(),
+            'duration': timedelta(hours=1),
+            'label': gettext_lazy('Active'),
+            'error': ErrorDetail('Invalid', code='invalid'),
+            'tags': {'a'},
+            'nested': [{'text': 'ünïcode \u2028 separator', 'none': None}],
+            1: 'non-string key',
+        }, serializer=None)
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_none_renders_empty_body(self):
+        """Test None renders an empty body, as with 204 responses"""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_indent_from_accept_header(self):
+        """Test an indent media type parameter pretty prints the output"""
+        rendered = ORJSONRenderer().render({'a': 1}, 'application/json; indent=4')
+
+        self.assertIn(b'\n', rendered)
+
+
+class ORJSONParserTest(SimpleTestCase):
+    """
+    Test cases for the orjson parser
+    """
+
+    def test_parses_like_drf_parser(self):
+        """Test the parsed data matches the DRF parser"""
+        body = '{"name": "Campaign ü", "budget": 10.5, "ids": [1, 2], "active": true}'.encode()
+
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(body)),
+            JSONParser().parse(io.BytesIO(body))
+        )
+
+    def test_invalid_json_raises_parse_error(self):
+        """Test malformed bodies and NaN raise ParseError"""
+        for body in [b'{"name": ', b'{"value": NaN}']:
+            with self.subTest(body=body):
+                with self.assertRaises(ParseError):
+                    ORJSONParser().parse(io.BytesIO(body))
+
+    def test_non_utf8_encoding(self):
+        """Test request bodies in other declared encodings are decoded first"""
+        body = '{"name": "café"}'.encode('latin-1')
+
+        data = ORJSONParser().parse(io.BytesIO(body), parser_context={'encoding': 'latin-1'})
+
+        self.assertEqual(data, {'name': 'café'})
+
+
+class FakeConnection:
+    """Stand-in for a DB-API connection in pool tests"""
+
+    def __init__(self):
+        self.closed = False
+        self.healthy = True
+        self.dirty = False
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    """
+    Test cases for the connection pool
+    """
+
+    def make_pool(self, **kwargs):
+        def check(conn):
+            return conn.healthy
+
+        def reset(conn):
+            return not conn.closed and not conn.dirty
+
+        return ConnectionPool('test', check=check, reset=reset, close=FakeConnection.close, **kwargs)
+
+    def test_returned_connections_are_reused(self):
+        """Test a returned connection is handed out again instead of a new one"""
+        pool = self.make_pool()
+        conn = pool.getconn(FakeConnection)
+        pool.putconn(conn)
+
+        self.assertIs(pool.getconn(FakeConnection), conn)
+        stats = pool.get_stats()
+        self.assertEqual(stats['connections_opened'], 1)
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['in_use'], 1)
+
+    def test_max_size_blocks_then_times_out(self):
+        """Test checkouts wait for a free connection and give up after the timeout"""
+        pool = self.make_pool(max_size=1, timeout=0.05)
+        pool.getconn(FakeConnection)
+
+        with self.assertRaises(PoolTimeout):
+            pool.getconn(FakeConnection)
+
+        stats = pool.get_stats()
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertEqual(stats['requests_waited'], 1)
+        self.assertEqual(stats['size'], 1)
+
+    def test_waiting_checkout_gets_returned_connection(self):
+        """Test a waiting thread receives a connection returned by another one"""
+        pool = self.make_pool(max_size=1, timeout=5)
+        conn = pool.getconn(FakeConnection)
+        received = []
+
+        thread = threading.Thread(target=lambda: received.append(pool.getconn(FakeConnection)))
+        thread.start()
+        while pool.get_stats()['waiting'] == 0:
+            pass
+        pool.putconn(conn)
+        thread.join()
+
+        self.assertEqual(received, [conn])
+
+    def test_unhealthy_idle_connection_is_replaced(self):
+        """Test a connection failing its check is closed and a new one opened"""
+        pool = self.make_pool(check_after=0)
+        conn = pool.getconn(FakeConnection)
+        pool.putconn(conn)
+        conn.healthy = False
+
+        new_conn = pool.getconn(FakeConnection)
+
+        self.assertIsNot(new_conn, conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(pool.get_stats()['size'], 1)
+
+    def test_broken_and_expired_connections_are_closed(self):
+        """Test connections that cannot be reset or are too old are not pooled"""
+        pool = self.make_pool(max_lifetime=60)
+        broken = pool.getconn(FakeConnection)
+        broken.dirty = True
+        pool.putconn(broken)
+
+        self.assertTrue(broken.closed)
+        self.assertEqual(pool.get_stats()['idle'], 0)
+
+        pool = self.make_pool(max_idle=0)
+        conn = pool.getconn(FakeConnection)
+        pool.putconn(conn)
+
+        self.assertIsNot(pool.getconn(FakeConnection), conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(pool.get_stats()['connections_closed'], 1)
+
+    def test_failed_connect_releases_slot(self):
+        """Test a connect error does not leak pool capacity"""
+        pool = self.make_pool(max_size=1, timeout=0.05)
+
+        def fail():
+            raise OSError('connection refused')
+
+        with self.assertRaises(OSError):
+            pool.getconn(fail)
+        self.assertIsNotNone(pool.getconn(FakeConnection))
+
+
+class PooledDatabaseBackendTest(TestCase):
+    """
+    Test cases for the pooled PostgreSQL backend
+    """
+
+    def setUp(self):
+        backend = load_backend('core.db.backends.postgresql_pool')
+        settings_dict = dict(connection.settings_dict, POOL={'MAX_SIZE': 2})
+        self.wrappers = [backend.DatabaseWrapper(settings_dict, alias='pooled') for _ in range(2)]
+
+    def tearDown(self):
+        for wrapper in self.wrappers:
+            wrapper.close()
+        close_pools()
+
+    def test_closed_connections_are_reused(self):
+        """Test closing a connection returns it to the pool for the next user"""
+        first, second = self.wrappers
+        with first.cursor() as cursor:
+            cursor.execute('SELECT pg_backend_pid()')
+            pid = cursor.fetchone()[0]
+        first.close()
+
+        with second.cursor() as cursor:
+            cursor.execute('SELECT pg_backend_pid()')
+            self.assertEqual(cursor.fetchone()[0], pid)
+
+        stats = get_pools()[0].get_stats()
+        self.assertEqual(stats['connections_opened'], 1)
+        self.assertEqual(stats['in_use'], 1)
+
+    def test_open_transaction_is_rolled_back_on_return(self):
+        """Test a connection returned mid-transaction is rolled back before reuse"""
+        first, second = self.wrappers
+        first.set_autocommit(False)
+        with first.cursor() as cursor:
+            cursor.execute('CREATE TEMPORARY TABLE pooled_probe (id int)')
+        first.close()
+
+        with second.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('pooled_probe')")
+            self.assertIsNone(cursor.fetchone()[0])
+
+    def test_metrics_endpoint(self):
+        """Test pool metrics are exposed for monitoring"""
+        with self.wrappers[0].cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+        response = self.client.get(reverse('database_metrics'))
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertIn('default', data['databases'])
+        self.assertEqual(data['pools'][0]['in_use'], 1)
+
+
+@override_settings(DB_READ_REPLICAS=['replica_1'], DB_REPLICA_MAX_LAG=5.0, DB_REPLICA_STICKY_SECONDS=15)
+class ReplicaRouterTest(SimpleTestCase):
+    """
+    Test cases for read replica routing
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.router = ReplicaRouter()
+        self.user = SimpleNamespace(pk=7, is_authenticated=True)
+        self.lag = 0.5
+        patcher = patch.object(routers, 'get_replica_lag', side_effect=lambda alias: self.lag)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def route_in_view(self, method='get'):
+        """Call a replica-enabled view and return where it would read from"""
+        @use_read_replica
+        def view(request):
+            # None means no preference, which is the primary
+            return self.router.db_for_read(Campaign) or 'default'
+
+        request = getattr(RequestFactory(), method)('/')
+        request.user = self.user
+        return view(request)
+
+    def test_reads_outside_opted_in_views_use_the_primary(self):
+        """Test only decorated views are routed to replicas"""
+        self.assertIsNone(self.router.db_for_read(Campaign))
+        self.assertEqual(self.router.db_for_write(Campaign), 'default')
+
+    def test_opted_in_view_reads_from_replica(self):
+        """Test reads in a decorated view go to a replica"""
+        self.assertEqual(self.route_in_view(), 'replica_1')
+        self.assertIsNone(self.router.db_for_read(Campaign))
+
+    def test_unsafe_methods_use_the_primary(self):
+        """Test the decorator is ignored for writes"""
+        self.assertEqual(self.route_in_view('post'), 'default')
+
+    def test_lagging_or_unreachable_replica_falls_back_to_primary(self):
+        """Test replicas over the lag limit or down are skipped"""
+        self.lag = 30.0
+        self.assertEqual(self.route_in_view(), 'default')
+
+        self.lag = None
+        self.assertEqual(self.route_in_view(), 'default')
+
+    def test_users_read_their_own_writes(self):
+        """Test a successful write pins the user to the primary"""
+        middleware = ReadYourWritesMiddleware(lambda request: HttpResponse(status=201))
+        request = RequestFactory().post('/')
+        request.user = self.user
+
+        middleware(request)
+
+        self.assertEqual(self.route_in_view(), 'default')
+        self.assertEqual(on_replica(Campaign.objects.all(), user=self.user).db, 'default')
+
+        other = SimpleNamespace(pk=8, is_authenticated=True)
+        self.assertEqual(on_replica(Campaign.objects.all(), user=other).db, 'replica_1')
+
+    def test_reads_and_failed_writes_do_not_pin(self):
+        """Test only successful unsafe requests pin the user"""
+        for method, response_status in [('get', 200), ('post', 400)]:
+            middleware = ReadYourWritesMiddleware(lambda request: HttpResponse(status=response_status))
+            request = getattr(RequestFactory(), method)('/')
+            request.user = self.user
+            middleware(request)
+
+        self.assertEqual(self.route_in_view(), 'replica_1')
+
+    def test_replica_built_responses_are_cached_briefly(self):
+        """Test responses built from a replica are kept no longer than the lag limit"""
+        response_cache = CampaignResponseCache(timeout=300)
+
+        @use_read_replica
+        def view(request):
+            self.router.db_for_read(Campaign)
+            return response_cache.get_entry_timeout()
+
+        request = RequestFactory().get('/')
+        request.user = self.user
+
+        self.assertEqual(view(request), 5)
+        self.assertEqual(response_cache.get_entry_timeout(), 300)
+
+
+class ReplicaLagTest(TestCase):
+    """
+    Test cases for replica lag measurement
+    """
+
+    @override_settings(DB_REPLICA_LAG_CHECK_INTERVAL=60)
+    def test_primary_reports_no_lag(self):
+        """Test the lag query runs and is cached per interval"""
+        routers._lag_cache.clear()
+
+        self.assertEqual(routers.get_replica_lag('default'), 0.0)
+        with self.assertNumQueries(0):
+            routers.get_replica_lag('default')
+        routers._lag_cache.clear()
+
+
+@override_settings(REALTIME_MAX_QUEUE=3)
+class InMemoryChannelLayerTest(SimpleTestCase):
+    """
+    Test cases for in-process realtime event fan-out
+    """
+
+    async def test_events_reach_topic_subscribers_only(self):
+        """Test published events are delivered to the subscribers of their topic"""
+        layer = InMemoryChannelLayer()
+        first = layer.subscribe('assets.1')
+        second = layer.subscribe('assets.1')
+        other = layer.subscribe('assets.2')
+
+        layer.deliver([('assets.1', {'event': 'a'}), ('assets.1', {'event': 'b'})])
+        await asyncio.sleep(0)
+
+        self.assertEqual([await first.get(), await first.get()], [{'event': 'a'}, {'event': 'b'}])
+        self.assertEqual(second.queue.qsize(), 2)
+        self.assertTrue(other.queue.empty())
+
+        layer.unsubscribe(first)
+        layer.unsubscribe(second)
+        layer.deliver([('assets.1', {'event': 'c'})])
+        await asyncio.sleep(0)
+        self.assertEqual(list(layer.subscriptions), ['assets.2'])
+
+    async def test_slow_subscriber_gets_resync(self):
+        """Test a full queue is replaced by a single resync event"""
+        layer = InMemoryChannelLayer()
+        subscription = layer.subscribe('assets.1')
+
+        layer.deliver([('assets.1', {'event': str(i)}) for i in range(5)])
+        await asyncio.sleep(0)
+
+        self.assertEqual(await subscription.get(), RESYNC_EVENT)
+        self.assertEqual(await subscription.get(), {'event': '4'})
+        self.assertTrue(subscription.queue.empty())
@@ -1,3 +1,29 @@
-from django.shortcuts import render
+from django.db import connections
+from django.http import JsonResponse
 
-# Create your views here.
+from core.db.backends.postgresql_pool.base import get_pools
+from core.db.routers import get_replica_status
+
+
+def database_metrics(request):
+    """
+    Database connection settings, pool metrics and replica lag for monitoring
+
+    Pools live in each worker process, so the numbers describe the
+    process that served the request.
+    """
+    databases = {}
+    for alias in connections:
+        settings_dict = connections.settings[alias]
+        databases[alias] = {
+            'engine': settings_dict['ENGINE'],
+            'conn_max_age': settings_dict['CONN_MAX_AGE'],
+            'conn_health_checks': settings_dict['CONN_HEALTH_CHECKS'],
+            'server_side_cursors': not settings_dict.get('DISABLE_SERVER_SIDE_CURSORS', False),
+        }
+
+    return JsonResponse({
+        'databases': databases,
+        'pools': [pool.get_stats() for pool in get_pools()],
+        'replicas': get_replica_status(),
+    })
@@ -0,0 +1,54 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from user_preferences.services.notification_queue import NotificationQueue
+
+
+class Command(BaseCommand):
+    """
+    Deliver queued notifications
+
+    Run once per tick from cron, or with --interval as a long-running
+    worker loop:
+
+        python manage.py deliver_notifications
+        python manage.py deliver_notifications --interval 5
+    """
+
+    help = 'Deliver queued notifications through the users\' notification settings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=NotificationQueue.DEFAULT_BATCH_SIZE,
+            help='Number of notifications claimed per transaction'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Keep running and repeat every N seconds (0 runs a single tick)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many notifications are queued'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be a positive integer')
+
+        queue = NotificationQueue(batch_size=options['batch_size'])
+
+        while True:
+            if options['dry_run']:
+                self.stdout.write(self.style.SUCCESS(f'Queued: {queue.count_pending()}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'Delivered: {queue.deliver_pending()}'))
+
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,129 @@
+import asyncio
+import statistics
+import time
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+ENDPOINTS = {
+    'sync': '/notifications/mock-task-alert/',
+    'async': '/notifications/async/mock-task-alert/',
+}
+
+
+class Command(BaseCommand):
+    """
+    Load test the sync and async mock notification endpoints
+
+    Sends POST requests to a running server from a single event loop,
+    keeping --concurrency requests in flight, and reports throughput,
+    latency percentiles and errors for each endpoint and concurrency
+    level. Run it once against the server under WSGI
+    (gunicorn backend.wsgi) and once under ASGI
+    (uvicorn backend.asgi:application) to compare how many concurrent
+    connections each deployment sustains.
+    """
+
+    help = 'Load test the sync and async notification endpoints of a running server'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--base-url',
+            default='http://localhost:8000',
+            help='Server to test (default: http://localhost:8000)'
+        )
+        parser.add_argument(
+            '--user-id',
+            type=int,
+            required=True,
+            help='ID of the user notifications are dispatched for'
+        )
+        parser.add_argument(
+            '--endpoints',
+            default='sync,async',
+            help='Comma separated endpoints to test: sync, async (default: both)'
+        )
+        parser.add_argument(
+            '--concurrency',
+            default='10,50,200',
+            help='Comma separated numbers of requests kept in flight (default: 10,50,200)'
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=500,
+            help='Requests sent per endpoint and concurrency level (default: 500)'
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=30.0,
+            help='Per-request timeout in seconds (default: 30)'
+        )
+
+    def handle(self, *args, **options):
+        endpoints = [name.strip() for name in options['endpoints'].split(',') if name.strip()]
+        unknown = [name for name in endpoints if name not in ENDPOINTS]
+        if unknown:
+            raise CommandError(f"Unknown endpoints: {', '.join(unknown)}")
+        try:
+            levels = [int(level) for level in options['concurrency'].split(',')]
+        except ValueError:
+            raise CommandError('--concurrency must be a comma separated list of integers')
+
+        self.stdout.write(
+            f'{"endpoint":<8} {"conc":>6} {"reqs":>6} {"errors":>7} '
+            f'{"req/s":>9} {"p50 ms":>9} {"p99 ms":>9} {"max ms":>9}'
+        )
+        for name in endpoints:
+            for concurrency in levels:
+                result = asyncio.run(self.run_level(
+                    options['base_url'].rstrip('/') + ENDPOINTS[name],
+                    options['user_id'],
+                    concurrency,
+                    options['requests'],
+                    options['timeout']
+                ))
+                self.write_row(name, concurrency, result)
+
+    async def run_level(self, url, user_id, concurrency, total, timeout):
+        """Send total requests keeping concurrency of them in flight"""
+        payload = {
+            'user_id': user_id,
+            'trigger_type': 'task_due',
+            'message': 'Load test notification'
+        }
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        timings = []
+        errors = 0
+        remaining = iter(range(total))
+
+        async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+            async def worker():
+                nonlocal errors
+                for _ in remaining:
+                    start = time.perf_counter()
+                    try:
+                        response = await client.post(url, json=payload)
+                        if response.status_code != 200:
+                            errors += 1
+                    except httpx.HTTPError:
+                        errors += 1
+                    timings.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+
+        return {'timings': timings, 'errors': errors, 'elapsed': elapsed}
+
+    def write_row(self, name, concurrency, result):
+        """Write one result line"""
+        timings = sorted(result['timings'])
+        p50 = statistics.median(timings) * 1000
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000
+        rate = len(timings) / result['elapsed'] if result['elapsed'] else float('inf')
+        self.stdout.write(
+            f'{name:<8} {concurrency:>6} {len(timings):>6} {result["errors"]:>7} '
+            f'{rate:>9.0f} {p50:>9.1f} {p99:>9.1f} {timings[-1] * 1000:>9.1f}'
+        )
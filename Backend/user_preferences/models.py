@@ -33,6 +33,34 @@ class NotificationSettings(models.Model):
         unique_together = ['user', 'channel_id', 'setting_key']  # One setting per user/channel/trigger combo
 
 
+class PendingNotification(models.Model):
+    """
+    Notification queued for delivery by the deliver_notifications worker
+
+    Rows are written in the same transaction as the change they report,
+    and delivered later through the user's NotificationSettings, so
+    requests do not wait on notification channels.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='pending_notifications')
+    trigger_type = models.CharField(max_length=255)  # matches NotificationSettings.setting_key
+    message = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'pending_notifications'
+        indexes = [
+            models.Index(
+                fields=['created_at'],
+                name='pending_notifications_unsent',
+                condition=models.Q(sent_at__isnull=True)
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.trigger_type} for user {self.user_id}"
+
+
 class SlackIntegration(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='slack_integrations')
     webhook_url = models.URLField(max_length=500)
@@ -51,6 +51,98 @@ class NotificationDispatcher:
             'mock_logs': mock_logs
         }
     
+    async def adispatch_mock_notification(self, user_id, trigger_type, message):
+        """
+        Async version of dispatch_mock_notification for ASGI views
+        
+        Uses the async ORM and loads the user with their preferences, the
+        matching notification settings and the Slack integration in at
+        most three queries. Returns the same dict.
+        """
+        try:
+            user = await User.objects.select_related('preferences').aget(id=user_id)
+        except User.DoesNotExist:
+            return {
+                'error': 'User not found',
+                'channels_would_notify': [],
+                'mock_logs': []
+            }
+        
+        # Preferences were loaded by select_related, so this does not query
+        if self._is_in_quiet_hours(user):
+            return {
+                'quiet_hours_active': True,
+                'channels_would_notify': [],
+                'mock_logs': [f"[MOCK NOTIFICATION] Skipped - User {user.username} is in quiet hours"]
+            }
+        
+        enabled_channels = await self._aget_enabled_channels(user, trigger_type)
+        mock_logs = self._generate_mock_logs(user, trigger_type, message, enabled_channels)
+        
+        return {
+            'user_id': user_id,
+            'trigger_type': trigger_type,
+            'quiet_hours_active': False,
+            'channels_would_notify': [channel['name'] for channel in enabled_channels],
+            'mock_logs': mock_logs
+        }
+    
+    def dispatch_bulk_notifications(self, trigger_type, messages_by_user):
+        """
+        Dispatch one trigger type to many users at once
+        
+        messages_by_user maps user IDs to a list of messages. Users,
+        notification settings and Slack integrations are each loaded with
+        a single query, so the cost does not grow with the number of
+        recipients. Returns a dict of user ID -> result in the same shape
+        as dispatch_mock_notification.
+        """
+        user_ids = list(messages_by_user)
+        users = User.objects.filter(id__in=user_ids).select_related('preferences')
+        
+        settings_by_user = {}
+        for setting in NotificationSettings.objects.filter(
+            user_id__in=user_ids,
+            setting_key=trigger_type,
+            enabled=True
+        ):
+            settings_by_user.setdefault(setting.user_id, []).append(setting)
+        
+        slack_by_user = {
+            integration.user_id: integration
+            for integration in SlackIntegration.objects.filter(user_id__in=user_ids, is_active=True)
+        }
+        
+        results = {}
+        for user in users:
+            if self._is_in_quiet_hours(user):
+                results[user.id] = {
+                    'quiet_hours_active': True,
+                    'channels_would_notify': [],
+                    'mock_logs': [f"[MOCK NOTIFICATION] Skipped - User {user.username} is in quiet hours"]
+                }
+                continue
+            
+            enabled_channels = []
+            for setting in settings_by_user.get(user.id, []):
+                channel_info = self._build_channel_info(setting, slack_by_user.get(user.id))
+                if channel_info:
+                    enabled_channels.append(channel_info)
+            
+            mock_logs = []
+            for message in messages_by_user[user.id]:
+                mock_logs.extend(self._generate_mock_logs(user, trigger_type, message, enabled_channels))
+            
+            results[user.id] = {
+                'user_id': user.id,
+                'trigger_type': trigger_type,
+                'quiet_hours_active': False,
+                'channels_would_notify': [channel['name'] for channel in enabled_channels],
+                'mock_logs': mock_logs
+            }
+        
+        return results
+    
     def _is_in_quiet_hours(self, user):
         """
         Check if user is currently in quiet hours based on their timezone
@@ -99,25 +191,62 @@ class NotificationDispatcher:
         )
         
         for setting in settings:
-            channel_info = {
-                'id': setting.channel_id,
-                'name': setting.channel_name,
-                'type': setting.channel_name.lower()
-            }
+            slack_integration = None
+            if setting.channel_id == 1 and self._has_active_slack_integration(user):
+                slack_integration = SlackIntegration.objects.get(user=user, is_active=True)
             
-            # For Slack, check if user has active integration
-            if setting.channel_id == 1:  # Slack channel
-                if self._has_active_slack_integration(user):
-                    slack_integration = SlackIntegration.objects.get(user=user, is_active=True)
-                    channel_info['webhook_url'] = slack_integration.webhook_url
-                    channel_info['channel_detail'] = slack_integration.channel_name or 'Default'
-                    enabled_channels.append(channel_info)
-            else:
-                # For other channels (Email, SMS, etc.), just add them
+            channel_info = self._build_channel_info(setting, slack_integration)
+            if channel_info:
+                enabled_channels.append(channel_info)
+        
+        return enabled_channels
+    
+    async def _aget_enabled_channels(self, user, trigger_type):
+        """
+        Async version of _get_enabled_channels
+        """
+        settings = [
+            setting async for setting in NotificationSettings.objects.filter(
+                user=user,
+                setting_key=trigger_type,
+                enabled=True
+            )
+        ]
+        
+        slack_integration = None
+        if any(setting.channel_id == 1 for setting in settings):
+            slack_integration = await SlackIntegration.objects.filter(user=user, is_active=True).afirst()
+        
+        enabled_channels = []
+        for setting in settings:
+            channel_info = self._build_channel_info(setting, slack_integration)
+            if channel_info:
                 enabled_channels.append(channel_info)
         
         return enabled_channels
     
+    def _build_channel_info(self, setting, slack_integration):
+        """
+        Build the channel description for one enabled notification setting
+        
+        Returns None for Slack settings without an active integration
+        """
+        channel_info = {
+            'id': setting.channel_id,
+            'name': setting.channel_name,
+            'type': setting.channel_name.lower()
+        }
+        
+        # For Slack, the user needs an active integration
+        if setting.channel_id == 1:  # Slack channel
+            if slack_integration is None:
+                return None
+            channel_info['webhook_url'] = slack_integration.webhook_url
+            channel_info['channel_detail'] = slack_integration.channel_name or 'Default'
+        
+        # For other channels (Email, SMS, etc.), just add them
+        return channel_info
+    
     def _has_active_slack_integration(self, user):
         """
         Check if user has an active Slack integration configured
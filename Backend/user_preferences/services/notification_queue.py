@@ -0,0 +1,71 @@
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import PendingNotification
+from .notification_dispatcher import NotificationDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationQueue:
+    """
+    Asynchronous notification delivery through PendingNotification rows
+
+    enqueue() only inserts rows, so callers can queue notifications inside
+    their own transaction and they are delivered only if it commits. The
+    deliver_notifications worker sends them in batches: rows are claimed
+    with SELECT ... FOR UPDATE SKIP LOCKED, so several workers can run at
+    once, and each trigger type in a batch is dispatched with
+    NotificationDispatcher.dispatch_bulk_notifications.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, dispatcher=None):
+        self.batch_size = batch_size
+        self.dispatcher = dispatcher or NotificationDispatcher()
+
+    def enqueue(self, trigger_type, messages_by_user):
+        """Queue messages (dict of user ID -> list of messages) with one INSERT"""
+        return PendingNotification.objects.bulk_create([
+            PendingNotification(user_id=user_id, trigger_type=trigger_type, message=message)
+            for user_id, messages in messages_by_user.items()
+            for message in messages
+        ], batch_size=self.batch_size)
+
+    def count_pending(self):
+        return PendingNotification.objects.filter(sent_at__isnull=True).count()
+
+    def deliver_pending(self):
+        """Deliver every queued notification and return the number sent"""
+        total = 0
+        while True:
+            sent = self._deliver_batch()
+            total += sent
+            if sent < self.batch_size:
+                return total
+
+    def _deliver_batch(self):
+        with transaction.atomic():
+            batch = list(
+                PendingNotification.objects.filter(sent_at__isnull=True)
+                .order_by('created_at', 'id')
+                .select_for_update(skip_locked=True)
+                .values('id', 'user_id', 'trigger_type', 'message')[:self.batch_size]
+            )
+            if not batch:
+                return 0
+
+            by_trigger = {}
+            for row in batch:
+                by_trigger.setdefault(row['trigger_type'], {}).setdefault(row['user_id'], []).append(row['message'])
+            for trigger_type, messages_by_user in by_trigger.items():
+                results = self.dispatcher.dispatch_bulk_notifications(trigger_type, messages_by_user)
+                for result in results.values():
+                    for log_line in result.get('mock_logs', []):
+                        logger.info(log_line)
+
+            PendingNotification.objects.filter(id__in=[row['id'] for row in batch]).update(sent_at=timezone.now())
+        return len(batch)
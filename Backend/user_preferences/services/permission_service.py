@@ -1,7 +1,6 @@
 # user_preferences/services/permission_service.py
 from django.contrib.auth import get_user_model
-from access_control.models import UserRole, RolePermission
-from core.models import Permission
+from access_control.services.permissions import PermissionCache
 from django.conf import settings
 
 User = get_user_model()
@@ -44,20 +43,6 @@ class PermissionService:
 
     @staticmethod
     def _get_permissions_via_orm(user_id):
-        """Fallback method: Get all permissions of the user using direct ORM query"""
-        user = User.objects.get(id=user_id)
-        
-        # Get all roles of the user
-        user_roles = UserRole.objects.filter(
-            user=user,
-            valid_to__isnull=True  # Current valid role
-        )
-        
-        # Get all permissions of these roles
-        permissions = set()
-        for user_role in user_roles:
-            role_permissions = RolePermission.objects.filter(role=user_role.role)
-            for role_perm in role_permissions:
-                permissions.add(f"{role_perm.permission.module}:{role_perm.permission.action}")
-        
-        return list(permissions)
\ No newline at end of file
+        """Fallback method: Get the permissions of the user's currently valid roles"""
+        User.objects.get(id=user_id)
+        return sorted(PermissionCache().get_permissions(user_id))
@@ -0,0 +1,76 @@
+import asyncio
+import weakref
+
+import httpx
+from django.conf import settings
+
+
+class SlackWebhookClient:
+    """
+    Sends messages to Slack incoming webhooks
+
+    With SLACK_WEBHOOK_DELIVERY disabled (the default) messages are only
+    written to the mock log, as SlackIntegration.send_mock_notification
+    does. With it enabled they are POSTed to the webhook; asend() uses an
+    httpx.AsyncClient so a slow Slack response does not hold a worker
+    thread under ASGI. One AsyncClient (and its connection pool) is kept
+    per event loop.
+    """
+
+    _async_clients = weakref.WeakKeyDictionary()
+
+    def __init__(self, deliver=None, timeout=None):
+        self.deliver = settings.SLACK_WEBHOOK_DELIVERY if deliver is None else deliver
+        self.timeout = settings.SLACK_WEBHOOK_TIMEOUT if timeout is None else timeout
+
+    def build_payload(self, integration, message):
+        """Build the webhook JSON body"""
+        payload = {'text': message}
+        if integration.channel_name:
+            payload['channel'] = integration.channel_name
+        return payload
+
+    def get_mock_logs(self, integration, message):
+        """Log lines for a message that is not delivered"""
+        return [
+            f"[MOCK SLACK] Webhook: {integration.webhook_url}",
+            f"[MOCK SLACK] Channel: {integration.channel_name or 'Default'}",
+            f"[MOCK SLACK] Message: {message}",
+        ]
+
+    def _get_async_client(self):
+        """Get the AsyncClient bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(timeout=self.timeout)
+            self._async_clients[loop] = client
+        return client
+
+    async def asend(self, integration, message):
+        """
+        Send a message to an integration's webhook without blocking
+
+        Returns a dict with 'delivered' and 'logs'; delivery errors are
+        reported in the result instead of being raised.
+        """
+        if not integration.is_active:
+            return {'delivered': False, 'logs': []}
+
+        if not self.deliver:
+            logs = self.get_mock_logs(integration, message)
+            for log_line in logs:
+                print(log_line)
+            return {'delivered': False, 'logs': logs}
+
+        try:
+            response = await self._get_async_client().post(
+                integration.webhook_url,
+                json=self.build_payload(integration, message),
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            return {'delivered': False, 'logs': [f"[SLACK] Delivery failed: {e}"]}
+
+        return {'delivered': True, 'logs': [f"[SLACK] Delivered to {integration.channel_name or 'Default'}"]}
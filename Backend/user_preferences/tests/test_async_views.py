@@ -0,0 +1,253 @@
+from unittest.mock import patch
+
+import httpx
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from user_preferences.models import NotificationSettings, SlackIntegration, UserPreferences
+from user_preferences.services.notification_dispatcher import NotificationDispatcher
+from user_preferences.services.slack_client import SlackWebhookClient
+
+User = get_user_model()
+
+
+class AsyncMockTaskAlertViewTest(TestCase):
+    """
+    Test cases for the async PROFILE-05 mock notification endpoint
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        UserPreferences.objects.create(user=self.user, timezone='UTC')
+        NotificationSettings.objects.create(
+            user=self.user,
+            channel_id=1,
+            channel_name='Slack',
+            setting_key='task_due',
+            module_scope='campaigns',
+            enabled=True
+        )
+        NotificationSettings.objects.create(
+            user=self.user,
+            channel_id=2,
+            channel_name='Email',
+            setting_key='task_due',
+            module_scope='campaigns',
+            enabled=True
+        )
+        SlackIntegration.objects.create(
+            user=self.user,
+            webhook_url='https://hooks.slack.com/services/T123/B456/token',
+            is_active=True
+        )
+        self.url = reverse('mock-task-alert-async')
+        self.data = {
+            'user_id': self.user.id,
+            'trigger_type': 'task_due',
+            'message': 'Task deadline approaching'
+        }
+
+    async def test_returns_same_result_as_sync_endpoint(self):
+        """Test the async endpoint answers like the DRF one"""
+        response = await self.async_client.post(self.url, self.data, content_type='application/json')
+        sync_response = await self.async_client.post(
+            reverse('mock-task-alert'), self.data, content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+        self.assertEqual(response.json()['channels_would_notify'], ['Slack', 'Email'])
+
+    async def test_validates_required_fields(self):
+        """Test missing parameters are rejected"""
+        for field in ['user_id', 'trigger_type', 'message']:
+            with self.subTest(field=field):
+                data = {key: value for key, value in self.data.items() if key != field}
+                response = await self.async_client.post(self.url, data, content_type='application/json')
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.json()['error'], f'{field} is required')
+
+    async def test_rejects_invalid_json(self):
+        """Test a malformed body is a 400"""
+        response = await self.async_client.post(self.url, '{not json', content_type='application/json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_handles_nonexistent_user(self):
+        """Test an unknown user is a 404"""
+        response = await self.async_client.post(
+            self.url, dict(self.data, user_id=99999), content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json()['error'], 'User not found')
+
+    async def test_rejects_get(self):
+        """Test only POST is allowed"""
+        response = await self.async_client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    def test_dispatch_query_count(self):
+        """Test user and preferences, settings and Slack integration take three queries"""
+        with self.assertNumQueries(3):
+            result = async_to_sync(NotificationDispatcher().adispatch_mock_notification)(
+                self.user.id, 'task_due', 'Hello'
+            )
+
+        self.assertEqual(
+            result,
+            NotificationDispatcher().dispatch_mock_notification(self.user.id, 'task_due', 'Hello')
+        )
+
+    def test_dispatch_without_preferences(self):
+        """Test users without a preferences row are not in quiet hours"""
+        other = User.objects.create_user(username='noprefs', email='noprefs@example.com', password='testpass123')
+
+        result = async_to_sync(NotificationDispatcher().adispatch_mock_notification)(
+            other.id, 'task_due', 'Hello'
+        )
+
+        self.assertFalse(result['quiet_hours_active'])
+        self.assertEqual(result['channels_would_notify'], [])
+
+
+class AsyncSlackIntegrationViewTest(TestCase):
+    """
+    Test cases for the async PROFILE-04 Slack integration view
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='slackuser',
+            email='slack@example.com',
+            password='testpass123'
+        )
+        self.url = reverse('user_preferences:slack-integration-async')
+        self.webhook_url = 'https://hooks.slack.com/services/T123456/B123456/abcdefghijklmnop'
+        token = RefreshToken.for_user(self.user).access_token
+        self.auth = {'headers': {'Authorization': f'Bearer {token}'}}
+
+    async def test_requires_authentication(self):
+        """Test requests without credentials are rejected"""
+        response = await self.async_client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_create_get_and_delete(self):
+        """Test the integration lifecycle through the async view"""
+        response = await self.async_client.get(self.url, **self.auth)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = await self.async_client.post(
+            self.url,
+            {'webhook_url': self.webhook_url, 'channel_name': '#alerts'},
+            content_type='application/json',
+            **self.auth
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['integration']['channel_name'], '#alerts')
+
+        response = await self.async_client.post(
+            self.url, {'channel_name': '#ops'}, content_type='application/json', **self.auth
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['message'], 'Slack integration updated successfully')
+
+        response = await self.async_client.get(self.url, **self.auth)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['channel_name'], '#ops')
+
+        response = await self.async_client.delete(self.url, **self.auth)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(await SlackIntegration.objects.filter(user=self.user).aexists())
+
+    async def test_invalid_webhook_url(self):
+        """Test model validation still applies"""
+        response = await self.async_client.post(
+            self.url,
+            {'webhook_url': 'https://invalid-url.com/not-slack'},
+            content_type='application/json',
+            **self.auth
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('webhook_url', response.json())
+
+    @override_settings(SLACK_WEBHOOK_DELIVERY=True)
+    async def test_delivers_confirmation_to_webhook(self):
+        """Test the confirmation is POSTed to the webhook when delivery is on"""
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            return httpx.Response(200, text='ok')
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(SlackWebhookClient, '_get_async_client', return_value=client):
+            response = await self.async_client.post(
+                self.url,
+                {'webhook_url': self.webhook_url, 'channel_name': '#alerts'},
+                content_type='application/json',
+                **self.auth
+            )
+        await client.aclose()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(str(sent[0].url), self.webhook_url)
+        self.assertIn(b'Slack integration created for user slackuser', sent[0].content)
+
+
+class SlackWebhookClientTest(TestCase):
+    """
+    Test cases for SlackWebhookClient
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(username='slackuser', email='slack@example.com', password='testpass123')
+        self.integration = SlackIntegration(
+            user=self.user,
+            webhook_url='https://hooks.slack.com/services/T1/B1/token',
+            channel_name='#alerts',
+            is_active=True
+        )
+
+    def _send(self, handler, **kwargs):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(SlackWebhookClient, '_get_async_client', return_value=client):
+            return async_to_sync(SlackWebhookClient(**kwargs).asend)(self.integration, 'Hello')
+
+    def test_mock_logs_when_delivery_disabled(self):
+        """Test nothing is sent when delivery is off"""
+        result = self._send(lambda request: self.fail('webhook called'), deliver=False)
+
+        self.assertFalse(result['delivered'])
+        self.assertIn('[MOCK SLACK] Message: Hello', result['logs'])
+
+    def test_delivery_errors_are_reported(self):
+        """Test a failing webhook does not raise"""
+        result = self._send(lambda request: httpx.Response(500), deliver=True)
+
+        self.assertFalse(result['delivered'])
+        self.assertTrue(result['logs'][0].startswith('[SLACK] Delivery failed'))
+
+    def test_inactive_integration_is_skipped(self):
+        """Test inactive integrations get nothing"""
+        self.integration.is_active = False
+
+        result = self._send(lambda request: self.fail('webhook called'), deliver=True)
+
+        self.assertEqual(result, {'delivered': False, 'logs': []})
@@ -0,0 +1,68 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from user_preferences.models import NotificationSettings, PendingNotification
+from user_preferences.services.notification_queue import NotificationQueue
+
+User = get_user_model()
+
+
+class NotificationQueueTest(TestCase):
+    """
+    Test cases for queued notification delivery
+    """
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        NotificationSettings.objects.create(
+            user=self.user,
+            channel_id=2,
+            channel_name='Email',
+            setting_key='asset_reviewed',
+            module_scope='assets'
+        )
+
+    def test_enqueue_only_inserts_rows(self):
+        """Test queued notifications wait for the worker"""
+        queue = NotificationQueue()
+
+        queue.enqueue('asset_reviewed', {self.user.id: ['a', 'b'], self.other_user.id: ['c']})
+
+        self.assertEqual(queue.count_pending(), 3)
+
+    def test_deliver_in_batches(self):
+        """Test every queued notification is dispatched once and marked sent"""
+        queue = NotificationQueue(batch_size=2)
+        queue.enqueue('asset_reviewed', {self.user.id: ['a', 'b', 'c']})
+        queue.enqueue('budget_alert', {self.other_user.id: ['d']})
+
+        with self.assertLogs('user_preferences.services.notification_queue', level='INFO') as logs:
+            self.assertEqual(queue.deliver_pending(), 4)
+
+        self.assertEqual(queue.count_pending(), 0)
+        self.assertFalse(PendingNotification.objects.filter(sent_at__isnull=True).exists())
+        self.assertTrue(any('[MOCK EMAIL] Recipient: test@example.com' in line for line in logs.output))
+        self.assertEqual(queue.deliver_pending(), 0)
+
+    def test_deliver_notifications_command(self):
+        """Test the worker command delivers the queue"""
+        NotificationQueue().enqueue('asset_reviewed', {self.user.id: ['a']})
+        out = StringIO()
+
+        call_command('deliver_notifications', stdout=out)
+
+        self.assertIn('Delivered: 1', out.getvalue())
+        self.assertEqual(NotificationQueue().count_pending(), 0)
@@ -1,10 +1,11 @@
 from django.urls import path
-from .views import UserPreferencesView, SlackIntegrationView, NotificationSettingsView
+from .views import UserPreferencesView, SlackIntegrationView, AsyncSlackIntegrationView, NotificationSettingsView
 
 app_name = 'user_preferences'
 
 urlpatterns = [
     path('me/preferences/', UserPreferencesView.as_view(), name='user-preferences'),
     path('me/notifications/slack/', SlackIntegrationView.as_view(), name='slack-integration'),
+    path('me/notifications/slack/async/', AsyncSlackIntegrationView.as_view(), name='slack-integration-async'),
     path('me/notifications/settings/', NotificationSettingsView.as_view(), name='notification-settings'),
 ] 
\ No newline at end of file
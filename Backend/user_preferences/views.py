@@ -1,10 +1,20 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from .models import SlackIntegration, NotificationSettings
 from .serializers import UserPreferencesSerializer, SlackIntegrationSerializer, NotificationSettingsSerializer
 from .services.notification_dispatcher import NotificationDispatcher
+from .services.slack_client import SlackWebhookClient
 
 class UserPreferencesView(generics.RetrieveUpdateAPIView):
   serializer_class = UserPreferencesSerializer
@@ -151,6 +161,177 @@ def mock_task_alert(request):
     # Return success response with channel confirmation
     return Response(result, status=status.HTTP_200_OK)
 
+@sync_to_async
+def _authenticate(request):
+    """
+    Authenticate a plain Django request with the DRF authentication classes
+    
+    Async views are not DRF views, so JWT / session / basic authentication
+    is run here (in a worker thread, as it may query). Returns None when
+    the request is not authenticated.
+    """
+    drf_request = Request(
+        request,
+        authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    )
+    try:
+        user = drf_request.user
+    except APIException:
+        return None
+    return user if user.is_authenticated else None
+
+
+def _parse_json_body(request):
+    """Parse a JSON request body; returns None if it is not a JSON object"""
+    try:
+        data = json.loads(request.body or b'{}')
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _api_response(data, status=200):
+    """Render data with the API's configured JSON renderer"""
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    return HttpResponse(renderer.render(data), status=status, content_type=renderer.media_type)
+
+
+def _not_authenticated_response():
+    return _api_response(
+        {'detail': 'Authentication credentials were not provided.'},
+        status=status.HTTP_401_UNAUTHORIZED
+    )
+
+
+class AsyncSlackIntegrationView(View):
+    """
+    Async PROFILE-04 Slack Integration view for ASGI deployments
+    Handles POST, GET, DELETE for /users/me/notifications/slack/async
+    
+    Same behaviour as SlackIntegrationView, but uses the async ORM and
+    sends the confirmation message through SlackWebhookClient.asend, so
+    waiting on Slack does not hold a worker thread.
+    """
+    
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Authentication is done per request, as in DRF views
+        view.csrf_exempt = True
+        return view
+    
+    async def dispatch(self, request, *args, **kwargs):
+        user = await _authenticate(request)
+        if user is None:
+            return _not_authenticated_response()
+        request.user = user
+        return await super().dispatch(request, *args, **kwargs)
+    
+    async def get(self, request):
+        """
+        GET /users/me/notifications/slack/async
+        """
+        slack_integration = await SlackIntegration.objects.filter(user=request.user).afirst()
+        if slack_integration is None:
+            return _api_response(
+                {'message': 'No Slack integration configured'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return _api_response(SlackIntegrationSerializer(slack_integration).data)
+    
+    async def post(self, request):
+        """
+        POST /users/me/notifications/slack/async
+        Create or update Slack integration for the authenticated user
+        """
+        data = _parse_json_body(request)
+        if data is None:
+            return _api_response({'error': 'Invalid JSON body'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        existing_integration = await SlackIntegration.objects.filter(user=request.user).afirst()
+        if existing_integration:
+            serializer = SlackIntegrationSerializer(existing_integration, data=data, partial=True)
+        else:
+            serializer = SlackIntegrationSerializer(data=data)
+        
+        if not await sync_to_async(serializer.is_valid)():
+            return _api_response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        slack_integration = await sync_to_async(serializer.save)(user=request.user)
+        
+        action = 'updated' if existing_integration else 'created'
+        await SlackWebhookClient().asend(
+            slack_integration,
+            f"Slack integration {action} for user {request.user.username}"
+        )
+        
+        return _api_response(
+            {
+                'message': f'Slack integration {action} successfully',
+                'integration': SlackIntegrationSerializer(slack_integration).data
+            },
+            status=status.HTTP_201_CREATED if not existing_integration else status.HTTP_200_OK
+        )
+    
+    async def delete(self, request):
+        """
+        DELETE /users/me/notifications/slack/async
+        """
+        slack_integration = await SlackIntegration.objects.filter(user=request.user).afirst()
+        if slack_integration is None:
+            return _api_response(
+                {'error': 'No Slack integration found for this user'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        print(f"[MOCK SLACK] Deleting integration for user: {request.user.username}")
+        print(f"[MOCK SLACK] Webhook URL: {slack_integration.webhook_url}")
+        await slack_integration.adelete()
+        
+        return _api_response({'message': 'Slack integration deleted successfully'})
+
+
+async def amock_task_alert(request):
+    """
+    Async PROFILE-05 Mock Notification Endpoint for ASGI deployments
+    POST /notifications/async/mock-task-alert
+    
+    Same request and response as mock_task_alert, using
+    NotificationDispatcher.adispatch_mock_notification
+    """
+    if request.method != 'POST':
+        return _api_response(
+            {'detail': f'Method "{request.method}" not allowed.'},
+            status=status.HTTP_405_METHOD_NOT_ALLOWED
+        )
+    
+    data = _parse_json_body(request)
+    if data is None:
+        return _api_response({'error': 'Invalid JSON body'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    user_id = data.get('user_id')
+    trigger_type = data.get('trigger_type')
+    message = data.get('message')
+    
+    for name, value in [('user_id', user_id), ('trigger_type', trigger_type), ('message', message)]:
+        if not value:
+            return _api_response({'error': f'{name} is required'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    result = await NotificationDispatcher().adispatch_mock_notification(user_id, trigger_type, message)
+    
+    for log_line in result.get('mock_logs', []):
+        print(log_line)
+    
+    if 'error' in result:
+        return _api_response(
+            {'error': result['error']},
+            status=status.HTTP_404_NOT_FOUND if result['error'] == 'User not found' else status.HTTP_400_BAD_REQUEST
+        )
+    
+    return _api_response(result, status=status.HTTP_200_OK)
+
+# Authentication is not session based, as for the DRF mock_task_alert view
+amock_task_alert.csrf_exempt = True
+
 class NotificationSettingsView(APIView):
     """
     PROFILE-07 Notification Settings API View